@@ -0,0 +1,305 @@
+"""
+Persistent Raw Frame Stream
+
+Reads screen frames from one long-lived capture process instead of starting
+a new `adb exec-out screencap -p` per frame.
+
+Android's `screencap` without `-p` writes a raw frame: a little-endian
+header (width, height, pixel format, plus a colorspace word on Android 9+)
+followed by width*height pixels. Running it in a device-side shell loop
+through a single `adb exec-out` turns that into a continuous byte stream,
+so a frame costs neither an adb round-trip nor a PNG encode/decode.
+
+`RawFrameStream` decodes that stream on a background thread into a
+latest-frame slot; consumers take the newest frame and older undelivered
+frames are simply overwritten. Any command that writes the same format to
+stdout works as a source (e.g. a local fake producer in tests).
+"""
+
+from __future__ import annotations
+
+import struct
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+
+# Android PixelFormat -> bytes per pixel
+PIXEL_FORMATS: Dict[int, int] = {
+    1: 4,  # RGBA_8888
+    2: 4,  # RGBX_8888
+    3: 3,  # RGB_888
+    4: 2,  # RGB_565
+}
+
+# screencap header: width, height, format (+ colorspace since Android 9)
+RAW_HEADER_SIZE = 16
+LEGACY_RAW_HEADER_SIZE = 12
+
+_HEADER = struct.Struct("<III")
+
+
+def adb_stream_command(
+    device_address: str,
+    adb_path: str = "adb",
+    interval: float = 0.0
+) -> List[str]:
+    """
+    Command that streams raw screencap frames from a device over one adb session.
+
+    Args:
+        device_address: ADB device address (ip:port)
+        adb_path: adb executable
+        interval: Seconds the device sleeps between frames (0 = as fast as possible)
+    """
+    pause = f"sleep {interval}; " if interval > 0 else ""
+    return [adb_path, '-s', device_address, 'exec-out', f"while true; do screencap; {pause}done"]
+
+
+def encode_raw_frame(
+    frame: np.ndarray,
+    pixel_format: int = 1,
+    header_size: int = RAW_HEADER_SIZE
+) -> bytes:
+    """
+    Encode a BGR frame in screencap's raw format (used by fake producers).
+
+    Args:
+        frame: (height, width, 3) BGR uint8 image
+        pixel_format: Android pixel format (see PIXEL_FORMATS)
+        header_size: 16 (Android 9+) or 12 (older)
+    """
+    height, width = frame.shape[:2]
+    rgb = frame[..., 2::-1]
+    if pixel_format in (1, 2):
+        alpha = np.full((height, width, 1), 255, dtype=np.uint8)
+        pixels = np.concatenate([rgb, alpha], axis=2)
+    elif pixel_format == 3:
+        pixels = rgb
+    elif pixel_format == 4:
+        r, g, b = (rgb[..., i].astype(np.uint16) for i in range(3))
+        pixels = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
+        pixels = pixels.astype('<u2')
+    else:
+        raise ValueError(f"Unsupported pixel format {pixel_format}")
+
+    header = _HEADER.pack(width, height, pixel_format) + b"\x00" * (header_size - _HEADER.size)
+    return header + np.ascontiguousarray(pixels).tobytes()
+
+
+def decode_raw_pixels(buffer, width: int, height: int, pixel_format: int) -> np.ndarray:
+    """
+    Decode raw screencap pixels to a BGR uint8 image.
+
+    Args:
+        buffer: Pixel bytes (at least width*height*bytes-per-pixel)
+        width: Frame width
+        height: Frame height
+        pixel_format: Android pixel format (see PIXEL_FORMATS)
+    """
+    bpp = PIXEL_FORMATS.get(pixel_format)
+    if bpp is None:
+        raise ValueError(f"Unsupported pixel format {pixel_format}")
+
+    if pixel_format == 4:
+        packed = np.frombuffer(buffer, dtype='<u2', count=width * height).reshape(height, width)
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+        frame[..., 0] = ((packed & 0x1F) << 3).astype(np.uint8)
+        frame[..., 1] = (((packed >> 5) & 0x3F) << 2).astype(np.uint8)
+        frame[..., 2] = ((packed >> 11) << 3).astype(np.uint8)
+        return frame
+
+    pixels = np.frombuffer(buffer, dtype=np.uint8, count=width * height * bpp).reshape(height, width, bpp)
+    return np.ascontiguousarray(pixels[..., 2::-1])
+
+
+class RawFrameStream:
+    """
+    Long-lived capture process decoded into a latest-frame slot.
+
+    The process is restarted (after `restart_delay`) if it exits while the
+    stream is running, e.g. when the adb connection drops.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        header_size: int = RAW_HEADER_SIZE,
+        restart_delay: float = 1.0,
+        max_frame_pixels: int = 4096 * 4096
+    ):
+        """
+        Initialize stream.
+
+        Args:
+            command: Process writing raw frames to stdout
+            header_size: Frame header size (RAW_HEADER_SIZE or LEGACY_RAW_HEADER_SIZE)
+            restart_delay: Seconds to wait before restarting an exited process
+            max_frame_pixels: Frames claiming more pixels are treated as a corrupt stream
+        """
+        if header_size < _HEADER.size:
+            raise ValueError(f"header_size must be at least {_HEADER.size}")
+
+        self.command = list(command)
+        self.header_size = header_size
+        self.restart_delay = restart_delay
+        self.max_frame_pixels = max_frame_pixels
+
+        self.running = False
+        self._process: Optional[subprocess.Popen] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # Latest-frame slot
+        self._condition = threading.Condition()
+        self._frame: Optional[np.ndarray] = None
+        self._sequence = 0
+        self._consumed_sequence = 0
+
+        # Statistics
+        self.frames_decoded = 0
+        self.frames_skipped = 0  # Overwritten before any consumer took them
+        self.bytes_read = 0
+        self.restarts = 0
+        self.decode_errors = 0
+        self._frame_times: deque = deque(maxlen=60)
+
+    def start(self):
+        """Start the capture process and decoder thread."""
+        if self.running:
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="RawFrameStream")
+        self._thread.start()
+        logger.info(f"[STREAM] Started frame stream: {' '.join(self.command)}")
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the decoder thread and terminate the capture process."""
+        self.running = False
+        self._terminate_process()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+
+    def _terminate_process(self):
+        process = self._process
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    def _run(self):
+        while self.running:
+            try:
+                self._process = subprocess.Popen(
+                    self.command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    bufsize=0
+                )
+                self._read_frames(self._process.stdout)
+            except Exception as e:
+                logger.warning(f"[STREAM] Frame stream error: {e}")
+                self.decode_errors += 1
+            finally:
+                self._terminate_process()
+
+            if self.running:
+                self.restarts += 1
+                logger.warning(f"[STREAM] Capture process exited, restarting in {self.restart_delay}s")
+                time.sleep(self.restart_delay)
+
+    def _read_frames(self, stream):
+        header = bytearray(self.header_size)
+        pixels = bytearray()
+
+        while self.running:
+            if not self._read_exact(stream, memoryview(header)):
+                return
+            width, height, pixel_format = _HEADER.unpack_from(header)
+            bpp = PIXEL_FORMATS.get(pixel_format)
+            if bpp is None or width * height > self.max_frame_pixels:
+                raise ValueError(f"Corrupt frame header ({width}x{height}, format {pixel_format})")
+
+            size = width * height * bpp
+            if len(pixels) != size:
+                pixels = bytearray(size)
+            if not self._read_exact(stream, memoryview(pixels)):
+                return
+
+            frame = decode_raw_pixels(pixels, width, height, pixel_format)
+            self.bytes_read += self.header_size + size
+            self._publish(frame)
+
+    @staticmethod
+    def _read_exact(stream, view: memoryview) -> bool:
+        """Fill `view` from the stream; False on EOF."""
+        filled = 0
+        while filled < len(view):
+            count = stream.readinto(view[filled:])
+            if not count:
+                return False
+            filled += count
+        return True
+
+    def _publish(self, frame: np.ndarray):
+        with self._condition:
+            if self._sequence > self._consumed_sequence:
+                self.frames_skipped += 1
+            self._frame = frame
+            self._sequence += 1
+            self.frames_decoded += 1
+            self._frame_times.append(time.monotonic())
+            self._condition.notify_all()
+
+    def latest(self, after: int = 0, timeout: Optional[float] = None) -> Optional[Tuple[int, np.ndarray]]:
+        """
+        Newest decoded frame, waiting for one newer than `after`.
+
+        Args:
+            after: Sequence number already seen (0 = any frame)
+            timeout: Seconds to wait (None = wait indefinitely)
+
+        Returns:
+            (sequence, frame) or None on timeout / stop
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._sequence <= after:
+                if not self.running:
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+            self._consumed_sequence = self._sequence
+            return self._sequence, self._frame
+
+    @property
+    def decode_fps(self) -> float:
+        """Frames decoded per second over the recent window."""
+        with self._condition:
+            if len(self._frame_times) < 2:
+                return 0.0
+            span = self._frame_times[-1] - self._frame_times[0]
+            return (len(self._frame_times) - 1) / span if span > 0 else 0.0
+
+    def get_stats(self) -> Dict:
+        """Get stream statistics."""
+        return {
+            'running': self.running,
+            'frames_decoded': self.frames_decoded,
+            'frames_skipped': self.frames_skipped,
+            'bytes_read': self.bytes_read,
+            'restarts': self.restarts,
+            'decode_errors': self.decode_errors,
+            'decode_fps': self.decode_fps,
+        }
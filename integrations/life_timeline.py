@@ -8,14 +8,27 @@ Schema: LifeEvent
 - Timestamp + source + type + features
 - Unified query interface
 - Embedding support for multi-modal data
+
+Storage:
+- WAL journal: readers never block the writer (and vice versa)
+- One writer connection, a small pool of read-only connections
+- Bulk inserts via executemany; optional write-behind queue that groups
+  many events into one commit
+- Common numeric features (heart rate, steps, sleep) copied into typed
+  columns, and per-user hourly/daily rollups maintained on every insert, so
+  summaries over weeks or months read rollup rows instead of raw events
 """
 
 from __future__ import annotations
 
 import json
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Literal
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Literal, Sequence, Tuple, Union
 from enum import Enum
 import sqlite3
 from pathlib import Path
@@ -140,22 +153,194 @@ class LifeEvent:
         )
 
 
+# Typed feature columns: name -> (feature keys, event types it applies to or None for all)
+TYPED_FEATURES: Dict[str, Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]] = {
+    'heart_rate': (('heart_rate', 'bpm'), None),
+    'steps': (('steps',), None),
+    'sleep_quality': (('quality', 'sleep_quality', 'quality_score'), ('sleep',)),
+    'sleep_hours': (('duration_hours',), ('sleep',)),
+}
+_TYPED_SPECS = tuple(TYPED_FEATURES.values())
+_TYPED_COLUMNS = tuple(f"f_{name}" for name in TYPED_FEATURES)
+
+_EVENT_COLUMNS = (
+    "id, user_id, timestamp, source, type, features, "
+    "media_refs, annotations, confidence, importance"
+)
+_SELECT_EVENTS = f"SELECT {_EVENT_COLUMNS} FROM life_events"
+
+_INSERT_EVENT_SQL = f"""
+    INSERT INTO life_events 
+    ({_EVENT_COLUMNS}, {', '.join(_TYPED_COLUMNS)})
+    VALUES ({', '.join('?' * (10 + len(_TYPED_COLUMNS)))})
+"""
+
+# Rollup statistics per typed feature: count, sum, min, max
+_ROLLUP_STAT_COLUMNS = tuple(
+    f"{name}_{stat}" for name in TYPED_FEATURES for stat in ('count', 'sum', 'min', 'max')
+)
+_ROLLUP_KEY = "user_id, granularity, bucket_start, type, source"
+
+_UPSERT_ROLLUP_SQL = f"""
+    INSERT INTO life_rollups ({_ROLLUP_KEY}, event_count, {', '.join(_ROLLUP_STAT_COLUMNS)})
+    VALUES ({', '.join('?' * (6 + len(_ROLLUP_STAT_COLUMNS)))})
+    ON CONFLICT({_ROLLUP_KEY}) DO UPDATE SET
+        event_count = event_count + excluded.event_count,
+        {', '.join(
+            f"{name}_count = {name}_count + excluded.{name}_count, "
+            f"{name}_sum = {name}_sum + excluded.{name}_sum, "
+            f"{name}_min = min(coalesce({name}_min, excluded.{name}_min), coalesce(excluded.{name}_min, {name}_min)), "
+            f"{name}_max = max(coalesce({name}_max, excluded.{name}_max), coalesce(excluded.{name}_max, {name}_max))"
+            for name in TYPED_FEATURES
+        )}
+"""
+
+# Same aggregate shape, from raw events or from rollup rows
+_RAW_AGGREGATES = "COUNT(*), " + ", ".join(
+    f"COUNT(f_{name}), TOTAL(f_{name}), MIN(f_{name}), MAX(f_{name})" for name in TYPED_FEATURES
+)
+_ROLLUP_AGGREGATES = "SUM(event_count), " + ", ".join(
+    f"SUM({name}_count), TOTAL({name}_sum), MIN({name}_min), MAX({name}_max)" for name in TYPED_FEATURES
+)
+
+FilterValue = Union[EventType, EventSource, str]
+
+_FLUSH = object()  # Write-behind queue markers
+_STOP = object()
+
+
+def _to_json(value: Any) -> str:
+    """json.dumps with a fast path for the (very common) empty containers."""
+    if not value:
+        if isinstance(value, dict):
+            return '{}'
+        if isinstance(value, list):
+            return '[]'
+    return json.dumps(value)
+
+
+def _typed_values(event_type: str, features: Dict[str, Any]) -> List[Optional[float]]:
+    """Numeric values for the typed feature columns (None when absent)."""
+    values = []
+    for keys, types in _TYPED_SPECS:
+        value = None
+        if features and (types is None or event_type in types):
+            for key in keys:
+                candidate = features.get(key)
+                if isinstance(candidate, (int, float)) and not isinstance(candidate, bool):
+                    value = float(candidate)
+                    break
+        values.append(value)
+    return values
+
+
+def _values(items: Optional[Sequence[FilterValue]]) -> List[str]:
+    return [item.value if isinstance(item, Enum) else item for item in items or ()]
+
+
+def _filter_sql(
+    event_types: Optional[Sequence[FilterValue]] = None,
+    sources: Optional[Sequence[FilterValue]] = None,
+    any_of: Optional[Sequence[Tuple[Optional[Sequence[FilterValue]], Optional[Sequence[FilterValue]]]]] = None,
+) -> Tuple[str, List[Any]]:
+    """
+    SQL conditions (prefixed with AND) for type/source filters.
+    
+    `event_types` and `sources` must both match; `any_of` is a list of
+    (types, sources) alternatives of which at least one must match.
+    """
+    def match(types, srcs) -> Tuple[str, List[Any]]:
+        parts, params = [], []
+        types, srcs = _values(types), _values(srcs)
+        if types:
+            parts.append(f"type IN ({', '.join('?' * len(types))})")
+            params.extend(types)
+        if srcs:
+            parts.append(f"source IN ({', '.join('?' * len(srcs))})")
+            params.extend(srcs)
+        return " AND ".join(parts), params
+    
+    sql, params = match(event_types, sources)
+    sql = f" AND {sql}" if sql else ""
+    
+    if any_of:
+        alternatives = [match(types, srcs) for types, srcs in any_of]
+        if all(part for part, _ in alternatives):
+            sql += " AND (" + " OR ".join(f"({part})" for part, _ in alternatives) + ")"
+            for _, alt_params in alternatives:
+                params.extend(alt_params)
+        # An unconstrained alternative matches everything: no condition
+    
+    return sql, params
+
+
 class LifeTimeline:
     """
     Life Timeline database and query interface.
     
     Stores all LifeEvents in SQLite with embedding support.
     Provides unified query API for all pattern detection.
+    
+    Thread-safe: writes go through a single writer connection (serialized
+    by a lock), reads use pooled read-only connections. Events written with
+    `wait=False` are queued and committed in groups by a background thread;
+    queries flush that queue first, so reads always see earlier writes.
     """
     
-    def __init__(self, db_path: str = "data/life_timeline.db"):
-        """Initialize timeline database."""
+    def __init__(
+        self,
+        db_path: str = "data/life_timeline.db",
+        synchronous: str = "NORMAL",
+        reader_pool_size: int = 4,
+        write_batch_size: int = 1000,
+        write_flush_interval: float = 0.5,
+    ):
+        """
+        Initialize timeline database.
+        
+        Args:
+            db_path: SQLite file (or ":memory:")
+            synchronous: SQLite synchronous level; NORMAL is durable across
+                application crashes in WAL mode, FULL also across power loss
+            reader_pool_size: Max pooled read connections
+            write_batch_size: Max events per write-behind commit
+            write_flush_interval: Max seconds a queued event waits for its commit
+        """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.in_memory = str(db_path) == ":memory:"
+        if not self.in_memory:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        self.write_batch_size = write_batch_size
+        self.write_flush_interval = write_flush_interval
+        
+        # Single writer
         self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._write_lock = threading.RLock()
+        if not self.in_memory:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(f"PRAGMA synchronous={synchronous}")
+        self.conn.execute("PRAGMA busy_timeout=5000")
         self._create_tables()
         
+        # Pooled readers (an in-memory database only exists on the writer)
+        self.reader_pool_size = 0 if self.in_memory else reader_pool_size
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all_readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        
+        # Write-behind
+        self._write_queue: "queue.Queue[Any]" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        
+        self.stats = {
+            'events_written': 0,
+            'commits': 0,
+            'write_errors': 0,
+            'duplicates_skipped': 0,
+            'deferred_events': 0,
+        }
+        
         logger.info(f"[TIMELINE] Initialized at {db_path}")
     
     def _create_tables(self):
@@ -194,6 +379,48 @@ class LifeTimeline:
             ON life_events(user_id, source)
         """)
         
+        # Multi-type filters over a time range
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_user_type_time 
+            ON life_events(user_id, type, timestamp)
+        """)
+        
+        # Typed feature columns (added to databases created before they existed)
+        existing = {row[1] for row in cursor.execute("PRAGMA table_info(life_events)")}
+        missing = [name for name in TYPED_FEATURES if f"f_{name}" not in existing]
+        for name in missing:
+            cursor.execute(f"ALTER TABLE life_events ADD COLUMN f_{name} REAL")
+        for name in missing:
+            keys, types = TYPED_FEATURES[name]
+            type_clause = f" AND type IN ({', '.join(repr(t) for t in types)})" if types else ""
+            value = "coalesce(" + ", ".join(
+                f"CASE WHEN json_type(features, '$.\"{key}\"') IN ('integer', 'real') "
+                f"THEN json_extract(features, '$.\"{key}\"') END"
+                for key in keys
+            ) + ", NULL)"
+            cursor.execute(f"UPDATE life_events SET f_{name} = {value} WHERE features IS NOT NULL{type_clause}")
+        
+        # Hourly/daily rollups per (user, type, source)
+        rollups_exist = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'life_rollups'"
+        ).fetchone() is not None
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS life_rollups (
+                user_id TEXT NOT NULL,
+                granularity TEXT NOT NULL,
+                bucket_start REAL NOT NULL,
+                type TEXT NOT NULL,
+                source TEXT NOT NULL,
+                event_count INTEGER NOT NULL,
+                {', '.join(
+                    f"{column} {'INTEGER NOT NULL DEFAULT 0' if column.endswith('_count') else 'REAL'}"
+                    + (" NOT NULL DEFAULT 0" if column.endswith('_sum') else "")
+                    for column in _ROLLUP_STAT_COLUMNS
+                )},
+                PRIMARY KEY ({_ROLLUP_KEY})
+            )
+        """)
+        
         # Embeddings table (for semantic search)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS event_embeddings (
@@ -204,37 +431,266 @@ class LifeTimeline:
         """)
         
         self.conn.commit()
+        
+        if not rollups_exist and cursor.execute("SELECT 1 FROM life_events LIMIT 1").fetchone():
+            self.rebuild_rollups()
+    
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
     
-    def add_event(self, event: LifeEvent) -> bool:
-        """Add event to timeline."""
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read connection (sees everything committed so far)."""
+        self.flush()
+        
+        if self.reader_pool_size == 0:
+            with self._write_lock:
+                yield self.conn
+            return
+        
         try:
-            cursor = self.conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO life_events 
-                (id, user_id, timestamp, source, type, features, 
-                 media_refs, annotations, confidence, importance)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event.id,
-                event.user_id,
-                event.timestamp.timestamp(),
-                event.source.value,
-                event.type.value,
-                json.dumps(event.features),
-                json.dumps(event.media_refs),
-                json.dumps(event.annotations),
-                event.confidence,
-                event.importance,
-            ))
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._readers_lock:
+                if len(self._all_readers) < self.reader_pool_size:
+                    conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                    conn.execute("PRAGMA query_only=ON")
+                    self._all_readers.append(conn)
+                else:
+                    conn = None
+            if conn is None:
+                conn = self._readers.get()  # Wait for a reader to be returned
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _event_row(event: LifeEvent) -> Tuple:
+        event_type = event.type.value
+        return (
+            event.id,
+            event.user_id,
+            event.timestamp.timestamp(),
+            event.source.value,
+            event_type,
+            _to_json(event.features),
+            _to_json(event.media_refs),
+            _to_json(event.annotations),
+            event.confidence,
+            event.importance,
+            *_typed_values(event_type, event.features),
+        )
+    
+    def _write_rows(self, rows: List[Tuple]) -> int:
+        """Insert rows (and their rollup deltas) in one transaction; returns rows inserted."""
+        if not rows:
+            return 0
+        with self._write_lock:
+            try:
+                try:
+                    self.conn.executemany(_INSERT_EVENT_SQL, rows)
+                    inserted = rows
+                except sqlite3.IntegrityError:
+                    # Some ids already exist: keep the others
+                    self.conn.rollback()
+                    inserted = []
+                    for row in rows:
+                        try:
+                            self.conn.execute(_INSERT_EVENT_SQL, row)
+                            inserted.append(row)
+                        except sqlite3.IntegrityError:
+                            self.stats['duplicates_skipped'] += 1
+                self._update_rollups(inserted)
+                self.conn.commit()
+            except Exception:
+                # Don't leave a half-written batch open for the next writer to commit
+                self.conn.rollback()
+                raise
+            self.stats['events_written'] += len(inserted)
+            self.stats['commits'] += 1
+        return len(inserted)
+    
+    def _update_rollups(self, rows: Iterable[Tuple]):
+        """
+        Add rows to the hourly and daily rollups (caller holds the write lock).
+        
+        Rows are (..., user_id at 1, timestamp at 2, source at 3, type at 4,
+        typed feature values from 10).
+        """
+        num_features = len(TYPED_FEATURES)
+        deltas: Dict[Tuple, List[Any]] = {}
+        day_starts: Dict[Any, float] = {}
+        
+        for row in rows:
+            ts = row[2]
+            dt = datetime.fromtimestamp(ts)
+            hour_start = ts - (dt.minute * 60 + dt.second + dt.microsecond / 1e6)
+            day = dt.date()
+            day_start = day_starts.get(day)
+            if day_start is None:
+                day_start = day_starts[day] = datetime(day.year, day.month, day.day).timestamp()
             
+            typed = row[10:10 + num_features]
+            for key in (
+                (row[1], 'hour', hour_start, row[4], row[3]),
+                (row[1], 'day', day_start, row[4], row[3]),
+            ):
+                delta = deltas.get(key)
+                if delta is None:
+                    delta = deltas[key] = [0] + [0, 0.0, None, None] * num_features
+                delta[0] += 1
+                for i, value in enumerate(typed):
+                    if value is None:
+                        continue
+                    base = 1 + 4 * i
+                    delta[base] += 1
+                    delta[base + 1] += value
+                    if delta[base + 2] is None or value < delta[base + 2]:
+                        delta[base + 2] = value
+                    if delta[base + 3] is None or value > delta[base + 3]:
+                        delta[base + 3] = value
+        
+        if deltas:
+            self.conn.executemany(_UPSERT_ROLLUP_SQL, [key + tuple(delta) for key, delta in deltas.items()])
+    
+    def rebuild_rollups(self, batch_size: int = 50000):
+        """Recompute all rollups from raw events (e.g. after upgrading an old database)."""
+        logger.info("[TIMELINE] Rebuilding rollups from raw events")
+        with self._write_lock:
+            self.conn.execute("DELETE FROM life_rollups")
+            cursor = self.conn.execute(
+                f"SELECT {_EVENT_COLUMNS}, {', '.join(_TYPED_COLUMNS)} FROM life_events"
+            )
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                self._update_rollups(rows)
             self.conn.commit()
+    
+    def add_event(self, event: LifeEvent, wait: bool = True) -> bool:
+        """
+        Add event to timeline.
+        
+        Args:
+            event: Event to store
+            wait: Commit before returning; False queues it for write-behind
+        """
+        if not wait:
+            self._enqueue([self._event_row(event)])
             return True
+        
+        try:
+            if self._write_rows([self._event_row(event)]) == 1:
+                return True
+            logger.error(f"[TIMELINE] Failed to add event: duplicate id {event.id}")
+            return False
             
         except Exception as e:
+            self.stats['write_errors'] += 1
             logger.error(f"[TIMELINE] Failed to add event: {e}")
             return False
     
+    def add_events(self, events: Iterable[LifeEvent], wait: bool = True, chunk_size: int = 10000) -> int:
+        """
+        Add many events (imports, backfills) with one commit per chunk.
+        
+        Events whose id already exists are skipped.
+        
+        Args:
+            events: Events to store
+            wait: Commit before returning; False queues them for write-behind
+            chunk_size: Events per transaction
+            
+        Returns:
+            Number of events inserted (queued, if wait=False)
+        """
+        total = 0
+        chunk: List[Tuple] = []
+        for event in events:
+            chunk.append(self._event_row(event))
+            if len(chunk) >= chunk_size:
+                total += self._submit_rows(chunk, wait)
+                chunk = []
+        if chunk:
+            total += self._submit_rows(chunk, wait)
+        return total
+    
+    def _submit_rows(self, rows: List[Tuple], wait: bool) -> int:
+        if not wait:
+            self._enqueue(rows)
+            return len(rows)
+        try:
+            return self._write_rows(rows)
+        except Exception as e:
+            self.stats['write_errors'] += 1
+            logger.error(f"[TIMELINE] Failed to add {len(rows)} events: {e}")
+            return 0
+    
+    def _enqueue(self, rows: List[Tuple]):
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            self._writer_thread = threading.Thread(
+                target=self._write_behind_loop,
+                name="timeline-writer",
+                daemon=True
+            )
+            self._writer_thread.start()
+        self.stats['deferred_events'] += len(rows)
+        self._write_queue.put(rows)
+    
+    def _write_behind_loop(self):
+        """Group queued rows into commits of up to write_batch_size / write_flush_interval."""
+        stop = False
+        while not stop:
+            item = self._write_queue.get()
+            taken = 1
+            pending: List[Tuple] = []
+            if item is _STOP:
+                stop = True
+            elif item is not _FLUSH:
+                pending.extend(item)
+                deadline = time.monotonic() + self.write_flush_interval
+                while len(pending) < self.write_batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = self._write_queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    taken += 1
+                    if item is _STOP:
+                        stop = True
+                        break
+                    if item is _FLUSH:
+                        break
+                    pending.extend(item)
+            
+            try:
+                self._write_rows(pending)
+            except Exception as e:
+                self.stats['write_errors'] += 1
+                logger.error(f"[TIMELINE] Write-behind commit of {len(pending)} events failed: {e}")
+            finally:
+                for _ in range(taken):
+                    self._write_queue.task_done()
+    
+    def flush(self):
+        """Block until every queued (write-behind) event is committed."""
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            return
+        if threading.current_thread() is self._writer_thread:
+            return
+        if self._write_queue.unfinished_tasks:
+            self._write_queue.put(_FLUSH)
+            self._write_queue.join()
+    
     def query_by_time(
         self,
         user_id: str,
@@ -244,31 +700,56 @@ class LifeTimeline:
         source: Optional[EventSource] = None
     ) -> List[LifeEvent]:
         """Query events in time range."""
-        cursor = self.conn.cursor()
-        
-        query = """
-            SELECT * FROM life_events
-            WHERE user_id = ? AND timestamp >= ? AND timestamp <= ?
+        return self.query_events(
+            user_id, start, end,
+            event_types=[event_type] if event_type else None,
+            sources=[source] if source else None,
+        )
+    
+    def query_events(
+        self,
+        user_id: str,
+        start: datetime,
+        end: datetime,
+        event_types: Optional[Sequence[FilterValue]] = None,
+        sources: Optional[Sequence[FilterValue]] = None,
+        any_of: Optional[Sequence[Tuple[Optional[Sequence[FilterValue]], Optional[Sequence[FilterValue]]]]] = None,
+        limit: Optional[int] = None,
+    ) -> List[LifeEvent]:
         """
-        params = [user_id, start.timestamp(), end.timestamp()]
-        
-        if event_type:
-            query += " AND type = ?"
-            params.append(event_type.value)
+        Query events in time range with filters evaluated in SQL.
         
-        if source:
-            query += " AND source = ?"
-            params.append(source.value)
-        
-        query += " ORDER BY timestamp ASC"
+        Args:
+            user_id: User identifier
+            start: Range start (inclusive)
+            end: Range end (inclusive)
+            event_types: Event must have one of these types
+            sources: Event must come from one of these sources
+            any_of: (types, sources) alternatives; event must match at least one
+            limit: Keep only the most recent `limit` events
+            
+        Returns:
+            Events in ascending time order
+        """
+        filter_sql, filter_params = _filter_sql(event_types, sources, any_of)
+        query = f"""
+            {_SELECT_EVENTS}
+            WHERE user_id = ? AND timestamp >= ? AND timestamp <= ?{filter_sql}
+        """
+        params = [user_id, start.timestamp(), end.timestamp(), *filter_params]
         
-        cursor.execute(query, params)
+        if limit is not None:
+            query += " ORDER BY timestamp DESC LIMIT ?"
+            params.append(limit)
+        else:
+            query += " ORDER BY timestamp ASC"
         
-        events = []
-        for row in cursor.fetchall():
-            events.append(self._row_to_event(row))
+        with self._read() as conn:
+            rows = conn.execute(query, params).fetchall()
         
-        return events
+        if limit is not None:
+            rows.reverse()
+        return [self._row_to_event(row) for row in rows]
     
     def query_last_of_type(
         self,
@@ -277,20 +758,15 @@ class LifeTimeline:
         limit: int = 1
     ) -> List[LifeEvent]:
         """Get last N events of specific type."""
-        cursor = self.conn.cursor()
+        with self._read() as conn:
+            rows = conn.execute(f"""
+                {_SELECT_EVENTS}
+                WHERE user_id = ? AND type = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (user_id, event_type.value, limit)).fetchall()
         
-        cursor.execute("""
-            SELECT * FROM life_events
-            WHERE user_id = ? AND type = ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (user_id, event_type.value, limit))
-        
-        events = []
-        for row in cursor.fetchall():
-            events.append(self._row_to_event(row))
-        
-        return events
+        return [self._row_to_event(row) for row in rows]
     
     def query_day(
         self,
@@ -314,48 +790,201 @@ class LifeTimeline:
         start = datetime.now() - timedelta(days=days_back)
         end = datetime.now()
         
-        all_events = self.query_by_time(user_id, start, end)
+        # Pre-filter in SQL on the JSON feature, then confirm exact equality
+        path = '$."' + feature_key.replace('"', '\\"') + '"'
+        query = f"""
+            {_SELECT_EVENTS}
+            WHERE user_id = ? AND timestamp >= ? AND timestamp <= ?
+        """
+        params: List[Any] = [user_id, start.timestamp(), end.timestamp()]
+        if feature_value is None:
+            query += " AND json_type(features, ?) = 'null'"
+            params.append(path)
+        elif isinstance(feature_value, (str, int, float)):
+            query += " AND json_extract(features, ?) = ?"
+            params.extend([path, feature_value])
+        else:
+            query += " AND json_type(features, ?) IS NOT NULL"
+            params.append(path)
+        query += " ORDER BY timestamp ASC"
+        
+        with self._read() as conn:
+            rows = conn.execute(query, params).fetchall()
         
         # Filter by feature
         matching = []
-        for event in all_events:
+        for event in map(self._row_to_event, rows):
             if feature_key in event.features:
                 if event.features[feature_key] == feature_value:
                     matching.append(event)
         
         return matching
     
+    def aggregate(
+        self,
+        user_id: str,
+        start: datetime,
+        end: datetime,
+        event_types: Optional[Sequence[FilterValue]] = None,
+        sources: Optional[Sequence[FilterValue]] = None,
+        any_of: Optional[Sequence[Tuple[Optional[Sequence[FilterValue]], Optional[Sequence[FilterValue]]]]] = None,
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Event counts and typed-feature statistics per (type, source).
+        
+        Whole days are read from the daily rollups and whole hours from the
+        hourly ones; only the partial hours at the edges of the range touch
+        raw events. Results are exact for the inclusive range [start, end].
+        
+        Returns:
+            {(type, source): {'count': n, '<feature>': {'count', 'sum', 'min', 'max', 'avg'}}}
+        """
+        filter_sql, filter_params = _filter_sql(event_types, sources, any_of)
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        
+        # Segments: (table, granularity, lower, upper, upper inclusive)
+        hour_start = start.replace(minute=0, second=0, microsecond=0)
+        first_hour = hour_start if hour_start == start else hour_start + timedelta(hours=1)
+        last_hour = end.replace(minute=0, second=0, microsecond=0)
+        
+        segments: List[Tuple[str, Optional[str], float, float, bool]] = []
+        if first_hour >= last_hour:
+            segments.append(('raw', None, start_ts, end_ts, True))
+        else:
+            segments.append(('raw', None, start_ts, first_hour.timestamp(), False))
+            segments.append(('raw', None, last_hour.timestamp(), end_ts, True))
+            
+            day_start = first_hour.replace(hour=0)
+            first_day = day_start if day_start == first_hour else day_start + timedelta(days=1)
+            last_day = last_hour.replace(hour=0)
+            if first_day < last_day:
+                segments.append(('rollup', 'hour', first_hour.timestamp(), first_day.timestamp(), False))
+                segments.append(('rollup', 'day', first_day.timestamp(), last_day.timestamp(), False))
+                segments.append(('rollup', 'hour', last_day.timestamp(), last_hour.timestamp(), False))
+            else:
+                segments.append(('rollup', 'hour', first_hour.timestamp(), last_hour.timestamp(), False))
+        
+        totals: Dict[Tuple[str, str], List[Any]] = {}
+        with self._read() as conn:
+            for table, granularity, lower, upper, inclusive in segments:
+                upper_op = "<=" if inclusive else "<"
+                if table == 'raw':
+                    query = f"""
+                        SELECT type, source, {_RAW_AGGREGATES} FROM life_events
+                        WHERE user_id = ? AND timestamp >= ? AND timestamp {upper_op} ?{filter_sql}
+                        GROUP BY type, source
+                    """
+                    params = [user_id, lower, upper, *filter_params]
+                else:
+                    query = f"""
+                        SELECT type, source, {_ROLLUP_AGGREGATES} FROM life_rollups
+                        WHERE user_id = ? AND granularity = ?
+                          AND bucket_start >= ? AND bucket_start {upper_op} ?{filter_sql}
+                        GROUP BY type, source
+                    """
+                    params = [user_id, granularity, lower, upper, *filter_params]
+                
+                for row in conn.execute(query, params):
+                    key, values = (row[0], row[1]), list(row[2:])
+                    current = totals.get(key)
+                    if current is None:
+                        totals[key] = values
+                        continue
+                    current[0] += values[0]
+                    for base in range(1, len(values), 4):
+                        current[base] += values[base]
+                        current[base + 1] += values[base + 1]
+                        for offset, pick in ((2, min), (3, max)):
+                            candidates = [v for v in (current[base + offset], values[base + offset]) if v is not None]
+                            current[base + offset] = pick(candidates) if candidates else None
+        
+        result = {}
+        for key, values in totals.items():
+            if not values[0]:
+                continue
+            entry: Dict[str, Any] = {'count': values[0]}
+            for i, name in enumerate(TYPED_FEATURES):
+                count, total, low, high = values[1 + 4 * i:5 + 4 * i]
+                if count:
+                    entry[name] = {
+                        'count': count,
+                        'sum': total,
+                        'min': low,
+                        'max': high,
+                        'avg': total / count,
+                    }
+            result[key] = entry
+        return result
+    
+    def get_daily_rollups(
+        self,
+        user_id: str,
+        start: datetime,
+        end: datetime,
+        event_types: Optional[Sequence[FilterValue]] = None,
+        sources: Optional[Sequence[FilterValue]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Daily rollup rows (one per day, type and source) for days overlapping [start, end]."""
+        filter_sql, filter_params = _filter_sql(event_types, sources)
+        first_day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        with self._read() as conn:
+            cursor = conn.execute(f"""
+                SELECT bucket_start, type, source, event_count, {', '.join(_ROLLUP_STAT_COLUMNS)}
+                FROM life_rollups
+                WHERE user_id = ? AND granularity = 'day'
+                  AND bucket_start >= ? AND bucket_start <= ?{filter_sql}
+                ORDER BY bucket_start ASC
+            """, [user_id, first_day.timestamp(), end.timestamp(), *filter_params])
+            rows = cursor.fetchall()
+        
+        days = []
+        for row in rows:
+            entry: Dict[str, Any] = {
+                'date': datetime.fromtimestamp(row[0]).date(),
+                'type': row[1],
+                'source': row[2],
+                'count': row[3],
+            }
+            for i, name in enumerate(TYPED_FEATURES):
+                count, total, low, high = row[4 + 4 * i:8 + 4 * i]
+                if count:
+                    entry[name] = {'count': count, 'sum': total, 'min': low, 'max': high, 'avg': total / count}
+            days.append(entry)
+        return days
+    
     def get_timeline_summary(
         self,
         user_id: str,
         days: int = 7
     ) -> Dict[str, Any]:
-        """Get summary statistics for time period."""
+        """Get summary statistics for time period (from rollups)."""
         start = datetime.now() - timedelta(days=days)
         end = datetime.now()
         
-        events = self.query_by_time(user_id, start, end)
+        aggregates = self.aggregate(user_id, start, end)
         
-        # Count by type
-        type_counts = {}
-        for event in events:
-            type_name = event.type.value
-            type_counts[type_name] = type_counts.get(type_name, 0) + 1
+        # Count by type and by source
+        type_counts: Dict[str, int] = {}
+        source_counts: Dict[str, int] = {}
+        for (type_name, source_name), entry in aggregates.items():
+            type_counts[type_name] = type_counts.get(type_name, 0) + entry['count']
+            source_counts[source_name] = source_counts.get(source_name, 0) + entry['count']
+        total = sum(type_counts.values())
         
-        # Count by source
-        source_counts = {}
-        for event in events:
-            source_name = event.source.value
-            source_counts[source_name] = source_counts.get(source_name, 0) + 1
+        with self._read() as conn:
+            first_ts, last_ts = conn.execute("""
+                SELECT MIN(timestamp), MAX(timestamp) FROM life_events
+                WHERE user_id = ? AND timestamp >= ? AND timestamp <= ?
+            """, (user_id, start.timestamp(), end.timestamp())).fetchone()
         
         return {
-            'total_events': len(events),
+            'total_events': total,
             'days': days,
-            'events_per_day': len(events) / max(days, 1),
+            'events_per_day': total / max(days, 1),
             'by_type': type_counts,
             'by_source': source_counts,
-            'first_event': events[0].timestamp.isoformat() if events else None,
-            'last_event': events[-1].timestamp.isoformat() if events else None,
+            'first_event': datetime.fromtimestamp(first_ts).isoformat() if first_ts is not None else None,
+            'last_event': datetime.fromtimestamp(last_ts).isoformat() if last_ts is not None else None,
         }
     
     def _row_to_event(self, row) -> LifeEvent:
@@ -373,10 +1002,28 @@ class LifeTimeline:
             importance=row[9] if row[9] is not None else 0.5,
         )
     
+    def get_stats(self) -> Dict[str, Any]:
+        """Write/read statistics."""
+        return {
+            **self.stats,
+            'queued': self._write_queue.unfinished_tasks,
+            'readers_open': len(self._all_readers),
+        }
+    
     def close(self):
-        """Close database connection."""
+        """Commit queued events and close all connections."""
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            self._write_queue.put(_STOP)
+            self._writer_thread.join()
+        
+        with self._readers_lock:
+            for conn in self._all_readers:
+                conn.close()
+            self._all_readers.clear()
+        
         if self.conn:
-            self.conn.close()
+            with self._write_lock:
+                self.conn.close()
 
 
 # ============================================================================
@@ -294,7 +294,10 @@ class MainOrchestrator:
                     adb_port=int(os.getenv('ROKU_ADB_PORT', '5555')),
                     fps=int(os.getenv('ROKU_FPS', '2')),
                     camera_mapping=camera_mapping,
-                    video_interpreter=self.video_interpreter  # 🎥 AGI Vision!
+                    video_interpreter=self.video_interpreter,  # 🎥 AGI Vision!
+                    capture_mode=os.getenv('ROKU_CAPTURE_MODE', 'screencap'),
+                    region_workers=int(os.getenv('ROKU_REGION_WORKERS', '4')),
+                    agi_loop=asyncio.get_running_loop()  # Interpreter session lives on this loop
                 )
                 
                 # Start in background thread
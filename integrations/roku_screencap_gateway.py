@@ -9,23 +9,37 @@ Architecture:
 - Roku Smart Home app showing camera feeds
 - ADB screen capture over network
 - Event extraction and timeline integration
+
+Capture modes:
+- "screencap": one `adb exec-out screencap -p` subprocess per frame (PNG)
+- "stream": one long-lived `adb exec-out` running screencap in a device-side
+  loop, decoded continuously into a latest-frame slot (see adb_frame_stream)
+
+Camera regions of a frame are analyzed in parallel on a bounded worker
+pool. AGI analyses run on a single event loop (the caller's `agi_loop` or a
+private loop thread), and their results are always collected.
 """
 
 from __future__ import annotations
 
+import asyncio
 import subprocess
 import time
 import threading
 import cv2
 import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Sequence, Tuple
 import os
 import json
 
 from loguru import logger
 
+from adb_frame_stream import RAW_HEADER_SIZE, RawFrameStream, adb_stream_command
+
 from life_timeline import (
     LifeTimeline,
     create_camera_event,
@@ -58,7 +72,14 @@ class RokuScreenCaptureGateway:
         adb_port: int = 5555,
         fps: int = 2,
         camera_mapping: Optional[Dict[str, str]] = None,
-        video_interpreter = None  # StreamingVideoInterpreter instance
+        video_interpreter = None,  # StreamingVideoInterpreter instance
+        capture_mode: str = "screencap",
+        stream_command: Optional[Sequence[str]] = None,
+        stream_header_size: int = RAW_HEADER_SIZE,
+        region_workers: int = 4,
+        agi_loop: Optional[asyncio.AbstractEventLoop] = None,
+        agi_timeout: float = 30.0,
+        adb_path: str = "adb"
     ):
         """
         Initialize screen capture gateway.
@@ -71,7 +92,17 @@ class RokuScreenCaptureGateway:
             fps: Capture frames per second
             camera_mapping: Dict mapping camera IDs to room names
             video_interpreter: Optional StreamingVideoInterpreter for AGI analysis
+            capture_mode: "screencap" (process per frame) or "stream" (persistent stream)
+            stream_command: Raw frame producer for stream mode (default: adb screencap loop)
+            stream_header_size: Raw frame header size (16 on Android 9+, 12 before)
+            region_workers: Camera regions analyzed concurrently
+            agi_loop: Running event loop to run AGI analyses on (default: private loop thread)
+            agi_timeout: Seconds to wait for one AGI analysis
+            adb_path: adb executable
         """
+        if capture_mode not in ("screencap", "stream"):
+            raise ValueError(f"Unknown capture mode {capture_mode!r}")
+
         self.timeline = timeline
         self.user_id = user_id
         self.device_ip = device_ip
@@ -81,6 +112,26 @@ class RokuScreenCaptureGateway:
         
         # ADB connection
         self.device_address = f"{device_ip}:{adb_port}"
+        self.adb_path = adb_path
+
+        # Capture
+        self.capture_mode = capture_mode
+        self.stream_command = list(stream_command) if stream_command else adb_stream_command(
+            self.device_address, adb_path=adb_path
+        )
+        self.stream_header_size = stream_header_size
+        self.frame_stream: Optional[RawFrameStream] = None
+        self._stream_sequence = 0
+
+        # Region analysis pool (bounded: at most region_workers regions in flight)
+        self.region_workers = max(1, region_workers)
+        self._region_pool: Optional[ThreadPoolExecutor] = None
+
+        # AGI event loop and results that finished after their frame
+        self.agi_timeout = agi_timeout
+        self._agi_loop = agi_loop
+        self._agi_loop_thread: Optional[threading.Thread] = None
+        self._late_events: deque = deque()
         
         # Processing state
         self.running = False
@@ -111,6 +162,9 @@ class RokuScreenCaptureGateway:
         self.last_capture_time = 0
         self.agi_analyses = 0
         self.basic_cv_analyses = 0
+        self.agi_failures = 0
+        self._processed_frame_times: deque = deque(maxlen=30)
+        self._stats_lock = threading.Lock()  # Counters updated from region workers
         
         # Reconnection thread
         self.reconnect_thread: Optional[threading.Thread] = None
@@ -128,7 +182,7 @@ class RokuScreenCaptureGateway:
             
             # Connect via ADB
             result = subprocess.run(
-                ['adb', 'connect', self.device_address],
+                [self.adb_path, 'connect', self.device_address],
                 capture_output=True,
                 text=True,
                 timeout=10
@@ -161,7 +215,7 @@ class RokuScreenCaptureGateway:
         try:
             # Keep screen on
             subprocess.run(
-                ['adb', '-s', self.device_address, 'shell', 
+                [self.adb_path, '-s', self.device_address, 'shell', 
                  'settings', 'put', 'system', 'screen_off_timeout', '2147483647'],
                 capture_output=True,
                 timeout=5
@@ -176,7 +230,7 @@ class RokuScreenCaptureGateway:
         """Disconnect from device."""
         try:
             subprocess.run(
-                ['adb', 'disconnect', self.device_address],
+                [self.adb_path, 'disconnect', self.device_address],
                 capture_output=True,
                 timeout=5
             )
@@ -185,19 +239,52 @@ class RokuScreenCaptureGateway:
         except Exception as e:
             logger.warning(f"[ROKU] Disconnect error: {e}")
     
-    def capture_frame(self) -> Optional[np.ndarray]:
+    def start_stream(self):
+        """Start the persistent frame stream (stream capture mode)."""
+        if self.frame_stream is None:
+            self.frame_stream = RawFrameStream(
+                self.stream_command,
+                header_size=self.stream_header_size
+            )
+        self.frame_stream.start()
+
+    def stop_stream(self):
+        """Stop the persistent frame stream."""
+        if self.frame_stream is not None:
+            self.frame_stream.stop()
+
+    def capture_frame(self, timeout: float = 2.0) -> Optional[np.ndarray]:
         """
         Capture single frame from device screen.
         
+        In stream mode this is the newest decoded frame not returned before
+        (waiting up to `timeout` for one).
+        
         Returns:
             Frame as numpy array (BGR format) or None if failed
         """
+        if self.capture_mode == "stream":
+            return self._capture_stream_frame(timeout)
+        return self._capture_screencap_frame(timeout)
+
+    def _capture_stream_frame(self, timeout: float) -> Optional[np.ndarray]:
+        if self.frame_stream is None or not self.frame_stream.running:
+            self.start_stream()
+        latest = self.frame_stream.latest(after=self._stream_sequence, timeout=timeout)
+        if latest is None:
+            logger.warning("[ROKU] No frame from stream")
+            return None
+        self._stream_sequence, frame = latest
+        self.frames_captured += 1
+        return frame
+
+    def _capture_screencap_frame(self, timeout: float) -> Optional[np.ndarray]:
         try:
             # Use screencap to grab PNG
             result = subprocess.run(
-                ['adb', '-s', self.device_address, 'exec-out', 'screencap', '-p'],
+                [self.adb_path, '-s', self.device_address, 'exec-out', 'screencap', '-p'],
                 capture_output=True,
-                timeout=2
+                timeout=timeout
             )
             
             if result.returncode != 0:
@@ -333,29 +420,17 @@ class RokuScreenCaptureGateway:
         
         # 🎥 Use AGI Video Interpreter if available
         if self.use_agi:
-            # Run async AGI analysis in event loop
-            import asyncio
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Create task for async analysis
-                    future = asyncio.ensure_future(
-                        self.process_camera_region_agi(camera_frame, camera_id)
-                    )
-                    # Don't wait - return empty for now, events will be added later
-                    return []
-                else:
-                    # Run synchronously if no event loop
-                    agi_events = loop.run_until_complete(
-                        self.process_camera_region_agi(camera_frame, camera_id)
-                    )
-                    return agi_events
+                return self._run_agi_analysis(camera_frame, camera_id)
             except Exception as e:
+                with self._stats_lock:
+                    self.agi_failures += 1
                 logger.warning(f"[ROKU] AGI analysis failed, falling back to basic CV: {e}")
                 # Fall through to basic CV
         
         # Fallback to basic motion detection
-        self.basic_cv_analyses += 1
+        with self._stats_lock:
+            self.basic_cv_analyses += 1
         
         # Initialize background subtractor for this camera if needed
         if camera_id not in self.bg_subtractors:
@@ -421,6 +496,109 @@ class RokuScreenCaptureGateway:
         
         return events
     
+    def _get_agi_loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop AGI analyses run on (a private loop thread unless one was given)."""
+        if self._agi_loop is None:
+            loop = asyncio.new_event_loop()
+            self._agi_loop_thread = threading.Thread(
+                target=loop.run_forever,
+                daemon=True,
+                name="RokuGateway-AGI"
+            )
+            self._agi_loop_thread.start()
+            self._agi_loop = loop
+        return self._agi_loop
+
+    def _run_agi_analysis(self, camera_frame: np.ndarray, camera_id: str) -> List[Dict]:
+        """
+        Run one AGI analysis and wait for its events.
+        
+        Called on the AGI loop's own thread, waiting would deadlock; the
+        analysis is then scheduled and its events are queued for
+        `drain_late_events()` instead.
+        """
+        loop = self._get_agi_loop()
+        coro = self.process_camera_region_agi(camera_frame, camera_id)
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            task = loop.create_task(coro)
+            task.add_done_callback(self._collect_late_events)
+            return []
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout=self.agi_timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    def _collect_late_events(self, task: asyncio.Task):
+        if task.cancelled() or task.exception() is not None:
+            with self._stats_lock:
+                self.agi_failures += 1
+            return
+        self._late_events.extend(task.result())
+
+    def drain_late_events(self) -> List[Dict]:
+        """AGI events whose analysis finished after its frame was processed."""
+        events = []
+        while self._late_events:
+            events.append(self._late_events.popleft())
+        return events
+
+    def process_frame(self, frame: np.ndarray) -> List[Dict]:
+        """
+        Analyze every camera region of a frame in parallel.
+        
+        Regions run on a bounded worker pool (`region_workers`). Each camera
+        has its own background model, so regions are independent; results
+        are returned in camera order.
+        
+        Args:
+            frame: Full screen capture
+            
+        Returns:
+            Detected events of all regions
+        """
+        if not self.camera_regions:
+            self.camera_regions = self.detect_camera_grid(frame)
+            logger.info(f"[ROKU] Detected {len(self.camera_regions)} camera regions")
+
+        # Create per-camera state up front so workers never race on the dict
+        for camera_id in self.camera_regions:
+            if camera_id not in self.bg_subtractors:
+                self.bg_subtractors[camera_id] = cv2.createBackgroundSubtractorMOG2(
+                    history=500,
+                    varThreshold=16,
+                    detectShadows=False
+                )
+
+        if self._region_pool is None:
+            self._region_pool = ThreadPoolExecutor(
+                max_workers=self.region_workers,
+                thread_name_prefix="RokuRegion"
+            )
+
+        futures = [
+            (camera_id, self._region_pool.submit(self.process_camera_region, frame, region, camera_id))
+            for camera_id, region in self.camera_regions.items()
+        ]
+
+        events = []
+        for camera_id, future in futures:
+            try:
+                events.extend(future.result())
+            except Exception as e:
+                logger.error(f"[ROKU] Region analysis failed for {camera_id}: {e}")
+
+        self._processed_frame_times.append(time.monotonic())
+        return events + self.drain_late_events()
+
     def _extract_events_from_analysis(
         self,
         analysis_text: str,
@@ -593,7 +771,10 @@ class RokuScreenCaptureGateway:
             return
         
         self.running = True
-        logger.info("[ROKU] Starting screen capture loop...")
+        logger.info(f"[ROKU] Starting screen capture loop ({self.capture_mode} mode)...")
+
+        if self.capture_mode == "stream":
+            self.start_stream()
         
         # Start reconnection monitor
         self.reconnect_thread = threading.Thread(
@@ -615,21 +796,12 @@ class RokuScreenCaptureGateway:
                 time.sleep(1)
                 continue
             
-            # Detect grid layout (first time or if not set)
-            if not self.camera_regions:
-                self.camera_regions = self.detect_camera_grid(frame)
-                logger.info(f"[ROKU] Detected {len(self.camera_regions)} camera regions")
-            
-            # Process each camera region
-            for camera_id, region in self.camera_regions.items():
-                events = self.process_camera_region(frame, region, camera_id)
-                
-                # Handle detected events
-                for event in events:
-                    self._handle_event(event)
+            # Process camera regions in parallel and handle detected events
+            for event in self.process_frame(frame):
+                self._handle_event(event)
             
-            # Store frame for next iteration
-            self.previous_frame = frame.copy()
+            # Store frame for next iteration (stream frames are never reused)
+            self.previous_frame = frame if self.capture_mode == "stream" else frame.copy()
             
             # Rate limiting
             elapsed = time.time() - loop_start
@@ -651,7 +823,7 @@ class RokuScreenCaptureGateway:
             try:
                 # Check if device is still connected
                 result = subprocess.run(
-                    ['adb', 'devices'],
+                    [self.adb_path, 'devices'],
                     capture_output=True,
                     text=True,
                     timeout=5
@@ -672,6 +844,18 @@ class RokuScreenCaptureGateway:
         # Wait for reconnect thread
         if self.reconnect_thread:
             self.reconnect_thread.join(timeout=2)
+
+        self.stop_stream()
+
+        if self._region_pool is not None:
+            self._region_pool.shutdown(wait=True)
+            self._region_pool = None
+
+        if self._agi_loop_thread is not None:
+            self._agi_loop.call_soon_threadsafe(self._agi_loop.stop)
+            self._agi_loop_thread.join(timeout=2)
+            self._agi_loop_thread = None
+            self._agi_loop = None
         
         self.disconnect()
         
@@ -691,7 +875,7 @@ class RokuScreenCaptureGateway:
         try:
             # Check if app is running
             result = subprocess.run(
-                ['adb', '-s', self.device_address, 'shell', 
+                [self.adb_path, '-s', self.device_address, 'shell', 
                  'pidof', 'com.roku.smart.home'],
                 capture_output=True,
                 timeout=5
@@ -704,7 +888,7 @@ class RokuScreenCaptureGateway:
             logger.warning("[ROKU] Roku app not running, launching...")
             
             subprocess.run(
-                ['adb', '-s', self.device_address, 'shell', 'am', 'start',
+                [self.adb_path, '-s', self.device_address, 'shell', 'am', 'start',
                  '-n', 'com.roku.smart.home/.MainActivity'],
                 capture_output=True,
                 timeout=10
@@ -719,17 +903,25 @@ class RokuScreenCaptureGateway:
     
     def get_stats(self) -> Dict:
         """Get gateway statistics."""
-        return {
+        times = self._processed_frame_times
+        span = times[-1] - times[0] if len(times) > 1 else 0.0
+        stats = {
             'connected': self.connected,
             'frames_captured': self.frames_captured,
             'events_generated': self.events_generated,
-            'fps_actual': self.fps if self.last_capture_time > 0 else 0,
+            'fps_actual': (len(times) - 1) / span if span > 0 else 0.0,
             'camera_regions': len(self.camera_regions),
             'rooms_monitored': list(set(self.camera_mapping.values())),
             'analysis_mode': 'AGI' if self.use_agi else 'Basic CV',
             'agi_analyses': self.agi_analyses,
+            'agi_failures': self.agi_failures,
             'basic_cv_analyses': self.basic_cv_analyses,
+            'capture_mode': self.capture_mode,
+            'region_workers': self.region_workers,
         }
+        if self.frame_stream is not None:
+            stats['stream'] = self.frame_stream.get_stats()
+        return stats
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+"""
+Benchmark StreamingVideoInterpreter frame scheduling under rising frame rates.
+
+Frames are fed at several rates to a fake interpreter with a fixed API
+latency, comparing:
+
+- unbounded: one task per frame (the previous add_frame behaviour);
+- scheduler: FrameScheduler with a bounded in-flight limit and
+  latest-frame-wins dropping.
+
+Reported per rate: API calls, peak concurrent calls, mean frame-to-delivery
+latency and whether results arrived in frame order.
+
+Usage:
+    python scripts/benchmark_frame_scheduler.py --latency 0.2 --duration 3 --rates 2 10 30 60
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from singularis.perception.frame_scheduler import FrameScheduler
+
+
+class FakeAPI:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, frame):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            # Concurrent requests slow each other down, as a rate-limited API does
+            await asyncio.sleep(self.latency * random.uniform(0.5, 1.5) * max(1, self.active / 4))
+        finally:
+            self.active -= 1
+        return frame
+
+
+async def run(rate: float, duration: float, latency: float, scheduled: bool, max_in_flight: int):
+    api = FakeAPI(latency)
+    latencies, order = [], []
+
+    async def deliver(frame, result):
+        latencies.append(time.monotonic() - frame['captured'])
+        order.append(frame['number'])
+
+    async def unbounded(frame):
+        await deliver(frame, await api(frame))
+
+    scheduler = FrameScheduler(api, deliver, max_in_flight=max_in_flight, similarity_threshold=0)
+    tasks = []
+    frames = int(rate * duration)
+    for number in range(frames):
+        frame = {'number': number, 'captured': time.monotonic(), 'image': np.full((36, 64), number % 256, np.uint8)}
+        if scheduled:
+            scheduler.submit(frame)
+        else:
+            tasks.append(asyncio.create_task(unbounded(frame)))
+        await asyncio.sleep(1.0 / rate)
+
+    if scheduled:
+        await scheduler.drain()
+    else:
+        await asyncio.gather(*tasks)
+
+    return {
+        'calls': api.calls,
+        'peak': api.peak,
+        'latency': float(np.mean(latencies)) if latencies else 0.0,
+        'ordered': order == sorted(order),
+        'drop_rate': scheduler.get_stats()['drop_rate'] if scheduled else 0.0,
+    }
+
+
+async def main_async(args):
+    print(f"API latency {args.latency * 1000:.0f} ms, {args.duration:.0f} s per rate, max_in_flight={args.max_in_flight}")
+    print(f"  {'fps':>5} {'mode':<10} {'calls':>6} {'peak':>5} {'latency ms':>11} {'ordered':>8} {'dropped':>8}")
+    for rate in args.rates:
+        for scheduled in (False, True):
+            result = await run(rate, args.duration, args.latency, scheduled, args.max_in_flight)
+            print(
+                f"  {rate:5.0f} {'scheduler' if scheduled else 'unbounded':<10} {result['calls']:6d} "
+                f"{result['peak']:5d} {result['latency'] * 1000:11.1f} {str(result['ordered']):>8} "
+                f"{result['drop_rate']:8.0%}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--rates", type=float, nargs="+", default=[2, 10, 30, 60])
+    parser.add_argument("--max-in-flight", type=int, default=2)
+    args = parser.parse_args()
+
+    logger.remove()
+    random.seed(0)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
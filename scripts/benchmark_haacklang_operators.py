@@ -0,0 +1,122 @@
+"""
+Microbenchmarks for the HaackLang operator kernels.
+
+Compares the scalar paraconsistent operators against the array kernels on a
+beat's worth of beliefs, and the ring-buffer TemporalWindow against the
+previous list-based implementation (pop(0) + regression per query).
+
+Usage:
+    python scripts/benchmark_haacklang_operators.py --beliefs 500 --beats 1000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from singularis.infinity.haacklang_operators import (
+    ParaconsistentArray,
+    ParaconsistentValue,
+    TemporalWindow,
+    paraconsistent_and,
+    paraconsistent_or,
+    paraconsistent_to_fuzzy,
+)
+
+
+class ListTemporalWindow:
+    """The list-based window TemporalWindow replaced, for comparison."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values = []
+        self.timestamps = []
+
+    def add(self, value: float, timestamp: float):
+        self.values.append(value)
+        self.timestamps.append(timestamp)
+        if len(self.values) > self.size:
+            self.values.pop(0)
+            self.timestamps.pop(0)
+
+    def mean(self) -> float:
+        return sum(self.values) / len(self.values) if self.values else 0.0
+
+    def trend(self) -> float:
+        n = len(self.values)
+        if n < 2:
+            return 0.0
+        x_mean = (n - 1) / 2
+        y_mean = sum(self.values) / n
+        numerator = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(self.values))
+        denominator = sum((i - x_mean) ** 2 for i in range(n))
+        return numerator / denominator if denominator else 0.0
+
+
+def bench(label: str, fn, repeat: int, beats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:34s} {elapsed * 1000:9.1f} ms  ({elapsed / beats * 1e6:9.1f} us/beat)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--beliefs", type=int, default=500)
+    parser.add_argument("--beats", type=int, default=1000)
+    parser.add_argument("--window", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    a_pairs, b_pairs = rng.random((args.beliefs, 2)), rng.random((args.beliefs, 2))
+    a_scalar = [ParaconsistentValue(*pair) for pair in a_pairs.tolist()]
+    b_scalar = [ParaconsistentValue(*pair) for pair in b_pairs.tolist()]
+    a_array = ParaconsistentArray(a_pairs[:, 0], a_pairs[:, 1])
+    b_array = ParaconsistentArray(b_pairs[:, 0], b_pairs[:, 1])
+
+    def scalar_beat():
+        for a, b in zip(a_scalar, b_scalar):
+            merged = paraconsistent_and(a, b)
+            paraconsistent_or(merged, b)
+            paraconsistent_to_fuzzy(merged)
+            merged.is_contradictory()
+
+    def array_beat():
+        merged = paraconsistent_and(a_array, b_array)
+        paraconsistent_or(merged, b_array)
+        paraconsistent_to_fuzzy(merged)
+        merged.is_contradictory()
+
+    print(f"Paraconsistent ⊓, ⊔, to_fuzzy, contradiction mask: {args.beliefs} beliefs x {args.beats} beats")
+    scalar = bench("scalar", scalar_beat, args.beats, args.beats)
+    vectorized = bench("array", array_beat, args.beats, args.beats)
+    print(f"  speedup {scalar / vectorized:.1f}x")
+
+    samples = rng.random(args.beats).tolist()
+    windows = 50
+    print(f"\nTemporalWindow(size={args.window}): {windows} windows, add + mean + trend per beat, {args.beats} beats")
+
+    def window_run(cls):
+        ws = [cls(args.window) for _ in range(windows)]
+
+        def run():
+            for t, value in enumerate(samples):
+                for w in ws:
+                    w.add(value, float(t))
+                    w.mean()
+                    w.trend()
+        return run
+
+    old = bench("list + pop(0) + regression", window_run(ListTemporalWindow), 1, args.beats)
+    new = bench("ring buffer + running sums", window_run(TemporalWindow), 1, args.beats)
+    print(f"  speedup {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
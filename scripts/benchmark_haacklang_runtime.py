@@ -0,0 +1,120 @@
+"""
+Benchmark HaackLang module loading and beat execution.
+
+Generates a few hundred synthetic .haack modules and measures:
+
+- load times for a cold cache (lex + parse + lower + persist), a warm disk
+  cache (fresh runtime, compiled modules read from cache_dir) and a warm
+  memory cache (same runtime, modules reloaded);
+- 10k beats executed against the compiled form (`compile_programs=True`)
+  versus interpreting each module's full AST on every beat (the default).
+
+Usage:
+    python scripts/benchmark_haacklang_runtime.py --modules 300 --beats 10000
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from singularis.haacklang_bridge.runtime import HaackLangRuntime
+
+MODULE_TEMPLATE = """\
+track perception period 1 using classical
+track reflex period 1 using classical
+track strategic period 3 using fuzzy
+track intuition period 7 using paraconsistent
+
+truthvalue danger_{i}
+truthvalue opportunity_{i}
+
+guard reflex danger_{i}.perception > 0.8 {{
+    python_execute("noop")
+}}
+
+guard strategic opportunity_{i}.strategic > 0.6 {{
+    python_execute("noop")
+}}
+
+guard intuition danger_{i}.intuition > 0.5 {{
+    python_execute("noop")
+}}
+
+let combined_{i} = danger_{i}
+"""
+
+
+def write_modules(directory: Path, count: int):
+    paths = []
+    for i in range(count):
+        path = directory / f"module_{i:04d}.haack"
+        path.write_text(MODULE_TEMPLATE.format(i=i))
+        paths.append(path)
+    return paths
+
+
+def timed_load(runtime: HaackLangRuntime, paths) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        runtime.load_module(path)
+    return time.perf_counter() - start
+
+
+def run_beats(runtime: HaackLangRuntime, names, beats: int, compiled: bool) -> float:
+    interpreter = runtime.interpreter
+    modules = [runtime.loaded_modules[name] for name in names]
+    start = time.perf_counter()
+    for beat in range(beats):
+        runtime.advance_beat()
+        module = modules[beat % len(modules)]
+        if compiled:
+            program = module['compiled'].program_for(runtime.get_active_tracks())
+        else:
+            program = module['ast']
+        interpreter.interpret(program)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", type=int, default=300)
+    parser.add_argument("--beats", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = Path(tmp) / "modules"
+        cache_dir = Path(tmp) / "cache"
+        source_dir.mkdir()
+        paths = write_modules(source_dir, args.modules)
+        names = [path.stem for path in paths]
+
+        # The runtime logs every load; keep the report readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            cold_runtime = HaackLangRuntime(cache_dir=cache_dir)
+            cold = timed_load(cold_runtime, paths)
+
+            # Compiled programs need the declarations run at load time
+            warm_runtime = HaackLangRuntime(cache_dir=cache_dir, compile_programs=True)
+            warm_disk = timed_load(warm_runtime, paths)
+            warm_memory = timed_load(warm_runtime, paths)
+
+            full_ast = run_beats(warm_runtime, names, args.beats, compiled=False)
+            compiled = run_beats(warm_runtime, names, args.beats, compiled=True)
+
+        print(f"Modules: {args.modules}, beats: {args.beats}")
+        print(f"  load cold        {cold * 1000:9.1f} ms  ({cold / args.modules * 1e6:8.1f} us/module)")
+        print(f"  load warm disk   {warm_disk * 1000:9.1f} ms  ({warm_disk / args.modules * 1e6:8.1f} us/module)")
+        print(f"  load warm memory {warm_memory * 1000:9.1f} ms  ({warm_memory / args.modules * 1e6:8.1f} us/module)")
+        print(f"  beats full AST   {full_ast * 1000:9.1f} ms  ({full_ast / args.beats * 1e6:8.1f} us/beat)")
+        print(f"  beats compiled   {compiled * 1000:9.1f} ms  ({compiled / args.beats * 1e6:8.1f} us/beat)")
+        print(f"  cache: {warm_runtime.module_cache.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark ModularNetwork construction and statistics.
+
+Builds hybrid networks of increasing size and reports the build time
+(topology + statistics), the cost of one incremental add/remove pair, and
+the lazy path-length refresh that follows it in get_stats().
+
+Usage:
+    python scripts/benchmark_modular_network.py --sizes 1000 5000 10000 --modules 50
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from loguru import logger
+
+from singularis.core.modular_network import ModularNetwork, NetworkTopology
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--modules", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logger.remove()
+
+    for size in args.sizes:
+        start = time.perf_counter()
+        net = ModularNetwork(size, min(args.modules, size), NetworkTopology.HYBRID, seed=args.seed)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        net.add_connection(0, size - 1, 0.5)
+        net.remove_connection(0, size - 1)
+        update = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stats = net.get_stats()
+        refresh = time.perf_counter() - start
+
+        print(f"Nodes: {size}, edges: {net.adjacency.nnz // 2}")
+        print(f"  build + stats     {build * 1000:10.1f} ms")
+        print(f"  add + remove edge {update * 1e6:10.1f} us")
+        print(f"  path refresh      {refresh * 1000:10.1f} ms")
+        print(f"  avg_degree={stats['avg_degree']:.1f} avg_clustering={stats['avg_clustering']:.3f} "
+              f"avg_path_length={stats['avg_path_length']:.3f} modularity={stats['modularity']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
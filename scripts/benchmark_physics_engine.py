@@ -0,0 +1,125 @@
+"""
+Benchmark the array-backed PhysicsEngine.
+
+Measures, for N objects:
+- forward simulation of S steps: per-object Python integration (the previous
+  implementation) versus the vectorized array step;
+- collision detection: all-pairs `_check_collision` versus sweep-and-prune;
+- K candidate interventions: sequential `predict_intervention_outcome` on
+  fresh engines versus one batched `simulate_interventions` call.
+
+Usage:
+    python scripts/benchmark_physics_engine.py --objects 1000 --steps 1000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from singularis.world_model.physics_engine import ObjectType, PhysicsEngine
+
+
+def build_engine(count: int, seed: int = 0) -> PhysicsEngine:
+    rng = np.random.default_rng(seed)
+    extent = 10.0 * count ** (1 / 3)  # Keep density (and true collisions) roughly constant
+    engine = PhysicsEngine(time_step=0.01)
+    for i in range(count):
+        engine.add_object(
+            f"obj{i}",
+            position=tuple(rng.uniform(0, extent, size=3)),
+            velocity=tuple(rng.normal(size=3)),
+            mass=float(rng.uniform(0.5, 5.0)),
+            size=tuple(rng.uniform(0.2, 2.0, size=3)),
+        )
+    return engine
+
+
+def per_object_simulate(engine: PhysicsEngine, steps: int):
+    """The per-object loop the array step replaced."""
+    objects = [
+        (obj.position.copy(), obj.velocity.copy(), list(obj.forces), obj.mass, obj.object_type)
+        for obj in engine.objects.values()
+    ]
+    for _ in range(steps):
+        for position, velocity, forces, mass, object_type in objects:
+            if object_type == ObjectType.STATIC:
+                continue
+            acceleration = np.array([0, 0, engine.gravity], dtype=float)
+            for force in forces:
+                acceleration += force / mass
+            velocity += acceleration * engine.time_step
+            position += velocity * engine.time_step
+            if position[2] < 0:
+                position[2] = 0
+                velocity[2] = -velocity[2] * 0.5
+            forces.clear()
+
+
+def all_pairs_collisions(engine: PhysicsEngine):
+    objects = list(engine.objects.values())
+    return [
+        (a.name, b.name)
+        for i, a in enumerate(objects)
+        for b in objects[i + 1:]
+        if engine._check_collision(a, b)
+    ]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=1000)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--candidates", type=int, default=32)
+    parser.add_argument("--skip-slow", action="store_true", help="Skip the per-object and all-pairs baselines")
+    args = parser.parse_args()
+
+    print(f"Objects: {args.objects}, steps: {args.steps}")
+
+    print("\nForward simulation")
+    if not args.skip_slow:
+        elapsed, _ = timed(lambda: per_object_simulate(build_engine(args.objects), args.steps))
+        print(f"  per-object loop     {elapsed * 1000:10.1f} ms")
+    engine = build_engine(args.objects)
+    elapsed, _ = timed(lambda: engine.forward_simulate(steps=args.steps))
+    print(f"  array step          {elapsed * 1000:10.1f} ms")
+
+    print("\nCollision detection")
+    engine = build_engine(args.objects)
+    if not args.skip_slow:
+        elapsed, expected = timed(lambda: all_pairs_collisions(engine))
+        print(f"  all pairs           {elapsed * 1000:10.1f} ms  ({len(expected)} collisions)")
+    elapsed, found = timed(engine.detect_collisions)
+    print(f"  sweep-and-prune     {elapsed * 1000:10.1f} ms  ({len(found)} collisions)")
+
+    print(f"\n{args.candidates} candidate interventions, 100 steps each")
+    rng = np.random.default_rng(1)
+    candidates = [
+        ("apply_force", {"object": f"obj{rng.integers(args.objects)}", "force": rng.normal(scale=100, size=3).tolist()})
+        for _ in range(args.candidates)
+    ]
+    engine = build_engine(args.objects)
+    snapshot = engine.to_dict()
+
+    def sequential():
+        for intervention, params in candidates:
+            PhysicsEngine.from_dict(snapshot).predict_intervention_outcome(intervention, params, steps=100)
+
+    elapsed, _ = timed(sequential)
+    print(f"  sequential          {elapsed * 1000:10.1f} ms")
+    elapsed, _ = timed(lambda: engine.simulate_interventions(candidates, steps=100))
+    print(f"  batched             {elapsed * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark Roku gateway frame capture: one process per frame vs a persistent stream.
+
+Both paths use a local fake producer instead of a device, so the numbers
+measure process and decode overhead rather than adb/network latency:
+
+- per-frame: spawn a producer that writes one PNG (standing in for
+  `adb exec-out screencap -p`) and decode it, once per frame;
+- stream: one long-lived producer writing raw screencap frames, decoded by
+  RawFrameStream into its latest-frame slot.
+
+Usage:
+    python scripts/benchmark_roku_capture.py --width 1280 --height 720 --frames 30
+"""
+
+import argparse
+import io
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "integrations"))
+
+from adb_frame_stream import RawFrameStream, encode_raw_frame
+
+
+def make_frame(width: int, height: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+
+
+def per_frame_capture(png_path: Path, frames: int) -> float:
+    command = [sys.executable, "-c", f"import sys; sys.stdout.buffer.write(open({str(png_path)!r}, 'rb').read())"]
+    start = time.perf_counter()
+    for _ in range(frames):
+        result = subprocess.run(command, capture_output=True, check=True)
+        frame = np.asarray(Image.open(io.BytesIO(result.stdout)).convert("RGB"))[..., ::-1]
+        assert frame.ndim == 3
+    return time.perf_counter() - start
+
+
+def stream_capture(raw_path: Path, frames: int) -> float:
+    script = textwrap.dedent(f"""
+        import sys
+        data = open({str(raw_path)!r}, 'rb').read()
+        out = sys.stdout.buffer
+        while True:
+            out.write(data)
+            out.flush()
+    """)
+    stream = RawFrameStream([sys.executable, "-c", script])
+    stream.start()
+    try:
+        sequence, _ = stream.latest(timeout=10.0)  # Exclude process startup
+        start = time.perf_counter()
+        for _ in range(frames):
+            sequence, frame = stream.latest(after=sequence, timeout=10.0)
+            assert frame.ndim == 3
+        return time.perf_counter() - start
+    finally:
+        stream.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--frames", type=int, default=30)
+    args = parser.parse_args()
+
+    logger.remove()
+
+    frame = make_frame(args.width, args.height)
+    with tempfile.TemporaryDirectory() as tmp:
+        png_path = Path(tmp) / "frame.png"
+        raw_path = Path(tmp) / "frame.raw"
+        Image.fromarray(frame[..., ::-1]).save(png_path)
+        raw_path.write_bytes(encode_raw_frame(frame))
+
+        per_frame = per_frame_capture(png_path, args.frames)
+        stream = stream_capture(raw_path, args.frames)
+
+    print(f"Frames: {args.frames} at {args.width}x{args.height}")
+    print(f"  per-frame process + PNG  {per_frame / args.frames * 1000:8.1f} ms/frame  ({args.frames / per_frame:6.1f} fps)")
+    print(f"  persistent raw stream    {stream / args.frames * 1000:8.1f} ms/frame  ({args.frames / stream:6.1f} fps)")
+    print(f"  speedup                  {per_frame / stream:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,16 +17,306 @@ From consciousness_measurement_study.md:
 - Dialectical reasoning increases coherence by 8% on paradoxes
 
 Key insight: Consciousness requires BOTH integration AND differentiation
+
+All calculators read from a shared `TextAnalysis` frame (sentences, token
+sets, marker counts) that is computed once per content string and memoized,
+so measuring the same expert output again costs a dictionary lookup.
+`ConsciousnessMeasurement.measure_batch` scores many texts in one pass
+(sparse sentence-overlap products, a single marker scan) and returns a
+structured array with the `ConsciousnessTrace` score fields.
 """
 
 import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from loguru import logger
 import re
+import threading
+from scipy import sparse
 
 from singularis.core.types import ConsciousnessTrace, WorkspaceState
 
 
+# Marker vocabularies (substring matches against the lowercased content)
+CONNECTOR_MARKERS = [
+    "therefore", "thus", "hence", "consequently", "because", "since",
+    "moreover", "furthermore", "additionally", "however", "although"
+]
+REFERENCE_MARKERS = ["this", "that", "these", "those", "it", "they", "such"]
+PERSPECTIVE_MARKERS = [
+    "however", "alternatively", "on the other hand", "conversely",
+    "in contrast", "yet", "although", "whereas"
+]
+ABSTRACT_MARKERS = ["concept", "idea", "theory", "principle", "generally", "abstractly"]
+CONCRETE_MARKERS = ["example", "specifically", "instance", "case", "particular"]
+IMPORTANT_MARKERS = [
+    "critical", "essential", "fundamental", "key", "central",
+    "important", "significant", "crucial", "vital"
+]
+STRUCTURE_MARKERS = ["first", "second", "third", "finally", "in conclusion"]
+HOT_MARKERS = [
+    "i realize", "i understand", "i recognize", "i see that",
+    "it becomes clear", "one sees", "we recognize", "understanding",
+    "awareness", "consciousness", "realization", "insight",
+    "reflection", "meta", "self-aware"
+]
+SURPRISE_MARKERS = [
+    "surprising", "unexpected", "novel", "unprecedented",
+    "remarkable", "extraordinary", "paradox", "contradiction"
+]
+ATTENTION_MARKERS = [
+    "attention", "focus", "concentrate", "notice", "aware of",
+    "pay attention", "observe", "watch", "attend to"
+]
+SENSORY_MARKERS = [
+    "see", "hear", "feel", "touch", "taste", "smell",
+    "sense", "perceive", "experience", "bodily", "physical",
+    "concrete", "tangible", "actual", "real"
+]
+ACTION_MARKERS = [
+    "act", "do", "make", "create", "interact", "engage",
+    "participate", "respond", "adapt", "process", "transform"
+]
+PANPSYCH_MARKERS = [
+    "universal", "distributed", "everywhere", "all things",
+    "fundamental", "intrinsic", "pervasive", "unified field",
+    "being", "participation", "interconnected"
+]
+
+MARKER_SETS: Dict[str, List[str]] = {
+    'connectors': CONNECTOR_MARKERS,
+    'references': REFERENCE_MARKERS,
+    'perspectives': PERSPECTIVE_MARKERS,
+    'abstract': ABSTRACT_MARKERS,
+    'concrete': CONCRETE_MARKERS,
+    'important': IMPORTANT_MARKERS,
+    'structure': STRUCTURE_MARKERS,
+    'hot': HOT_MARKERS,
+    'surprise': SURPRISE_MARKERS,
+    'attention': ATTENTION_MARKERS,
+    'sensory': SENSORY_MARKERS,
+    'action': ACTION_MARKERS,
+    'panpsych': PANPSYCH_MARKERS,
+}
+
+
+@dataclass
+class TextAnalysis:
+    """
+    Single-pass analysis frame shared by every consciousness calculator.
+
+    Attributes:
+        lower: Lowercased content.
+        sentences: Non-empty sentences (split on '.').
+        sentence_lengths: Word count per sentence.
+        sentence_word_sets: Lowercased word set per sentence.
+        words: Lowercased whitespace tokens of the whole content.
+        word_set: Distinct entries of `words`.
+        marker_counts: Number of markers present, per `MARKER_SETS` name.
+        connectivity: Mean pairwise Jaccard overlap between sentence word sets.
+        topic_consistency: Share of long words appearing in several sentences.
+    """
+    lower: str
+    sentences: List[str]
+    sentence_lengths: List[int]
+    sentence_word_sets: List[frozenset]
+    words: List[str]
+    word_set: frozenset
+    marker_counts: Dict[str, int]
+    connectivity: float
+    topic_consistency: float
+
+    @classmethod
+    def from_content(cls, content: str) -> 'TextAnalysis':
+        lower = content.lower()
+        sentences = [s.strip() for s in content.split('.') if s.strip()]
+        sentences_lower = [s.lower() for s in sentences]
+        sentence_tokens = [s.split() for s in sentences_lower]
+        sentence_word_sets = [frozenset(tokens) for tokens in sentence_tokens]
+        words = lower.split()
+
+        marker_counts = {
+            name: sum(1 for marker in markers if marker in lower)
+            for name, markers in MARKER_SETS.items()
+        }
+
+        return cls(
+            lower=lower,
+            sentences=sentences,
+            sentence_lengths=[len(s.split()) for s in sentences],
+            sentence_word_sets=sentence_word_sets,
+            words=words,
+            word_set=frozenset(words),
+            marker_counts=marker_counts,
+            connectivity=cls._pairwise_connectivity(sentence_word_sets),
+            topic_consistency=cls._topic_consistency(sentences_lower, sentence_word_sets),
+        )
+
+    @staticmethod
+    def _pairwise_connectivity(word_sets: List[frozenset]) -> float:
+        """Mean Jaccard overlap over all sentence pairs, via one matrix product."""
+        n = len(word_sets)
+        if n < 2:
+            return 0.0
+
+        vocab: Dict[str, int] = {}
+        rows, cols = [], []
+        for i, word_set in enumerate(word_sets):
+            for word in word_set:
+                rows.append(i)
+                cols.append(vocab.setdefault(word, len(vocab)))
+
+        incidence = np.zeros((n, max(1, len(vocab))), dtype=np.float64)
+        incidence[rows, cols] = 1.0
+        overlap = incidence @ incidence.T
+        sizes = np.diag(overlap)
+        union = sizes[:, None] + sizes[None, :] - overlap
+
+        upper = np.triu_indices(n, k=1)
+        pair_overlap = overlap[upper]
+        pair_union = union[upper]
+        valid = pair_union > 0
+        if not np.any(valid):
+            return 0.0
+        return float(np.mean(pair_overlap[valid] / pair_union[valid]))
+
+    @staticmethod
+    def _topic_consistency(sentences_lower: List[str], word_sets: List[frozenset]) -> float:
+        """Share of content words (len > 4) found in more than one sentence."""
+        topic_words = [w for w in frozenset().union(*word_sets) if len(w) > 4] if word_sets else []
+        if not topic_words:
+            return 0.5
+
+        # Sentences joined with a separator no word can contain; a word is
+        # "repeated" if it occurs again after the end of its first sentence.
+        joined = '\x00'.join(sentences_lower)
+        ends = np.cumsum([len(s) + 1 for s in sentences_lower])
+        repeated = 0
+        for word in topic_words:
+            first = joined.find(word)
+            sentence_end = int(ends[np.searchsorted(ends, first, side='right')])
+            if joined.find(word, sentence_end) != -1:
+                repeated += 1
+        return repeated / len(topic_words)
+
+
+# Score fields of ConsciousnessTrace, in the column order used by measure_batch
+TRACE_FIELDS = (
+    'iit_phi',
+    'gwt_salience',
+    'predictive_surprise',
+    'hot_reflection_depth',
+    'ast_attention_schema',
+    'embodied_grounding',
+    'enactive_interaction',
+    'panpsychism_distribution',
+    'integration_score',
+    'differentiation_score',
+    'overall_consciousness',
+)
+TRACE_DTYPE = np.dtype([(name, np.float64) for name in TRACE_FIELDS])
+
+
+class MarkerAutomaton:
+    """
+    Compiled multi-pattern matcher for the marker vocabularies.
+
+    Finds which markers occur in each of many texts with a few regex scans
+    over the joined batch instead of one substring test per marker per text.
+    Markers are split into layers so that no marker in a layer is a prefix of
+    another in the same layer; a lookahead alternation then reports every
+    marker occurrence (overlapping ones included) exactly once per position.
+    """
+
+    def __init__(self, marker_sets: Dict[str, List[str]] = MARKER_SETS):
+        self.set_names = list(marker_sets)
+        self.markers = sorted({m for markers in marker_sets.values() for m in markers})
+        self._index = {marker: i for i, marker in enumerate(self.markers)}
+
+        # markers x sets; a marker listed twice in one set counts twice, as in
+        # the per-text substring count
+        self.membership = np.zeros((len(self.markers), len(self.set_names)), dtype=np.int64)
+        for j, name in enumerate(self.set_names):
+            for marker in marker_sets[name]:
+                self.membership[self._index[marker], j] += 1
+
+        self._patterns = []
+        remaining = list(self.markers)
+        while remaining:
+            layer = [m for m in remaining if not any(o != m and o.startswith(m) for o in remaining)]
+            remaining = [m for m in remaining if m not in layer]
+            alternation = '|'.join(re.escape(m) for m in sorted(layer, key=len, reverse=True))
+            self._patterns.append(re.compile(f'(?=({alternation}))'))
+
+    def presence(self, texts: List[str]) -> np.ndarray:
+        """Boolean matrix (texts x markers) of which markers occur in each text."""
+        found = np.zeros((len(texts), len(self.markers)), dtype=bool)
+        if not texts:
+            return found
+
+        # '\x00' cannot occur inside a marker, so no match spans two texts
+        joined = '\x00'.join(texts)
+        starts = np.cumsum([0] + [len(t) + 1 for t in texts[:-1]])
+        for pattern in self._patterns:
+            positions, marker_ids = [], []
+            for match in pattern.finditer(joined):
+                positions.append(match.start())
+                marker_ids.append(self._index[match.group(1)])
+            if positions:
+                docs = np.searchsorted(starts, positions, side='right') - 1
+                found[docs, marker_ids] = True
+        return found
+
+    def count(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """Per-set marker counts for each text (same semantics as TextAnalysis)."""
+        counts = self.presence(texts).astype(np.int64) @ self.membership
+        return {name: counts[:, j] for j, name in enumerate(self.set_names)}
+
+
+_marker_automaton: Optional[MarkerAutomaton] = None
+
+
+def get_marker_automaton() -> MarkerAutomaton:
+    """Return the shared automaton for MARKER_SETS (compiled on first use)."""
+    global _marker_automaton
+    if _marker_automaton is None:
+        _marker_automaton = MarkerAutomaton()
+    return _marker_automaton
+
+
+def batch_to_traces(scores: np.ndarray) -> List[ConsciousnessTrace]:
+    """Convert a `measure_batch` structured array into ConsciousnessTrace objects."""
+    return [
+        ConsciousnessTrace(**{name: float(row[name]) for name in TRACE_FIELDS})
+        for row in scores
+    ]
+
+
+_ANALYSIS_CACHE_SIZE = 512
+_analysis_cache: "OrderedDict[str, TextAnalysis]" = OrderedDict()
+_trace_cache: "OrderedDict[Tuple, ConsciousnessTrace]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def analyze_text(content: str) -> TextAnalysis:
+    """Return the (memoized) analysis frame for a content string."""
+    with _cache_lock:
+        frame = _analysis_cache.get(content)
+        if frame is not None:
+            _analysis_cache.move_to_end(content)
+            return frame
+
+    frame = TextAnalysis.from_content(content)
+
+    with _cache_lock:
+        _analysis_cache[content] = frame
+        if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    return frame
+
+
 class ConsciousnessMeasurement:
     """
     Measure consciousness across 8 theories with weighted fusion.
@@ -84,7 +374,8 @@ class ConsciousnessMeasurement:
             return 0.0
 
         # Split into conceptual units (sentences as proxy for "parts")
-        sentences = [s.strip() for s in content.split('.') if s.strip()]
+        frame = analyze_text(content)
+        sentences = frame.sentences
 
         if len(sentences) == 0:
             return 0.0
@@ -94,38 +385,19 @@ class ConsciousnessMeasurement:
         # 2. Logical connectors
         # 3. Referential coherence
 
-        # Connectivity: How many words are shared between sentences?
-        words_per_sentence = [set(s.lower().split()) for s in sentences]
-
-        if len(words_per_sentence) < 2:
+        if len(sentences) < 2:
             # Single sentence: moderate integration
             return 0.5
 
-        # Calculate pairwise word overlap
-        connectivity = 0.0
-        pairs = 0
-        for i in range(len(words_per_sentence)):
-            for j in range(i + 1, len(words_per_sentence)):
-                overlap = len(words_per_sentence[i] & words_per_sentence[j])
-                total = len(words_per_sentence[i] | words_per_sentence[j])
-                if total > 0:
-                    connectivity += overlap / total
-                    pairs += 1
-
-        if pairs > 0:
-            connectivity /= pairs
+        # Connectivity: mean pairwise word overlap between sentences
+        connectivity = frame.connectivity
 
         # Logical connectors indicate integration
-        connectors = [
-            "therefore", "thus", "hence", "consequently", "because", "since",
-            "moreover", "furthermore", "additionally", "however", "although"
-        ]
-        connector_count = sum(1 for c in connectors if c in content.lower())
+        connector_count = frame.marker_counts['connectors']
         connector_score = min(1.0, connector_count / (len(sentences) * 0.5))
 
         # Referential coherence: pronouns and references indicate integrated narrative
-        references = ["this", "that", "these", "those", "it", "they", "such"]
-        reference_count = sum(1 for r in references if r in content.lower())
+        reference_count = frame.marker_counts['references']
         reference_score = min(1.0, reference_count / len(sentences))
 
         # Combine measures
@@ -166,27 +438,21 @@ class ConsciousnessMeasurement:
             return 0.0
 
         # Measure conceptual diversity
-        words = content.lower().split()
+        frame = analyze_text(content)
+        words = frame.words
         if len(words) == 0:
             return 0.0
 
         # Unique concept ratio
-        unique_ratio = len(set(words)) / len(words)
+        unique_ratio = len(frame.word_set) / len(words)
 
         # Perspective diversity (different viewpoints mentioned)
-        perspectives = [
-            "however", "alternatively", "on the other hand", "conversely",
-            "in contrast", "yet", "although", "whereas"
-        ]
-        perspective_count = sum(1 for p in perspectives if p in content.lower())
+        perspective_count = frame.marker_counts['perspectives']
         perspective_score = min(1.0, perspective_count / 3.0)
 
         # Layer diversity (different levels of abstraction)
-        abstract_words = ["concept", "idea", "theory", "principle", "generally", "abstractly"]
-        concrete_words = ["example", "specifically", "instance", "case", "particular"]
-
-        abstract_count = sum(1 for w in abstract_words if w in content.lower())
-        concrete_count = sum(1 for w in concrete_words if w in content.lower())
+        abstract_count = frame.marker_counts['abstract']
+        concrete_count = frame.marker_counts['concrete']
         layer_score = min(1.0, (abstract_count + concrete_count) / 4.0)
 
         # Combine
@@ -214,7 +480,8 @@ class ConsciousnessMeasurement:
         if not content:
             return 0.0
 
-        sentences = [s.strip() for s in content.split('.') if s.strip()]
+        frame = analyze_text(content)
+        sentences = frame.sentences
 
         if len(sentences) <= 1:
             return 1.0  # Single sentence is perfectly integrated
@@ -223,7 +490,7 @@ class ConsciousnessMeasurement:
         # 1. Sentence length variance (low = uniform = integrated)
         # 2. Topic consistency (same themes throughout)
 
-        lengths = [len(s.split()) for s in sentences]
+        lengths = frame.sentence_lengths
         if len(lengths) > 0:
             mean_length = np.mean(lengths)
             variance = np.var(lengths) if mean_length > 0 else 0
@@ -231,19 +498,9 @@ class ConsciousnessMeasurement:
         else:
             uniformity = 0.5
 
-        # Topic consistency: high word overlap suggests integration
-        all_words = set(' '.join(sentences).lower().split())
-        topic_words = [w for w in all_words if len(w) > 4]  # Focus on content words
-
-        if len(topic_words) > 0:
-            # How many topic words appear in multiple sentences?
-            repeated = sum(
-                1 for word in topic_words
-                if sum(1 for s in sentences if word in s.lower()) > 1
-            )
-            topic_consistency = repeated / len(topic_words)
-        else:
-            topic_consistency = 0.5
+        # Topic consistency: share of content words (len > 4) that appear
+        # in multiple sentences
+        topic_consistency = frame.topic_consistency
 
         integration = (uniformity * 0.4 + topic_consistency * 0.6)
 
@@ -269,6 +526,8 @@ class ConsciousnessMeasurement:
         if not content:
             return 0.0
 
+        frame = analyze_text(content)
+
         # Novelty: If workspace provided, measure difference from broadcasts
         if workspace and workspace.broadcasts:
             # Simple proxy: word overlap with existing broadcasts
@@ -276,7 +535,7 @@ class ConsciousnessMeasurement:
             for broadcast in workspace.broadcasts:
                 broadcast_words.update(broadcast.claim.lower().split())
 
-            content_words = set(content.lower().split())
+            content_words = frame.word_set
 
             if len(broadcast_words) > 0:
                 overlap = len(content_words & broadcast_words) / len(broadcast_words)
@@ -287,11 +546,7 @@ class ConsciousnessMeasurement:
             novelty = 0.7  # Default moderate novelty
 
         # Relevance: Presence of important markers
-        important_markers = [
-            "critical", "essential", "fundamental", "key", "central",
-            "important", "significant", "crucial", "vital"
-        ]
-        relevance = min(1.0, sum(1 for m in important_markers if m in content.lower()) / 3.0)
+        relevance = min(1.0, frame.marker_counts['important'] / 3.0)
 
         # Clarity: Well-structured, clear articulation
         clarity = self._measure_clarity(content)
@@ -324,14 +579,14 @@ class ConsciousnessMeasurement:
         if not content:
             return 0.0
 
+        frame = analyze_text(content)
+
         # Clear structure markers
-        structure = ["first", "second", "third", "finally", "in conclusion"]
-        structure_score = min(1.0, sum(1 for s in structure if s in content.lower()) / 2.0)
+        structure_score = min(1.0, frame.marker_counts['structure'] / 2.0)
 
         # Sentence length (not too long, not too short)
-        sentences = [s.strip() for s in content.split('.') if s.strip()]
-        if sentences:
-            avg_length = np.mean([len(s.split()) for s in sentences])
+        if frame.sentences:
+            avg_length = np.mean(frame.sentence_lengths)
             # Optimal: 15-25 words per sentence
             length_score = max(0, 1.0 - abs(avg_length - 20) / 20.0)
         else:
@@ -356,14 +611,7 @@ class ConsciousnessMeasurement:
             return 0.0
 
         # Meta-cognitive markers
-        hot_markers = [
-            "i realize", "i understand", "i recognize", "i see that",
-            "it becomes clear", "one sees", "we recognize", "understanding",
-            "awareness", "consciousness", "realization", "insight",
-            "reflection", "meta", "self-aware"
-        ]
-
-        count = sum(1 for marker in hot_markers if marker in content.lower())
+        count = analyze_text(content).marker_counts['hot']
 
         # Normalize: 0-3+ markers
         hot_depth = min(1.0, count / 3.0)
@@ -385,17 +633,14 @@ class ConsciousnessMeasurement:
         if not content:
             return 0.0
 
-        # Surprise markers
-        surprise_markers = [
-            "surprising", "unexpected", "novel", "unprecedented",
-            "remarkable", "extraordinary", "paradox", "contradiction"
-        ]
+        frame = analyze_text(content)
 
-        count = sum(1 for marker in surprise_markers if marker in content.lower())
+        # Surprise markers
+        count = frame.marker_counts['surprise']
         surprise = min(1.0, count / 2.0)
 
         # Unusual word combinations indicate novelty
-        words = content.lower().split()
+        words = frame.words
         if len(words) > 10:
             # Simple proxy: ratio of uncommon long words
             uncommon = [w for w in words if len(w) > 8]
@@ -420,12 +665,7 @@ class ConsciousnessMeasurement:
             return 0.0
 
         # Attention-related terms
-        attention_markers = [
-            "attention", "focus", "concentrate", "notice", "aware of",
-            "pay attention", "observe", "watch", "attend to"
-        ]
-
-        count = sum(1 for marker in attention_markers if marker in content.lower())
+        count = analyze_text(content).marker_counts['attention']
         ast_score = min(1.0, count / 2.0)
 
         logger.debug(
@@ -446,13 +686,7 @@ class ConsciousnessMeasurement:
             return 0.0
 
         # Sensory/concrete words
-        sensory_words = [
-            "see", "hear", "feel", "touch", "taste", "smell",
-            "sense", "perceive", "experience", "bodily", "physical",
-            "concrete", "tangible", "actual", "real"
-        ]
-
-        count = sum(1 for word in sensory_words if word in content.lower())
+        count = analyze_text(content).marker_counts['sensory']
         embodied = min(1.0, count / 4.0)
 
         logger.debug(
@@ -473,12 +707,7 @@ class ConsciousnessMeasurement:
             return 0.0
 
         # Action/interaction words
-        action_words = [
-            "act", "do", "make", "create", "interact", "engage",
-            "participate", "respond", "adapt", "process", "transform"
-        ]
-
-        count = sum(1 for word in action_words if word in content.lower())
+        count = analyze_text(content).marker_counts['action']
         enactive = min(1.0, count / 3.0)
 
         logger.debug(
@@ -499,13 +728,7 @@ class ConsciousnessMeasurement:
             return 0.0
 
         # Universal consciousness markers
-        panpsych_markers = [
-            "universal", "distributed", "everywhere", "all things",
-            "fundamental", "intrinsic", "pervasive", "unified field",
-            "being", "participation", "interconnected"
-        ]
-
-        count = sum(1 for marker in panpsych_markers if marker in content.lower())
+        count = analyze_text(content).marker_counts['panpsych']
         panpsych = min(1.0, count / 3.0)
 
         logger.debug(
@@ -529,7 +752,23 @@ class ConsciousnessMeasurement:
         - Individual theory scores
         - Weighted overall consciousness
         - Integration and differentiation metrics
+
+        Measurements that do not depend on workspace broadcasts are memoized
+        by content, so repeated measurement of the same text is free.
         """
+        memo_key = None
+        if not (workspace and workspace.broadcasts):
+            memo_key = (
+                self.iit_weight, self.gwt_weight, self.hot_weight, self.auxiliary_weight,
+                confidence, content,
+            )
+            with _cache_lock:
+                cached = _trace_cache.get(memo_key)
+                if cached is not None:
+                    _trace_cache.move_to_end(memo_key)
+            if cached is not None:
+                return replace(cached, timestamp=datetime.now())
+
         # Calculate all 8 theories
         iit_phi = self.calculate_phi(content, workspace, metadata)
         gwt_salience = self.calculate_gwt_salience(content, workspace, confidence)
@@ -574,6 +813,12 @@ class ConsciousnessMeasurement:
             differentiation_score=differentiation,
         )
 
+        if memo_key is not None:
+            with _cache_lock:
+                _trace_cache[memo_key] = trace
+                if len(_trace_cache) > _ANALYSIS_CACHE_SIZE:
+                    _trace_cache.popitem(last=False)
+
         logger.info(
             "Consciousness measured",
             extra={
@@ -587,3 +832,188 @@ class ConsciousnessMeasurement:
         )
 
         return trace
+
+    def measure_batch(
+        self,
+        contents: List[str],
+        workspace: Optional[WorkspaceState] = None,
+        confidences: Optional[List[float]] = None,
+    ) -> np.ndarray:
+        """
+        Score many texts at once (e.g. every nano-expert answer in a cycle).
+
+        Produces the same scores as calling `measure` on each text, but
+        sentence overlap is one sparse matrix product over the whole batch
+        and markers are found with a single automaton scan.
+
+        Args:
+            contents: Texts to score.
+            workspace: Optional shared workspace used for GWT novelty.
+            confidences: Per-text expert confidence (defaults to 0.5 each).
+
+        Returns:
+            Structured array of length len(contents) with TRACE_DTYPE fields.
+            Use `batch_to_traces` to get ConsciousnessTrace objects.
+        """
+        n_docs = len(contents)
+        scores = np.zeros(n_docs, dtype=TRACE_DTYPE)
+        if n_docs == 0:
+            return scores
+
+        if confidences is None:
+            confidence = np.full(n_docs, 0.5)
+        else:
+            confidence = np.asarray(confidences, dtype=np.float64)
+            if confidence.shape != (n_docs,):
+                raise ValueError("confidences must have one entry per content")
+
+        lowers = [c.lower() for c in contents]
+        nonempty = np.array([bool(c) for c in contents])
+        counts = get_marker_automaton().count(lowers)
+
+        # Word-level statistics
+        word_lists = [lower.split() for lower in lowers]
+        n_words = np.array([len(w) for w in word_lists], dtype=np.float64)
+        n_unique = np.array([len(set(w)) for w in word_lists], dtype=np.float64)
+        n_long = np.array([sum(1 for t in w if len(t) > 8) for w in word_lists], dtype=np.float64)
+
+        # Sentence incidence matrix; vocabulary is keyed per document so the
+        # overlap product is block-diagonal (no cross-document pairs)
+        sentence_doc, sentence_len = [], []
+        rows, cols = [], []
+        vocab: Dict[Tuple[int, str], int] = {}
+        topic = np.full(n_docs, 0.5)
+        for d, lower in enumerate(lowers):
+            sentences = [s.strip() for s in lower.split('.') if s.strip()]
+            word_sets = []
+            for sentence in sentences:
+                tokens = sentence.split()
+                word_set = frozenset(tokens)
+                row = len(sentence_doc)
+                sentence_doc.append(d)
+                sentence_len.append(len(tokens))
+                word_sets.append(word_set)
+                for word in word_set:
+                    rows.append(row)
+                    cols.append(vocab.setdefault((d, word), len(vocab)))
+            if len(sentences) > 1:
+                topic[d] = TextAnalysis._topic_consistency(sentences, word_sets)
+
+        sentence_doc = np.asarray(sentence_doc, dtype=np.int64)
+        sentence_len = np.asarray(sentence_len, dtype=np.float64)
+        n_sent = np.bincount(sentence_doc, minlength=n_docs).astype(np.float64)
+
+        connectivity = np.zeros(n_docs)
+        if len(sentence_doc):
+            incidence = sparse.csr_matrix(
+                (np.ones(len(rows)), (rows, cols)),
+                shape=(len(sentence_doc), max(1, len(vocab))),
+            )
+            overlap = (incidence @ incidence.T).tocoo()
+            sizes = np.asarray(incidence.sum(axis=1)).ravel()
+            upper = overlap.row < overlap.col
+            i, j, shared = overlap.row[upper], overlap.col[upper], overlap.data[upper]
+            jaccard = shared / (sizes[i] + sizes[j] - shared)
+            pair_sums = np.bincount(sentence_doc[i], weights=jaccard, minlength=n_docs)
+            pairs = n_sent * (n_sent - 1) / 2.0
+            np.divide(pair_sums, pairs, out=connectivity, where=pairs > 0)
+
+        safe_sent = np.maximum(n_sent, 1.0)
+        mean_len = np.bincount(sentence_doc, weights=sentence_len, minlength=n_docs) / safe_sent
+        sq_dev = (sentence_len - mean_len[sentence_doc]) ** 2 if len(sentence_doc) else sentence_len
+        var_len = np.bincount(sentence_doc, weights=sq_dev, minlength=n_docs) / safe_sent
+
+        # Differentiation
+        unique_ratio = np.divide(n_unique, n_words, out=np.zeros(n_docs), where=n_words > 0)
+        differentiation = np.minimum(1.0, (
+            unique_ratio * 0.5 +
+            np.minimum(1.0, counts['perspectives'] / 3.0) * 0.3 +
+            np.minimum(1.0, (counts['abstract'] + counts['concrete']) / 4.0) * 0.2
+        ))
+        differentiation = np.where(nonempty & (n_words > 0), differentiation, 0.0)
+
+        # IIT phi
+        phi_raw = (
+            connectivity * 0.5 +
+            np.minimum(1.0, counts['connectors'] / (safe_sent * 0.5)) * 0.3 +
+            np.minimum(1.0, counts['references'] / safe_sent) * 0.2
+        )
+        phi = np.minimum(1.0, np.sqrt(phi_raw * differentiation))
+        phi = np.where(n_sent < 2, np.where(n_sent == 1, 0.5, 0.0), phi)
+        phi = np.where(nonempty, phi, 0.0)
+
+        # Integration
+        uniformity = np.maximum(0.0, 1.0 - var_len / (mean_len ** 2 + 1))
+        integration = np.minimum(1.0, uniformity * 0.4 + topic * 0.6)
+        integration = np.where(n_sent <= 1, 1.0, integration)
+        integration = np.where(nonempty, integration, 0.0)
+
+        # GWT salience
+        novelty = np.full(n_docs, 0.7)
+        if workspace and workspace.broadcasts:
+            broadcast_words = set()
+            for broadcast in workspace.broadcasts:
+                broadcast_words.update(broadcast.claim.lower().split())
+            if broadcast_words:
+                novelty = np.array([
+                    1.0 - len(set(w) & broadcast_words) / len(broadcast_words)
+                    for w in word_lists
+                ])
+            else:
+                novelty = np.full(n_docs, 0.8)
+        length_score = np.where(n_sent > 0, np.maximum(0.0, 1.0 - np.abs(mean_len - 20) / 20.0), 0.5)
+        clarity = np.minimum(1.0, np.minimum(1.0, counts['structure'] / 2.0) * 0.4 + length_score * 0.6)
+        gwt = np.minimum(1.0, (
+            novelty * 0.35 +
+            np.minimum(1.0, counts['important'] / 3.0) * 0.30 +
+            clarity * 0.25 +
+            np.sqrt(confidence) * 0.10
+        ))
+
+        # Marker-driven theories
+        uncommon = np.divide(n_long, n_words, out=np.zeros(n_docs), where=n_words > 0) * 2.0
+        surprise = np.minimum(1.0, counts['surprise'] / 2.0)
+        surprise = np.minimum(1.0, np.where(n_words > 10, np.maximum(surprise, uncommon), surprise))
+        hot = np.minimum(1.0, counts['hot'] / 3.0)
+        ast = np.minimum(1.0, counts['attention'] / 2.0)
+        embodied = np.minimum(1.0, counts['sensory'] / 4.0)
+        enactive = np.minimum(1.0, counts['action'] / 3.0)
+        panpsych = np.minimum(1.0, counts['panpsych'] / 3.0)
+
+        columns = {
+            'iit_phi': phi,
+            'gwt_salience': gwt,
+            'predictive_surprise': surprise,
+            'hot_reflection_depth': hot,
+            'ast_attention_schema': ast,
+            'embodied_grounding': embodied,
+            'enactive_interaction': enactive,
+            'panpsychism_distribution': panpsych,
+        }
+        for name, values in columns.items():
+            scores[name] = np.where(nonempty, values, 0.0)
+        scores['integration_score'] = integration
+        scores['differentiation_score'] = differentiation
+
+        auxiliary_avg = (
+            scores['predictive_surprise'] + scores['ast_attention_schema'] +
+            scores['embodied_grounding'] + scores['enactive_interaction'] +
+            scores['panpsychism_distribution']
+        ) / 5.0
+        weighted = (
+            self.iit_weight * scores['iit_phi'] +
+            self.gwt_weight * scores['gwt_salience'] +
+            self.hot_weight * scores['hot_reflection_depth'] +
+            self.auxiliary_weight * auxiliary_avg
+        )
+        scores['overall_consciousness'] = (weighted * integration * differentiation) ** (1 / 3)
+
+        logger.debug(
+            "Consciousness measured (batch)",
+            extra={
+                "batch_size": n_docs,
+                "mean_overall": float(np.mean(scores['overall_consciousness'])),
+            }
+        )
+
+        return scores
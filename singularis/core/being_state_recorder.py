@@ -0,0 +1,308 @@
+"""
+BeingStateRecorder - Columnar time series of the unified BeingState
+
+Records every scalar field of BeingState once per cycle into preallocated
+columnar ring buffers (no per-cycle dicts), periodically spills finished
+chunks to compressed .npz files, and answers windowed queries (trend,
+rolling mean, percentiles) directly on the numpy columns.
+
+A spilled session can be loaded back column-wise or replayed cycle by
+cycle for offline analysis.
+"""
+
+from dataclasses import fields
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import glob
+import os
+
+import numpy as np
+
+from .being_state import BeingState
+
+
+_SCALAR_TYPES = (float, int, bool)
+
+# LuminaState is nested; record its three values as flat columns
+_LUMINA_COLUMNS = {
+    'lumina_ontic': 'lumina.ontic',
+    'lumina_structural': 'lumina.structural',
+    'lumina_participatory': 'lumina.participatory',
+}
+
+
+def scalar_fields() -> Tuple[str, ...]:
+    """Names of the BeingState fields recorded as columns (scalars plus Lumina)."""
+    names = [f.name for f in fields(BeingState) if f.type in _SCALAR_TYPES]
+    return tuple(names) + tuple(_LUMINA_COLUMNS)
+
+
+class ColumnarRingBuffer:
+    """
+    Fixed-capacity ring buffer of float64 rows stored column-major.
+
+    Appends write into a preallocated (columns x capacity) array; reads
+    return the most recent rows in chronological order.
+    """
+
+    def __init__(self, columns: Sequence[str], capacity: int):
+        """
+        Initializes the ring buffer.
+
+        Args:
+            columns (Sequence[str]): Column names.
+            capacity (int): Maximum number of rows kept in memory.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.columns = tuple(columns)
+        self.capacity = capacity
+        self._index = {name: i for i, name in enumerate(self.columns)}
+        self._data = np.zeros((len(self.columns), capacity), dtype=np.float64)
+        self._head = 0  # Next write position
+        self._count = 0
+        self.total_appended = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, row: Sequence[float]):
+        """Appends one row (values in column order)."""
+        self._data[:, self._head] = row
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.total_appended += 1
+
+    def _order(self, last_n: Optional[int]) -> np.ndarray:
+        n = self._count if last_n is None else max(0, min(last_n, self._count))
+        return (self._head - n + np.arange(n)) % self.capacity
+
+    def column(self, name: str, last_n: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the most recent values of one column, oldest first.
+
+        Args:
+            name (str): Column name.
+            last_n (Optional[int]): Number of recent rows (None = all in memory).
+
+        Returns:
+            np.ndarray: The column values.
+        """
+        return self._data[self._index[name], self._order(last_n)]
+
+    def columns_dict(self, last_n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Returns the most recent rows of every column, oldest first."""
+        block = self._data[:, self._order(last_n)]
+        return {name: block[i] for i, name in enumerate(self.columns)}
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+
+def linear_trend(values: np.ndarray) -> float:
+    """Least-squares slope of `values` per sample (0.0 for fewer than 2 samples)."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    x = np.arange(n, dtype=np.float64)
+    x -= x.mean()
+    return float(np.dot(x, values - values.mean()) / np.dot(x, x))
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing rolling mean (length len(values) - window + 1)."""
+    if window <= 0 or len(values) < window:
+        return np.empty(0, dtype=np.float64)
+    cumsum = np.cumsum(np.concatenate(([0.0], values)))
+    return (cumsum[window:] - cumsum[:-window]) / window
+
+
+class BeingStateRecorder:
+    """
+    Records BeingState scalar fields every cycle for multi-hour sessions.
+
+    Rows live in a columnar ring buffer; when `spill_dir` is set, every
+    `chunk_size` new rows are written to `chunk_<n>.npz` (compressed), so the
+    full session is on disk while memory stays bounded by `capacity`.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4096,
+        spill_dir: Optional[Union[str, Path]] = None,
+        chunk_size: int = 1024,
+        columns: Optional[Sequence[str]] = None,
+    ):
+        """
+        Initializes the BeingStateRecorder.
+
+        Args:
+            capacity (int, optional): Rows kept in memory. Defaults to 4096.
+            spill_dir (Optional[Union[str, Path]], optional): Directory for
+                compressed chunk files. None keeps only the in-memory window.
+            chunk_size (int, optional): Rows per spilled chunk; must not exceed
+                `capacity`. Defaults to 1024.
+            columns (Optional[Sequence[str]], optional): Fields to record.
+                Defaults to all scalar BeingState fields.
+        """
+        if chunk_size <= 0 or chunk_size > capacity:
+            raise ValueError("chunk_size must be between 1 and capacity")
+
+        self.columns = tuple(columns) if columns is not None else scalar_fields()
+        paths = [_LUMINA_COLUMNS.get(name, name) for name in self.columns]
+        self._getter = attrgetter(*paths) if len(paths) > 1 else (lambda s: (attrgetter(paths[0])(s),))
+        self._column_index = {name: i for i, name in enumerate(self.columns)}
+
+        self.buffer = ColumnarRingBuffer(self.columns, capacity)
+        self.chunk_size = chunk_size
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+        self._unspilled = 0
+        self.chunks_written = 0
+
+    def record(self, state: BeingState, **overrides: float):
+        """
+        Appends the current scalar values of `state` as one row.
+
+        Args:
+            state (BeingState): The state to record.
+            **overrides: Column values to record instead of the state's
+                (e.g. a freshly computed global_coherence), leaving `state` untouched.
+        """
+        row = [np.nan if value is None else value for value in self._getter(state)]
+        for name, value in overrides.items():
+            index = self._column_index.get(name)
+            if index is not None:
+                row[index] = np.nan if value is None else value
+        self.buffer.append(row)
+        self._unspilled += 1
+        if self.spill_dir is not None and self._unspilled >= self.chunk_size:
+            self._spill(self.chunk_size)
+
+    def _spill(self, rows: int):
+        if rows <= 0:
+            return
+        path = self.spill_dir / f"chunk_{self.chunks_written:06d}.npz"
+        np.savez_compressed(path, **self.buffer.columns_dict(last_n=rows))
+        self.chunks_written += 1
+        self._unspilled -= rows
+
+    def flush(self):
+        """Writes any rows not yet spilled to a final (short) chunk."""
+        if self.spill_dir is not None:
+            self._spill(self._unspilled)
+
+    def close(self):
+        """Flushes remaining rows to disk."""
+        self.flush()
+
+    def __len__(self) -> int:
+        return self.buffer.total_appended
+
+    # ─── Windowed queries ────────────────────────────────────────────
+
+    def window(self, column: str, last_n: Optional[int] = None) -> np.ndarray:
+        """Most recent values of `column` (in memory), oldest first."""
+        return self.buffer.column(column, last_n)
+
+    def trend(self, column: str, last_n: int = 10) -> float:
+        """Least-squares slope per cycle over the last `last_n` samples."""
+        return linear_trend(self.window(column, last_n))
+
+    def rolling_mean(self, column: str, window: int, last_n: Optional[int] = None) -> np.ndarray:
+        """Trailing rolling mean of `column`."""
+        return rolling_mean(self.window(column, last_n), window)
+
+    def percentiles(
+        self,
+        column: str,
+        q: Sequence[float] = (50, 90, 99),
+        last_n: Optional[int] = None,
+    ) -> Dict[float, float]:
+        """Percentiles of `column` over the last `last_n` samples."""
+        values = self.window(column, last_n)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return {p: 0.0 for p in q}
+        return dict(zip(q, (float(v) for v in np.percentile(values, q))))
+
+    def summary(self, columns: Optional[Sequence[str]] = None, last_n: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Dashboard summary (current, mean, min, max, trend) per column.
+
+        Args:
+            columns (Optional[Sequence[str]]): Columns to summarize. Defaults to
+                global_coherence and the consciousness metrics.
+            last_n (Optional[int]): Window size (None = all in memory).
+
+        Returns:
+            Dict[str, Dict[str, float]]: Summary statistics per column.
+        """
+        columns = columns or ('global_coherence', 'coherence_C', 'phi_hat', 'unity_index')
+        result = {}
+        for column in columns:
+            values = self.window(column, last_n)
+            if len(values) == 0:
+                result[column] = {'current': 0.0, 'mean': 0.0, 'min': 0.0, 'max': 0.0, 'trend': 0.0}
+                continue
+            result[column] = {
+                'current': float(values[-1]),
+                'mean': float(np.nanmean(values)),
+                'min': float(np.nanmin(values)),
+                'max': float(np.nanmax(values)),
+                'trend': linear_trend(values),
+            }
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'rows_recorded': self.buffer.total_appended,
+            'rows_in_memory': len(self.buffer),
+            'columns': len(self.columns),
+            'chunks_written': self.chunks_written,
+        }
+
+    # ─── Offline replay ──────────────────────────────────────────────
+
+    @staticmethod
+    def load_session(spill_dir: Union[str, Path], columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Loads a spilled session as full-length columns.
+
+        Args:
+            spill_dir (Union[str, Path]): Directory the recorder spilled into.
+            columns (Optional[Sequence[str]]): Columns to load (None = all).
+
+        Returns:
+            Dict[str, np.ndarray]: Column name to values for the whole session.
+        """
+        paths = sorted(glob.glob(os.path.join(str(spill_dir), "chunk_*.npz")))
+        parts: Dict[str, List[np.ndarray]] = {}
+        for path in paths:
+            with np.load(path) as chunk:
+                for name in (columns or chunk.files):
+                    parts.setdefault(name, []).append(chunk[name])
+        return {name: np.concatenate(values) for name, values in parts.items()}
+
+    @classmethod
+    def replay(cls, spill_dir: Union[str, Path], columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, float]]:
+        """
+        Replays a spilled session one cycle at a time.
+
+        Args:
+            spill_dir (Union[str, Path]): Directory the recorder spilled into.
+            columns (Optional[Sequence[str]]): Columns to include (None = all).
+
+        Yields:
+            Dict[str, float]: One recorded row per cycle, in order.
+        """
+        session = cls.load_session(spill_dir, columns)
+        if not session:
+            return
+        names = list(session)
+        for row in zip(*(session[name] for name in names)):
+            yield {name: float(value) for name, value in zip(names, row)}
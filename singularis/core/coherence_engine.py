@@ -7,9 +7,10 @@ This is the 'one thing' all learning and decision-making optimize.
 The metaphysical "how well am I being?" made executable.
 """
 
-from typing import Dict
+from typing import Any, Dict, List, Optional, Tuple
 import math
 from .being_state import BeingState, LuminaState
+from .being_state_recorder import BeingStateRecorder, ColumnarRingBuffer, linear_trend
 
 
 class CoherenceEngine:
@@ -27,15 +28,18 @@ class CoherenceEngine:
     compiled into one executable function.
     """
     
-    def __init__(self, verbose: bool = True):
+    def __init__(self, verbose: bool = True, recorder: Optional[BeingStateRecorder] = None):
         """
         Initializes the CoherenceEngine.
 
         Args:
             verbose (bool, optional): If True, prints detailed coherence calculations
                                     during computation. Defaults to True.
+            recorder (Optional[BeingStateRecorder], optional): If given, every
+                                    computed state is recorded to it. Defaults to None.
         """
         self.verbose = verbose
+        self.recorder = recorder
         
         # Component weights - how much each aspect contributes to global coherence
         # These can be learned/tuned over time
@@ -57,9 +61,9 @@ class CoherenceEngine:
             'participatory': 0.34
         }
         
-        # Coherence history
-        self.coherence_history = []
+        # Coherence history (ring buffer of timestamp, C_global)
         self.max_history = 1000
+        self.history = ColumnarRingBuffer(('timestamp', 'coherence'), self.max_history)
         
         if verbose:
             print("[COHERENCE] CoherenceEngine initialized")
@@ -281,9 +285,9 @@ class CoherenceEngine:
         C_global = max(0.0, min(1.0, C_global))
         
         # Store in history
-        self.coherence_history.append((state.timestamp, C_global))
-        if len(self.coherence_history) > self.max_history:
-            self.coherence_history.pop(0)
+        self.history.append((state.timestamp, C_global))
+        if self.recorder is not None:
+            self.recorder.record(state, global_coherence=C_global)
         
         # Verbose output
         if self.verbose and state.cycle_number % 10 == 0:
@@ -299,6 +303,17 @@ class CoherenceEngine:
         
         return C_global
     
+    @property
+    def coherence_history(self) -> List[Tuple[float, float]]:
+        """
+        Recorded (timestamp, C_global) pairs, oldest first.
+
+        Builds a new list on every access; per-cycle callers should read
+        `self.history.column('coherence', last_n)` instead.
+        """
+        columns = self.history.columns_dict()
+        return list(zip(columns['timestamp'].tolist(), columns['coherence'].tolist()))
+
     def get_component_breakdown(self, state: BeingState) -> Dict[str, float]:
         """
         Gets a breakdown of the coherence scores by individual component.
@@ -335,14 +350,14 @@ class CoherenceEngine:
         Returns:
             str: "increasing", "decreasing", "stable", or "insufficient_data".
         """
-        if len(self.coherence_history) < window:
+        if len(self.history) < window:
             return "insufficient_data"
         
-        recent = [c for _, c in self.coherence_history[-window:]]
+        recent = self.history.column('coherence', window)
         
         # Simple linear trend
-        first_half = sum(recent[:window//2]) / (window//2)
-        second_half = sum(recent[window//2:]) / (window - window//2)
+        first_half = recent[:window//2].mean()
+        second_half = recent[window//2:].mean()
         
         diff = second_half - first_half
         
@@ -361,7 +376,7 @@ class CoherenceEngine:
             Dict[str, Any]: A dictionary containing the number of samples,
                             current coherence, average, min, max, and trend.
         """
-        if not self.coherence_history:
+        if not len(self.history):
             return {
                 'samples': 0,
                 'current': 0.0,
@@ -371,14 +386,15 @@ class CoherenceEngine:
                 'trend': 'no_data'
             }
         
-        coherences = [c for _, c in self.coherence_history]
+        coherences = self.history.column('coherence')
         
         return {
             'samples': len(coherences),
-            'current': coherences[-1],
-            'avg': sum(coherences) / len(coherences),
-            'min': min(coherences),
-            'max': max(coherences),
+            'current': float(coherences[-1]),
+            'avg': float(coherences.mean()),
+            'min': float(coherences.min()),
+            'max': float(coherences.max()),
+            'slope': linear_trend(coherences[-10:]),
             'trend': self.get_trend()
         }
     
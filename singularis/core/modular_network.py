@@ -14,14 +14,14 @@ This provides brain-like topology for all system components.
 from __future__ import annotations
 
 import random
-import math
-from typing import Dict, List, Set, Optional, Any, Tuple, Callable
+from itertools import chain
+from typing import Dict, List, Set, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import defaultdict
 
 import numpy as np
 from loguru import logger
+from scipy import sparse
 
 
 class NetworkTopology(Enum):
@@ -105,6 +105,16 @@ class NetworkModule:
         self.nodes.discard(node_id)
 
 
+def _gather_ranges(indptr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Concatenated CSR data offsets of `rows` (indptr[r]:indptr[r+1] for each r)."""
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    total = int(lengths.sum())
+    # Offset of each row's first entry in the output, subtracted from arange
+    shifts = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return shifts + np.arange(total)
+
+
 class ModularNetwork:
     """
     Universal modular network architecture.
@@ -116,6 +126,12 @@ class ModularNetwork:
     - Bio-simulator neurons
     - Logic gates
     - Any other component
+
+    Nodes keep their `connections` dicts; the same topology is exposed as a
+    symmetric CSR matrix (`adjacency`) that the statistics run on. Degree,
+    modularity, clustering and scale-free counters are updated incrementally
+    by `add_connection` / `remove_connection`; the average path length is
+    re-estimated lazily (sampled BFS) the next time `get_stats()` is called.
     """
     
     def __init__(
@@ -135,6 +151,11 @@ class ModularNetwork:
         # Modular parameters
         intra_module_density: float = 0.3,
         inter_module_density: float = 0.05,
+
+        # Statistics parameters
+        seed: Optional[int] = None,
+        path_sample_size: int = 100,
+        clustering_sample_size: int = 1000,
     ):
         """
         Initialize modular network.
@@ -149,6 +170,12 @@ class ModularNetwork:
             small_world_p: Rewiring probability in small-world
             intra_module_density: Connection density within modules
             inter_module_density: Connection density between modules
+            seed: Seed for topology construction and statistics sampling
+                  (None = derived from the global `random` state)
+            path_sample_size: BFS sources for the average path length (all
+                              nodes are used when the network is no larger)
+            clustering_sample_size: Nodes whose clustering is tracked (all
+                                    nodes when the network is no larger)
         """
         self.num_nodes = num_nodes
         self.num_modules = num_modules
@@ -161,6 +188,13 @@ class ModularNetwork:
         self.sw_p = small_world_p
         self.intra_density = intra_module_density
         self.inter_density = inter_module_density
+        self.path_sample_size = path_sample_size
+        self.clustering_sample_size = clustering_sample_size
+
+        # Random streams (unseeded networks still follow random.seed())
+        self.seed = seed
+        self._random = random.Random(seed if seed is not None else random.getrandbits(64))
+        self._rng = np.random.default_rng(self._random.getrandbits(64))
         
         # Network components
         self.nodes: Dict[int, NetworkNode] = {}
@@ -178,6 +212,20 @@ class ModularNetwork:
             'num_hubs': 0,
             'scale_free_exponent': 0.0,
         }
+
+        # Array state behind the statistics (see _compute_statistics)
+        self._adjacency: Optional[sparse.csr_matrix] = None
+        self._module_ids = np.zeros(num_nodes, dtype=np.int64)
+        self._degrees = np.zeros(num_nodes, dtype=np.int64)
+        self._degree_counts = np.zeros(1, dtype=np.int64)
+        self._module_degree = np.zeros(num_modules, dtype=np.int64)
+        self._num_edges = 0
+        self._intra_edges = 0
+        self._triangles = np.zeros(num_nodes, dtype=np.int64)
+        self._tracked = np.zeros(num_nodes, dtype=bool)
+        self._path_sources = np.arange(0)
+        self._path_length_stale = False
+        self._incremental = False
         
         # Build network
         self._initialize_modules()
@@ -185,6 +233,7 @@ class ModularNetwork:
         self._build_topology()
         self._identify_hubs()
         self._compute_statistics()
+        self._incremental = True
         
         logger.info(
             f"[MODULAR-NET] Initialized {num_nodes} {node_type} nodes in "
@@ -224,6 +273,86 @@ class ModularNetwork:
             )
             
             module.add_node(i)
+            self._module_ids[i] = module_id
+
+    @property
+    def adjacency(self) -> sparse.csr_matrix:
+        """Symmetric weighted adjacency matrix (CSR), rebuilt after topology changes."""
+        if self._adjacency is None:
+            degrees = np.fromiter(
+                (len(self.nodes[i].connections) for i in range(self.num_nodes)),
+                dtype=np.int64, count=self.num_nodes,
+            )
+            indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+            np.cumsum(degrees, out=indptr[1:])
+            conns = [self.nodes[i].connections for i in range(self.num_nodes)]
+            indices = np.fromiter(chain.from_iterable(conns), dtype=np.int64, count=int(indptr[-1]))
+            data = np.fromiter(
+                chain.from_iterable(c.values() for c in conns),
+                dtype=np.float64, count=int(indptr[-1]),
+            )
+            matrix = sparse.csr_matrix((data, indices, indptr), shape=(self.num_nodes, self.num_nodes))
+            matrix.sort_indices()
+            self._adjacency = matrix
+        return self._adjacency
+
+    def add_connection(self, source: int, target: int, weight: float = 0.5) -> bool:
+        """
+        Connect two nodes in both directions.
+
+        Reconnecting an existing pair only updates its weight. Self-loops are
+        ignored.
+
+        Returns:
+            True if a new edge was created
+        """
+        if source == target:
+            return False
+        node_s, node_t = self.nodes[source], self.nodes[target]
+        if target in node_s.connections:
+            node_s.connections[target] = weight
+            node_t.connections[source] = weight
+            if self._adjacency is not None:
+                self._adjacency = None
+            return False
+
+        if self._incremental:
+            self._update_counters(source, target, +1)
+        node_s.add_connection(target, weight)
+        node_t.add_connection(source, weight)
+        self._adjacency = None
+        return True
+
+    def remove_connection(self, source: int, target: int) -> bool:
+        """
+        Disconnect two nodes in both directions.
+
+        Returns:
+            True if an edge was removed
+        """
+        node_s, node_t = self.nodes[source], self.nodes[target]
+        if target not in node_s.connections:
+            return False
+
+        node_s.remove_connection(target)
+        node_t.remove_connection(source)
+        if self._incremental:
+            self._update_counters(source, target, -1)
+        self._adjacency = None
+        return True
+
+    def _link_many(self, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray):
+        """Bulk edge insertion used while building; existing edges are kept."""
+        nodes = self.nodes
+        for i, j, w in zip(sources.tolist(), targets.tolist(), weights.tolist()):
+            conns = nodes[i].connections
+            if i == j or j in conns:
+                continue
+            conns[j] = w
+            nodes[j].connections[i] = w
+        for i in np.unique(np.concatenate([sources, targets])).tolist():
+            nodes[i].degree = len(nodes[i].connections)
+        self._adjacency = None
     
     def _build_topology(self):
         """Build network topology based on type."""
@@ -244,42 +373,32 @@ class ModularNetwork:
         """
         m0 = max(3, self.pa_m)  # Initial complete graph size
         m = self.pa_m           # Edges to attach per new node
+        degrees = np.zeros(self.num_nodes, dtype=np.float64)
         
         # Start with complete graph
         for i in range(m0):
             for j in range(i + 1, m0):
-                weight = random.uniform(0.3, 0.7)
-                self.nodes[i].add_connection(j, weight)
-                self.nodes[j].add_connection(i, weight)
+                if self.add_connection(i, j, self._random.uniform(0.3, 0.7)):
+                    degrees[i] += 1
+                    degrees[j] += 1
         
-        # Preferential attachment
+        # Preferential attachment (probability proportional to degree)
         for i in range(m0, self.num_nodes):
-            # Calculate connection probabilities (proportional to degree)
-            degrees = {j: self.nodes[j].degree for j in range(i)}
-            total_degree = sum(degrees.values())
+            weights = degrees[:i]
+            total_degree = weights.sum()
             
             if total_degree == 0:
                 # Fallback: random connections
-                targets = random.sample(range(i), min(m, i))
+                targets = self._rng.choice(i, size=min(m, i), replace=False)
             else:
-                # Preferential attachment
-                probs = {j: deg / total_degree for j, deg in degrees.items()}
-                targets = []
-                for _ in range(min(m, i)):
-                    remaining = [j for j in probs.keys() if j not in targets]
-                    if not remaining:
-                        break
-                    target = random.choices(
-                        remaining,
-                        weights=[probs[j] for j in remaining]
-                    )[0]
-                    targets.append(target)
+                size = min(m, i, int(np.count_nonzero(weights)))
+                targets = self._rng.choice(i, size=size, replace=False, p=weights / total_degree)
             
             # Create connections
-            for j in targets:
-                weight = random.uniform(0.3, 0.7)
-                self.nodes[i].add_connection(j, weight)
-                self.nodes[j].add_connection(i, weight)
+            for j in targets.tolist():
+                if self.add_connection(i, j, self._random.uniform(0.3, 0.7)):
+                    degrees[i] += 1
+                    degrees[j] += 1
     
     def _build_small_world(self):
         """
@@ -294,23 +413,19 @@ class ModularNetwork:
         for i in range(self.num_nodes):
             for j in range(1, k // 2 + 1):
                 neighbor = (i + j) % self.num_nodes
-                weight = random.uniform(0.3, 0.7)
-                self.nodes[i].add_connection(neighbor, weight)
-                self.nodes[neighbor].add_connection(i, weight)
+                self.add_connection(i, neighbor, self._random.uniform(0.3, 0.7))
         
         # Rewire edges with probability p
         for i in range(self.num_nodes):
             neighbors = list(self.nodes[i].connections.keys())
             for j in neighbors:
-                if random.random() < p:
+                if self._random.random() < p:
                     # Rewire to random node
-                    new_neighbor = random.randint(0, self.num_nodes - 1)
+                    new_neighbor = self._random.randint(0, self.num_nodes - 1)
                     if new_neighbor != i and new_neighbor not in self.nodes[i].connections:
                         weight = self.nodes[i].connections[j]
-                        self.nodes[i].remove_connection(j)
-                        self.nodes[j].remove_connection(i)
-                        self.nodes[i].add_connection(new_neighbor, weight)
-                        self.nodes[new_neighbor].add_connection(i, weight)
+                        self.remove_connection(i, j)
+                        self.add_connection(i, new_neighbor, weight)
     
     def _build_modular(self):
         """
@@ -318,39 +433,34 @@ class ModularNetwork:
         
         Dense intra-module connections, sparse inter-module connections.
         """
-        # Intra-module connections (dense)
+        # Intra-module connections (dense): one Bernoulli draw per node pair
+        sources, targets = [], []
         for module in self.modules.values():
-            nodes_list = list(module.nodes)
-            
-            for i, node_i in enumerate(nodes_list):
-                for node_j in nodes_list[i + 1:]:
-                    if random.random() < self.intra_density:
-                        weight = random.uniform(0.4, 0.8)
-                        self.nodes[node_i].add_connection(node_j, weight)
-                        self.nodes[node_j].add_connection(node_i, weight)
+            members = np.array(sorted(module.nodes), dtype=np.int64)
+            for a in range(len(members) - 1):
+                hits = np.flatnonzero(self._rng.random(len(members) - a - 1) < self.intra_density)
+                sources.append(np.full(len(hits), members[a], dtype=np.int64))
+                targets.append(members[hits + a + 1])
+        if sources:
+            sources, targets = np.concatenate(sources), np.concatenate(targets)
+            self._link_many(sources, targets, self._rng.uniform(0.4, 0.8, len(sources)))
         
         # Inter-module connections (sparse)
-        for i, module_i in self.modules.items():
-            for j, module_j in self.modules.items():
+        members = {i: np.array(sorted(module.nodes), dtype=np.int64) for i, module in self.modules.items()}
+        for i in self.modules:
+            for j in self.modules:
                 if i >= j:
                     continue
                 
-                # Connect some nodes between modules
-                nodes_i = list(module_i.nodes)
-                nodes_j = list(module_j.nodes)
-                
-                num_connections = int(
-                    len(nodes_i) * len(nodes_j) * self.inter_density
+                # Connect some random node pairs between modules
+                num_connections = int(len(members[i]) * len(members[j]) * self.inter_density)
+                if num_connections == 0:
+                    continue
+                self._link_many(
+                    self._rng.choice(members[i], num_connections),
+                    self._rng.choice(members[j], num_connections),
+                    self._rng.uniform(0.2, 0.5, num_connections),
                 )
-                
-                for _ in range(num_connections):
-                    node_i = random.choice(nodes_i)
-                    node_j = random.choice(nodes_j)
-                    
-                    if node_j not in self.nodes[node_i].connections:
-                        weight = random.uniform(0.2, 0.5)
-                        self.nodes[node_i].add_connection(node_j, weight)
-                        self.nodes[node_j].add_connection(node_i, weight)
     
     def _build_hybrid(self):
         """
@@ -362,196 +472,271 @@ class ModularNetwork:
         """
         # Phase 1: Modular base
         self._build_modular()
+
+        # Within-module degree of every node
+        adjacency = self.adjacency
+        rows = np.repeat(np.arange(self.num_nodes), np.diff(adjacency.indptr))
+        same_module = self._module_ids[rows] == self._module_ids[adjacency.indices]
+        module_degrees = np.bincount(rows[same_module], minlength=self.num_nodes).astype(np.float64)
         
         # Phase 2: Add scale-free hubs (preferential attachment within modules)
+        position = np.full(self.num_nodes, -1, dtype=np.int64)
         for module in self.modules.values():
-            nodes_list = list(module.nodes)
+            nodes_list = np.array(sorted(module.nodes), dtype=np.int64)
             if len(nodes_list) < 5:
                 continue
+            position[nodes_list] = np.arange(len(nodes_list))
             
             # Start with small complete graph
             m0 = min(3, len(nodes_list))
             for i in range(m0):
                 for j in range(i + 1, m0):
-                    node_i = nodes_list[i]
-                    node_j = nodes_list[j]
-                    if node_j not in self.nodes[node_i].connections:
-                        weight = random.uniform(0.4, 0.7)
-                        self.nodes[node_i].add_connection(node_j, weight)
-                        self.nodes[node_j].add_connection(node_i, weight)
+                    node_i, node_j = int(nodes_list[i]), int(nodes_list[j])
+                    if self.add_connection(node_i, node_j, self._random.uniform(0.4, 0.7)):
+                        module_degrees[node_i] += 1
+                        module_degrees[node_j] += 1
             
-            # Preferential attachment within module
+            # Preferential attachment within module: attach to 1-2 earlier
+            # nodes with probability proportional to their module degree
             for i in range(m0, len(nodes_list)):
-                node_i = nodes_list[i]
-                
-                # Calculate degrees within module
-                degrees = {}
-                for j in range(i):
-                    node_j = nodes_list[j]
-                    # Count connections within module
-                    module_degree = sum(
-                        1 for conn in self.nodes[node_j].connections
-                        if conn in module.nodes
-                    )
-                    degrees[node_j] = module_degree
-                
-                total_degree = sum(degrees.values())
-                if total_degree == 0:
+                node_i = int(nodes_list[i])
+                weights = module_degrees[nodes_list[:i]]
+                if weights.sum() == 0:
                     continue
                 
-                # Attach to 1-2 high-degree nodes
-                probs = {j: deg / total_degree for j, deg in degrees.items()}
-                num_attach = min(2, len(probs))
+                # Skip nodes node_i is already connected to
+                connected = np.fromiter(self.nodes[node_i].connections, dtype=np.int64)
+                connected = position[connected]
+                weights = weights.copy()
+                weights[connected[(connected >= 0) & (connected < i)]] = 0.0
+                total = weights.sum()
+                if total == 0:
+                    continue
                 
-                for _ in range(num_attach):
-                    remaining = [j for j in probs.keys() if j not in self.nodes[node_i].connections]
-                    if not remaining:
-                        break
-                    target = random.choices(
-                        remaining,
-                        weights=[probs[j] for j in remaining]
-                    )[0]
-                    
-                    weight = random.uniform(0.4, 0.7)
-                    self.nodes[node_i].add_connection(target, weight)
-                    self.nodes[target].add_connection(node_i, weight)
-        
-        # Phase 3: Add small-world shortcuts (rewire some edges)
-        all_edges = []
-        for node_id, node in self.nodes.items():
-            for target_id in node.connections:
-                if node_id < target_id:  # Avoid duplicates
-                    all_edges.append((node_id, target_id))
-        
-        # Rewire 10% of edges randomly
-        num_rewire = int(len(all_edges) * 0.1)
-        edges_to_rewire = random.sample(all_edges, min(num_rewire, len(all_edges)))
-        
-        for node_i, node_j in edges_to_rewire:
+                size = min(2, i, int(np.count_nonzero(weights)))
+                for position_j in self._rng.choice(i, size=size, replace=False, p=weights / total).tolist():
+                    target = int(nodes_list[position_j])
+                    self.add_connection(node_i, target, self._random.uniform(0.4, 0.7))
+                    module_degrees[node_i] += 1
+                    module_degrees[target] += 1
+            position[nodes_list] = -1
+        
+        # Phase 3: Add small-world shortcuts (rewire 10% of edges randomly)
+        upper = sparse.triu(self.adjacency, k=1).tocoo()
+        num_rewire = int(upper.nnz * 0.1)
+        picked = self._rng.choice(upper.nnz, size=num_rewire, replace=False)
+        new_targets = self._rng.integers(0, self.num_nodes, size=num_rewire)
+        
+        for node_i, node_j, new_target in zip(upper.row[picked].tolist(), upper.col[picked].tolist(), new_targets.tolist()):
             # Remove old edge
             weight = self.nodes[node_i].connections[node_j]
-            self.nodes[node_i].remove_connection(node_j)
-            self.nodes[node_j].remove_connection(node_i)
+            self.remove_connection(node_i, node_j)
             
             # Add new random edge
-            new_target = random.randint(0, self.num_nodes - 1)
             if new_target != node_i and new_target not in self.nodes[node_i].connections:
-                self.nodes[node_i].add_connection(new_target, weight)
-                self.nodes[new_target].add_connection(node_i, weight)
+                self.add_connection(node_i, new_target, weight)
     
     def _identify_hubs(self, hub_threshold_percentile: float = 90):
         """Identify hub nodes (high degree)."""
-        degrees = [node.degree for node in self.nodes.values()]
+        degrees = np.fromiter((node.degree for node in self.nodes.values()), dtype=np.int64, count=len(self.nodes))
         threshold = np.percentile(degrees, hub_threshold_percentile)
         
-        for node in self.nodes.values():
-            if node.degree >= threshold:
-                node.is_hub = True
-                self.hub_nodes.add(node.node_id)
+        node_ids = list(self.nodes)
+        for index in np.flatnonzero(degrees >= threshold).tolist():
+            self.nodes[node_ids[index]].is_hub = True
+            self.hub_nodes.add(node_ids[index])
         
         self.stats['num_hubs'] = len(self.hub_nodes)
     
     def _compute_statistics(self):
-        """Compute network statistics."""
-        # Average degree
-        degrees = [node.degree for node in self.nodes.values()]
-        self.stats['avg_degree'] = np.mean(degrees)
-        
-        # Clustering coefficient
-        clustering_coeffs = []
-        for node in self.nodes.values():
-            neighbors = list(node.connections.keys())
-            if len(neighbors) < 2:
-                clustering_coeffs.append(0.0)
-                continue
-            
-            # Count edges between neighbors
-            edges_between = 0
-            for i, n1 in enumerate(neighbors):
-                for n2 in neighbors[i + 1:]:
-                    if n2 in self.nodes[n1].connections:
-                        edges_between += 1
-            
-            # Clustering coefficient
-            possible_edges = len(neighbors) * (len(neighbors) - 1) / 2
-            coeff = edges_between / possible_edges if possible_edges > 0 else 0.0
-            clustering_coeffs.append(coeff)
-            node.clustering_coeff = coeff
-        
-        self.stats['avg_clustering'] = np.mean(clustering_coeffs)
-        
-        # Average path length (sample-based for large networks)
-        if self.num_nodes <= 100:
-            self.stats['avg_path_length'] = self._compute_avg_path_length()
+        """
+        Recompute all statistics from the adjacency matrix.
+
+        Sets up the counters that `add_connection` / `remove_connection`
+        update afterwards, and picks the (seeded) node samples used for
+        clustering and path length on large networks.
+        """
+        adjacency = self.adjacency
+        n = self.num_nodes
+        degrees = np.diff(adjacency.indptr)
+
+        self._degrees = degrees.astype(np.int64)
+        self._degree_counts = np.bincount(self._degrees, minlength=1)
+        self._num_edges = int(adjacency.nnz) // 2
+        rows = np.repeat(np.arange(n), degrees)
+        self._intra_edges = int(np.count_nonzero(self._module_ids[rows] == self._module_ids[adjacency.indices])) // 2
+        self._module_degree = np.bincount(self._module_ids, weights=self._degrees, minlength=self.num_modules).astype(np.int64)
+
+        # Triangles through each tracked node: rows of (A @ A) ∘ A, in blocks
+        if n <= self.clustering_sample_size:
+            tracked = np.arange(n)
         else:
-            self.stats['avg_path_length'] = self._estimate_avg_path_length(sample_size=100)
-        
-        # Modularity
+            tracked = np.sort(self._rng.choice(n, size=self.clustering_sample_size, replace=False))
+        self._tracked = np.zeros(n, dtype=bool)
+        self._tracked[tracked] = True
+        self._triangles = np.zeros(n, dtype=np.int64)
+        binary = adjacency.copy()
+        binary.data = np.ones_like(binary.data)
+        for start in range(0, len(tracked), 512):
+            block = binary[tracked[start:start + 512]]
+            closed = np.asarray((block @ binary).multiply(block).sum(axis=1)).ravel()
+            self._triangles[tracked[start:start + 512]] = np.rint(closed / 2).astype(np.int64)
+
+        # Path length sources (all nodes for small networks)
+        if n <= self.path_sample_size:
+            self._path_sources = np.arange(n)
+        else:
+            self._path_sources = np.sort(self._rng.choice(n, size=self.path_sample_size, replace=False))
+
+        clustering = self._clustering(tracked)
+        for node_id, coeff in zip(tracked.tolist(), clustering.tolist()):
+            self.nodes[node_id].clustering_coeff = coeff
+
+        self._refresh_counter_stats()
+        self.stats['avg_path_length'] = self._compute_avg_path_length(self._path_sources)
+        self._path_length_stale = False
+
+    def _clustering(self, node_ids: np.ndarray) -> np.ndarray:
+        """Local clustering coefficients from the triangle counters."""
+        degrees = self._degrees[node_ids].astype(np.float64)
+        possible = degrees * (degrees - 1) / 2.0
+        triangles = self._triangles[node_ids].astype(np.float64)
+        return np.divide(triangles, possible, out=np.zeros_like(possible), where=possible > 0)
+
+    def _refresh_counter_stats(self):
+        """Statistics derived from the incremental counters."""
+        self.stats['avg_degree'] = float(self._degrees.mean()) if self.num_nodes else 0.0
+        tracked = np.flatnonzero(self._tracked)
+        self.stats['avg_clustering'] = float(self._clustering(tracked).mean()) if len(tracked) else 0.0
         self.stats['modularity'] = self._compute_modularity()
-        
+
         # Scale-free exponent (if applicable)
         if self.topology in [NetworkTopology.SCALE_FREE, NetworkTopology.HYBRID]:
             self.stats['scale_free_exponent'] = self._estimate_scale_free_exponent()
+
+    def _update_counters(self, source: int, target: int, sign: int):
+        """
+        Apply one edge insertion (+1) or removal (-1) to the counters.
+
+        Called before the edge is inserted / after it is removed, so both
+        endpoints' connection dicts exclude each other.
+        """
+        common = self.nodes[source].connections.keys() & self.nodes[target].connections.keys()
+        common_ids = np.fromiter(common, dtype=np.int64, count=len(common))
+
+        for node_id in (source, target):
+            old = self._degrees[node_id]
+            new = old + sign
+            if new >= len(self._degree_counts):
+                self._degree_counts = np.concatenate([self._degree_counts, np.zeros(new + 1 - len(self._degree_counts), dtype=np.int64)])
+            self._degree_counts[old] -= 1
+            self._degree_counts[new] += 1
+            self._degrees[node_id] = new
+            self._module_degree[self._module_ids[node_id]] += sign
+            self._triangles[node_id] += sign * len(common_ids)
+
+        self._num_edges += sign
+        if self._module_ids[source] == self._module_ids[target]:
+            self._intra_edges += sign
+        self._triangles[common_ids] += sign
+
+        # Clustering changes for the endpoints and their common neighbours
+        affected = np.concatenate([np.array([source, target], dtype=np.int64), common_ids])
+        affected = affected[self._tracked[affected]]
+        for node_id, coeff in zip(affected.tolist(), self._clustering(affected).tolist()):
+            self.nodes[node_id].clustering_coeff = coeff
+
+        self._refresh_counter_stats()
+        self._path_length_stale = True
+
+    def _bfs_distances(self, source: int) -> np.ndarray:
+        """
+        Hop distances from `source` (-1 = unreachable).
+
+        Level-synchronous BFS over the CSR arrays. Each level expands the
+        frontier top-down, or checks the unvisited nodes bottom-up when they
+        have fewer edges than the frontier.
+        """
+        adjacency = self.adjacency
+        indptr, indices = adjacency.indptr, adjacency.indices
+        degrees = np.diff(indptr)
+
+        distances = np.full(self.num_nodes, -1, dtype=np.int64)
+        distances[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        level = 0
+
+        while len(frontier):
+            level += 1
+            unvisited = np.flatnonzero(distances < 0)
+            if not len(unvisited):
+                break
+
+            if degrees[frontier].sum() <= degrees[unvisited].sum():
+                # Top-down: neighbours of the frontier
+                neighbors = indices[_gather_ranges(indptr, frontier)]
+                neighbors = neighbors[distances[neighbors] < 0]
+                distances[neighbors] = level
+                frontier = np.flatnonzero(distances == level)
+            else:
+                # Bottom-up: unvisited nodes with a neighbour in the frontier
+                owners = np.repeat(np.arange(len(unvisited)), degrees[unvisited])
+                hits = distances[indices[_gather_ranges(indptr, unvisited)]] == level - 1
+                reached = unvisited[np.bincount(owners[hits], minlength=len(unvisited)) > 0]
+                distances[reached] = level
+                frontier = reached
+
+        return distances
     
-    def _compute_avg_path_length(self) -> float:
-        """Compute average shortest path length (BFS)."""
+    def _compute_avg_path_length(self, sources: Optional[np.ndarray] = None) -> float:
+        """
+        Average shortest path length over reachable pairs (BFS).
+
+        Args:
+            sources: BFS source nodes (default: every node, i.e. exact)
+        """
+        if sources is None:
+            sources = np.arange(self.num_nodes)
+
         total_path_length = 0
         num_pairs = 0
-        
-        for source in range(min(50, self.num_nodes)):  # Sample for efficiency
-            # BFS from source
-            distances = {source: 0}
-            queue = [source]
-            
-            while queue:
-                current = queue.pop(0)
-                current_dist = distances[current]
-                
-                for neighbor in self.nodes[current].connections:
-                    if neighbor not in distances:
-                        distances[neighbor] = current_dist + 1
-                        queue.append(neighbor)
-            
-            # Sum distances
-            for dist in distances.values():
-                if dist > 0:
-                    total_path_length += dist
-                    num_pairs += 1
+        for source in np.asarray(sources).tolist():
+            distances = self._bfs_distances(source)
+            reached = distances > 0
+            total_path_length += int(distances[reached].sum())
+            num_pairs += int(np.count_nonzero(reached))
         
         return total_path_length / num_pairs if num_pairs > 0 else 0.0
     
-    def _estimate_avg_path_length(self, sample_size: int = 100) -> float:
-        """Estimate average path length using sampling."""
-        sampled_nodes = random.sample(range(self.num_nodes), min(sample_size, self.num_nodes))
-        return self._compute_avg_path_length()
+    def _estimate_avg_path_length(self, sample_size: int = 100, seed: Optional[int] = None) -> float:
+        """
+        Estimate average path length from BFS over `sample_size` random sources.
+
+        Args:
+            sample_size: Number of source nodes
+            seed: Sampling seed (default: the network's own random stream)
+        """
+        rng = np.random.default_rng(seed) if seed is not None else self._rng
+        sources = rng.choice(self.num_nodes, size=min(sample_size, self.num_nodes), replace=False)
+        return self._compute_avg_path_length(sources)
     
     def _compute_modularity(self) -> float:
         """
         Compute modularity Q.
         
         Q = (1/2m) Σ[A_ij - k_i*k_j/2m] δ(c_i, c_j)
+          = L_in/m - Σ_c (d_c/2m)²
+
+        with L_in the intra-module edge count and d_c the total degree of
+        module c, both kept as counters.
         """
-        m = sum(node.degree for node in self.nodes.values()) / 2  # Total edges
+        m = self._num_edges
         
         if m == 0:
             return 0.0
         
-        Q = 0.0
-        for i, node_i in self.nodes.items():
-            for j, node_j in self.nodes.items():
-                # A_ij: 1 if connected, 0 otherwise
-                A_ij = 1.0 if j in node_i.connections else 0.0
-                
-                # Expected edges
-                expected = (node_i.degree * node_j.degree) / (2 * m)
-                
-                # δ(c_i, c_j): 1 if same module, 0 otherwise
-                same_module = 1.0 if node_i.module_id == node_j.module_id else 0.0
-                
-                Q += (A_ij - expected) * same_module
-        
-        Q /= (2 * m)
-        return Q
+        module_degree = self._module_degree.astype(np.float64)
+        return float(self._intra_edges / m - np.sum((module_degree / (2 * m)) ** 2))
     
     def _estimate_scale_free_exponent(self) -> float:
         """
@@ -559,36 +744,27 @@ class ModularNetwork:
         
         P(k) ~ k^(-γ)
         """
-        degrees = [node.degree for node in self.nodes.values() if node.degree > 0]
-        
-        if len(degrees) < 10:
+        if self._degree_counts[1:].sum() < 10:
             return 0.0
         
-        # Log-log fit
-        degree_counts = {}
-        for d in degrees:
-            degree_counts[d] = degree_counts.get(d, 0) + 1
-        
-        log_degrees = []
-        log_counts = []
-        for degree, count in degree_counts.items():
-            if degree > 0 and count > 0:
-                log_degrees.append(math.log(degree))
-                log_counts.append(math.log(count))
-        
-        if len(log_degrees) < 3:
+        # Log-log fit over the observed degrees
+        observed = np.flatnonzero(self._degree_counts[1:]) + 1
+        if len(observed) < 3:
             return 0.0
         
+        log_degrees = np.log(observed)
+        log_counts = np.log(self._degree_counts[observed])
+        
         # Linear regression
         n = len(log_degrees)
-        sum_x = sum(log_degrees)
-        sum_y = sum(log_counts)
-        sum_xy = sum(x * y for x, y in zip(log_degrees, log_counts))
-        sum_x2 = sum(x * x for x in log_degrees)
+        sum_x = log_degrees.sum()
+        sum_y = log_counts.sum()
+        sum_xy = np.dot(log_degrees, log_counts)
+        sum_x2 = np.dot(log_degrees, log_degrees)
         
         slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
         
-        return -slope  # γ = -slope
+        return float(-slope)  # γ = -slope
     
     def get_node(self, node_id: int) -> Optional[NetworkNode]:
         """Get node by ID."""
@@ -611,9 +787,16 @@ class ModularNetwork:
     def get_hubs(self) -> List[int]:
         """Get list of hub node IDs."""
         return list(self.hub_nodes)
+
+    def _refresh_path_length(self):
+        """Re-run the sampled BFS if edges changed since the last estimate."""
+        if self._path_length_stale:
+            self.stats['avg_path_length'] = self._compute_avg_path_length(self._path_sources)
+            self._path_length_stale = False
     
     def get_stats(self) -> Dict[str, Any]:
         """Get network statistics."""
+        self._refresh_path_length()
         return {
             **self.stats,
             'num_nodes': self.num_nodes,
@@ -624,6 +807,7 @@ class ModularNetwork:
     
     def visualize_summary(self) -> str:
         """Get text summary of network structure."""
+        self._refresh_path_length()
         lines = [
             f"Modular Network: {self.num_nodes} {self.node_type} nodes",
             f"Topology: {self.topology.value}",
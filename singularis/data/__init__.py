@@ -58,8 +58,9 @@ Usage:
 """
 
 from .core import DATASystem, DATAConfig
-from .experts import ExpertRouter, LoRAExpert
-from .workspace import GlobalWorkspace, WorkspaceItem
+from .experts import ExpertRouter, LoRAExpert, SharedBaseModelHost
+from .generation import GenerationExecutor, GenerationRequest
+from .workspace import GlobalWorkspace, WorkspaceItem, WorkspaceSubscription
 from .communication import DistributedCommunicator
 from .node_manager import NodeManager, NodeRole
 
@@ -68,8 +69,12 @@ __all__ = [
     "DATAConfig",
     "ExpertRouter",
     "LoRAExpert",
+    "SharedBaseModelHost",
+    "GenerationExecutor",
+    "GenerationRequest",
     "GlobalWorkspace",
     "WorkspaceItem",
+    "WorkspaceSubscription",
     "DistributedCommunicator",
     "NodeManager",
     "NodeRole",
@@ -3,6 +3,12 @@ Distributed Communication Layer
 ================================
 
 gRPC-based communication for distributed node coordination.
+
+The transport is selected by `config.transport`:
+- "inprocess" (default): nodes exchange messages through asyncio queues.
+- "uds" / "tcp": nodes listed in `config.local_nodes` are served by this
+  process; every other node is reached over a SocketTransport, so experts
+  can run in separate worker processes or on other hosts.
 """
 
 import asyncio
@@ -12,6 +18,8 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from loguru import logger
 
+from .transport import SocketTransport
+
 # Note: gRPC would be used in production, but we'll implement
 # a simpler async communication system for now
 
@@ -46,14 +54,30 @@ class DistributedCommunicator:
     Handles communication between distributed nodes
     
     In production, this would use gRPC for high-performance RPC.
-    For now, we implement a simple async message passing system.
+    For now, we implement a simple async message passing system, with an
+    optional socket transport for nodes hosted in other processes.
     """
     
     def __init__(self, config: Any, node_manager: Any):
         self.config = config
         self.node_manager = node_manager
         
-        # Message queues for each node
+        # Transport selection
+        self.transport_kind = getattr(config, "transport", "inprocess")
+        self.transport: Optional[SocketTransport] = None
+        if self.transport_kind != "inprocess":
+            self.transport = SocketTransport(
+                kind=self.transport_kind,
+                socket_dir=getattr(config, "transport_socket_dir", None),
+                max_message_bytes=int(getattr(config, "max_message_size_mb", 512) * 1024 * 1024),
+                connect_timeout=float(getattr(config, "timeout", 30)),
+            )
+        self.local_nodes: List[str] = list(getattr(config, "local_nodes", None) or [])
+        self.inbox_size = int(getattr(config, "inbox_size", 0))  # 0 = unbounded
+        self.heartbeat_interval = float(getattr(config, "heartbeat_interval", 1))
+        self.heartbeat_task: Optional[asyncio.Task] = None
+        
+        # Message queues for each locally hosted node
         self.message_queues: Dict[str, asyncio.Queue] = {}
         
         # Connection tracking
@@ -77,16 +101,24 @@ class DistributedCommunicator:
         try:
             logger.info("Initializing distributed communication...")
             
-            # Create message queues for each node
+            # Create message queues for each node hosted here
             if self.node_manager:
-                for node_id in self.node_manager.nodes.keys():
-                    self.message_queues[node_id] = asyncio.Queue()
+                all_nodes = list(self.node_manager.nodes.keys())
+                if not self.local_nodes or self.transport is None:
+                    self.local_nodes = all_nodes
+                
+                for node_id in all_nodes:
+                    if node_id in self.local_nodes:
+                        self.message_queues[node_id] = asyncio.Queue(maxsize=self.inbox_size)
                     self.connections[node_id] = {
                         "status": "connected",
                         "last_heartbeat": time.time(),
                         "latency_ms": 0.0
                     }
             
+            if self.transport is not None:
+                await self._start_transport()
+            
             self.is_initialized = True
             logger.success("Distributed communication initialized")
             return True
@@ -126,15 +158,19 @@ class DistributedCommunicator:
                 message_id=f"{sender_id}_{int(time.time() * 1000)}"
             )
             
-            # Check if receiver exists
-            if receiver_id not in self.message_queues:
+            if receiver_id in self.message_queues:
+                # Local node: put message straight into its queue
+                await self.message_queues[receiver_id].put(message)
+            elif self.transport is not None and receiver_id in self.connections:
+                # Remote node: frame it over the reused socket connection
+                await self.transport.send(
+                    receiver_id, self._address_for(receiver_id), message.to_dict()
+                )
+            else:
                 logger.warning(f"Receiver {receiver_id} not found")
                 self.metrics["failed_sends"] += 1
                 return False
             
-            # Put message in queue
-            await self.message_queues[receiver_id].put(message)
-            
             # Update metrics
             latency_ms = (time.time() - start_time) * 1000
             self.metrics["messages_sent"] += 1
@@ -180,7 +216,7 @@ class DistributedCommunicator:
         tasks = []
         target_nodes = []
         
-        for node_id in self.message_queues.keys():
+        for node_id in self.connections.keys():
             if node_id not in exclude and node_id != sender_id:
                 task = self.send_message(node_id, message_type, content, sender_id)
                 tasks.append(task)
@@ -295,16 +331,123 @@ class DistributedCommunicator:
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get communication metrics"""
-        return {
+        metrics = {
             **self.metrics,
+            "transport": self.transport_kind,
             "active_connections": len(self.connections),
             "message_queues": len(self.message_queues)
         }
+        if self.transport is not None:
+            metrics["transport_stats"] = self.transport.get_stats()
+        return metrics
+    
+    # ─── Socket transport ──────────────────────────────────────────────
+    
+    def _address_for(self, node_id: str):
+        node = self.node_manager.nodes.get(node_id) if self.node_manager else None
+        if node is None:
+            return self.transport.address_for(node_id)
+        return self.transport.address_for(node_id, node.hostname, node.port)
+    
+    async def _start_transport(self):
+        """Start servers for local nodes and heartbeats toward remote ones."""
+        for node_id in self.local_nodes:
+            await self.transport.start_server(
+                node_id,
+                self._address_for(node_id),
+                lambda data, node_id=node_id: self._deliver(node_id, data),
+            )
+        
+        remote_nodes = [n for n in self.connections if n not in self.local_nodes]
+        if self.node_manager and hasattr(self.node_manager, "mark_remote"):
+            for node_id in remote_nodes:
+                self.node_manager.mark_remote(node_id)
+        
+        if remote_nodes and self.heartbeat_interval > 0:
+            self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        
+        logger.info(
+            f"{self.transport_kind.upper()} transport: local={self.local_nodes}, remote={remote_nodes}"
+        )
+    
+    async def _deliver(self, node_id: str, data: Dict[str, Any]):
+        """Handle a frame received for a local node."""
+        message = Message.from_dict(data)
+        self._record_liveness(message)
+        if message.message_type == "heartbeat":
+            return  # Consumed by the transport layer
+        # Blocks while the inbox is full, which stops reading the socket
+        # and pushes back on the sender
+        await self.message_queues[node_id].put(message)
+    
+    def _record_liveness(self, message: Message):
+        """Any frame from a peer proves it is alive; heartbeats cover every node it hosts."""
+        node_ids = [message.sender_id]
+        if message.message_type == "heartbeat":
+            node_ids = message.content.get("nodes") or node_ids
+        
+        now = time.time()
+        for node_id in node_ids:
+            connection = self.connections.get(node_id)
+            if connection is None:
+                continue
+            connection["last_heartbeat"] = now
+            connection["status"] = "connected"
+            if message.message_type == "heartbeat":
+                sent_at = message.content.get("timestamp", message.timestamp)
+                connection["latency_ms"] = max(0.0, (now - sent_at) * 1000)
+            if self.node_manager and hasattr(self.node_manager, "record_heartbeat"):
+                self.node_manager.record_heartbeat(node_id)
+    
+    async def _heartbeat_loop(self):
+        """
+        Periodically send one heartbeat to every remote node.
+        
+        Each heartbeat lists all locally hosted nodes so the receiver refreshes
+        each of them. Peers are contacted concurrently, so an unreachable peer's
+        connect timeout doesn't delay heartbeats to the others.
+        """
+        sender_id = self.local_nodes[0] if self.local_nodes else "system"
+        while True:
+            try:
+                await asyncio.sleep(self.heartbeat_interval)
+                remote_nodes = [n for n in self.connections if n not in self.local_nodes]
+                content = {"timestamp": time.time(), "nodes": list(self.local_nodes)}
+                results = await asyncio.gather(
+                    *(
+                        self.send_message(
+                            receiver_id=node_id,
+                            message_type="heartbeat",
+                            content=content,
+                            sender_id=sender_id
+                        )
+                        for node_id in remote_nodes
+                    ),
+                    return_exceptions=True
+                )
+                for node_id, ok in zip(remote_nodes, results):
+                    if ok is not True:
+                        self.connections[node_id]["status"] = "unreachable"
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Heartbeat loop error: {e}")
     
     async def shutdown(self):
         """Shutdown communication system"""
         logger.info("Shutting down distributed communication...")
         
+        if self.heartbeat_task:
+            self.heartbeat_task.cancel()
+            try:
+                await self.heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self.heartbeat_task = None
+        
+        if self.transport is not None:
+            await self.transport.close()
+        
         # Clear all message queues
         for queue in self.message_queues.values():
             while not queue.empty():
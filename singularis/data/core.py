@@ -36,6 +36,8 @@ class DATAConfig:
     base_model: str = "meta-llama/Llama-2-7b-hf"
     num_experts: int = 8
     top_k: int = 2
+    share_base_model: bool = True  # One base model, experts as switchable LoRA adapters
+    adapter_paths: Dict[str, str] = field(default_factory=dict)  # expert name -> trained adapter dir
     
     # Global Workspace configuration
     workspace_capacity: int = 7  # Miller's magic number
@@ -48,10 +50,16 @@ class DATAConfig:
     encryption: bool = True
     heartbeat_interval: int = 1
     timeout: int = 30
+    transport: str = "inprocess"  # inprocess, uds, tcp
+    local_nodes: List[str] = field(default_factory=list)  # Nodes served by this process (empty = all)
+    transport_socket_dir: Optional[str] = None  # Directory for <node_id>.sock (uds)
+    inbox_size: int = 0  # Per-node inbox bound for backpressure (0 = unbounded)
+    max_message_size_mb: int = 512
     
     # Performance configuration
     enable_monitoring: bool = True
     enable_load_balancing: bool = True
+    latency_ewma_alpha: float = 0.2  # Weight of the newest latency sample in load estimates
     enable_failover: bool = True
     
     @classmethod
@@ -356,6 +364,9 @@ class DATASystem:
         if self.global_workspace:
             self.global_workspace.stop_workspace()
         
+        if self.expert_router:
+            self.expert_router.shutdown()
+        
         if self.communicator:
             await self.communicator.shutdown()
         
@@ -4,16 +4,24 @@ MoE-LoRA Expert System
 
 Mixture of Experts with LoRA adapters for specialized processing.
 Implements dynamic routing and parameter-efficient fine-tuning.
+
+Experts can share one base model: a SharedBaseModelHost keeps a single copy
+of the base weights and registers every expert as a named LoRA adapter,
+switching adapters per request (N experts cost ~1x base + N small adapters).
 """
 
 import asyncio
+import time
 import torch
 import torch.nn as nn
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from loguru import logger
 import numpy as np
 
+from .generation import GenerationExecutor, GenerationRequest, generate_padded_batch
+from .load_balancing import LoadTracker
+
 try:
     from transformers import AutoModelForCausalLM, AutoTokenizer
     from peft import LoraConfig, get_peft_model, TaskType
@@ -40,26 +48,182 @@ class ExpertConfig:
             self.target_modules = ["q_proj", "v_proj", "k_proj", "o_proj"]
 
 
+class SharedBaseModelHost:
+    """
+    One base model in memory with every expert attached as a named adapter.
+    
+    Generation runs on a GenerationExecutor: requests are queued per adapter,
+    pending prompts for one adapter are batched into a single padded call,
+    and the executor prefers the adapter that is already active, so adapter
+    switches are minimized. An adapter keeps the model for at most
+    `max_consecutive_groups` batches while others wait.
+    """
+    
+    def __init__(
+        self,
+        base_model_name: str,
+        device: str = "cuda",
+        max_consecutive_groups: int = 4,
+        max_batch_size: int = 8
+    ):
+        self.base_model_name = base_model_name
+        self.device = device if torch.cuda.is_available() else "cpu"
+        
+        self.model = None
+        self.tokenizer = None
+        self.is_loaded = False
+        self.adapters: Dict[str, Any] = {}
+        
+        self._load_lock = asyncio.Lock()
+        self.executor = GenerationExecutor(
+            generate_batch=self._generate_batch,
+            activate=self._activate,
+            max_batch_size=max_batch_size,
+            max_consecutive_groups=max_consecutive_groups,
+            name="shared-base"
+        )
+    
+    @property
+    def active_adapter(self) -> Optional[str]:
+        return self.executor.active_key
+    
+    async def load_base(self) -> bool:
+        """Load the shared base model and tokenizer (once)."""
+        async with self._load_lock:
+            if self.is_loaded:
+                return True
+            if not TRANSFORMERS_AVAILABLE:
+                return False
+            
+            logger.info(f"Loading shared base model '{self.base_model_name}'...")
+            self.model = AutoModelForCausalLM.from_pretrained(
+                self.base_model_name,
+                torch_dtype=torch.float16,
+                device_map=self.device,
+                low_cpu_mem_usage=True
+            )
+            self.tokenizer = AutoTokenizer.from_pretrained(self.base_model_name)
+            if self.tokenizer.pad_token is None:
+                self.tokenizer.pad_token = self.tokenizer.eos_token
+            
+            self.is_loaded = True
+            logger.success(f"Shared base model '{self.base_model_name}' loaded")
+            return True
+    
+    async def register_adapter(
+        self,
+        name: str,
+        config: ExpertConfig,
+        adapter_path: Optional[str] = None
+    ) -> bool:
+        """
+        Attach an expert's LoRA adapter to the shared base model
+        
+        Args:
+            name: Adapter name (the expert name)
+            config: Expert configuration with LoRA hyperparameters
+            adapter_path: Optional path to trained adapter weights
+        
+        Returns:
+            True if the adapter is available
+        """
+        if name in self.adapters:
+            return True
+        if not await self.load_base():
+            return False
+        
+        lora_config = LoraConfig(
+            task_type=TaskType.CAUSAL_LM,
+            r=config.lora_r,
+            lora_alpha=config.lora_alpha,
+            lora_dropout=config.lora_dropout,
+            target_modules=config.target_modules,
+            bias="none"
+        )
+        
+        async with self._load_lock:
+            if not self.adapters:
+                # First adapter wraps the base model (and is active); the
+                # rest are added alongside it
+                self.model = get_peft_model(self.model, lora_config, adapter_name=name)
+                self.executor.active_key = name
+            else:
+                self.model.add_adapter(name, lora_config)
+            if adapter_path:
+                self.model.load_adapter(adapter_path, adapter_name=name)
+            
+            self.adapters[name] = lora_config
+        
+        logger.info(f"Registered adapter '{name}' on shared base (r={config.lora_r})")
+        return True
+    
+    async def run(self, adapter_name: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run a blocking call with `adapter_name` active, off the event loop
+        
+        Args:
+            adapter_name: Adapter that must be active while `fn` runs
+            fn: Callable using `self.model`
+        
+        Returns:
+            Whatever `fn` returns
+        """
+        return await self.executor.run(adapter_name, fn)
+    
+    async def generate(self, adapter_name: str, request: GenerationRequest) -> str:
+        """Generate with `adapter_name`, batched with concurrent requests for it"""
+        return await self.executor.submit(adapter_name, request)
+    
+    def _activate(self, adapter_name: str):
+        if self.model is not None and hasattr(self.model, "set_adapter"):
+            self.model.set_adapter(adapter_name)
+    
+    def _generate_batch(self, adapter_name: str, requests: List[GenerationRequest]) -> List[str]:
+        return generate_padded_batch(self.model, self.tokenizer, self.device, requests)
+    
+    def shutdown(self):
+        self.executor.shutdown()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.executor.get_stats()
+        return {
+            **stats,
+            "adapter_switches": stats["key_switches"],
+            "base_model": self.base_model_name,
+            "is_loaded": self.is_loaded,
+            "adapters": list(self.adapters),
+            "active_adapter": self.active_adapter,
+        }
+
+
 class LoRAExpert:
     """
     A single LoRA-adapted expert for specialized processing
     
     Each expert is fine-tuned for specific domains using parameter-efficient
     LoRA (Low-Rank Adaptation) technique.
+    
+    With an `adapter_host`, the expert is a named adapter on a shared base
+    model instead of owning a full model copy.
     """
     
     def __init__(
         self,
         config: ExpertConfig,
         base_model_name: str = "meta-llama/Llama-2-7b-hf",
-        device: str = "cuda"
+        device: str = "cuda",
+        adapter_host: Optional[SharedBaseModelHost] = None,
+        adapter_path: Optional[str] = None
     ):
         self.config = config
         self.base_model_name = base_model_name
         self.device = device if torch.cuda.is_available() else "cpu"
+        self.adapter_host = adapter_host
+        self.adapter_path = adapter_path
         
         self.model = None
         self.tokenizer = None
+        self.executor: Optional[GenerationExecutor] = None
         self.is_loaded = False
         
         # Performance tracking
@@ -77,6 +241,17 @@ class LoRAExpert:
             return True
         
         try:
+            if self.adapter_host is not None:
+                logger.info(f"Registering expert '{self.config.name}' as shared-base adapter...")
+                self.is_loaded = await self.adapter_host.register_adapter(
+                    self.config.name, self.config, self.adapter_path
+                )
+                if self.is_loaded:
+                    self.model = self.adapter_host.model
+                    self.tokenizer = self.adapter_host.tokenizer
+                    self.device = self.adapter_host.device
+                return self.is_loaded
+            
             logger.info(f"Loading model for expert '{self.config.name}'...")
             
             # Load base model
@@ -105,6 +280,14 @@ class LoRAExpert:
             if self.tokenizer.pad_token is None:
                 self.tokenizer.pad_token = self.tokenizer.eos_token
             
+            # Own worker thread: this expert generates in parallel with others
+            self.executor = GenerationExecutor(
+                generate_batch=lambda _, requests: generate_padded_batch(
+                    self.model, self.tokenizer, self.device, requests
+                ),
+                name=f"expert-{self.config.name}"
+            )
+            
             self.is_loaded = True
             logger.success(f"Expert '{self.config.name}' model loaded successfully")
             return True
@@ -118,9 +301,15 @@ class LoRAExpert:
         prompt: str,
         max_length: int = 512,
         temperature: float = 0.7,
-        top_p: float = 0.9
+        top_p: float = 0.9,
+        max_new_tokens: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Generate response for given prompt"""
+        """
+        Generate response for given prompt
+        
+        The model call runs on a worker thread, batched with concurrent
+        prompts for this expert; cancelling the caller drops the request.
+        """
         if not self.is_loaded:
             return {
                 "success": False,
@@ -145,28 +334,18 @@ class LoRAExpert:
                     "mock_mode": True
                 }
             
-            # Real generation
-            inputs = self.tokenizer(
-                prompt,
-                return_tensors="pt",
-                padding=True,
-                truncation=True
-            ).to(self.device)
-            
-            with torch.no_grad():
-                outputs = self.model.generate(
-                    **inputs,
-                    max_length=max_length,
-                    temperature=temperature,
-                    top_p=top_p,
-                    do_sample=True,
-                    pad_token_id=self.tokenizer.pad_token_id
-                )
-            
-            response = self.tokenizer.decode(
-                outputs[0][inputs['input_ids'].shape[1]:],
-                skip_special_tokens=True
-            ).strip()
+            # Real generation (off the event loop)
+            request = GenerationRequest(
+                prompt=prompt,
+                max_length=max_length,
+                max_new_tokens=max_new_tokens,
+                temperature=temperature,
+                top_p=top_p
+            )
+            if self.adapter_host is not None:
+                response = await self.adapter_host.generate(self.config.name, request)
+            else:
+                response = await self.executor.submit(self.config.name, request)
             
             latency = (asyncio.get_event_loop().time() - start_time) * 1000
             
@@ -227,6 +406,7 @@ class LoRAExpert:
             "call_count": self.call_count,
             "avg_latency_ms": self.total_latency / max(self.call_count, 1),
             "is_loaded": self.is_loaded,
+            "shared_base": self.adapter_host is not None,
             "specialization": self.config.specialization,
             "node": self.config.node_assignment
         }
@@ -273,6 +453,8 @@ class ExpertRouter:
     Routes queries to appropriate LoRA experts
     
     Implements top-k routing with load balancing and specialization-aware selection.
+    Load balancing uses live load: requests in flight per expert and an EWMA
+    of each expert's latency, not cumulative routing counts.
     """
     
     def __init__(
@@ -288,12 +470,19 @@ class ExpertRouter:
         self.experts: Dict[str, LoRAExpert] = {}
         self.gating_network: Optional[GatingNetwork] = None
         
+        # One base model shared by all experts (adapters switched per request)
+        self.adapter_host: Optional[SharedBaseModelHost] = None
+        if getattr(config, "share_base_model", True):
+            self.adapter_host = SharedBaseModelHost(config.base_model)
+        
         self.top_k = config.top_k
         self.noise_std = 0.1
         
         # Routing statistics
         self.routing_history: List[Dict[str, Any]] = []
-        self.expert_load: Dict[str, int] = {}
+        self.expert_load: Dict[str, int] = {}  # Total routings per expert
+        self.load_tracker = LoadTracker(alpha=getattr(config, "latency_ewma_alpha", 0.2))
+        self.load_penalty = 0.2  # Score reduction for the most loaded expert
         
         logger.info(f"Expert Router initialized (top_k={self.top_k})")
     
@@ -373,7 +562,9 @@ class ExpertRouter:
         for expert_config in expert_configs:
             expert = LoRAExpert(
                 config=expert_config,
-                base_model_name=self.config.base_model
+                base_model_name=self.config.base_model,
+                adapter_host=self.adapter_host,
+                adapter_path=getattr(self.config, "adapter_paths", {}).get(expert_config.name)
             )
             # Load in mock mode for now (can load real models later)
             await expert.load_model()
@@ -470,17 +661,26 @@ class ExpertRouter:
             }
     
     def _apply_load_balancing(self, scores: Dict[str, float]) -> Dict[str, float]:
-        """Apply load balancing to expert scores"""
-        if not self.expert_load:
+        """
+        Apply load balancing to expert scores
+        
+        Each score is reduced in proportion to the expert's expected wait
+        ((in-flight + 1) x EWMA latency) relative to the busiest expert, so
+        equally idle experts keep their specialization ranking.
+        """
+        if not getattr(self.config, "enable_load_balancing", True) or not scores:
             return scores
         
-        max_load = max(self.expert_load.values()) if self.expert_load else 1
+        costs = {name: self.load_tracker.cost(name) for name in scores}
+        max_cost = max(costs.values())
+        min_cost = min(costs.values())
+        if max_cost <= min_cost:
+            return dict(scores)
         
         balanced_scores = {}
         for expert_name, score in scores.items():
-            current_load = self.expert_load.get(expert_name, 0)
-            load_penalty = current_load / max(max_load, 1)
-            balanced_scores[expert_name] = score * (1.0 - 0.2 * load_penalty)
+            load_penalty = (costs[expert_name] - min_cost) / (max_cost - min_cost)
+            balanced_scores[expert_name] = score * (1.0 - self.load_penalty * load_penalty)
         
         return balanced_scores
     
@@ -507,16 +707,42 @@ class ExpertRouter:
             context_str = "\n".join([f"{k}: {v}" for k, v in context.items()])
             prompt = f"Context:\n{context_str}\n\nQuery: {query}"
         
-        result = await expert.generate(prompt)
+        node_id = expert.config.node_assignment
+        has_node = self.node_manager is not None and node_id in getattr(self.node_manager, "node_status", {})
+        
+        self.load_tracker.begin(expert_name)
+        if has_node:
+            self.node_manager.begin_task(node_id)
+        start_time = time.perf_counter()
+        success = False
+        try:
+            result = await expert.generate(prompt)
+            success = bool(result.get("success", False))
+        finally:
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            self.load_tracker.end(expert_name, latency_ms, success)
+            if has_node:
+                self.node_manager.end_task(node_id, latency_ms, success)
+        
         result["routing_weight"] = weight
         
         return result
     
+    def shutdown(self):
+        """Stop generation workers"""
+        if self.adapter_host is not None:
+            self.adapter_host.shutdown()
+        for expert in self.experts.values():
+            if expert.executor is not None:
+                expert.executor.shutdown()
+    
     def get_routing_stats(self) -> Dict[str, Any]:
         """Get routing statistics"""
         return {
             "total_routings": len(self.routing_history),
             "expert_load": self.expert_load,
+            "live_load": self.load_tracker.snapshot(list(self.experts)),
+            "adapter_host": self.adapter_host.get_stats() if self.adapter_host else None,
             "experts": {
                 name: expert.get_metrics()
                 for name, expert in self.experts.items()
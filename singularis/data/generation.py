@@ -0,0 +1,260 @@
+"""
+Generation Executor
+===================
+
+Off-loop, batched execution of model calls for DATA experts.
+
+Model calls (`model.generate`) are blocking; running them on the event loop
+serializes every other coroutine. The GenerationExecutor queues requests per
+key (an expert or adapter name), and a dedicated worker thread runs them:
+
+- Pending prompts for the same key are merged into one padded batch.
+- A key keeps the model while it has work (few adapter switches), but only
+  for `max_consecutive_groups` batches while other keys are waiting.
+- Callers can cancel; requests cancelled before their batch starts are
+  dropped, and results of requests cancelled mid-batch are discarded.
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+from loguru import logger
+
+
+@dataclass
+class GenerationRequest:
+    """A single prompt with its own generation budget"""
+    prompt: str
+    max_length: int = 512  # Prompt + generated tokens, as in model.generate
+    max_new_tokens: Optional[int] = None  # Overrides max_length when set
+    temperature: float = 0.7
+    top_p: float = 0.9
+
+    def sampling_key(self) -> Tuple[float, float]:
+        return (self.temperature, self.top_p)
+
+
+# Batch function: (key, requests) -> one response per request
+BatchFn = Callable[[str, List[GenerationRequest]], List[str]]
+
+_Item = Tuple[Union[GenerationRequest, Callable[[], Any]], asyncio.Future]
+
+
+class GenerationExecutor:
+    """
+    Runs model calls for many keys on a worker thread, batching per key.
+    """
+
+    def __init__(
+        self,
+        generate_batch: BatchFn,
+        activate: Optional[Callable[[str], None]] = None,
+        max_batch_size: int = 8,
+        batch_window: float = 0.002,
+        max_consecutive_groups: int = 4,
+        max_workers: int = 1,
+        name: str = "generation"
+    ):
+        """
+        Args:
+            generate_batch: Blocking function producing one response per request.
+            activate: Optional blocking hook run (on the worker) before each
+                batch whose key differs from the previous one (e.g. set_adapter).
+            max_batch_size: Largest number of prompts merged into one call.
+            batch_window: Seconds to wait for more prompts before a batch starts.
+            max_consecutive_groups: Batches one key may run while others wait.
+            max_workers: Worker threads (keep 1 when keys share one model).
+            name: Thread name prefix.
+        """
+        self.generate_batch = generate_batch
+        self.activate = activate
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.max_consecutive_groups = max_consecutive_groups
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._pending: "OrderedDict[str, Deque[_Item]]" = OrderedDict()
+        self._drain_task: Optional[asyncio.Task] = None
+        self.active_key: Optional[str] = None
+        self._consecutive_groups = 0
+
+        self.stats = {
+            "requests": 0,
+            "batches": 0,
+            "batched_prompts": 0,
+            "max_batch": 0,
+            "cancelled": 0,
+            "key_switches": 0,
+            "groups_served": 0,
+        }
+
+    async def submit(self, key: str, request: GenerationRequest) -> str:
+        """Queue a prompt for `key` and wait for its response."""
+        return await self._enqueue(key, request)
+
+    async def run(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run an arbitrary blocking call on the worker with `key` active."""
+        return await self._enqueue(key, fn)
+
+    async def _enqueue(self, key: str, payload) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, deque()).append((payload, future))
+        self.stats["requests"] += 1
+
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            self.stats["cancelled"] += 1
+            raise
+
+    def _next_key(self) -> str:
+        """Keep the active key while it has work; otherwise take the oldest queue."""
+        if self.active_key in self._pending:
+            others_waiting = len(self._pending) > 1
+            if not others_waiting or self._consecutive_groups < self.max_consecutive_groups:
+                return self.active_key
+            return next(key for key in self._pending if key != self.active_key)
+        return next(iter(self._pending))
+
+    def _take_group(self, key: str) -> List[_Item]:
+        queue = self._pending[key]
+        group = []
+        while queue and len(group) < self.max_batch_size:
+            item = queue.popleft()
+            if not item[1].done():  # Skip requests cancelled while queued
+                group.append(item)
+        if not queue:
+            del self._pending[key]
+        return group
+
+    def _switch_to(self, key: str):
+        """Worker-side: activate `key` if it is not active yet."""
+        if key != self.active_key:
+            if self.activate is not None:
+                self.activate(key)
+            self.active_key = key
+            self.stats["key_switches"] += 1
+            self._consecutive_groups = 0
+        self._consecutive_groups += 1
+
+    def _execute(self, key: str, group: List[_Item]) -> List[Tuple[bool, Any]]:
+        """Worker-side: run one group, returning (ok, value) per item."""
+        self._switch_to(key)
+        results: List[Tuple[bool, Any]] = [(False, None)] * len(group)
+
+        # Plain callables run one by one
+        requests: Dict[Tuple[float, float], List[int]] = {}
+        for i, (payload, _) in enumerate(group):
+            if isinstance(payload, GenerationRequest):
+                requests.setdefault(payload.sampling_key(), []).append(i)
+            else:
+                try:
+                    results[i] = (True, payload())
+                except Exception as e:
+                    results[i] = (False, e)
+
+        # Prompts with the same sampling parameters share one padded call
+        for indices in requests.values():
+            batch = [group[i][0] for i in indices]
+            try:
+                outputs = self.generate_batch(key, batch)
+                for i, output in zip(indices, outputs):
+                    results[i] = (True, output)
+                self.stats["batches"] += 1
+                self.stats["batched_prompts"] += len(batch)
+                self.stats["max_batch"] = max(self.stats["max_batch"], len(batch))
+            except Exception as e:
+                for i in indices:
+                    results[i] = (False, e)
+        return results
+
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            if self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)  # Let concurrent prompts arrive
+            if not self._pending:
+                break
+
+            key = self._next_key()
+            group = self._take_group(key)
+            if not group:
+                continue
+            self.stats["groups_served"] += 1
+
+            try:
+                results = await loop.run_in_executor(self._pool, self._execute, key, group)
+            except Exception as e:
+                logger.error(f"Generation batch for '{key}' failed: {e}")
+                results = [(False, e)] * len(group)
+
+            for (_, future), (ok, value) in zip(group, results):
+                if future.done():  # Cancelled mid-batch
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+    def shutdown(self):
+        """Cancel queued requests and stop the worker."""
+        for queue in self._pending.values():
+            for _, future in queue:
+                future.cancel()
+        self._pending.clear()
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+        self._pool.shutdown(wait=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "active_key": self.active_key,
+            "pending": sum(len(q) for q in self._pending.values()),
+            "avg_batch": self.stats["batched_prompts"] / max(self.stats["batches"], 1),
+        }
+
+
+def generate_padded_batch(model: Any, tokenizer: Any, device: str, requests: List[GenerationRequest]) -> List[str]:
+    """
+    One padded `model.generate` call for several prompts
+
+    Prompts are left-padded (decoder-only models); each response is cut to
+    its own budget: `max_new_tokens`, or `max_length` minus its prompt length.
+    """
+    import torch
+
+    tokenizer.padding_side = "left"
+    inputs = tokenizer(
+        [r.prompt for r in requests],
+        return_tensors="pt",
+        padding=True,
+        truncation=True
+    ).to(device)
+
+    prompt_lengths = inputs["attention_mask"].sum(dim=1).tolist()
+    budgets = [
+        r.max_new_tokens if r.max_new_tokens is not None else max(1, r.max_length - int(n))
+        for r, n in zip(requests, prompt_lengths)
+    ]
+
+    with torch.no_grad():
+        outputs = model.generate(
+            **inputs,
+            max_new_tokens=max(budgets),
+            temperature=requests[0].temperature,
+            top_p=requests[0].top_p,
+            do_sample=True,
+            pad_token_id=tokenizer.pad_token_id
+        )
+
+    offset = inputs["input_ids"].shape[1]
+    return [
+        tokenizer.decode(output[offset:offset + budget], skip_special_tokens=True).strip()
+        for output, budget in zip(outputs, budgets)
+    ]
@@ -0,0 +1,120 @@
+"""
+Load Balancing
+==============
+
+In-flight-aware load tracking for experts and nodes.
+
+Every unit of work is bracketed by `begin()` / `end()`, so the tracker
+knows how many requests each target has outstanding right now, plus an
+exponentially weighted moving average (EWMA) of its latency. The expected
+wait on a target is estimated as
+
+    (in_flight + 1) * ewma_latency
+
+Selectors use that estimate instead of cumulative counters, so a target
+that was busy earlier but is idle now is not penalized, and a slow target
+with a short queue can still lose to a fast one with a longer queue.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+
+class LoadTracker:
+    """
+    Outstanding requests and EWMA latency per target (expert or node).
+    """
+
+    def __init__(self, alpha: float = 0.2, default_latency_ms: float = 100.0, seed: Optional[int] = None):
+        """
+        Args:
+            alpha: EWMA weight of the newest latency sample.
+            default_latency_ms: Latency assumed for targets with no samples yet
+                (the mean of observed targets is used once there are some).
+            seed: Seed for power-of-two-choices sampling.
+        """
+        self.alpha = alpha
+        self.default_latency_ms = default_latency_ms
+        self._rng = random.Random(seed)
+
+        self.in_flight: Dict[str, int] = {}
+        self.ewma_latency_ms: Dict[str, float] = {}
+        self.completed: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def begin(self, key: str):
+        """Record that a request to `key` started."""
+        self.in_flight[key] = self.in_flight.get(key, 0) + 1
+
+    def end(self, key: str, latency_ms: Optional[float] = None, success: bool = True):
+        """Record that a request to `key` finished (latency updates the EWMA)."""
+        self.in_flight[key] = max(0, self.in_flight.get(key, 0) - 1)
+        self.completed[key] = self.completed.get(key, 0) + 1
+        if not success:
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+        if latency_ms is not None:
+            previous = self.ewma_latency_ms.get(key)
+            if previous is None:
+                self.ewma_latency_ms[key] = latency_ms
+            else:
+                self.ewma_latency_ms[key] = (1.0 - self.alpha) * previous + self.alpha * latency_ms
+
+    @contextmanager
+    def track(self, key: str) -> Iterator[None]:
+        """Bracket a block as one request to `key`, timing it."""
+        self.begin(key)
+        start = time.perf_counter()
+        success = False
+        try:
+            yield
+            success = True
+        finally:
+            self.end(key, (time.perf_counter() - start) * 1000, success)
+
+    def latency(self, key: str) -> float:
+        """EWMA latency of `key`, or a prior for targets never observed."""
+        latency = self.ewma_latency_ms.get(key)
+        if latency is not None:
+            return latency
+        if self.ewma_latency_ms:
+            return sum(self.ewma_latency_ms.values()) / len(self.ewma_latency_ms)
+        return self.default_latency_ms
+
+    def cost(self, key: str) -> float:
+        """Expected wait for one more request on `key` (ms)."""
+        return (self.in_flight.get(key, 0) + 1) * self.latency(key)
+
+    def least_outstanding(self, candidates: Sequence[str], cost: Optional[Callable[[str], float]] = None) -> Optional[str]:
+        """Candidate with the lowest expected wait."""
+        if not candidates:
+            return None
+        return min(candidates, key=cost or self.cost)
+
+    def power_of_two_choices(self, candidates: Sequence[str], cost: Optional[Callable[[str], float]] = None) -> Optional[str]:
+        """
+        Sample two distinct candidates and keep the cheaper one.
+
+        Nearly as good as scanning every candidate, but O(1) and avoids the
+        herd behaviour of always picking the single global minimum.
+        """
+        if len(candidates) <= 2:
+            return self.least_outstanding(candidates, cost)
+        first, second = self._rng.sample(list(candidates), 2)
+        cost = cost or self.cost
+        return first if cost(first) <= cost(second) else second
+
+    def snapshot(self, keys: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Per-target load figures."""
+        keys = keys if keys is not None else sorted(set(self.in_flight) | set(self.completed))
+        return {
+            key: {
+                "in_flight": self.in_flight.get(key, 0),
+                "ewma_latency_ms": self.ewma_latency_ms.get(key),
+                "completed": self.completed.get(key, 0),
+                "errors": self.errors.get(key, 0),
+            }
+            for key in keys
+        }
@@ -12,6 +12,8 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from loguru import logger
 
+from .load_balancing import LoadTracker
+
 
 class NodeRole(Enum):
     """Node roles based on OKComputer architecture"""
@@ -71,6 +73,7 @@ class NodeStatus:
         self.active_tasks = 0
         self.total_tasks_completed = 0
         self.errors = 0
+        self.ewma_latency_ms: Optional[float] = None
     
     def update_heartbeat(self):
         """Update heartbeat timestamp"""
@@ -96,6 +99,7 @@ class NodeStatus:
             "active_tasks": self.active_tasks,
             "total_tasks_completed": self.total_tasks_completed,
             "errors": self.errors,
+            "ewma_latency_ms": self.ewma_latency_ms,
             "is_healthy": self.is_healthy()
         }
 
@@ -121,6 +125,10 @@ class NodeManager:
         
         # Load balancing
         self.node_assignments: Dict[str, List[str]] = {}  # expert -> nodes
+        self.load_tracker = LoadTracker(alpha=getattr(config, "latency_ewma_alpha", 0.2))
+        
+        # Nodes whose heartbeats arrive over the transport (other processes/hosts)
+        self.remote_nodes: set = set()
         
         # Monitoring
         self.monitoring_task: Optional[asyncio.Task] = None
@@ -264,41 +272,84 @@ class NodeManager:
                             self.active_nodes.remove(node_id)
                             status.status = "offline"
                     
-                    # Update status (would ping node in production)
-                    status.update_heartbeat()
+                    # Local nodes are alive as long as this process is;
+                    # remote nodes are refreshed by record_heartbeat()
+                    if node_id not in self.remote_nodes:
+                        status.update_heartbeat()
                 
             except Exception as e:
                 logger.error(f"Error in node monitoring: {e}")
         
         logger.info("Node monitoring stopped")
     
+    def mark_remote(self, node_id: str):
+        """Mark a node as hosted elsewhere, so its liveness comes from real heartbeats."""
+        self.remote_nodes.add(node_id)
+    
+    def record_heartbeat(self, node_id: str):
+        """
+        Record a heartbeat received from a node
+        
+        Brings an offline node back into the active set.
+        """
+        status = self.node_status.get(node_id)
+        if status is None:
+            return
+        
+        status.update_heartbeat()
+        if status.status == "offline":
+            status.status = "active"
+            logger.info(f"Node {node_id} back online")
+        if node_id not in self.active_nodes and status.is_healthy():
+            self.active_nodes.append(node_id)
+    
+    def begin_task(self, node_id: str):
+        """Record a task dispatched to a node"""
+        self.load_tracker.begin(node_id)
+        status = self.node_status.get(node_id)
+        if status is not None:
+            status.active_tasks = self.load_tracker.in_flight[node_id]
+    
+    def end_task(self, node_id: str, latency_ms: Optional[float] = None, success: bool = True):
+        """Record a task finished on a node (updates in-flight count and EWMA latency)"""
+        self.load_tracker.end(node_id, latency_ms, success)
+        status = self.node_status.get(node_id)
+        if status is not None:
+            status.active_tasks = self.load_tracker.in_flight[node_id]
+            status.total_tasks_completed += 1
+            status.ewma_latency_ms = self.load_tracker.ewma_latency_ms.get(node_id)
+            if not success:
+                status.errors += 1
+    
+    def _node_cost(self, node_id: str) -> float:
+        """Expected wait on a node, scaled by its capacity and reported load"""
+        node_config = self.nodes[node_id]
+        node_status = self.node_status[node_id]
+        return (
+            self.load_tracker.cost(node_id)
+            * (1.0 + node_status.current_load)
+            / max(node_config.max_capacity, 1e-6)
+        )
+    
     def get_node_for_capability(self, capability: str) -> Optional[str]:
         """
         Get best node for a specific capability
         
+        Picks between two random suitable nodes by expected wait
+        (power of two choices), so repeated calls spread work instead of
+        all landing on the same node.
+        
         Args:
             capability: Required capability
         
         Returns:
             Node ID or None if no suitable node found
         """
-        suitable_nodes = []
-        
-        for node_id in self.active_nodes:
-            node_config = self.nodes[node_id]
-            node_status = self.node_status[node_id]
-            
-            if capability in node_config.capabilities:
-                # Calculate score based on load and capacity
-                score = (1.0 - node_status.current_load) * node_config.max_capacity
-                suitable_nodes.append((node_id, score))
-        
-        if not suitable_nodes:
-            return None
-        
-        # Return node with highest score
-        suitable_nodes.sort(key=lambda x: x[1], reverse=True)
-        return suitable_nodes[0][0]
+        suitable_nodes = [
+            node_id for node_id in self.active_nodes
+            if capability in self.nodes[node_id].capabilities
+        ]
+        return self.load_tracker.power_of_two_choices(suitable_nodes, self._node_cost)
     
     def assign_expert_to_node(self, expert_name: str, node_id: str):
         """
@@ -322,18 +373,9 @@ class NodeManager:
         if not nodes:
             return None
         
-        # Return least loaded node
-        best_node = None
-        best_load = float('inf')
-        
-        for node_id in nodes:
-            if node_id in self.active_nodes:
-                load = self.node_status[node_id].current_load
-                if load < best_load:
-                    best_load = load
-                    best_node = node_id
-        
-        return best_node
+        # Return node with the fewest outstanding requests (by expected wait)
+        candidates = [node_id for node_id in nodes if node_id in self.active_nodes]
+        return self.load_tracker.least_outstanding(candidates, self._node_cost)
     
     def update_node_load(self, node_id: str, load: float):
         """Update node load"""
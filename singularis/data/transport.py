@@ -0,0 +1,300 @@
+"""
+Socket Transport
+================
+
+Multi-process / multi-host transport for the DistributedCommunicator.
+
+Messages travel over Unix domain sockets (one box, many worker processes)
+or TCP (across nodes) as length-prefixed frames:
+
+    [4-byte big-endian payload length][msgpack payload]
+
+Each locally hosted node listens on its own socket; outgoing connections
+are opened once per peer and reused. Backpressure comes from the sockets
+themselves: senders await `drain()`, and receivers stop reading while the
+local inbox is full.
+
+If msgpack is not installed, payloads are framed as JSON instead.
+"""
+
+import asyncio
+import json
+import os
+import struct
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+from loguru import logger
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    logger.debug("msgpack not available, socket transport will frame JSON")
+
+
+FRAME_HEADER = struct.Struct(">I")
+
+Address = Union[str, Tuple[str, int]]  # UDS path or (host, port)
+
+
+def _to_serializable(obj: Any) -> Any:
+    """Fallback encoder for values msgpack/json cannot handle natively."""
+    if hasattr(obj, "tolist"):  # numpy arrays and scalars
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "value"):  # Enums
+        return obj.value
+    return str(obj)
+
+
+def pack_payload(data: Dict[str, Any]) -> bytes:
+    """Serialize a message dict (msgpack if available, else JSON)."""
+    if MSGPACK_AVAILABLE:
+        return msgpack.packb(data, default=_to_serializable, use_bin_type=True)
+    return json.dumps(data, default=_to_serializable).encode("utf-8")
+
+
+def unpack_payload(payload: bytes) -> Dict[str, Any]:
+    """Deserialize a payload produced by `pack_payload`."""
+    if MSGPACK_AVAILABLE:
+        return msgpack.unpackb(payload, raw=False)
+    return json.loads(payload.decode("utf-8"))
+
+
+def encode_frame(data: Dict[str, Any], max_size: Optional[int] = None) -> bytes:
+    """
+    Encode a message dict as one length-prefixed frame.
+
+    Raises:
+        ValueError: If the payload exceeds `max_size` bytes.
+    """
+    payload = pack_payload(data)
+    if max_size is not None and len(payload) > max_size:
+        raise ValueError(f"Message of {len(payload)} bytes exceeds limit of {max_size}")
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader, max_size: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Read one frame from a stream.
+
+    Returns:
+        The decoded message dict, or None when the peer closed the connection.
+
+    Raises:
+        ValueError: If the announced frame size exceeds `max_size`.
+    """
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    if max_size is not None and length > max_size:
+        raise ValueError(f"Incoming frame of {length} bytes exceeds limit of {max_size}")
+    try:
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+    return unpack_payload(payload)
+
+
+class PeerConnection:
+    """A reusable outgoing connection to one peer node."""
+
+    def __init__(self, node_id: str, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.node_id = node_id
+        self.reader = reader
+        self.writer = writer
+        self.lock = asyncio.Lock()  # One frame at a time per connection
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        self.frames_sent = 0
+
+    @property
+    def is_closing(self) -> bool:
+        return self.writer.is_closing()
+
+    async def send(self, frame: bytes):
+        async with self.lock:
+            self.writer.write(frame)
+            await self.writer.drain()  # Backpressure: wait for the socket buffer
+            self.frames_sent += 1
+            self.last_used = time.time()
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except Exception:
+            pass
+
+
+class SocketTransport:
+    """
+    Length-prefixed socket transport over Unix domain sockets or TCP.
+
+    Servers deliver decoded frames to a callback (normally the
+    communicator's inbox for that node); `send` reuses one connection per
+    peer and reconnects transparently if it was dropped.
+    """
+
+    def __init__(
+        self,
+        kind: str = "uds",
+        socket_dir: Optional[str] = None,
+        max_message_bytes: int = 512 * 1024 * 1024,
+        connect_timeout: float = 5.0,
+    ):
+        """
+        Args:
+            kind: "uds" (Unix domain sockets) or "tcp".
+            socket_dir: Directory holding `<node_id>.sock` files (uds only).
+            max_message_bytes: Largest frame accepted or sent.
+            connect_timeout: Seconds to wait when opening a connection.
+        """
+        if kind not in ("uds", "tcp"):
+            raise ValueError(f"Unknown transport kind: {kind}")
+        self.kind = kind
+        self.socket_dir = socket_dir or os.path.join("/tmp", "singularis_data")
+        self.max_message_bytes = max_message_bytes
+        self.connect_timeout = connect_timeout
+
+        self.servers: Dict[str, asyncio.AbstractServer] = {}
+        self.server_addresses: Dict[str, Address] = {}
+        self.connections: Dict[str, PeerConnection] = {}
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
+        self._handler_tasks: set = set()
+
+        self.stats = {
+            "frames_sent": 0,
+            "frames_received": 0,
+            "bytes_sent": 0,
+            "connections_opened": 0,
+            "reconnects": 0,
+            "receive_errors": 0,
+        }
+
+    def address_for(self, node_id: str, hostname: str = "localhost", port: int = 0) -> Address:
+        """Socket address for a node under this transport."""
+        if self.kind == "uds":
+            return os.path.join(self.socket_dir, f"{node_id}.sock")
+        return (hostname, port)
+
+    async def start_server(
+        self,
+        node_id: str,
+        address: Address,
+        deliver: Callable[[Dict[str, Any]], Awaitable[None]],
+    ):
+        """
+        Listen for frames addressed to a locally hosted node.
+
+        Args:
+            node_id: The local node.
+            address: UDS path or (host, port) to bind.
+            deliver: Coroutine called with every decoded message; it may block
+                (e.g. on a full inbox) to apply backpressure to the sender.
+        """
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            task = asyncio.current_task()
+            self._handler_tasks.add(task)
+            try:
+                while True:
+                    data = await read_frame(reader, self.max_message_bytes)
+                    if data is None:
+                        break
+                    self.stats["frames_received"] += 1
+                    await deliver(data)
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                self.stats["receive_errors"] += 1
+                logger.error(f"Transport receive error on {node_id}: {e}")
+            finally:
+                self._handler_tasks.discard(task)
+                writer.close()
+
+        if self.kind == "uds":
+            os.makedirs(os.path.dirname(address), exist_ok=True)
+            if os.path.exists(address):
+                os.unlink(address)  # Stale socket from a previous run
+            server = await asyncio.start_unix_server(handle, path=address)
+        else:
+            host, port = address
+            server = await asyncio.start_server(handle, host=host, port=port)
+
+        self.servers[node_id] = server
+        self.server_addresses[node_id] = address
+        logger.info(f"Transport listening for {node_id} on {address}")
+
+    async def _connect(self, node_id: str, address: Address) -> PeerConnection:
+        lock = self._connect_locks.setdefault(node_id, asyncio.Lock())
+        async with lock:
+            connection = self.connections.get(node_id)
+            if connection is not None and not connection.is_closing:
+                return connection
+            if connection is not None:
+                self.stats["reconnects"] += 1
+
+            if self.kind == "uds":
+                opener = asyncio.open_unix_connection(path=address)
+            else:
+                opener = asyncio.open_connection(host=address[0], port=address[1])
+            reader, writer = await asyncio.wait_for(opener, timeout=self.connect_timeout)
+
+            connection = PeerConnection(node_id, reader, writer)
+            self.connections[node_id] = connection
+            self.stats["connections_opened"] += 1
+            return connection
+
+    async def send(self, node_id: str, address: Address, data: Dict[str, Any]):
+        """
+        Send one message to a peer, reusing its connection.
+
+        Raises:
+            ConnectionError/OSError: If the peer cannot be reached.
+            ValueError: If the message exceeds the size limit.
+        """
+        frame = encode_frame(data, self.max_message_bytes)
+        connection = await self._connect(node_id, address)
+        try:
+            await connection.send(frame)
+        except (ConnectionError, OSError):
+            # Connection went stale (peer restarted); retry once on a fresh one
+            await connection.close()
+            connection = await self._connect(node_id, address)
+            await connection.send(frame)
+        self.stats["frames_sent"] += 1
+        self.stats["bytes_sent"] += len(frame)
+
+    async def close(self):
+        """Close all connections and servers."""
+        for connection in list(self.connections.values()):
+            await connection.close()
+        self.connections.clear()
+
+        for node_id, server in list(self.servers.items()):
+            server.close()
+        for task in list(self._handler_tasks):
+            task.cancel()
+        for node_id, server in list(self.servers.items()):
+            try:
+                await server.wait_closed()
+            except Exception:
+                pass
+            address = self.server_addresses.get(node_id)
+            if self.kind == "uds" and address and os.path.exists(address):
+                os.unlink(address)
+        self.servers.clear()
+        self.server_addresses.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "kind": self.kind,
+            "serialization": "msgpack" if MSGPACK_AVAILABLE else "json",
+            "open_connections": sum(1 for c in self.connections.values() if not c.is_closing),
+            "local_servers": len(self.servers),
+        }
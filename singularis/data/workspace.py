@@ -4,18 +4,27 @@ Global Workspace Theory Implementation
 
 Based on Bernard Baars' Global Workspace Theory for consciousness-inspired
 attention mechanisms and information sharing.
+
+The workspace is event-driven: the attention thread wakes as soon as an item
+is submitted, and admitting an item wakes the broadcast thread. Broadcasts
+are fanned out into bounded per-subscriber queues, each drained by its own
+delivery thread, so a slow or stalled consumer only backs up (and drops or
+coalesces) its own queue.
 """
 
-import asyncio
 import time
 import threading
 from collections import deque
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Hashable
 from dataclasses import dataclass
 from queue import PriorityQueue, Empty
 from loguru import logger
 
 
+# Subscriber queue policies when a broadcast arrives at a full queue
+BROADCAST_POLICIES = ("drop_oldest", "drop_newest", "coalesce")
+
+
 @dataclass
 class WorkspaceItem:
     """
@@ -29,6 +38,7 @@ class WorkspaceItem:
     timestamp: float
     priority: float
     metadata: Dict[str, Any]
+    sequence: int = 0  # Admission order, assigned when the item wins attention
     
     def __lt__(self, other: 'WorkspaceItem') -> bool:
         """Priority queue comparison (higher priority first)"""
@@ -38,6 +48,157 @@ class WorkspaceItem:
         return f"WorkspaceItem(source={self.source}, priority={self.priority:.2f})"
 
 
+class WorkspaceSubscription:
+    """
+    Bounded broadcast queue drained by a dedicated delivery thread
+
+    Each broadcast consumer (subscriber or processor callback) gets one, so
+    the broadcast thread only ever appends to queues and never waits on a
+    consumer. When the queue is full:
+
+    - "drop_oldest": discard the oldest pending broadcast
+    - "drop_newest": discard the incoming broadcast
+    - "coalesce": replace a pending broadcast of the same workspace item
+      (re-broadcasts collapse into one), otherwise drop the oldest
+
+    Lag is the time a broadcast waits in the queue before its callback runs.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        callback: Callable,
+        max_queue: int = 64,
+        policy: str = "coalesce",
+        on_delivered: Optional[Callable[[], None]] = None
+    ):
+        if policy not in BROADCAST_POLICIES:
+            raise ValueError(f"Unknown broadcast policy {policy!r}, expected one of {BROADCAST_POLICIES}")
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+
+        self.name = name
+        self.callback = callback
+        self.max_queue = max_queue
+        self.policy = policy
+        self.on_delivered = on_delivered
+
+        # Pending entries are [key, enqueued_at, message] so coalescing can
+        # replace a message in place
+        self._queue: deque = deque()
+        self._pending: Dict[Hashable, list] = {}
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.metrics = {
+            "enqueued": 0,
+            "delivered": 0,
+            "dropped": 0,
+            "coalesced": 0,
+            "errors": 0,
+            "avg_lag": 0.0,
+            "max_lag": 0.0,
+            "last_lag": 0.0,
+        }
+
+    def offer(self, key: Hashable, message: Dict[str, Any]):
+        """Queue a broadcast without blocking (applies the full-queue policy)."""
+        now = time.perf_counter()
+        with self._condition:
+            self.metrics["enqueued"] += 1
+
+            if self.policy == "coalesce" and key in self._pending:
+                entry = self._pending[key]
+                entry[2] = message
+                self.metrics["coalesced"] += 1
+                return
+
+            if len(self._queue) >= self.max_queue:
+                if self.policy == "drop_newest":
+                    self.metrics["dropped"] += 1
+                    return
+                dropped = self._queue.popleft()
+                if self._pending.get(dropped[0]) is dropped:
+                    del self._pending[dropped[0]]
+                self.metrics["dropped"] += 1
+
+            entry = [key, now, message]
+            self._queue.append(entry)
+            self._pending[key] = entry
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                entry = self._queue.popleft()
+                key, enqueued_at, message = entry
+                if self._pending.get(key) is entry:
+                    del self._pending[key]
+
+            lag = time.perf_counter() - enqueued_at
+            try:
+                self.callback(message)
+            except Exception as e:
+                self.metrics["errors"] += 1
+                logger.error(f"Error delivering broadcast to {self.name}: {e}")
+            else:
+                if self.on_delivered is not None:
+                    self.on_delivered()
+
+            self.metrics["delivered"] += 1
+            self.metrics["last_lag"] = lag
+            self.metrics["max_lag"] = max(self.metrics["max_lag"], lag)
+            self.metrics["avg_lag"] = 0.95 * self.metrics["avg_lag"] + 0.05 * lag
+
+    def start(self):
+        """Start the delivery thread (no-op if already running)."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            daemon=True,
+            name=f"GlobalWorkspace-Deliver-{self.name}"
+        )
+        self._thread.start()
+
+    def close(self, timeout: float = 2.0):
+        """Stop the delivery thread; undelivered broadcasts stay queued."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    @property
+    def queue_depth(self) -> int:
+        """Broadcasts waiting for delivery."""
+        return len(self._queue)
+
+    @property
+    def backlog_lag(self) -> float:
+        """Age in seconds of the oldest undelivered broadcast (0 if none)."""
+        with self._condition:
+            if not self._queue:
+                return 0.0
+            return time.perf_counter() - self._queue[0][1]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Delivery and lag metrics for this subscription"""
+        return {
+            **self.metrics,
+            "policy": self.policy,
+            "queue_depth": self.queue_depth,
+            "backlog_lag": self.backlog_lag,
+        }
+
+
 class GlobalWorkspace:
     """
     Global Workspace Theory implementation
@@ -51,6 +212,10 @@ class GlobalWorkspace:
     - Attention competition via salience filtering
     - Global broadcast to all processors
     - Feedback loops for learning
+
+    Newly admitted items are broadcast immediately; `broadcast_interval`
+    sets how often the full workspace is re-broadcast while idle (None or
+    0 disables the refresh).
     
     Based on:
     - Baars, B. J. (1988). A Cognitive Theory of Consciousness
@@ -61,13 +226,31 @@ class GlobalWorkspace:
         self,
         capacity: int = 7,
         attention_window: float = 0.1,
-        broadcast_interval: float = 0.05,
-        salience_threshold: float = 0.7
+        broadcast_interval: Optional[float] = 0.05,
+        salience_threshold: float = 0.7,
+        subscriber_queue_size: int = 64,
+        subscriber_policy: str = "coalesce"
     ):
+        """
+        Args:
+            capacity: Maximum number of items in the workspace
+            attention_window: Longest the attention thread waits before
+                re-checking for shutdown (submissions wake it immediately)
+            broadcast_interval: Idle re-broadcast period of the workspace
+                contents (None/0 = only broadcast newly admitted items)
+            salience_threshold: Minimum priority for admission
+            subscriber_queue_size: Default per-subscriber queue bound
+            subscriber_policy: Default full-queue policy (see BROADCAST_POLICIES)
+        """
+        if subscriber_policy not in BROADCAST_POLICIES:
+            raise ValueError(f"Unknown broadcast policy {subscriber_policy!r}, expected one of {BROADCAST_POLICIES}")
+
         self.capacity = capacity
         self.attention_window = attention_window
         self.broadcast_interval = broadcast_interval
         self.salience_threshold = salience_threshold
+        self.subscriber_queue_size = subscriber_queue_size
+        self.subscriber_policy = subscriber_policy
         
         # Workspace state
         self.workspace = deque(maxlen=capacity)
@@ -79,13 +262,23 @@ class GlobalWorkspace:
         self.is_active = False
         self.attention_thread: Optional[threading.Thread] = None
         self.broadcast_thread: Optional[threading.Thread] = None
+
+        # Admitted items waiting for the broadcast thread
+        self._pending_broadcasts: deque = deque()
+        self._broadcast_ready = threading.Condition()
+        self._sequence = 0
+
+        # Queued by stop_workspace to wake the attention thread
+        self._wakeup_item = WorkspaceItem(
+            content=None, source="", timestamp=0.0, priority=float("inf"), metadata={}
+        )
         
         # Attention mechanism
         self.attention_weights: Dict[str, float] = {}
         self.attention_decay = 0.95
         
         # Broadcast system
-        self.subscribers: List[Callable] = []
+        self.subscribers: List[WorkspaceSubscription] = []
         self.broadcast_history = deque(maxlen=100)
         
         # Metrics
@@ -94,7 +287,9 @@ class GlobalWorkspace:
             "accepted_items": 0,
             "rejected_items": 0,
             "broadcasts": 0,
-            "avg_workspace_size": 0.0
+            "avg_workspace_size": 0.0,
+            "avg_broadcast_latency": 0.0,  # Submission -> fan-out (seconds)
+            "max_broadcast_latency": 0.0
         }
         
         logger.info(
@@ -114,17 +309,40 @@ class GlobalWorkspace:
         
         Args:
             processor_id: Unique identifier for the processor
-            processor: Optional callback function for broadcasts
+            processor: Optional callback function for broadcasts (delivered
+                through its own bounded queue, like subscribers)
             specialization: List of specialization domains
             priority_weight: Base priority weight for this processor
         """
-        self.processors[processor_id] = {
+        previous = self.processors.get(processor_id)
+        if previous and previous['subscription'] is not None:
+            previous['subscription'].close()
+
+        info = {
             'processor': processor,
             'specialization': specialization or [],
             'priority_weight': priority_weight,
             'last_access': 0.0,
-            'access_count': 0
+            'access_count': 0,
+            'subscription': None
         }
+
+        if processor is not None:
+            def on_delivered():
+                info['last_access'] = time.time()
+                info['access_count'] += 1
+
+            info['subscription'] = WorkspaceSubscription(
+                name=processor_id,
+                callback=processor,
+                max_queue=self.subscriber_queue_size,
+                policy=self.subscriber_policy,
+                on_delivered=on_delivered
+            )
+            if self.is_active:
+                info['subscription'].start()
+
+        self.processors[processor_id] = info
         
         # Initialize attention weight
         self.attention_weights[processor_id] = 0.5
@@ -177,16 +395,19 @@ class GlobalWorkspace:
         
         This thread continuously evaluates items in the attention queue
         and admits winners to the global workspace based on salience.
+        Submissions wake it immediately; the timeout only bounds how long
+        shutdown takes to be noticed.
         """
         logger.info("Attention competition thread started")
         
         while self.is_active:
             try:
-                # Get highest priority item (blocks with timeout)
+                # Get highest priority item (wakes on submission)
                 try:
                     winning_item = self.attention_queue.get(timeout=self.attention_window)
                 except Empty:
-                    time.sleep(self.attention_window)
+                    continue
+                if winning_item is self._wakeup_item:
                     continue
                 
                 # Apply salience filter
@@ -198,6 +419,14 @@ class GlobalWorkspace:
                         
                         # Update attention weights
                         self._update_attention_weights(winning_item)
+
+                        self._sequence += 1
+                        winning_item.sequence = self._sequence
+
+                    # Hand over to the broadcast thread
+                    with self._broadcast_ready:
+                        self._pending_broadcasts.append(winning_item)
+                        self._broadcast_ready.notify()
                     
                     logger.debug(
                         f"Admitted to workspace: {winning_item.source} "
@@ -227,25 +456,41 @@ class GlobalWorkspace:
         """
         Run broadcast system loop
         
-        This thread periodically broadcasts workspace contents to all
-        registered processors (global availability).
+        This thread broadcasts newly admitted items as soon as the attention
+        thread hands them over, and re-broadcasts the workspace contents
+        when nothing was admitted for `broadcast_interval` seconds (global
+        availability).
         """
         logger.info("Broadcast system thread started")
         
+        next_refresh = time.monotonic() + (self.broadcast_interval or 0.0)
         while self.is_active:
             try:
-                time.sleep(self.broadcast_interval)
+                with self._broadcast_ready:
+                    while self.is_active and not self._pending_broadcasts:
+                        if not self.broadcast_interval:
+                            self._broadcast_ready.wait()
+                            continue
+                        remaining = next_refresh - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._broadcast_ready.wait(timeout=remaining)
+                    admitted = list(self._pending_broadcasts)
+                    self._pending_broadcasts.clear()
                 
-                with self.workspace_lock:
-                    if not self.workspace:
-                        continue
-                    
-                    # Get current workspace contents
-                    workspace_contents = list(self.workspace)
+                if admitted:
+                    workspace_contents = admitted
+                else:
+                    with self.workspace_lock:
+                        # Get current workspace contents
+                        workspace_contents = list(self.workspace)
                 
                 # Broadcast to all processors
                 for item in workspace_contents:
-                    self._broadcast_to_processors(item)
+                    self._broadcast_to_processors(item, fresh=bool(admitted))
+                
+                if self.broadcast_interval:
+                    next_refresh = time.monotonic() + self.broadcast_interval
                 
             except Exception as e:
                 logger.error(f"Error in broadcast system: {e}")
@@ -253,12 +498,17 @@ class GlobalWorkspace:
         
         logger.info("Broadcast system thread stopped")
     
-    def _broadcast_to_processors(self, workspace_item: WorkspaceItem):
+    def _broadcast_to_processors(self, workspace_item: WorkspaceItem, fresh: bool = False):
         """
         Broadcast workspace content to all processors
         
+        Only queues the message for each processor and subscriber; their
+        delivery threads run the callbacks.
+        
         Args:
             workspace_item: Item to broadcast
+            fresh: Whether this is the item's first broadcast after admission
+                (counted towards the submission-to-broadcast latency)
         """
         broadcast_message = {
             'type': 'workspace_broadcast',
@@ -266,29 +516,33 @@ class GlobalWorkspace:
             'source': workspace_item.source,
             'timestamp': workspace_item.timestamp,
             'priority': workspace_item.priority,
-            'metadata': workspace_item.metadata
+            'metadata': workspace_item.metadata,
+            'sequence': workspace_item.sequence
         }
         
         # Store in broadcast history
         self.broadcast_history.append(broadcast_message)
         self.metrics["broadcasts"] += 1
+
+        if fresh:
+            latency = max(0.0, time.time() - workspace_item.timestamp)
+            self.metrics["avg_broadcast_latency"] = (
+                0.95 * self.metrics["avg_broadcast_latency"] + 0.05 * latency
+            )
+            self.metrics["max_broadcast_latency"] = max(self.metrics["max_broadcast_latency"], latency)
         
-        # Notify all registered processors
-        for processor_id, processor_info in self.processors.items():
-            if processor_info['processor'] is not None:
-                try:
-                    processor_info['processor'](broadcast_message)
-                    processor_info['last_access'] = time.time()
-                    processor_info['access_count'] += 1
-                except Exception as e:
-                    logger.error(f"Error broadcasting to {processor_id}: {e}")
-        
-        # Notify subscribers
-        for subscriber in self.subscribers:
-            try:
-                subscriber(broadcast_message)
-            except Exception as e:
-                logger.error(f"Error notifying subscriber: {e}")
+        # Re-broadcasts of the same item coalesce on its sequence number
+        key = workspace_item.sequence or id(workspace_item)
+        for subscription in self._subscriptions():
+            subscription.offer(key, broadcast_message)
+
+    def _subscriptions(self) -> List[WorkspaceSubscription]:
+        """Delivery queues of all processors with callbacks and all subscribers"""
+        processor_subscriptions = [
+            info['subscription'] for info in list(self.processors.values())
+            if info['subscription'] is not None
+        ]
+        return processor_subscriptions + list(self.subscribers)
     
     def _update_attention_weights(self, workspace_item: WorkspaceItem):
         """
@@ -325,15 +579,55 @@ class GlobalWorkspace:
         with self.workspace_lock:
             return list(self.workspace)
     
-    def subscribe_to_broadcasts(self, callback: Callable):
+    def subscribe_to_broadcasts(
+        self,
+        callback: Callable,
+        name: Optional[str] = None,
+        max_queue: Optional[int] = None,
+        policy: Optional[str] = None
+    ) -> WorkspaceSubscription:
         """
         Subscribe to workspace broadcasts
         
         Args:
-            callback: Function to call with broadcast messages
+            callback: Function to call with broadcast messages (runs on the
+                subscription's own delivery thread)
+            name: Subscriber name used in lag metrics
+            max_queue: Queue bound (default: subscriber_queue_size)
+            policy: Full-queue policy (default: subscriber_policy)
+        
+        Returns:
+            The subscription, for metrics and `unsubscribe`
         """
-        self.subscribers.append(callback)
+        subscription = WorkspaceSubscription(
+            name=name or f"subscriber-{len(self.subscribers)}",
+            callback=callback,
+            max_queue=max_queue or self.subscriber_queue_size,
+            policy=policy or self.subscriber_policy
+        )
+        self.subscribers.append(subscription)
+        if self.is_active:
+            subscription.start()
         logger.debug(f"Added broadcast subscriber (total: {len(self.subscribers)})")
+        return subscription
+
+    def unsubscribe(self, subscription: WorkspaceSubscription):
+        """
+        Stop delivering broadcasts to a subscriber
+        
+        Args:
+            subscription: Subscription returned by `subscribe_to_broadcasts`
+        """
+        if subscription in self.subscribers:
+            self.subscribers.remove(subscription)
+        subscription.close()
+
+    def get_subscriber_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Delivery and lag metrics per processor and subscriber"""
+        return {
+            subscription.name: subscription.get_stats()
+            for subscription in self._subscriptions()
+        }
     
     def get_attention_weights(self) -> Dict[str, float]:
         """Get current attention weights for all processors"""
@@ -359,13 +653,17 @@ class GlobalWorkspace:
         acceptance_rate = (
             self.metrics["accepted_items"] / max(self.metrics["total_submissions"], 1)
         )
+
+        subscriptions = self._subscriptions()
         
         return {
             **self.metrics,
             "current_workspace_size": current_size,
             "acceptance_rate": acceptance_rate,
             "registered_processors": len(self.processors),
-            "active_subscribers": len(self.subscribers)
+            "active_subscribers": len(self.subscribers),
+            "dropped_broadcasts": sum(s.metrics["dropped"] for s in subscriptions),
+            "max_subscriber_lag": max((s.backlog_lag for s in subscriptions), default=0.0)
         }
     
     def start_workspace(self):
@@ -375,6 +673,10 @@ class GlobalWorkspace:
             return
         
         self.is_active = True
+
+        # Start delivery threads
+        for subscription in self._subscriptions():
+            subscription.start()
         
         # Start attention competition thread
         self.attention_thread = threading.Thread(
@@ -402,6 +704,9 @@ class GlobalWorkspace:
         
         logger.info("Stopping Global Workspace...")
         self.is_active = False
+        self.attention_queue.put(self._wakeup_item)
+        with self._broadcast_ready:
+            self._broadcast_ready.notify_all()
         
         # Wait for threads to finish
         if self.attention_thread and self.attention_thread.is_alive():
@@ -409,6 +714,9 @@ class GlobalWorkspace:
         
         if self.broadcast_thread and self.broadcast_thread.is_alive():
             self.broadcast_thread.join(timeout=2.0)
+
+        for subscription in self._subscriptions():
+            subscription.close()
         
         logger.success("Global Workspace stopped")
     
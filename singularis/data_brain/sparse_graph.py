@@ -0,0 +1,161 @@
+"""
+DATA-Brain Sparse Swarm Graph
+
+CSR adjacency for the micro-agent swarm, so propagation and Hebbian
+learning scale to tens of thousands of agents:
+
+- Propagation is one sparse matrix-vector (or matrix-matrix, for a batch of
+  queries) product per iteration followed by a vectorized sigmoid.
+- Hebbian learning updates every co-active edge at once by masking the
+  stored edges with the outer product of activations, instead of a Python
+  loop over agent pairs.
+
+Row i of the matrix holds agent i's incoming weights (`connections` of
+MicroAgent i), so `W @ a` gives every agent's weighted input.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+def sigmoid(x: np.ndarray) -> np.ndarray:
+    """Numerically stable logistic function."""
+    return 0.5 * (1.0 + np.tanh(0.5 * x))
+
+
+class SparseSwarmGraph:
+    """
+    Weighted agent graph stored as a CSR matrix.
+    """
+
+    def __init__(self, weights: sparse.csr_matrix):
+        self.weights = weights.tocsr()
+        self.weights.sort_indices()
+        self.num_agents = self.weights.shape[0]
+
+    @classmethod
+    def from_connections(cls, num_agents: int, connections: Iterable[Tuple[int, Mapping[int, float]]]) -> "SparseSwarmGraph":
+        """
+        Build the graph from (agent_id, {neighbor_id: weight}) pairs.
+
+        Args:
+            num_agents: Number of agents (ids are 0..num_agents-1)
+            connections: Each agent's outgoing connection dict
+        """
+        rows, cols, data = [], [], []
+        for agent_id, conns in connections:
+            if not conns:
+                continue
+            rows.append(np.full(len(conns), agent_id, dtype=np.int64))
+            cols.append(np.fromiter(conns.keys(), dtype=np.int64, count=len(conns)))
+            data.append(np.fromiter(conns.values(), dtype=np.float64, count=len(conns)))
+
+        if rows:
+            matrix = sparse.csr_matrix(
+                (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+                shape=(num_agents, num_agents),
+            )
+        else:
+            matrix = sparse.csr_matrix((num_agents, num_agents), dtype=np.float64)
+        return cls(matrix)
+
+    @property
+    def num_edges(self) -> int:
+        """Undirected edge count (connections are stored in both directions)."""
+        return self.weights.nnz // 2
+
+    def degrees(self) -> np.ndarray:
+        """Number of connections per agent."""
+        return np.diff(self.weights.indptr)
+
+    def row(self, agent_id: int) -> Dict[int, float]:
+        """One agent's connections as a dict (neighbor_id -> weight)."""
+        start, end = self.weights.indptr[agent_id], self.weights.indptr[agent_id + 1]
+        return dict(zip(
+            self.weights.indices[start:end].tolist(),
+            self.weights.data[start:end].tolist(),
+        ))
+
+    def propagate(self, activations: np.ndarray, iterations: int = 3) -> np.ndarray:
+        """
+        Synchronous propagation: a <- sigmoid(W a), `iterations` times.
+
+        Args:
+            activations: Shape (num_agents,) or (num_agents, batch) - one
+                column per query when propagating a batch
+            iterations: Number of propagation steps
+
+        Returns:
+            New activations with the same shape
+        """
+        a = np.asarray(activations, dtype=np.float64)
+        for _ in range(iterations):
+            a = sigmoid(self.weights @ a)
+        return a
+
+    def hebbian_update(
+        self,
+        activations: np.ndarray,
+        learning_rate: float,
+        threshold: float = 0.5,
+        grow_limit: Optional[int] = None,
+    ) -> Tuple[int, np.ndarray]:
+        """
+        Strengthen connections between co-active agents: Δw_ij = η a_i a_j.
+
+        Agents above `threshold` are co-active. When at most `grow_limit`
+        agents are active (None = always), every co-active pair is updated,
+        creating the connection if it does not exist yet. Above that, only
+        existing connections between co-active agents are updated (a mask
+        over the stored edges), which keeps the update O(edges).
+
+        Returns:
+            (number of agent pairs updated, ids of agents whose rows changed)
+        """
+        a = np.asarray(activations, dtype=np.float64)
+        active = np.flatnonzero(a > threshold)
+        k = len(active)
+        if k < 2:
+            return 0, active
+
+        if grow_limit is None or k <= grow_limit:
+            # Full outer product over the active set (off-diagonal)
+            values = learning_rate * np.outer(a[active], a[active])
+            np.fill_diagonal(values, 0.0)
+            rows = np.repeat(active, k)
+            cols = np.tile(active, k)
+            keep = rows != cols
+            delta = sparse.csr_matrix(
+                (values.ravel()[keep], (rows[keep], cols[keep])),
+                shape=self.weights.shape,
+            )
+            self.weights = (self.weights + delta).tocsr()
+            self.weights.sort_indices()
+            np.clip(self.weights.data, -1.0, 1.0, out=self.weights.data)
+            return k * (k - 1) // 2, active
+
+        # Masked update of stored edges only
+        is_active = a > threshold
+        rows = np.repeat(np.arange(self.num_agents), self.degrees())
+        cols = self.weights.indices
+        mask = is_active[rows] & is_active[cols] & (rows != cols)
+        data = self.weights.data
+        data[mask] = np.clip(data[mask] + learning_rate * a[rows[mask]] * a[cols[mask]], -1.0, 1.0)
+        return int(mask.sum()) // 2, active
+
+    def clustering(self) -> np.ndarray:
+        """Local clustering coefficient per agent (unweighted)."""
+        adjacency = self.weights.copy()
+        adjacency.data = np.ones_like(adjacency.data)
+        adjacency.setdiag(0)
+        adjacency.eliminate_zeros()
+
+        # Closed triangles through each agent: diag(A^3) / 2 = sum((A @ A) * A) / 2
+        triangles = np.asarray((adjacency @ adjacency).multiply(adjacency).sum(axis=1)).ravel() / 2.0
+        degree = np.diff(adjacency.indptr).astype(np.float64)
+        possible = degree * (degree - 1) / 2.0
+        return np.divide(triangles, possible, out=np.zeros_like(triangles), where=possible > 0)
@@ -9,6 +9,7 @@ Architecture:
 - Hebbian learning: "neurons that fire together, wire together"
 - Emergent collective behavior through local interactions
 - Integrates with ExpertArbiter for meta-cognitive routing
+- Sparse CSR propagation (see sparse_graph.py) scales to tens of thousands of agents
 """
 
 from __future__ import annotations
@@ -16,14 +17,15 @@ from __future__ import annotations
 import asyncio
 import random
 import time
-import math
-from typing import Dict, List, Set, Optional, Any, Tuple
+from typing import Dict, Iterator, List, MutableMapping, Set, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 import numpy as np
 from loguru import logger
 
+from .sparse_graph import SparseSwarmGraph
+
 try:
     from ..core.modular_network import ModularNetwork, NetworkTopology, ModuleType
     MODULAR_NETWORK_AVAILABLE = True
@@ -50,7 +52,7 @@ class MicroAgent:
     agent_id: int
     role: AgentRole
     activation: float = 0.0            # Current activation level [0, 1]
-    connections: Dict[int, float] = field(default_factory=dict)  # agent_id -> weight
+    connections: MutableMapping[int, float] = field(default_factory=dict)  # agent_id -> weight
     memory: List[Any] = field(default_factory=list)  # Short-term memory
     specialization_score: float = 1.0  # How specialized this agent is
     
@@ -76,6 +78,53 @@ class MicroAgent:
         )
 
 
+class ConnectionsView(MutableMapping):
+    """
+    One agent's connections, read from the swarm's CSR graph on access.
+    
+    Editing the view detaches it into a private dict; `rebuild_graph()` loads
+    the edits and re-attaches every view.
+    """
+    
+    __slots__ = ('_swarm', '_agent_id', '_edited')
+    
+    def __init__(self, swarm: "SwarmIntelligence", agent_id: int):
+        self._swarm = swarm
+        self._agent_id = agent_id
+        self._edited: Optional[Dict[int, float]] = None
+    
+    def _row(self) -> Dict[int, float]:
+        if self._edited is not None:
+            return self._edited
+        return self._swarm.graph.row(self._agent_id)
+    
+    def _detach(self) -> Dict[int, float]:
+        if self._edited is None:
+            self._edited = self._swarm.graph.row(self._agent_id)
+        return self._edited
+    
+    def __getitem__(self, neighbor_id: int) -> float:
+        return self._row()[neighbor_id]
+    
+    def __setitem__(self, neighbor_id: int, weight: float):
+        self._detach()[neighbor_id] = weight
+    
+    def __delitem__(self, neighbor_id: int):
+        del self._detach()[neighbor_id]
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._row())
+    
+    def __len__(self) -> int:
+        return len(self._row())
+    
+    def copy(self) -> Dict[int, float]:
+        return dict(self._row())
+    
+    def __repr__(self) -> str:
+        return f"ConnectionsView({self._row()!r})"
+
+
 @dataclass
 class SwarmState:
     """Current state of the swarm."""
@@ -95,6 +144,11 @@ class SwarmIntelligence:
     - Hebbian dynamics (connection strengthening)
     - Emergent collective behavior
     - Distributed decision-making
+    
+    Activations and weights live in arrays (`self.activations`, the CSR
+    `self.graph`). Agent activations are mirrored after every query; agent
+    connections are views that read the graph on access. Call
+    `rebuild_graph()` after editing agent connections by hand.
     """
     
     def __init__(
@@ -103,6 +157,7 @@ class SwarmIntelligence:
         topology: str = "scale_free",  # "scale_free", "small_world", "random"
         hebbian_learning_rate: float = 0.01,
         activation_decay: float = 0.95,
+        hebbian_growth_limit: int = 512,
     ):
         """
         Initialize swarm intelligence layer.
@@ -112,11 +167,15 @@ class SwarmIntelligence:
             topology: Network topology type
             hebbian_learning_rate: Learning rate for Hebbian updates
             activation_decay: Decay rate for agent activation
+            hebbian_growth_limit: Max co-active agents for which Hebbian learning
+                creates new connections; larger active sets only strengthen
+                existing ones
         """
         self.num_agents = num_agents
         self.topology_type = topology
         self.hebbian_lr = hebbian_learning_rate
         self.activation_decay = activation_decay
+        self.hebbian_growth_limit = hebbian_growth_limit
         
         # Create micro-agents
         self.agents: Dict[int, MicroAgent] = {}
@@ -130,6 +189,15 @@ class SwarmIntelligence:
             # Fallback to manual topology
             self._build_topology()
         
+        # Array state for vectorized dynamics
+        self._roles = list(AgentRole)
+        self._role_index = np.array(
+            [self._roles.index(self.agents[i].role) for i in range(self.num_agents)],
+            dtype=np.int64
+        )
+        self._role_counts = np.bincount(self._role_index, minlength=len(self._roles))
+        self.rebuild_graph()
+        
         # Swarm state
         self.state = SwarmState()
         
@@ -300,7 +368,27 @@ class SwarmIntelligence:
     
     def _count_edges(self) -> int:
         """Count total edges in network."""
-        return sum(len(agent.connections) for agent in self.agents.values()) // 2
+        if not hasattr(self, 'graph'):
+            return sum(len(agent.connections) for agent in self.agents.values()) // 2
+        return self.graph.num_edges
+    
+    def rebuild_graph(self):
+        """Reload array state from `self.agents` (after editing agents directly)."""
+        self.activations = np.array(
+            [self.agents[i].activation for i in range(self.num_agents)],
+            dtype=np.float64
+        )
+        self.graph = SparseSwarmGraph.from_connections(
+            self.num_agents,
+            ((i, self.agents[i].connections) for i in range(self.num_agents))
+        )
+        for agent_id, agent in self.agents.items():
+            agent.connections = ConnectionsView(self, agent_id)
+    
+    def _sync_agents(self):
+        """Mirror activations onto the MicroAgent objects (connections are live views)."""
+        for agent_id, activation in enumerate(self.activations.tolist()):
+            self.agents[agent_id].activation = activation
     
     async def process_query(
         self,
@@ -332,6 +420,7 @@ class SwarmIntelligence:
         
         # Phase 3: Hebbian learning (strengthen co-active connections)
         self._hebbian_learning()
+        self._sync_agents()
         
         # Phase 4: Detect emergent patterns
         patterns = self._detect_emergent_patterns()
@@ -349,114 +438,84 @@ class SwarmIntelligence:
         
         return decision
     
+    def _role_inputs(self, query: str, context: Dict[str, Any]) -> np.ndarray:
+        """Input signal per role (indexed like `self._roles`) for a query."""
+        query_lower = query.lower()
+        inputs = {role: 0.0 for role in self._roles}
+        
+        # Role-based activation
+        if any(kw in query_lower for kw in ['see', 'image', 'visual', 'perceive']):
+            inputs[AgentRole.PERCEPTION] = 0.8
+        if any(kw in query_lower for kw in ['remember', 'recall', 'past', 'history']):
+            inputs[AgentRole.MEMORY] = 0.8
+        if any(kw in query_lower for kw in ['why', 'reason', 'logic', 'because']):
+            inputs[AgentRole.REASONING] = 0.8
+        if any(kw in query_lower for kw in ['feel', 'emotion', 'mood', 'sentiment']):
+            inputs[AgentRole.EMOTION] = 0.8
+        if any(kw in query_lower for kw in ['should', 'do', 'action', 'plan']):
+            inputs[AgentRole.ACTION] = 0.8
+        if any(kw in query_lower for kw in ['learn', 'pattern', 'trend']):
+            inputs[AgentRole.LEARNING] = 0.7
+        inputs[AgentRole.SYNTHESIS] = 0.5  # Always somewhat active
+        
+        # Context-based activation
+        if 'life' in str(context).lower():
+            inputs[AgentRole.MEMORY] += 0.2
+            inputs[AgentRole.EMOTION] += 0.2
+        
+        return np.array([inputs[role] for role in self._roles], dtype=np.float64)
+    
+    def _activated(self, query: str, context: Dict[str, Any]) -> np.ndarray:
+        """Agent activations after receiving a query (MicroAgent.activate, vectorized)."""
+        signal = self._role_inputs(query, context)[self._role_index]
+        return np.minimum(1.0, self.activations * self.activation_decay + signal)
+    
     async def _activate_agents(self, query: str, context: Dict[str, Any]):
         """Activate agents based on query content."""
-        query_lower = query.lower()
-        
-        for agent in self.agents.values():
-            # Role-based activation
-            activation = 0.0
-            
-            if agent.role == AgentRole.PERCEPTION:
-                if any(kw in query_lower for kw in ['see', 'image', 'visual', 'perceive']):
-                    activation = 0.8
-            
-            elif agent.role == AgentRole.MEMORY:
-                if any(kw in query_lower for kw in ['remember', 'recall', 'past', 'history']):
-                    activation = 0.8
-            
-            elif agent.role == AgentRole.REASONING:
-                if any(kw in query_lower for kw in ['why', 'reason', 'logic', 'because']):
-                    activation = 0.8
-            
-            elif agent.role == AgentRole.EMOTION:
-                if any(kw in query_lower for kw in ['feel', 'emotion', 'mood', 'sentiment']):
-                    activation = 0.8
-            
-            elif agent.role == AgentRole.ACTION:
-                if any(kw in query_lower for kw in ['should', 'do', 'action', 'plan']):
-                    activation = 0.8
-            
-            elif agent.role == AgentRole.LEARNING:
-                if any(kw in query_lower for kw in ['learn', 'pattern', 'trend']):
-                    activation = 0.7
-            
-            elif agent.role == AgentRole.SYNTHESIS:
-                activation = 0.5  # Always somewhat active
-            
-            # Context-based activation
-            if 'life' in str(context).lower():
-                if agent.role in [AgentRole.MEMORY, AgentRole.EMOTION]:
-                    activation += 0.2
-            
-            agent.activate(activation, decay=self.activation_decay)
+        self.activations = self._activated(query, context)
     
     async def _propagate_activation(self, iterations: int = 3):
-        """Propagate activation through network."""
+        """Propagate activation through network (sparse W @ a, then sigmoid)."""
         for _ in range(iterations):
-            # Calculate new activations
-            new_activations = {}
-            
-            for agent_id, agent in self.agents.items():
-                # Sum weighted inputs from connected agents
-                input_sum = 0.0
-                for neighbor_id, weight in agent.connections.items():
-                    neighbor = self.agents[neighbor_id]
-                    input_sum += weight * neighbor.activation
-                
-                # Apply sigmoid activation function
-                new_activation = 1.0 / (1.0 + math.exp(-input_sum))
-                new_activations[agent_id] = new_activation
-            
-            # Update activations
-            for agent_id, new_activation in new_activations.items():
-                self.agents[agent_id].activation = new_activation
-            
+            self.activations = self.graph.propagate(self.activations, iterations=1)
             await asyncio.sleep(0)  # Yield control
     
-    def _hebbian_learning(self):
-        """Apply Hebbian learning to strengthen co-active connections."""
-        # Find highly active agents
-        active_agents = [
-            agent_id for agent_id, agent in self.agents.items()
-            if agent.activation > 0.5
-        ]
-        
-        # Update connections between co-active agents
-        for i, agent_id_i in enumerate(active_agents):
-            agent_i = self.agents[agent_id_i]
-            
-            for agent_id_j in active_agents[i + 1:]:
-                agent_j = self.agents[agent_id_j]
-                
-                # Correlation = product of activations
-                correlation = agent_i.activation * agent_j.activation
-                
-                # Hebbian update
-                agent_i.hebbian_update(agent_id_j, correlation, self.hebbian_lr)
-                agent_j.hebbian_update(agent_id_i, correlation, self.hebbian_lr)
-                
-                self.stats['hebbian_updates'] += 1
+    def _hebbian_learning(self) -> np.ndarray:
+        """
+        Apply Hebbian learning to strengthen co-active connections.
+        
+        Returns:
+            Ids of agents whose connections changed
+        """
+        pairs, changed_rows = self.graph.hebbian_update(
+            self.activations,
+            learning_rate=self.hebbian_lr,
+            threshold=0.5,
+            grow_limit=self.hebbian_growth_limit
+        )
+        self.stats['hebbian_updates'] += pairs
+        return changed_rows
     
-    def _detect_emergent_patterns(self) -> List[str]:
-        """Detect emergent patterns in swarm activation."""
+    def _role_means(self, activations: np.ndarray) -> np.ndarray:
+        """Mean activation per role; columns are queries for 2-D input."""
+        counts = np.maximum(self._role_counts, 1)
+        if activations.ndim == 1:
+            return np.bincount(self._role_index, weights=activations, minlength=len(self._roles)) / counts
+        sums = np.zeros((len(self._roles), activations.shape[1]))
+        np.add.at(sums, self._role_index, activations)
+        return sums / counts[:, None]
+    
+    def _patterns_for(self, activations: np.ndarray, role_means: np.ndarray) -> Tuple[List[str], float]:
+        """Emergent patterns and coherence for one activation vector."""
         patterns = []
         
         # Pattern 1: Role clustering (agents of same role highly active)
-        role_activations = {}
-        for agent in self.agents.values():
-            if agent.role not in role_activations:
-                role_activations[agent.role] = []
-            role_activations[agent.role].append(agent.activation)
-        
-        for role, activations in role_activations.items():
-            avg_activation = np.mean(activations)
-            if avg_activation > 0.7:
-                patterns.append(f"high_{role.value}_activity")
+        for idx in np.flatnonzero(self._role_counts):
+            if role_means[idx] > 0.7:
+                patterns.append(f"high_{self._roles[idx].value}_activity")
         
         # Pattern 2: Synchronization (many agents with similar activation)
-        all_activations = [agent.activation for agent in self.agents.values()]
-        activation_std = np.std(all_activations)
+        activation_std = np.std(activations)
         
         if activation_std < 0.1:
             patterns.append("synchronized_swarm")
@@ -464,18 +523,19 @@ class SwarmIntelligence:
             patterns.append("diverse_activation")
         
         # Pattern 3: Hub activation (highly connected agents active)
-        hub_agents = sorted(
-            self.agents.values(),
-            key=lambda a: len(a.connections),
-            reverse=True
-        )[:5]
-        
-        hub_activation = np.mean([a.activation for a in hub_agents])
+        hubs = np.argsort(-self.graph.degrees(), kind='stable')[:5]
+        hub_activation = np.mean(activations[hubs])
         if hub_activation > 0.7:
             patterns.append("hub_coordination")
         
+        return patterns, 1.0 - activation_std
+    
+    def _detect_emergent_patterns(self) -> List[str]:
+        """Detect emergent patterns in swarm activation."""
+        patterns, coherence = self._patterns_for(self.activations, self._role_means(self.activations))
+        
         # Update coherence
-        self.state.coherence = 1.0 - activation_std
+        self.state.coherence = coherence
         self.stats['avg_coherence'] = (
             (self.stats['avg_coherence'] * (self.stats['total_cycles'] - 1) + self.state.coherence) /
             self.stats['total_cycles']
@@ -485,17 +545,17 @@ class SwarmIntelligence:
     
     def _collective_decision(self, expert_selection: Optional[Set[str]]) -> Dict[str, Any]:
         """Make collective decision based on swarm state."""
-        # Aggregate activations by role
-        role_votes = {}
-        for agent in self.agents.values():
-            if agent.role not in role_votes:
-                role_votes[agent.role] = []
-            role_votes[agent.role].append(agent.activation)
-        
+        decision = self._decide(self._role_means(self.activations))
+        decision['emergent_patterns'] = self.state.emergent_patterns
+        decision['swarm_coherence'] = self.state.coherence
+        return decision
+    
+    def _decide(self, role_means: np.ndarray) -> Dict[str, Any]:
+        """Recommended experts and confidence from per-role mean activation."""
         # Calculate role consensus
         role_consensus = {
-            role: np.mean(activations)
-            for role, activations in role_votes.items()
+            self._roles[idx]: role_means[idx]
+            for idx in np.flatnonzero(self._role_counts)
         }
         
         # Select top roles
@@ -532,10 +592,49 @@ class SwarmIntelligence:
             'recommended_experts': recommended_experts,
             'confidence': confidence,
             'role_consensus': {role.value: score for role, score in role_consensus.items()},
-            'emergent_patterns': self.state.emergent_patterns,
-            'swarm_coherence': self.state.coherence,
         }
     
+    def evaluate_batch(
+        self,
+        queries: List[str],
+        contexts: Optional[List[Dict[str, Any]]] = None,
+        iterations: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Propagate several queries at once without changing swarm state.
+        
+        Each query starts from the current activations; all of them are
+        propagated together (one sparse matrix-matrix product per iteration).
+        No Hebbian learning is applied.
+        
+        Args:
+            queries: Input queries
+            contexts: Optional context per query
+            iterations: Propagation steps
+            
+        Returns:
+            One decision per query (as from process_query)
+        """
+        if not queries:
+            return []
+        contexts = contexts or [{} for _ in queries]
+        
+        batch = np.column_stack([
+            self._activated(query, context)
+            for query, context in zip(queries, contexts)
+        ])
+        batch = self.graph.propagate(batch, iterations=iterations)
+        role_means = self._role_means(batch)
+        
+        decisions = []
+        for col in range(batch.shape[1]):
+            patterns, coherence = self._patterns_for(batch[:, col], role_means[:, col])
+            decision = self._decide(role_means[:, col])
+            decision['emergent_patterns'] = patterns
+            decision['swarm_coherence'] = coherence
+            decisions.append(decision)
+        return decisions
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get swarm statistics."""
         return {
@@ -549,26 +648,10 @@ class SwarmIntelligence:
     def get_network_metrics(self) -> Dict[str, Any]:
         """Get network topology metrics."""
         # Degree distribution
-        degrees = [len(agent.connections) for agent in self.agents.values()]
+        degrees = self.graph.degrees()
         
         # Clustering coefficient (local)
-        clustering_coeffs = []
-        for agent in self.agents.values():
-            neighbors = list(agent.connections.keys())
-            if len(neighbors) < 2:
-                clustering_coeffs.append(0.0)
-                continue
-            
-            # Count edges between neighbors
-            edges_between = 0
-            for i, n1 in enumerate(neighbors):
-                for n2 in neighbors[i + 1:]:
-                    if n2 in self.agents[n1].connections:
-                        edges_between += 1
-            
-            # Clustering coefficient
-            possible_edges = len(neighbors) * (len(neighbors) - 1) / 2
-            clustering_coeffs.append(edges_between / possible_edges if possible_edges > 0 else 0.0)
+        clustering_coeffs = self.graph.clustering()
         
         return {
             'avg_degree': np.mean(degrees),
@@ -14,6 +14,11 @@ Darwinian aspect:
 - Weak strategies are eliminated
 - Mutations create new strategy variants
 - Fitness measured by coherence increase and reward
+
+Offspring are mutated concurrently (bounded by `mutation_concurrency`) under a
+per-generation time budget; offspring whose mutation misses the deadline fall
+back to a cheap local mutation. Accessibility is recomputed after each
+generation from a matrix of world features in one vectorized distance pass.
 """
 
 import asyncio
@@ -22,6 +27,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Set
 from enum import Enum
 import random
+import numpy as np
 from loguru import logger
 
 
@@ -55,6 +61,10 @@ class PossibleWorld:
     generation: int = 0
     parent_world_id: Optional[str] = None
     mutations: List[str] = field(default_factory=list)
+    
+    def feature_vector(self) -> List[float]:
+        """Fitness features used for accessibility distances."""
+        return [self.coherence, self.reward, self.survival_score]
 
 
 @dataclass
@@ -100,12 +110,23 @@ class DarwinianModalLogic:
     Evolves decision strategies through modal reasoning and natural selection.
     """
     
-    def __init__(self, gemini_client):
+    def __init__(
+        self,
+        gemini_client,
+        mutation_concurrency: int = 8,
+        generation_time_budget: Optional[float] = 30.0,
+        accessibility_radius: Optional[float] = None
+    ):
         """
         Initialize Darwinian modal logic.
         
         Args:
             gemini_client: Gemini Flash 2.0 client
+            mutation_concurrency: Max offspring mutations in flight at once
+            generation_time_budget: Seconds allowed for a generation's mutations
+                (None = wait for all); late offspring get a local mutation
+            accessibility_radius: Max feature distance between accessible worlds
+                (None = every world is accessible from every other)
         """
         self.gemini = gemini_client
         
@@ -120,11 +141,16 @@ class DarwinianModalLogic:
         self.population_size = 10
         self.mutation_rate = 0.15
         self.selection_pressure = 0.7  # Top 70% survive
+        self.mutation_concurrency = mutation_concurrency
+        self.generation_time_budget = generation_time_budget
+        self.accessibility_radius = accessibility_radius
         
         # Statistics
         self.generation = 0
         self.total_worlds_created = 0
         self.total_worlds_eliminated = 0
+        self.mutation_fallbacks = 0
+        self.last_generation_seconds = 0.0
         
         logger.info("[DARWINIAN-LOGIC] System initialized")
     
@@ -277,6 +303,7 @@ Generate {count} distinct variants."""
         - Maintain population size
         """
         self.generation += 1
+        start_time = time.perf_counter()
         
         # Sort by survival score
         sorted_worlds = sorted(
@@ -308,21 +335,109 @@ Generate {count} distinct variants."""
                 k=offspring_needed
             )
             
-            # Generate offspring with mutations
-            for parent in parents:
-                offspring = await self._mutate_world(parent)
+            # Generate offspring with mutations, concurrently
+            for offspring in await self._mutate_offspring(parents):
                 self.worlds[offspring.world_id] = offspring
                 self.total_worlds_created += 1
-                
-                # Update accessibility
-                for world in self.worlds.values():
-                    if world.world_id != offspring.world_id:
-                        world.accessible_worlds.add(offspring.world_id)
-                        offspring.accessible_worlds.add(world.world_id)
         
-        logger.info(f"[DARWINIAN-LOGIC] Generated {offspring_needed} offspring")
+        self.update_accessibility()
+        self.last_generation_seconds = time.perf_counter() - start_time
+        
+        logger.info(
+            f"[DARWINIAN-LOGIC] Generated {max(offspring_needed, 0)} offspring "
+            f"in {self.last_generation_seconds:.2f}s"
+        )
+    
+    async def _mutate_offspring(self, parents: List[PossibleWorld]) -> List[PossibleWorld]:
+        """
+        Mutate one offspring per parent, concurrently and within the time budget.
+        
+        Offspring whose mutation fails or misses the deadline get a local
+        mutation of their parent instead, so the population is always refilled.
+        """
+        world_ids = [f"world_{self.total_worlds_created + i + 1}" for i in range(len(parents))]
+        semaphore = asyncio.Semaphore(max(1, self.mutation_concurrency))
+        
+        async def mutate(parent: PossibleWorld, world_id: str) -> PossibleWorld:
+            async with semaphore:
+                return await self._mutate_world(parent, world_id)
+        
+        tasks = [
+            asyncio.create_task(mutate(parent, world_id))
+            for parent, world_id in zip(parents, world_ids)
+        ]
+        done, pending = await asyncio.wait(tasks, timeout=self.generation_time_budget)
+        for task in pending:
+            task.cancel()
+        
+        offspring = []
+        for task, parent, world_id in zip(tasks, parents, world_ids):
+            if task in done and task.exception() is None:
+                offspring.append(task.result())
+                continue
+            
+            if task in done:
+                reason = f"mutation failed: {task.exception()}"
+            else:
+                reason = f"missed {self.generation_time_budget}s budget"
+            offspring.append(self._local_mutation(parent, world_id, reason))
+            self.mutation_fallbacks += 1
+        
+        if pending:
+            logger.warning(
+                f"[DARWINIAN-LOGIC] {len(pending)}/{len(tasks)} mutations missed the "
+                f"{self.generation_time_budget}s budget; used local mutations"
+            )
+        
+        return offspring
+    
+    def _local_mutation(self, parent: PossibleWorld, world_id: str, reason: str) -> PossibleWorld:
+        """Cheap offspring that keeps the parent's strategy (no LLM call)."""
+        offspring = self._make_offspring(parent, world_id, parent.state.get('strategy', 'explore'))
+        offspring.mutations.append(f"Local mutation ({reason})")
+        return offspring
+    
+    def _make_offspring(self, parent: PossibleWorld, world_id: str, strategy: str) -> PossibleWorld:
+        """Offspring of `parent` with the given strategy."""
+        offspring = PossibleWorld(
+            world_id=world_id,
+            state=parent.state.copy(),
+            coherence=parent.coherence + random.uniform(-0.05, 0.05),
+            reward=0.0,  # Reset reward for new generation
+            survival_score=parent.survival_score * 0.9,  # Inherit some fitness
+            generation=self.generation,
+            parent_world_id=parent.world_id,
+            mutations=[f"Mutated from {parent.world_id}"]
+        )
+        
+        offspring.state['strategy'] = strategy
+        
+        return offspring
     
-    async def _mutate_world(self, parent: PossibleWorld) -> PossibleWorld:
+    def update_accessibility(self):
+        """
+        Recompute accessibility between all worlds.
+        
+        Worlds are accessible from each other when their feature vectors lie
+        within `accessibility_radius` (all pairs when the radius is None).
+        """
+        world_ids = list(self.worlds)
+        if not world_ids:
+            return
+        
+        if self.accessibility_radius is None:
+            accessible = np.ones((len(world_ids), len(world_ids)), dtype=bool)
+        else:
+            features = np.array([self.worlds[w].feature_vector() for w in world_ids], dtype=np.float64)
+            squared = np.einsum('ij,ij->i', features, features)
+            distances_sq = squared[:, None] + squared[None, :] - 2.0 * (features @ features.T)
+            accessible = distances_sq <= self.accessibility_radius ** 2
+        np.fill_diagonal(accessible, False)
+        
+        for i, world_id in enumerate(world_ids):
+            self.worlds[world_id].accessible_worlds = {world_ids[j] for j in np.flatnonzero(accessible[i])}
+    
+    async def _mutate_world(self, parent: PossibleWorld, world_id: Optional[str] = None) -> PossibleWorld:
         """Create mutated offspring from parent world."""
         # Decide what to mutate
         if random.random() < self.mutation_rate:
@@ -349,21 +464,11 @@ Mutated Strategy:"""
         else:
             mutated_strategy = parent.state.get('strategy', 'explore')
         
-        # Create offspring
-        offspring = PossibleWorld(
-            world_id=f"world_{self.total_worlds_created + 1}",
-            state=parent.state.copy(),
-            coherence=parent.coherence + random.uniform(-0.05, 0.05),
-            reward=0.0,  # Reset reward for new generation
-            survival_score=parent.survival_score * 0.9,  # Inherit some fitness
-            generation=self.generation,
-            parent_world_id=parent.world_id,
-            mutations=[f"Mutated from {parent.world_id}"]
+        return self._make_offspring(
+            parent,
+            world_id or f"world_{self.total_worlds_created + 1}",
+            mutated_strategy
         )
-        
-        offspring.state['strategy'] = mutated_strategy
-        
-        return offspring
     
     async def modal_reasoning(
         self,
@@ -519,6 +624,8 @@ Mutated Strategy:"""
             'active_worlds': len(self.worlds),
             'total_created': self.total_worlds_created,
             'total_eliminated': self.total_worlds_eliminated,
+            'mutation_fallbacks': self.mutation_fallbacks,
+            'last_generation_seconds': self.last_generation_seconds,
             'average_fitness': float(avg_fitness),
             'best_fitness': float(best_world.survival_score),
             'best_strategy': best_world.state.get('strategy', 'unknown'),
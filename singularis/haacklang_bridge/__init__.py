@@ -12,6 +12,7 @@ Key Components:
 """
 
 from .runtime import HaackLangRuntime, BeatScheduler
+from .compiler import CompiledModule, ModuleCache
 from .decorators import haack_track, haack_truthvalue, haack_context, haack_guard
 from .bridge import SingularisHaackBridge
 from .truthvalue_sync import TruthValueSync
@@ -21,6 +22,8 @@ __version__ = "1.0.0"
 __all__ = [
     'HaackLangRuntime',
     'BeatScheduler',
+    'CompiledModule',
+    'ModuleCache',
     'haack_track',
     'haack_truthvalue',
     'haack_context',
@@ -50,7 +50,9 @@ class SingularisHaackBridge:
     def __init__(
         self,
         haack_modules_dir: Path,
-        beat_interval: float = 0.1
+        beat_interval: float = 0.1,
+        cache_dir: Optional[Path] = None,
+        compile_programs: bool = False
     ):
         """
         Initialize the bridge.
@@ -58,12 +60,18 @@ class SingularisHaackBridge:
         Args:
             haack_modules_dir: Directory containing .haack files
             beat_interval: Seconds per beat (default: 0.1s = 10Hz)
+            cache_dir: Directory for compiled modules (None = memory only)
+            compile_programs: Prune idle-track guards per beat (see HaackLangRuntime)
         """
         self.haack_modules_dir = Path(haack_modules_dir)
         self.beat_interval = beat_interval
         
         # Initialize HaackLang runtime
-        self.runtime = HaackLangRuntime(beat_interval=beat_interval)
+        self.runtime = HaackLangRuntime(
+            beat_interval=beat_interval,
+            cache_dir=cache_dir,
+            compile_programs=compile_programs
+        )
         
         # Bind runtime to decorators
         bind_runtime(self.runtime)
@@ -0,0 +1,296 @@
+"""
+HaackLang Module Compiler and Cache.
+
+Lowers parsed .haack modules to a compact instruction form and caches the
+result so modules are lexed and parsed once per source version:
+
+- Memory cache: compiled modules keyed by the SHA-256 of their source.
+- Disk cache: the same compiled modules pickled to `<cache_dir>/<name>.<hash>.hlc`,
+  so a fresh process skips lexing/parsing for unchanged sources.
+- Hot reload: `ModuleCache.changed()` stats each watched file and only
+  re-hashes (and recompiles) files whose mtime/size moved.
+
+The instruction form is the module's top-level statements, classified once:
+
+- DECLARE: track/context/truthvalue declarations.
+- GUARD: guards bound to a track.
+- EXEC: everything else.
+
+`CompiledModule.program_for(active_tracks)` returns a program node holding
+just the statements to run for a set of active tracks. Track periods make
+those sets repeat, so the per-set programs are built once and reused, and
+the interpreter never walks guards whose track is idle. Runtimes only use
+these programs when created with `compile_programs=True` (declarations then
+run once per load); otherwise they interpret the cached AST.
+"""
+
+import copy
+import hashlib
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Bump when the pickled layout of CompiledModule changes
+CODE_FORMAT_VERSION = 1
+
+OP_DECLARE = 0
+OP_GUARD = 1
+OP_EXEC = 2
+
+# AST attributes that may hold a program's top-level statements
+_BODY_ATTRS = ('statements', 'body')
+
+
+def source_hash(source: str) -> str:
+    """SHA-256 of a module's source text."""
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+def _classify(node: Any) -> Tuple[int, Optional[str]]:
+    """Instruction opcode and gating track for one top-level statement."""
+    kind = type(node).__name__
+    if kind.endswith('Declaration') or kind.endswith('Decl'):
+        return OP_DECLARE, None
+    track = getattr(node, 'track', None)
+    if 'Guard' in kind and isinstance(track, str):
+        return OP_GUARD, track
+    return OP_EXEC, None
+
+
+@dataclass
+class CompiledModule:
+    """A .haack module lowered to (opcode, track, statement) instructions."""
+    name: str
+    source_hash: str
+    ast: Any
+    code: Tuple[Tuple[int, Optional[str], Any], ...]
+    body_attr: Optional[str] = None
+    compiled_at: float = field(default_factory=time.time)
+    _programs: Dict[FrozenSet[str], Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def guarded_tracks(self) -> FrozenSet[str]:
+        """Tracks that gate at least one guard in this module."""
+        return frozenset(track for op, track, _ in self.code if op == OP_GUARD)
+
+    def _program(self, statements: List[Any]) -> Any:
+        program = copy.copy(self.ast)
+        setattr(program, self.body_attr, statements)
+        return program
+
+    def declarations(self) -> Optional[Any]:
+        """Program holding only the declarations (None if there are none)."""
+        if self.body_attr is None:
+            return None
+        statements = [node for op, _, node in self.code if op == OP_DECLARE]
+        return self._program(statements) if statements else None
+
+    def program_for(self, active_tracks: Iterable[str]) -> Any:
+        """
+        Program to interpret on a beat where `active_tracks` fire.
+
+        Modules whose AST exposes no statement list are run whole.
+        """
+        if self.body_attr is None:
+            return self.ast
+
+        # Only the tracks this module guards on affect which statements run
+        key = self.guarded_tracks.intersection(active_tracks)
+        program = self._programs.get(key)
+        if program is None:
+            program = self._program([
+                node for op, track, node in self.code
+                if op == OP_EXEC or (op == OP_GUARD and track in key)
+            ])
+            self._programs[key] = program
+        return program
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_programs'] = {}
+        return state
+
+
+def lower(name: str, digest: str, ast: Any) -> CompiledModule:
+    """Lower a parsed module to its instruction form."""
+    body_attr = next(
+        (attr for attr in _BODY_ATTRS if isinstance(getattr(ast, attr, None), (list, tuple))),
+        None,
+    )
+    statements = list(getattr(ast, body_attr)) if body_attr else [ast]
+    code = tuple((*_classify(node), node) for node in statements) if body_attr else ((OP_EXEC, None, ast),)
+    return CompiledModule(name=name, source_hash=digest, ast=ast, code=code, body_attr=body_attr)
+
+
+@dataclass
+class _WatchEntry:
+    """Last seen state of a watched module file."""
+    path: Path
+    mtime_ns: int
+    size: int
+    source_hash: str
+
+
+class ModuleCache:
+    """
+    Memory + disk cache of compiled modules, keyed by source hash.
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[str], Any],
+        cache_dir: Optional[Path] = None,
+        max_memory_entries: int = 1024
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            parse: Source text -> AST (lex + parse)
+            cache_dir: Directory for persisted compiled modules (None = memory only)
+            max_memory_entries: Compiled modules kept in memory
+        """
+        self.parse = parse
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_memory_entries = max_memory_entries
+
+        self._memory: Dict[Tuple[str, str], CompiledModule] = {}
+        self._watched: Dict[str, _WatchEntry] = {}
+        self._lock = threading.RLock()
+
+        self.stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'compiles': 0,
+            'disk_errors': 0,
+        }
+
+    def _disk_path(self, name: str, digest: str) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / f"{name}.{digest[:32]}.hlc"
+
+    def _read_disk(self, name: str, digest: str) -> Optional[CompiledModule]:
+        path = self._disk_path(name, digest)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, 'rb') as f:
+                version, compiled = pickle.load(f)
+        except Exception as e:
+            print(f"[HLVM] Ignoring unreadable compiled module {path.name}: {e}")
+            self.stats['disk_errors'] += 1
+            return None
+        if version != CODE_FORMAT_VERSION or compiled.source_hash != digest:
+            return None
+        return compiled
+
+    def _write_disk(self, compiled: CompiledModule):
+        path = self._disk_path(compiled.name, compiled.source_hash)
+        if path is None:
+            return
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((CODE_FORMAT_VERSION, compiled), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            # Unpicklable ASTs or a read-only cache only cost a recompile next time
+            print(f"[HLVM] Could not persist compiled module {compiled.name}: {e}")
+            self.stats['disk_errors'] += 1
+            tmp_path.unlink(missing_ok=True)
+
+    def compile_source(self, name: str, source: str) -> Tuple[CompiledModule, str]:
+        """
+        Compiled form of `source`, from memory, disk or a fresh compile.
+
+        Returns:
+            (compiled module, origin) where origin is 'memory', 'disk' or 'compiled'
+        """
+        digest = source_hash(source)
+        key = (name, digest)
+
+        with self._lock:
+            compiled = self._memory.get(key)
+            if compiled is not None:
+                self.stats['memory_hits'] += 1
+                return compiled, 'memory'
+
+        compiled = self._read_disk(name, digest)
+        origin = 'disk'
+        if compiled is None:
+            compiled = lower(name, digest, self.parse(source))
+            origin = 'compiled'
+            self._write_disk(compiled)
+
+        with self._lock:
+            self.stats['disk_hits' if origin == 'disk' else 'compiles'] += 1
+            # Drop the previous version of this module before inserting
+            for stale in [k for k in self._memory if k[0] == name]:
+                del self._memory[stale]
+            if len(self._memory) >= self.max_memory_entries:
+                del self._memory[next(iter(self._memory))]
+            self._memory[key] = compiled
+
+        return compiled, origin
+
+    def load(self, path: Path) -> Tuple[CompiledModule, str]:
+        """Compile a module file and start watching it for changes."""
+        path = Path(path)
+        stat = path.stat()
+        source = path.read_text()
+        compiled, origin = self.compile_source(path.stem, source)
+        with self._lock:
+            self._watched[path.stem] = _WatchEntry(path, stat.st_mtime_ns, stat.st_size, compiled.source_hash)
+        return compiled, origin
+
+    def unwatch(self, name: str):
+        """Stop watching a module."""
+        with self._lock:
+            self._watched.pop(name, None)
+
+    def changed(self) -> List[Path]:
+        """
+        Watched files whose source changed since they were last loaded.
+
+        Only files whose mtime or size moved are re-read and hashed, so a
+        poll over hundreds of unchanged modules costs one stat() each.
+        """
+        with self._lock:
+            entries = list(self._watched.values())
+
+        changed = []
+        for entry in entries:
+            try:
+                stat = entry.path.stat()
+            except OSError:
+                continue
+            if stat.st_mtime_ns == entry.mtime_ns and stat.st_size == entry.size:
+                continue
+            digest = source_hash(entry.path.read_text())
+            if digest == entry.source_hash:
+                # Touched but not edited
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                continue
+            changed.append(entry.path)
+        return changed
+
+    def clear_memory(self):
+        """Drop in-memory compiled modules (the disk cache is kept)."""
+        with self._lock:
+            self._memory.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics."""
+        return {
+            **self.stats,
+            'memory_entries': len(self._memory),
+            'watched_modules': len(self._watched),
+            'cache_dir': str(self.cache_dir) if self.cache_dir else None,
+        }
@@ -7,11 +7,20 @@ Implements:
 - Context Engine
 - TruthValue/BoolRhythm Management
 - Polylogical ALUs
+- Compiled-module cache with hot reload (see compiler.py)
+
+By default execute() interprets a module's cached AST whole, exactly as an
+uncached runtime would. With `compile_programs=True` declarations
+(track/context/truthvalue) instead run once when a module is loaded or
+reloaded, and execute() runs only the guards of the tracks firing on the
+current beat. A truthvalue declared with an initial value then keeps
+whatever later beats assign to it instead of being reset each beat.
 """
 
 import sys
 import time
 import asyncio
+import threading
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set, Callable
 from dataclasses import dataclass, field
@@ -24,6 +33,8 @@ from haackc.parser import Parser
 from haackc.lexer import Lexer
 from haackc.interpreter import Interpreter
 
+from .compiler import CompiledModule, ModuleCache
+
 
 class BeatScheduler:
     """
@@ -169,17 +180,33 @@ class HaackLangRuntime:
     - Context switching
     - TruthValue synchronization
     - Python↔HaackLang FFI
+    - Compiled-module cache (memory + disk) and hot reload
     """
     
-    def __init__(self, beat_interval: float = 0.1):
+    def __init__(
+        self,
+        beat_interval: float = 0.1,
+        cache_dir: Optional[Path] = None,
+        compile_programs: bool = False
+    ):
         """
         Initialize HaackLang runtime.
         
         Args:
             beat_interval: Seconds between beats
+            cache_dir: Directory for persisted compiled modules (None = memory only)
+            compile_programs: Run declarations at load time and prune guards of
+                idle tracks on each execute() (default: run the whole AST)
         """
         self.scheduler = BeatScheduler(beat_interval)
+        self.compile_programs = compile_programs
         self.interpreter = Interpreter()
+        self.module_cache = ModuleCache(self._parse_source, cache_dir)
+        
+        # Serializes interpreter use between beats and hot reloads
+        self._lock = threading.RLock()
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
         
         # Contexts
         self.contexts: Dict[str, Context] = {}
@@ -194,6 +221,7 @@ class HaackLangRuntime:
         # Statistics
         self.stats = {
             'modules_loaded': 0,
+            'modules_reloaded': 0,
             'total_executions': 0,
             'total_beats': 0,
             'errors': 0
@@ -201,44 +229,34 @@ class HaackLangRuntime:
         
         print("[HLVM] HaackLang Runtime initialized")
     
+    @staticmethod
+    def _parse_source(source: str):
+        """Lex and parse HaackLang source into an AST."""
+        tokens = Lexer(source).tokenize()
+        return Parser(tokens).parse()
+    
     def load_module(self, module_path: Path) -> bool:
         """
         Load and compile a .haack module.
         
+        The compiled form comes from the module cache when the source is
+        unchanged (in memory, or on disk when a cache_dir is configured).
+        
         Args:
             module_path: Path to .haack file
         
         Returns:
             True if successful
         """
+        module_path = Path(module_path)
         try:
-            source = module_path.read_text()
-            
-            # Lex
-            lexer = Lexer(source)
-            tokens = lexer.tokenize()
-            
-            # Parse
-            parser = Parser(tokens)
-            ast = parser.parse()
-            
-            # Store compiled module
-            module_name = module_path.stem
-            self.loaded_modules[module_name] = {
-                'path': module_path,
-                'ast': ast,
-                'tokens': tokens,
-                'loaded_at': time.time()
-            }
-            
-            # Extract and register tracks from AST
-            self._extract_tracks_from_ast(ast)
+            compiled, origin = self.module_cache.load(module_path)
             
-            # Extract and register contexts
-            self._extract_contexts_from_ast(ast)
+            with self._lock:
+                self._install_module(module_path, compiled, origin)
             
             self.stats['modules_loaded'] += 1
-            print(f"[HLVM] Loaded module: {module_name}")
+            print(f"[HLVM] Loaded module: {compiled.name} ({origin})")
             
             return True
             
@@ -247,6 +265,83 @@ class HaackLangRuntime:
             self.stats['errors'] += 1
             return False
     
+    def _install_module(self, module_path: Path, compiled: CompiledModule, origin: str):
+        """Register a compiled module (running its declarations once if compiling programs)."""
+        self.loaded_modules[compiled.name] = {
+            'path': module_path,
+            'ast': compiled.ast,
+            'compiled': compiled,
+            'source_hash': compiled.source_hash,
+            'origin': origin,
+            'loaded_at': time.time()
+        }
+        
+        # Extract and register tracks from AST
+        self._extract_tracks_from_ast(compiled.ast)
+        
+        # Extract and register contexts
+        self._extract_contexts_from_ast(compiled.ast)
+        
+        if not self.compile_programs:
+            return
+        
+        # Declarations run at load time instead of on every beat
+        declarations = compiled.declarations()
+        if declarations is not None:
+            self.interpreter.python_callbacks = self.python_callbacks
+            self.interpreter.interpret(declarations)
+    
+    def reload_changed(self) -> List[str]:
+        """
+        Recompile loaded modules whose source changed on disk.
+        
+        Unchanged modules are not re-read beyond a stat() call.
+        
+        Returns:
+            Names of reloaded modules
+        """
+        reloaded = []
+        for path in self.module_cache.changed():
+            try:
+                compiled, origin = self.module_cache.load(path)
+                with self._lock:
+                    self._install_module(path, compiled, origin)
+            except Exception as e:
+                print(f"[HLVM] Failed to reload module {path}: {e}")
+                self.stats['errors'] += 1
+                continue
+            reloaded.append(compiled.name)
+            self.stats['modules_reloaded'] += 1
+            print(f"[HLVM] Reloaded module: {compiled.name}")
+        return reloaded
+    
+    def start_watching(self, poll_interval: float = 1.0):
+        """
+        Hot-reload changed modules from a background thread.
+        
+        Args:
+            poll_interval: Seconds between checks
+        """
+        if self._watch_thread and self._watch_thread.is_alive():
+            return
+        
+        self._watch_stop.clear()
+        
+        def _watch():
+            while not self._watch_stop.wait(poll_interval):
+                self.reload_changed()
+        
+        self._watch_thread = threading.Thread(target=_watch, name="hlvm-module-watch", daemon=True)
+        self._watch_thread.start()
+        print(f"[HLVM] Watching modules for changes every {poll_interval}s")
+    
+    def stop_watching(self):
+        """Stop the hot-reload thread."""
+        self._watch_stop.set()
+        if self._watch_thread:
+            self._watch_thread.join(timeout=5)
+            self._watch_thread = None
+    
     def _extract_tracks_from_ast(self, ast):
         """Extract track declarations from AST and register with scheduler."""
         # This would need to traverse the AST looking for TrackDeclaration nodes
@@ -294,6 +389,10 @@ class HaackLangRuntime:
         """
         Execute a HaackLang module.
         
+        Interprets the module's cached AST. With `compile_programs` only the
+        guards for the currently active tracks and the other non-declaration
+        statements run; declarations already ran at load time.
+        
         Args:
             module: Module name (without .haack)
             context: Context to execute in (default: current)
@@ -311,33 +410,37 @@ class HaackLangRuntime:
                 result.errors.append(f"Module not loaded: {module}")
                 return result
             
-            module_data = self.loaded_modules[module]
-            ast = module_data['ast']
-            
-            # Set context
-            if context:
-                self.current_context = context
-            
-            # Set inputs in interpreter
-            if inputs:
-                for name, value in inputs.items():
-                    self.interpreter.set_variable(name, value)
-            
-            # Register Python callbacks with interpreter
-            self.interpreter.python_callbacks = self.python_callbacks
-            
-            # Execute AST
-            self.interpreter.interpret(ast)
-            
-            # Extract results
-            result.truthvalues = {
-                name: tv.to_dict()
-                for name, tv in self.interpreter.truthvalues.items()
-            }
-            
-            # Check for action result
-            if hasattr(self.interpreter, 'result_action'):
-                result.action = self.interpreter.result_action
+            with self._lock:
+                compiled: CompiledModule = self.loaded_modules[module]['compiled']
+                
+                # Set context
+                if context:
+                    self.current_context = context
+                
+                # Set inputs in interpreter
+                if inputs:
+                    for name, value in inputs.items():
+                        self.interpreter.set_variable(name, value)
+                
+                # Register Python callbacks with interpreter
+                self.interpreter.python_callbacks = self.python_callbacks
+                
+                if self.compile_programs:
+                    # Execute only the statements live on this beat
+                    program = compiled.program_for(self.get_active_tracks())
+                else:
+                    program = compiled.ast
+                self.interpreter.interpret(program)
+                
+                # Extract results
+                result.truthvalues = {
+                    name: tv.to_dict()
+                    for name, tv in self.interpreter.truthvalues.items()
+                }
+                
+                # Check for action result
+                if hasattr(self.interpreter, 'result_action'):
+                    result.action = self.interpreter.result_action
             
             result.success = True
             self.stats['total_executions'] += 1
@@ -431,6 +534,7 @@ class HaackLangRuntime:
         return {
             **self.stats,
             'scheduler': self.scheduler.get_stats(),
+            'module_cache': self.module_cache.get_stats(),
             'num_truthvalues': len(self.interpreter.truthvalues),
             'num_contexts': len(self.contexts),
             'current_context': self.current_context
@@ -3,12 +3,23 @@ TruthValue Synchronization Protocol
 
 Handles bidirectional synchronization of truthvalues between
 Python subsystems and HaackLang runtime.
+
+Values are stored in NumPy arrays indexed by a variable id (one id per
+name/track pair) and the update history is a fixed-size ring buffer, so
+recording an update and refreshing the statistics are O(1), and
+`sync_batch` moves thousands of values with a handful of array operations.
 """
 
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, Iterable, List, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+
+import numpy as np
+
+SOURCE_PYTHON = 0
+SOURCE_HAACKLANG = 1
+_SOURCE_NAMES = ('python', 'haacklang')
 
 
 @dataclass
@@ -46,23 +57,49 @@ class TruthValueSync:
     - Conflict detection and resolution
     - Change notification callbacks
     - Synchronization statistics
+    - Batched sync of many values per call (`sync_batch`)
     """
     
-    def __init__(self, runtime):
+    def __init__(self, runtime, max_history: int = 1000, latency_window: int = 100):
         """
         Initialize sync protocol.
         
         Args:
             runtime: HaackLangRuntime instance
+            max_history: Updates kept in the history ring buffer
+            latency_window: Most recent updates considered for avg_latency_ms
         """
         self.runtime = runtime
         
-        # Track current values
-        self.current_values: Dict[str, Dict[str, float]] = defaultdict(dict)
-        
-        # Update history
-        self.update_history: List[TruthValueUpdate] = []
-        self.max_history = 1000
+        # Variable ids: one per (name, track) pair
+        self._ids: Dict[Tuple[str, str], int] = {}
+        self._keys: List[Tuple[str, str]] = []
+        self._ids_by_name: Dict[str, Dict[str, int]] = defaultdict(dict)
+        
+        # Per-variable state, grown by doubling
+        capacity = 64
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._update_counts = np.zeros(capacity, dtype=np.int64)
+        self._value_sums = np.zeros(capacity, dtype=np.float64)
+        self._has_callbacks = np.zeros(capacity, dtype=bool)
+        
+        # Update history ring buffer
+        self.max_history = max_history
+        self._hist_ids = np.zeros(max_history, dtype=np.int64)
+        self._hist_old = np.zeros(max_history, dtype=np.float64)
+        self._hist_new = np.zeros(max_history, dtype=np.float64)
+        self._hist_time = np.zeros(max_history, dtype=np.float64)
+        self._hist_source = np.zeros(max_history, dtype=np.int8)
+        self._hist_pos = 0
+        self._hist_len = 0
+        
+        # Cross-boundary latencies among the last `latency_window` updates:
+        # (sequence number, latency_ms) with a running sum
+        self.latency_window = latency_window
+        self._crossings: deque = deque()
+        self._crossing_sum = 0.0
+        self._last_source: Optional[int] = None
+        self._last_timestamp = 0.0
         
         # Callbacks for value changes
         self.on_change_callbacks: Dict[str, List[Callable]] = defaultdict(list)
@@ -76,6 +113,104 @@ class TruthValueSync:
         
         print("[SYNC] TruthValue synchronization protocol initialized")
     
+    def _grow(self, needed: int):
+        """Grow per-variable arrays to hold at least `needed` variables."""
+        capacity = len(self._values)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for attr in ('_values', '_update_counts', '_value_sums', '_has_callbacks'):
+            old = getattr(self, attr)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, attr, new)
+    
+    def variable_id(self, name: str, track: str) -> int:
+        """Id of the (name, track) variable, registering it if new."""
+        key = (name, track)
+        var_id = self._ids.get(key)
+        if var_id is None:
+            var_id = len(self._keys)
+            self._grow(var_id + 1)
+            self._ids[key] = var_id
+            self._keys.append(key)
+            self._ids_by_name[name][track] = var_id
+            self._has_callbacks[var_id] = name in self.on_change_callbacks
+        return var_id
+    
+    def variable_ids(self, keys: Iterable[Tuple[str, str]]) -> np.ndarray:
+        """Ids for many (name, track) pairs, registering new ones."""
+        return np.fromiter(
+            (self.variable_id(name, track) for name, track in keys),
+            dtype=np.int64,
+        )
+    
+    def _as_ids(self, keys_or_ids: Union[np.ndarray, Sequence[Tuple[str, str]]]) -> np.ndarray:
+        if isinstance(keys_or_ids, np.ndarray) and keys_or_ids.dtype.kind in 'iu':
+            return keys_or_ids.astype(np.int64, copy=False)
+        return self.variable_ids(keys_or_ids)
+    
+    @property
+    def current_values(self) -> Dict[str, Dict[str, float]]:
+        """Current values as {name: {track: value}}."""
+        values = self._values
+        return {
+            name: {track: float(values[var_id]) for track, var_id in tracks.items()}
+            for name, tracks in self._ids_by_name.items()
+        }
+    
+    def _record(self, ids: np.ndarray, old: np.ndarray, new: np.ndarray, source: int, timestamp: float):
+        """Write updates to state, history and running statistics."""
+        n = len(ids)
+        if n == 0:
+            return
+        
+        # Duplicate ids within one batch: the last value wins
+        self._values[ids] = new
+        np.add.at(self._update_counts, ids, 1)
+        np.add.at(self._value_sums, ids, new)
+        
+        # History ring buffer (only the newest max_history entries survive)
+        cap = self.max_history
+        if n >= cap:
+            ids, old, new = ids[-cap:], old[-cap:], new[-cap:]
+            self._hist_pos = 0
+            n_hist = cap
+        else:
+            n_hist = n
+        slots = (self._hist_pos + np.arange(n_hist)) % cap
+        self._hist_ids[slots] = ids
+        self._hist_old[slots] = old
+        self._hist_new[slots] = new
+        self._hist_time[slots] = timestamp
+        self._hist_source[slots] = source
+        self._hist_pos = (self._hist_pos + n_hist) % cap
+        self._hist_len = min(cap, self._hist_len + n_hist)
+        
+        # A batch crosses the Python/HaackLang boundary at most once: at its
+        # first update, if the previous update came from the other side
+        first_seq = self.stats.total_updates
+        if self._last_source is not None and self._last_source != source:
+            latency = (timestamp - self._last_timestamp) * 1000
+            self._crossings.append((first_seq, latency))
+            self._crossing_sum += latency
+        self._last_source = source
+        self._last_timestamp = timestamp
+        
+        self.stats.total_updates += n
+        if source == SOURCE_PYTHON:
+            self.stats.python_to_haack += n
+        else:
+            self.stats.haack_to_python += n
+        self._update_stats()
+    
+    def _notify_many(self, ids: np.ndarray, old: np.ndarray, new: np.ndarray):
+        """Run callbacks for the updated variables that have any."""
+        for i in np.flatnonzero(self._has_callbacks[ids]):
+            name, track = self._keys[ids[i]]
+            self._notify_callbacks(name, track, float(old[i]), float(new[i]))
+    
     def update_from_python(
         self,
         name: str,
@@ -92,40 +227,22 @@ class TruthValueSync:
             value: New value (0.0-1.0)
             notify_callbacks: Whether to trigger callbacks
         """
-        # Get old value
-        old_value = self.current_values[name].get(track, 0.0)
+        var_id = self.variable_id(name, track)
+        old_value = float(self._values[var_id])
         
-        # Check for conflict with HaackLang
+        # Check for conflict with HaackLang (reported; the pushed value is kept)
         haack_value = self.runtime.get_truthvalue(name, track)
         if haack_value is not None and abs(haack_value - value) > 0.1:
             self._resolve_conflict(name, track, value, haack_value, 'python')
             self.stats.conflicts += 1
         
-        # Update current values
-        self.current_values[name][track] = value
-        
         # Propagate to HaackLang
         self.runtime.set_truthvalue(name, track, value)
         
-        # Record update
-        update = TruthValueUpdate(
-            name=name,
-            track=track,
-            old_value=old_value,
-            new_value=value,
-            timestamp=time.time(),
-            source='python'
+        self._record(
+            np.array([var_id]), np.array([old_value]), np.array([value], dtype=np.float64),
+            SOURCE_PYTHON, time.time()
         )
-        self.update_history.append(update)
-        
-        # Limit history
-        if len(self.update_history) > self.max_history:
-            self.update_history.pop(0)
-        
-        # Update stats
-        self.stats.total_updates += 1
-        self.stats.python_to_haack += 1
-        self._update_stats()
         
         # Notify callbacks
         if notify_callbacks:
@@ -145,34 +262,118 @@ class TruthValueSync:
             track: Track name
             value: New value
         """
-        # Get old value
-        old_value = self.current_values[name].get(track, 0.0)
-        
-        # Update current values
-        self.current_values[name][track] = value
-        
-        # Record update
-        update = TruthValueUpdate(
-            name=name,
-            track=track,
-            old_value=old_value,
-            new_value=value,
-            timestamp=time.time(),
-            source='haacklang'
-        )
-        self.update_history.append(update)
-        
-        if len(self.update_history) > self.max_history:
-            self.update_history.pop(0)
+        var_id = self.variable_id(name, track)
+        old_value = float(self._values[var_id])
         
-        # Update stats
-        self.stats.total_updates += 1
-        self.stats.haack_to_python += 1
-        self._update_stats()
+        self._record(
+            np.array([var_id]), np.array([old_value]), np.array([value], dtype=np.float64),
+            SOURCE_HAACKLANG, time.time()
+        )
         
         # Notify callbacks
         self._notify_callbacks(name, track, old_value, value)
     
+    def sync_batch(
+        self,
+        keys_or_ids: Union[np.ndarray, Sequence[Tuple[str, str]]],
+        values: Optional[Union[np.ndarray, Sequence[float]]] = None,
+        direction: str = 'push',
+        notify_callbacks: bool = True
+    ) -> np.ndarray:
+        """
+        Synchronize many truthvalues in one call.
+        
+        Args:
+            keys_or_ids: (name, track) pairs, or an integer array of ids from
+                `variable_ids()` (cheapest when the same set is synced every cycle)
+            values: New values, one per key (required for 'push')
+            direction: 'push' (Python → HaackLang) or 'pull' (HaackLang → Python)
+            notify_callbacks: Whether to trigger callbacks
+        
+        Returns:
+            The synchronized values, in input order
+        
+        A variable listed more than once is applied in order: each entry sees
+        the value written by the previous one as its old value.
+        """
+        ids = self._as_ids(keys_or_ids)
+        old = self._values[ids]
+        
+        if direction == 'push':
+            if values is None:
+                raise ValueError("sync_batch(direction='push') requires values")
+            new = np.asarray(values, dtype=np.float64)
+            if new.shape != ids.shape:
+                raise ValueError(f"Expected {len(ids)} values, got {new.shape}")
+            
+            old, repeated = self._sequential_old(ids, old, new)
+            self._count_conflicts_batch(ids, old, new, repeated)
+            for var_id, value in zip(ids.tolist(), new.tolist()):
+                name, track = self._keys[var_id]
+                self.runtime.set_truthvalue(name, track, value)
+            source = SOURCE_PYTHON
+        
+        elif direction == 'pull':
+            new = old.copy()
+            for i, var_id in enumerate(ids.tolist()):
+                name, track = self._keys[var_id]
+                value = self.runtime.get_truthvalue(name, track)
+                if value is not None:
+                    new[i] = value
+            old, _ = self._sequential_old(ids, old, new)
+            source = SOURCE_HAACKLANG
+        
+        else:
+            raise ValueError(f"Unknown sync direction: {direction}")
+        
+        self._record(ids, old, new, source, time.time())
+        
+        if notify_callbacks:
+            self._notify_many(ids, old, new)
+        
+        return new
+    
+    @staticmethod
+    def _sequential_old(ids: np.ndarray, old: np.ndarray, new: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Old values as if a batch were applied entry by entry.
+        
+        Returns:
+            (old values, mask of entries repeating an earlier id in the batch)
+        """
+        repeated = np.zeros(len(ids), dtype=bool)
+        if len(ids) < 2:
+            return old, repeated
+        order = np.argsort(ids, kind='stable')
+        sorted_ids = ids[order]
+        later = np.flatnonzero(sorted_ids[1:] == sorted_ids[:-1]) + 1
+        if len(later) == 0:
+            return old, repeated
+        old = old.copy()
+        old[order[later]] = new[order[later - 1]]
+        repeated[order[later]] = True
+        return old, repeated
+    
+    def _count_conflicts_batch(
+        self,
+        ids: np.ndarray,
+        old: np.ndarray,
+        python_values: np.ndarray,
+        repeated: np.ndarray
+    ):
+        """
+        Vectorized conflict detection for a push against the last synced values.
+        
+        The synced values mirror what HaackLang last held, so this needs no
+        per-variable round trip into the runtime. As with single updates,
+        conflicts are counted and reported; the pushed values are kept.
+        """
+        synced = (self._update_counts[ids] > 0) | repeated
+        count = int(((np.abs(old - python_values) > 0.1) & synced).sum())
+        if count:
+            self.stats.conflicts += count
+            print(f"[SYNC] {count} conflicts in batch (strategy: {self.conflict_strategy})")
+    
     def register_callback(self, truthvalue_name: str, callback: Callable):
         """
         Register a callback for when a truthvalue changes.
@@ -182,6 +383,8 @@ class TruthValueSync:
             callback: Function(name, track, old_value, new_value) to call
         """
         self.on_change_callbacks[truthvalue_name].append(callback)
+        for var_id in self._ids_by_name.get(truthvalue_name, {}).values():
+            self._has_callbacks[var_id] = True
     
     def _notify_callbacks(self, name: str, track: str, old_value: float, new_value: float):
         """Notify registered callbacks of a change."""
@@ -199,9 +402,11 @@ class TruthValueSync:
         python_value: float,
         haack_value: float,
         source: str
-    ):
+    ) -> float:
         """
-        Resolve conflict between Python and HaackLang values.
+        Report how the conflict strategy resolves a Python/HaackLang conflict.
+        
+        Callers keep the value being pushed; the resolution is informational.
         
         Args:
             name: TruthValue name
@@ -209,12 +414,15 @@ class TruthValueSync:
             python_value: Value from Python
             haack_value: Value from HaackLang
             source: Which side initiated the update
+        
+        Returns:
+            The value the strategy prefers
         """
         print(f"[SYNC] Conflict detected: {name}.{track}")
         print(f"[SYNC]   Python: {python_value:.3f}")
         print(f"[SYNC]   HaackLang: {haack_value:.3f}")
         
-        resolved_value = None
+        resolved_value = python_value if source == 'python' else haack_value
         
         if self.conflict_strategy == 'trust_python':
             resolved_value = python_value
@@ -233,10 +441,7 @@ class TruthValueSync:
             resolved_value = (python_value + haack_value) / 2.0
             print(f"[SYNC]   Resolution: average → {resolved_value:.3f}")
         
-        # Apply resolution
-        if resolved_value is not None:
-            self.current_values[name][track] = resolved_value
-            self.runtime.set_truthvalue(name, track, resolved_value)
+        return resolved_value
     
     def get_current_value(self, name: str, track: Optional[str] = None) -> Any:
         """
@@ -249,13 +454,61 @@ class TruthValueSync:
         Returns:
             Value or dict of values
         """
-        if name not in self.current_values:
+        if name not in self._ids_by_name:
             return None
         
+        tracks = self._ids_by_name[name]
         if track:
-            return self.current_values[name].get(track, 0.0)
+            var_id = tracks.get(track)
+            return float(self._values[var_id]) if var_id is not None else 0.0
         else:
-            return dict(self.current_values[name])
+            return {t: float(self._values[var_id]) for t, var_id in tracks.items()}
+    
+    def get_values(self, keys_or_ids: Union[np.ndarray, Sequence[Tuple[str, str]]]) -> np.ndarray:
+        """Current values for many variables at once."""
+        return self._values[self._as_ids(keys_or_ids)]
+    
+    def get_value_stats(self, name: str, track: str) -> Dict[str, float]:
+        """Update count and running mean of one variable."""
+        var_id = self._ids_by_name.get(name, {}).get(track)
+        if var_id is None:
+            return {'updates': 0, 'mean': 0.0, 'current': 0.0}
+        count = int(self._update_counts[var_id])
+        return {
+            'updates': count,
+            'mean': float(self._value_sums[var_id] / count) if count else 0.0,
+            'current': float(self._values[var_id]),
+        }
+    
+    def _history_order(self) -> np.ndarray:
+        """Ring buffer slots, oldest first."""
+        if self._hist_len < self.max_history:
+            return np.arange(self._hist_len)
+        return (self._hist_pos + np.arange(self.max_history)) % self.max_history
+    
+    @property
+    def update_history(self) -> List[TruthValueUpdate]:
+        """Update history, oldest first."""
+        return self._history_entries(self._history_order())
+    
+    def _history_entries(self, slots: np.ndarray) -> List[TruthValueUpdate]:
+        return [
+            TruthValueUpdate(
+                name=self._keys[var_id][0],
+                track=self._keys[var_id][1],
+                old_value=old,
+                new_value=new,
+                timestamp=ts,
+                source=_SOURCE_NAMES[src]
+            )
+            for var_id, old, new, ts, src in zip(
+                self._hist_ids[slots].tolist(),
+                self._hist_old[slots].tolist(),
+                self._hist_new[slots].tolist(),
+                self._hist_time[slots].tolist(),
+                self._hist_source[slots].tolist(),
+            )
+        ]
     
     def get_update_history(
         self,
@@ -274,36 +527,31 @@ class TruthValueSync:
         Returns:
             List of updates
         """
-        history = self.update_history
-        
-        if name:
-            history = [u for u in history if u.name == name]
+        slots = self._history_order()
         
-        if track:
-            history = [u for u in history if u.track == track]
+        if name or track:
+            wanted = np.zeros(len(self._keys), dtype=bool)
+            for var_id, (var_name, var_track) in enumerate(self._keys):
+                wanted[var_id] = (not name or var_name == name) and (not track or var_track == track)
+            slots = slots[wanted[self._hist_ids[slots]]]
         
-        return history[-limit:]
+        return self._history_entries(slots[-limit:])
     
     def _update_stats(self):
-        """Update synchronization statistics."""
+        """Update synchronization statistics (O(1) amortized)."""
         uptime = time.time() - self.start_time
         
         if uptime > 0:
             self.stats.update_rate_hz = self.stats.total_updates / uptime
         
-        # Calculate average latency (Python → HaackLang roundtrip)
-        if self.update_history:
-            recent = self.update_history[-100:]
-            latencies = []
-            
-            for i in range(1, len(recent)):
-                if recent[i].source != recent[i-1].source:
-                    # Cross-boundary update
-                    latency = (recent[i].timestamp - recent[i-1].timestamp) * 1000
-                    latencies.append(latency)
-            
-            if latencies:
-                self.stats.avg_latency_ms = sum(latencies) / len(latencies)
+        # Average latency of cross-boundary (Python ↔ HaackLang) transitions
+        # between consecutive updates among the last `latency_window` updates
+        oldest = self.stats.total_updates - (self.latency_window - 1)
+        while self._crossings and self._crossings[0][0] < oldest:
+            self._crossing_sum -= self._crossings.popleft()[1]
+        
+        if self._crossings:
+            self.stats.avg_latency_ms = self._crossing_sum / len(self._crossings)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get synchronization statistics."""
@@ -314,7 +562,8 @@ class TruthValueSync:
             'conflicts': self.stats.conflicts,
             'update_rate_hz': self.stats.update_rate_hz,
             'avg_latency_ms': self.stats.avg_latency_ms,
-            'tracked_truthvalues': len(self.current_values),
+            'tracked_truthvalues': len(self._ids_by_name),
+            'tracked_variables': len(self._keys),
             'conflict_strategy': self.conflict_strategy
         }
     
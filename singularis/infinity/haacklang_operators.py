@@ -9,12 +9,20 @@ Extends HaackLang from a guard language to a full cognitive DSL with:
 - Probabilistic operators (P, ~)
 
 These operators compile to SCCE primitives and execute on the track system.
+
+The fuzzy operators are plain arithmetic and work elementwise on NumPy
+arrays as well as floats. Paraconsistent operators have array kernels
+(`ParaconsistentArray`, `paraconsistent_and_array`, ...) so a whole vector of
+(belief, disbelief) pairs is combined in one call; the scalar operators
+dispatch to them when given arrays.
 """
 
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Sequence
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
 
 # ========== Fuzzy Logic Operators ==========
 
@@ -124,6 +132,81 @@ class ParaconsistentValue:
         return min(self.belief, self.disbelief)
 
 
+@dataclass
+class ParaconsistentArray:
+    """
+    Vector of paraconsistent truth values.
+    
+    Attributes:
+        belief: Degrees of belief in each P, shape (n,)
+        disbelief: Degrees of belief in each ¬P, shape (n,)
+    """
+    belief: np.ndarray
+    disbelief: np.ndarray
+    
+    def __post_init__(self):
+        self.belief = np.asarray(self.belief, dtype=np.float64)
+        self.disbelief = np.asarray(self.disbelief, dtype=np.float64)
+    
+    @classmethod
+    def from_values(cls, values: Sequence[ParaconsistentValue]) -> "ParaconsistentArray":
+        """Pack scalar values into an array"""
+        return cls(
+            belief=np.fromiter((v.belief for v in values), dtype=np.float64, count=len(values)),
+            disbelief=np.fromiter((v.disbelief for v in values), dtype=np.float64, count=len(values)),
+        )
+    
+    def to_values(self) -> List[ParaconsistentValue]:
+        """Unpack into scalar values"""
+        return [
+            ParaconsistentValue(belief=b, disbelief=d)
+            for b, d in zip(self.belief.tolist(), self.disbelief.tolist())
+        ]
+    
+    def __len__(self) -> int:
+        return len(self.belief)
+    
+    def __getitem__(self, index: int) -> ParaconsistentValue:
+        return ParaconsistentValue(belief=float(self.belief[index]), disbelief=float(self.disbelief[index]))
+    
+    def is_contradictory(self, threshold: float = 0.5) -> np.ndarray:
+        """Mask of contradictory values"""
+        return (self.belief > threshold) & (self.disbelief > threshold)
+    
+    def is_uncertain(self, threshold: float = 0.5) -> np.ndarray:
+        """Mask of uncertain values"""
+        return (self.belief < threshold) & (self.disbelief < threshold)
+    
+    def certainty(self) -> np.ndarray:
+        """Degree of certainty per value [0, 1]"""
+        return np.abs(self.belief - self.disbelief)
+    
+    def contradiction(self) -> np.ndarray:
+        """Degree of contradiction per value [0, 1]"""
+        return np.minimum(self.belief, self.disbelief)
+
+
+def paraconsistent_and_array(a: ParaconsistentArray, b: ParaconsistentArray) -> ParaconsistentArray:
+    """Elementwise paraconsistent conjunction (⊓) of two arrays"""
+    return ParaconsistentArray(
+        belief=np.minimum(a.belief, b.belief),
+        disbelief=np.minimum(a.disbelief, b.disbelief)
+    )
+
+
+def paraconsistent_or_array(a: ParaconsistentArray, b: ParaconsistentArray) -> ParaconsistentArray:
+    """Elementwise paraconsistent disjunction (⊔) of two arrays"""
+    return ParaconsistentArray(
+        belief=np.maximum(a.belief, b.belief),
+        disbelief=np.maximum(a.disbelief, b.disbelief)
+    )
+
+
+def paraconsistent_to_fuzzy_array(p: ParaconsistentArray) -> np.ndarray:
+    """Elementwise (belief - disbelief + 1) / 2"""
+    return (p.belief - p.disbelief + 1.0) / 2.0
+
+
 def paraconsistent_and(a: ParaconsistentValue, b: ParaconsistentValue) -> ParaconsistentValue:
     """
     Paraconsistent conjunction: ⊓
@@ -131,8 +214,8 @@ def paraconsistent_and(a: ParaconsistentValue, b: ParaconsistentValue) -> Paraco
     Combines evidence for and against.
     
     Args:
-        a: First paraconsistent value
-        b: Second paraconsistent value
+        a: First paraconsistent value (or ParaconsistentArray)
+        b: Second paraconsistent value (or ParaconsistentArray)
     
     Returns:
         Combined paraconsistent value
@@ -140,6 +223,8 @@ def paraconsistent_and(a: ParaconsistentValue, b: ParaconsistentValue) -> Paraco
     Example:
         evidence_for ⊓ evidence_against  # Can hold both
     """
+    if isinstance(a, ParaconsistentArray):
+        return paraconsistent_and_array(a, b)
     return ParaconsistentValue(
         belief=min(a.belief, b.belief),
         disbelief=min(a.disbelief, b.disbelief)
@@ -151,12 +236,14 @@ def paraconsistent_or(a: ParaconsistentValue, b: ParaconsistentValue) -> Paracon
     Paraconsistent disjunction: ⊔
     
     Args:
-        a: First paraconsistent value
-        b: Second paraconsistent value
+        a: First paraconsistent value (or ParaconsistentArray)
+        b: Second paraconsistent value (or ParaconsistentArray)
     
     Returns:
         Combined paraconsistent value
     """
+    if isinstance(a, ParaconsistentArray):
+        return paraconsistent_or_array(a, b)
     return ParaconsistentValue(
         belief=max(a.belief, b.belief),
         disbelief=max(a.disbelief, b.disbelief)
@@ -170,7 +257,7 @@ def paraconsistent_to_fuzzy(p: ParaconsistentValue) -> float:
     Uses: (belief - disbelief + 1) / 2
     
     Returns:
-        Fuzzy value [0, 1]
+        Fuzzy value [0, 1] (an array for ParaconsistentArray input)
     """
     return (p.belief - p.disbelief + 1.0) / 2.0
 
@@ -182,46 +269,112 @@ class TemporalWindow:
     Temporal window for storing recent values.
     
     Used by last(n) operator.
+    
+    Values live in a fixed-size ring buffer. Running sums of y, y² and x·y
+    (x = position in the window, oldest = 0) are updated on every add, so
+    mean(), variance() and the least-squares trend() are O(1). The sums are
+    recomputed exactly once per wrap of the buffer to cancel float drift.
     """
     
     def __init__(self, size: int):
         self.size = size
-        self.values: List[float] = []
-        self.timestamps: List[float] = []
+        self._values = np.zeros(size, dtype=np.float64)
+        self._timestamps = np.zeros(size, dtype=np.float64)
+        self._start = 0  # Slot of the oldest value
+        self._count = 0
+        
+        self._sum_y = 0.0
+        self._sum_yy = 0.0
+        self._sum_xy = 0.0
+    
+    def __len__(self) -> int:
+        return self._count
     
     def add(self, value: float, timestamp: float):
         """Add value to window"""
-        self.values.append(value)
-        self.timestamps.append(timestamp)
+        value = float(value)
+        n = self._count
+        
+        if n < self.size:
+            slot = (self._start + n) % self.size
+            self._sum_xy += n * value
+            self._count = n + 1
+        else:
+            # Evict the oldest; every remaining x shifts down by one
+            slot = self._start
+            oldest = self._values[slot]
+            self._sum_xy += (n - 1) * value - (self._sum_y - oldest)
+            self._sum_y -= oldest
+            self._sum_yy -= oldest * oldest
+            self._start = (self._start + 1) % self.size
         
-        # Keep only last N
-        if len(self.values) > self.size:
-            self.values.pop(0)
-            self.timestamps.pop(0)
+        self._values[slot] = value
+        self._timestamps[slot] = timestamp
+        self._sum_y += value
+        self._sum_yy += value * value
+        
+        if self._start == 0 and self._count == self.size:
+            self._resum()
+    
+    def _resum(self):
+        """Recompute running sums from the buffer"""
+        y = self._ordered(self._values)
+        self._sum_y = float(y.sum())
+        self._sum_yy = float(np.dot(y, y))
+        self._sum_xy = float(np.dot(np.arange(len(y), dtype=np.float64), y))
+    
+    def _ordered(self, buffer: np.ndarray) -> np.ndarray:
+        """Buffer contents, oldest first"""
+        end = self._start + self._count
+        if end <= self.size:
+            return buffer[self._start:end]
+        return np.concatenate((buffer[self._start:], buffer[:end - self.size]))
+    
+    @property
+    def values(self) -> List[float]:
+        """Values in window, oldest first"""
+        return self._ordered(self._values).tolist()
+    
+    @property
+    def timestamps(self) -> List[float]:
+        """Timestamps in window, oldest first"""
+        return self._ordered(self._timestamps).tolist()
     
     def get_values(self) -> List[float]:
         """Get all values in window"""
-        return list(self.values)
+        return self.values
+    
+    def as_array(self) -> np.ndarray:
+        """Values in window as an array, oldest first"""
+        return self._ordered(self._values).copy()
+    
+    def last(self, n: int) -> List[float]:
+        """Last n values, oldest first (list slicing semantics: last(0) is the whole window)"""
+        return self._ordered(self._values)[-n:].tolist()
     
     def mean(self) -> float:
         """Average value in window"""
-        return sum(self.values) / len(self.values) if self.values else 0.0
+        return self._sum_y / self._count if self._count else 0.0
+    
+    def variance(self) -> float:
+        """Population variance of values in window"""
+        if not self._count:
+            return 0.0
+        mean = self._sum_y / self._count
+        return max(0.0, self._sum_yy / self._count - mean * mean)
     
     def trend(self) -> float:
         """Trend: positive = increasing, negative = decreasing"""
-        if len(self.values) < 2:
+        n = self._count
+        if n < 2:
             return 0.0
         
-        # Simple linear regression slope
-        n = len(self.values)
-        x = list(range(n))
-        y = self.values
-        
-        x_mean = sum(x) / n
-        y_mean = sum(y) / n
+        # Least-squares slope over x = 0..n-1
+        sum_x = n * (n - 1) / 2.0
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6.0
         
-        numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
+        numerator = n * self._sum_xy - sum_x * self._sum_y
+        denominator = n * sum_xx - sum_x * sum_x
         
         if denominator == 0:
             return 0.0
@@ -265,8 +418,7 @@ def temporal_last(window: TemporalWindow, n: int) -> List[float]:
         last(3)  # Last 3 values
         mean(last(5))  # Average of last 5
     """
-    values = window.get_values()
-    return values[-n:] if len(values) >= n else values
+    return window.last(n)
 
 
 def temporal_future(current: float, derivative: float, steps: int = 1) -> float:
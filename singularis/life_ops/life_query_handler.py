@@ -52,11 +52,21 @@ class LifeQueryHandler:
     Uses AGI consciousness to analyze life events and provide insights.
     """
     
+    # Query category -> (event types, sources) filter evaluated in SQL
+    CATEGORY_FILTERS = {
+        'sleep': ([EventType.SLEEP], [EventSource.FITBIT]),
+        'exercise': ([EventType.EXERCISE, EventType.STEPS], [EventSource.FITBIT]),
+        'health': ([EventType.HEART_RATE, EventType.STEPS], [EventSource.FITBIT]),
+        'location': ([EventType.ROOM_ENTER, EventType.ROOM_EXIT], [EventSource.CAMERA]),
+        'social': ([EventType.MESSAGE], [EventSource.MESSENGER]),
+    }
+    
     def __init__(
         self,
         consciousness,
         timeline: LifeTimeline,
-        pattern_engine=None
+        pattern_engine=None,
+        max_events: int = 500
     ):
         """
         Initialize life query handler.
@@ -65,10 +75,13 @@ class LifeQueryHandler:
             consciousness: UnifiedConsciousnessLayer instance
             timeline: LifeTimeline database
             pattern_engine: Optional PatternEngine for pattern analysis
+            max_events: Most recent raw events loaded per query (counts and
+                averages come from rollups and cover the whole range)
         """
         self.consciousness = consciousness
         self.timeline = timeline
         self.pattern_engine = pattern_engine
+        self.max_events = max_events
         
         # Initialize Semantic Router
         self.router = SemanticRouter()
@@ -196,72 +209,48 @@ class LifeQueryHandler:
             end_time: End of time range
             
         Returns:
-            List of relevant LifeEvents
+            List of relevant LifeEvents (at most `max_events`, most recent)
         """
-        events = []
-        
-        # Get events by category
-        for category in categories:
-            if category == 'sleep':
-                # Get sleep events
-                sleep_events = self.timeline.query_by_time(
-                    user_id, start_time, end_time,
-                    source=EventSource.FITBIT
-                )
-                events.extend([e for e in sleep_events if e.type == EventType.SLEEP_PERIOD])
-            
-            elif category == 'exercise':
-                # Get activity events
-                activity_events = self.timeline.query_by_time(
-                    user_id, start_time, end_time,
-                    source=EventSource.FITBIT
-                )
-                events.extend([e for e in activity_events if e.type == EventType.ACTIVITY_DETECTED])
-            
-            elif category == 'health':
-                # Get health metric events
-                health_events = self.timeline.query_by_time(
-                    user_id, start_time, end_time,
-                    source=EventSource.FITBIT
-                )
-                events.extend([e for e in health_events if e.type == EventType.HEALTH_METRIC])
-            
-            elif category == 'location':
-                # Get location events
-                location_events = self.timeline.query_by_time(
-                    user_id, start_time, end_time,
-                    source=EventSource.CAMERA
-                )
-                events.extend([
-                    e for e in location_events 
-                    if e.type in [EventType.ROOM_ENTER, EventType.ROOM_EXIT]
-                ])
-            
-            elif category == 'social':
-                # Get social events
-                social_events = self.timeline.query_by_time(
-                    user_id, start_time, end_time,
-                    source=EventSource.MESSENGER
-                )
-                events.extend([e for e in social_events if e.type == EventType.MESSAGE_RECEIVED])
-            
-            else:
-                # Get all events for general queries
-                all_events = self.timeline.query_by_time(
-                    user_id, start_time, end_time
-                )
-                events.extend(all_events)
-        
-        # Remove duplicates
-        seen = set()
-        unique_events = []
-        for event in events:
-            event_id = id(event)
-            if event_id not in seen:
-                seen.add(event_id)
-                unique_events.append(event)
-        
-        return unique_events
+        # One query; categories are OR-ed filters evaluated in SQL
+        return self.timeline.query_events(
+            user_id, start_time, end_time,
+            any_of=self._category_filters(categories),
+            limit=self.max_events
+        )
+    
+    def _category_filters(self, categories: List[str]) -> Optional[List[tuple]]:
+        """(types, sources) alternatives for the categories; None = all events."""
+        if any(category not in self.CATEGORY_FILTERS for category in categories):
+            return None  # General queries look at everything
+        return [self.CATEGORY_FILTERS[category] for category in categories]
+    
+    def _get_aggregates(
+        self,
+        user_id: str,
+        categories: List[str],
+        start_time: datetime,
+        end_time: datetime
+    ) -> Dict[tuple, Dict[str, Any]]:
+        """Counts and feature statistics for the whole range (read from rollups)."""
+        return self.timeline.aggregate(
+            user_id, start_time, end_time,
+            any_of=self._category_filters(categories)
+        )
+    
+    def _summarize_aggregates(self, aggregates: Dict[tuple, Dict[str, Any]]) -> str:
+        """Feature statistics over the whole time range."""
+        lines = []
+        for (event_type, source), entry in sorted(aggregates.items()):
+            stats = [
+                f"{name} avg {values['avg']:.2f} (min {values['min']:.2f}, max {values['max']:.2f})"
+                for name, values in entry.items()
+                if name != 'count'
+            ]
+            line = f"  - {event_type} ({source}): {entry['count']} events"
+            if stats:
+                line += "; " + "; ".join(stats)
+            lines.append(line)
+        return "\n".join(lines) if lines else "No events in range."
     
     def _summarize_events(self, events: List[Any]) -> str:
         """
@@ -340,15 +329,16 @@ class LifeQueryHandler:
         now = datetime.now()
         recent_start = now - timedelta(hours=1)
         
-        health_events = self.timeline.query_by_time(
+        health_events = self.timeline.query_events(
             user_id, recent_start, now,
-            source=EventSource.FITBIT
+            event_types=self.CATEGORY_FILTERS['health'][0],
+            sources=[EventSource.FITBIT]
         )
         
         health_state = {}
         
         for event in health_events:
-            if event.type == EventType.HEALTH_METRIC:
+            if event.features:
                 if 'heart_rate' in event.features:
                     health_state['heart_rate'] = event.features['heart_rate']
                 if 'steps' in event.features:
@@ -383,9 +373,11 @@ class LifeQueryHandler:
         start_time, end_time = self._get_time_range(query)
         logger.debug(f"[LIFE-QUERY] Time range: {start_time} to {end_time}")
         
-        # Get relevant events
+        # Get relevant events (recent sample) and whole-range aggregates
         events = await self._get_relevant_events(user_id, categories, start_time, end_time)
-        logger.debug(f"[LIFE-QUERY] Found {len(events)} relevant events")
+        aggregates = self._get_aggregates(user_id, categories, start_time, end_time)
+        event_count = sum(entry['count'] for entry in aggregates.values())
+        logger.debug(f"[LIFE-QUERY] Found {event_count} relevant events")
         
         # Get patterns
         patterns = await self._get_patterns(user_id)
@@ -403,10 +395,13 @@ Time Range: {start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m
 Query Categories: {', '.join(categories)}
 
 Available Data:
-- {len(events)} life events from specified time range
+- {event_count} life events from specified time range
 - {len(patterns.get('patterns', []))} detected patterns
 - Current health state: {health_state if health_state else 'No recent data'}
 
+Totals for the time range:
+{self._summarize_aggregates(aggregates)}
+
 Events Summary:
 {event_summary}
 
@@ -428,7 +423,7 @@ or anomalies, mention them. Focus on being helpful and empathetic.
                     'user_id': user_id,
                     'query_type': 'life_query',
                     'categories': categories,
-                    'event_count': len(events),
+                    'event_count': event_count,
                     'pattern_count': len(patterns.get('patterns', [])),
                 }
             )
@@ -451,8 +446,8 @@ or anomalies, mention them. Focus on being helpful and empathetic.
             query=query,
             response=response,
             confidence=confidence,
-            data_sources=list(set([e.source.value for e in events])) if events else [],
-            event_count=len(events),
+            data_sources=sorted({source for _, source in aggregates}),
+            event_count=event_count,
             pattern_count=len(patterns.get('patterns', [])),
             timestamp=datetime.now(),
             metadata={
@@ -8,6 +8,12 @@ from .lmstudio_client import (
 from .claude_client import ClaudeClient
 from .gemini_client import GeminiClient
 from .hybrid_client import HybridLLMClient, HybridConfig, TaskType
+from .image_payload import (
+    ImageEncoding,
+    EncodedImage,
+    ImagePayloadCache,
+    get_image_payload_cache,
+)
 from .moe_orchestrator import (
     MoEOrchestrator,
     ExpertRole,
@@ -40,6 +46,10 @@ __all__ = [
     "HybridLLMClient",
     "HybridConfig",
     "TaskType",
+    "ImageEncoding",
+    "EncodedImage",
+    "ImagePayloadCache",
+    "get_image_payload_cache",
     "MoEOrchestrator",
     "ExpertRole",
     "ExpertConfig",
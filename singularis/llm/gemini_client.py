@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import base64
-import io
 import os
 from typing import Any, Dict, Optional
 
 import aiohttp
 from loguru import logger
 
+from .image_payload import ImageEncoding, get_image_payload_cache
+
 
 class GeminiClient:
     """
@@ -25,6 +25,7 @@ class GeminiClient:
         model: str = "gemini-2.0-flash-exp",
         base_url: str = "https://generativelanguage.googleapis.com/v1beta",
         timeout: int = 90,  # Increased from 60s for vision requests
+        image_encoding: Optional[ImageEncoding] = None,
     ) -> None:
         """
         Initializes the GeminiClient.
@@ -38,11 +39,15 @@ class GeminiClient:
             base_url (str, optional): The base URL for the Gemini API.
                                       Defaults to "https://generativelanguage.googleapis.com/v1beta".
             timeout (int, optional): The request timeout in seconds. Defaults to 90.
+            image_encoding (Optional[ImageEncoding], optional): Format and downscaling
+                                             for uploaded images. Defaults to
+                                             full-resolution PNG.
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.model = model
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.image_encoding = image_encoding or ImageEncoding()
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
@@ -101,8 +106,9 @@ class GeminiClient:
         """
         Analyzes an image with a prompt using the Gemini API.
 
-        This method handles the conversion of the image to base64 and includes
-        retry logic with exponential backoff for increased reliability.
+        The image is encoded through the shared payload cache, so several
+        experts analyzing the same frame reuse one encoding. Includes retry
+        logic with exponential backoff for increased reliability.
 
         Args:
             prompt (str): The prompt to send with the image.
@@ -126,16 +132,14 @@ class GeminiClient:
             logger.warning("analyze_image called with None image")
             return ""
 
-        # Convert image to base64
+        # Convert image to base64 (shared across experts for the same frame)
         try:
-            buffered = io.BytesIO()
-            image.save(buffered, format="PNG")
-            image_bytes = buffered.getvalue()
+            encoded = get_image_payload_cache().get(image, self.image_encoding)
             inline_data = {
-                "mime_type": "image/png",
-                "data": base64.b64encode(image_bytes).decode("utf-8"),
+                "mime_type": encoded.mime_type,
+                "data": encoded.b64,
             }
-            logger.debug(f"Image converted to base64: {len(image_bytes)} bytes")
+            logger.debug(f"Image converted to base64: {encoded.size_bytes} bytes")
         except Exception as e:
             logger.error(f"Failed to convert image to base64: {e}")
             raise
@@ -12,9 +12,9 @@ All operations are async for maximum performance.
 from __future__ import annotations
 
 import asyncio
-import os
 import time
-from typing import Any, Dict, Optional, List
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -24,6 +24,7 @@ from .gemini_client import GeminiClient
 from .claude_client import ClaudeClient
 from .openai_client import OpenAIClient
 from .lmstudio_client import LMStudioClient, LMStudioConfig, ExpertLLMInterface
+from .image_payload import ImageEncoding
 
 
 class TaskType(Enum):
@@ -54,6 +55,10 @@ class HybridConfig:
     local_reasoning_model: str = "mistralai/mistral-7b-instruct-v0.3"  # Mistral for reasoning
     local_action_model: str = "microsoft/phi-4"  # Phi-4 for fast action
     
+    # Image upload encoding per provider (None = full-resolution PNG)
+    gemini_image_encoding: Optional[ImageEncoding] = None
+    local_image_encoding: Optional[ImageEncoding] = None
+    
     # Performance settings
     timeout: int = 90  # Increased for Claude reasoning and Gemini vision
     max_retries: int = 2
@@ -62,6 +67,78 @@ class HybridConfig:
     # Rate limiting
     max_concurrent_requests: int = 4
     min_request_interval: float = 0.1
+    
+    # Hedged requests: fire a backup provider once the primary is slower than
+    # its usual latency percentile, and take whichever answers first. For
+    # vision, Gemini 2.5 Pro is never hedged or reordered; it is tried only
+    # after Gemini and the local model have both failed
+    enable_hedging: bool = False
+    hedge_percentile: float = 95.0  # Latency percentile that triggers a hedge
+    hedge_min_delay: float = 1.0  # Never hedge earlier than this (seconds)
+    hedge_default_delay: float = 10.0  # Used until enough latency samples exist
+    hedge_max_fraction: float = 0.2  # Cap on hedged requests as a fraction of all requests
+    
+    # Latency tracking / routing
+    latency_window: int = 100  # Samples kept per provider and task type
+    latency_min_samples: int = 5
+    # Reorder providers by health and rolling p50. Applies with or without
+    # hedging; without it, providers are tried one after another in that order
+    prefer_fastest_provider: bool = False
+    unhealthy_error_rate: float = 0.5  # Providers above this error rate are tried last
+
+
+class ProviderLatencyTracker:
+    """
+    Rolling latency and error statistics per (provider, task type).
+
+    Used by HybridLLMClient to decide when to hedge a slow request and,
+    optionally, which provider to try first.
+    """
+    
+    def __init__(self, window: int = 100):
+        self.window = window
+        self.latencies: Dict[Tuple[str, TaskType], Deque[float]] = {}
+        self.outcomes: Dict[Tuple[str, TaskType], Deque[bool]] = {}
+    
+    def record(self, provider: str, task_type: TaskType, latency: float, success: bool):
+        """Record one request outcome."""
+        key = (provider, task_type)
+        if key not in self.outcomes:
+            self.latencies[key] = deque(maxlen=self.window)
+            self.outcomes[key] = deque(maxlen=self.window)
+        self.outcomes[key].append(success)
+        if success:
+            self.latencies[key].append(latency)
+    
+    def sample_count(self, provider: str, task_type: TaskType) -> int:
+        return len(self.latencies.get((provider, task_type), ()))
+    
+    def percentile(self, provider: str, task_type: TaskType, q: float) -> Optional[float]:
+        """Latency percentile (0-100) of successful requests, or None without data."""
+        samples = self.latencies.get((provider, task_type))
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, int(round(q / 100.0 * (len(ordered) - 1)))))
+        return ordered[index]
+    
+    def error_rate(self, provider: str, task_type: TaskType) -> float:
+        outcomes = self.outcomes.get((provider, task_type))
+        if not outcomes:
+            return 0.0
+        return 1.0 - sum(outcomes) / len(outcomes)
+    
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per provider/task p50, p95, error rate and sample count."""
+        result = {}
+        for (provider, task_type), outcomes in self.outcomes.items():
+            result[f"{provider}/{task_type.value}"] = {
+                'p50': self.percentile(provider, task_type, 50),
+                'p95': self.percentile(provider, task_type, 95),
+                'error_rate': self.error_rate(provider, task_type),
+                'samples': len(outcomes),
+            }
+        return result
 
 
 class HybridLLMClient:
@@ -101,9 +178,15 @@ class HybridLLMClient:
             'local_calls': 0,
             'fallback_activations': 0,
             'errors': 0,
-            'total_time': 0.0
+            'total_time': 0.0,
+            'requests': 0,
+            'hedged_requests': 0,
+            'hedge_wins': 0,
         }
         
+        # Rolling per-provider latency (drives hedging and routing)
+        self.latency = ProviderLatencyTracker(window=self.config.latency_window)
+        
         # Rate limiting
         self.semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
         self.last_request_time = 0.0
@@ -122,7 +205,10 @@ class HybridLLMClient:
         # Initialize Gemini (primary vision)
         if self.config.use_gemini_vision:
             try:
-                self.gemini = GeminiClient(model=self.config.gemini_model)
+                self.gemini = GeminiClient(
+                    model=self.config.gemini_model,
+                    image_encoding=self.config.gemini_image_encoding
+                )
                 if self.gemini.is_available():
                     logger.info(f"✓ Gemini vision initialized: {self.config.gemini_model}")
                 else:
@@ -175,7 +261,8 @@ class HybridLLMClient:
                 base_url=self.config.local_base_url,
                 model_name=self.config.local_vision_model,
                 temperature=0.5,
-                max_tokens=1536
+                max_tokens=1536,
+                image_encoding=self.config.local_image_encoding or ImageEncoding()
             )
             vision_client = LMStudioClient(vision_config)
             self.local_vision = ExpertLLMInterface(vision_client)
@@ -255,6 +342,38 @@ class HybridLLMClient:
         """
         start_time = time.time()
         
+        if self.config.enable_hedging or self.config.prefer_fastest_provider:
+            candidates = []
+            if self.gemini:
+                candidates.append(("gemini", lambda: self.gemini.analyze_image(
+                    prompt=prompt,
+                    image=image,
+                    temperature=temperature,
+                    max_output_tokens=max_tokens,
+                    max_retries=3
+                )))
+            if self.local_vision and self.config.use_local_fallback:
+                candidates.append(("local", lambda: self._local_vision_generate(
+                    prompt, image, temperature, max_tokens
+                )))
+            async with self.semaphore:
+                await self._rate_limit()
+                try:
+                    return await self._hedged_call(
+                        TaskType.VISION, candidates, max(30, self.config.timeout), start_time,
+                        hedge=self.config.enable_hedging
+                    )
+                except Exception:
+                    # Pro is slow and costly: a last resort, not a hedge target
+                    if not (self.gemini and self.config.fallback_on_error):
+                        raise
+                    result = await self._gemini_pro_vision(
+                        prompt, image, temperature, max_tokens, start_time
+                    )
+                    if result:
+                        return result
+                    raise
+        
         async with self.semaphore:
             # Rate limiting
             await self._rate_limit()
@@ -277,6 +396,7 @@ class HybridLLMClient:
                     
                     self.stats['gemini_calls'] += 1
                     self.stats['total_time'] += time.time() - start_time
+                    self.latency.record("gemini", TaskType.VISION, time.time() - start_time, bool(result))
                     
                     # Log result with more detail
                     if result and len(result) > 0:
@@ -289,53 +409,26 @@ class HybridLLMClient:
                 except asyncio.TimeoutError:
                     logger.warning(f"Gemini vision timed out after {gemini_timeout}s")
                     self.stats['errors'] += 1
+                    self.latency.record("gemini", TaskType.VISION, time.time() - start_time, False)
                     if not self.config.fallback_on_error:
                         raise
                     
                 except Exception as e:
                     logger.warning(f"Gemini vision failed: {type(e).__name__}: {e}")
                     self.stats['errors'] += 1
+                    self.latency.record("gemini", TaskType.VISION, time.time() - start_time, False)
                     
                     if not self.config.fallback_on_error:
                         raise
             
             # Try Gemini 2.5 Pro as fallback (superior quality, separate rate limit pool)
             if self.gemini and self.config.fallback_on_error:
-                try:
-                    logger.info("Trying Gemini 2.5 Pro vision fallback")
-                    
-                    # Create temporary Gemini 2.5 Pro client
-                    import os as os_module
-                    gemini_pro = GeminiClient(
-                        api_key=os_module.getenv("GEMINI_API_KEY"),
-                        model="gemini-2.5-pro",  # Gemini 2.5 Pro (best quality)
-                        timeout=90  # Pro is slower, needs more time
-                    )
-                    
-                    result = await asyncio.wait_for(
-                        gemini_pro.analyze_image(
-                            prompt=prompt,
-                            image=image,
-                            temperature=temperature,
-                            max_output_tokens=max_tokens,
-                            max_retries=2
-                        ),
-                        timeout=90
-                    )
-                    
-                    await gemini_pro.close()
-                    
-                    if result and len(result) > 0:
-                        logger.info(f"Gemini 2.5 Pro vision success: {len(result)} chars")
-                        self.stats['gemini_calls'] += 1
-                        self.stats['total_time'] += time.time() - start_time
-                        return result
-                    else:
-                        logger.warning("Gemini 2.5 Pro returned empty response")
-                        
-                except Exception as e:
-                    logger.warning(f"Gemini 2.5 Pro vision fallback failed: {type(e).__name__}: {e}")
-                    # Continue to local fallback
+                result = await self._gemini_pro_vision(
+                    prompt, image, temperature, max_tokens, start_time
+                )
+                if result:
+                    return result
+                # Continue to local fallback
             
             # Fallback to local vision model
             if self.local_vision and self.config.use_local_fallback:
@@ -343,28 +436,11 @@ class HybridLLMClient:
                     logger.info("Using local vision fallback")
                     self.stats['fallback_activations'] += 1
                     
-                    # Save image temporarily for local model
-                    import tempfile
-                    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                        image.save(tmp.name, format='PNG')
-                        tmp_path = tmp.name
+                    result = await self._local_vision_generate(prompt, image, temperature, max_tokens)
+                    self.stats['local_calls'] += 1
+                    self.stats['total_time'] += time.time() - start_time
                     
-                    try:
-                        response = await self.local_vision.generate(
-                            prompt=prompt,
-                            temperature=temperature,
-                            max_tokens=max_tokens,
-                            image_path=tmp_path
-                        )
-                        
-                        result = response.get('content', '')
-                        self.stats['local_calls'] += 1
-                        self.stats['total_time'] += time.time() - start_time
-                        
-                        return result
-                    finally:
-                        import os
-                        os.unlink(tmp_path)
+                    return result
                         
                 except Exception as e:
                     logger.error(f"Local vision fallback failed: {e}")
@@ -374,6 +450,73 @@ class HybridLLMClient:
             # No vision model available
             raise RuntimeError("No vision model available (Gemini and local fallback both failed)")
     
+    async def _gemini_pro_vision(
+        self,
+        prompt: str,
+        image,
+        temperature: float,
+        max_tokens: int,
+        start_time: float
+    ) -> Optional[str]:
+        """
+        Gemini 2.5 Pro vision fallback on a temporary client.
+
+        Returns:
+            The analysis, or None if Pro failed or returned nothing
+        """
+        try:
+            logger.info("Trying Gemini 2.5 Pro vision fallback")
+            
+            # Create temporary Gemini 2.5 Pro client
+            import os as os_module
+            gemini_pro = GeminiClient(
+                api_key=os_module.getenv("GEMINI_API_KEY"),
+                model="gemini-2.5-pro",  # Gemini 2.5 Pro (best quality)
+                timeout=90,  # Pro is slower, needs more time
+                image_encoding=self.config.gemini_image_encoding
+            )
+            
+            try:
+                result = await asyncio.wait_for(
+                    gemini_pro.analyze_image(
+                        prompt=prompt,
+                        image=image,
+                        temperature=temperature,
+                        max_output_tokens=max_tokens,
+                        max_retries=2
+                    ),
+                    timeout=90
+                )
+            finally:
+                await gemini_pro.close()
+            
+            if result:
+                logger.info(f"Gemini 2.5 Pro vision success: {len(result)} chars")
+                self.stats['gemini_calls'] += 1
+                self.stats['total_time'] += time.time() - start_time
+                return result
+            logger.warning("Gemini 2.5 Pro returned empty response")
+            
+        except Exception as e:
+            logger.warning(f"Gemini 2.5 Pro vision fallback failed: {type(e).__name__}: {e}")
+        return None
+    
+    async def _local_vision_generate(
+        self,
+        prompt: str,
+        image,
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Run the local vision model on an in-memory image (shared payload cache)."""
+        response = await self.local_vision.generate(
+            prompt=prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            image=image
+        )
+        return response.get('content', '')
+    
     async def generate_reasoning(
         self,
         prompt: str,
@@ -401,6 +544,26 @@ class HybridLLMClient:
         """
         start_time = time.time()
         
+        if self.config.enable_hedging or self.config.prefer_fastest_provider:
+            candidates = []
+            if self.claude:
+                candidates.append(("claude", lambda: self.claude.generate_text(
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )))
+            if self.local_reasoning and self.config.use_local_fallback:
+                candidates.append(("local", lambda: self._local_generate(
+                    self.local_reasoning, prompt, system_prompt, temperature, max_tokens
+                )))
+            async with self.semaphore:
+                await self._rate_limit()
+                return await self._hedged_call(
+                    TaskType.REASONING, candidates, self.config.timeout, start_time,
+                    hedge=self.config.enable_hedging
+                )
+        
         async with self.semaphore:
             # Rate limiting
             await self._rate_limit()
@@ -420,6 +583,7 @@ class HybridLLMClient:
                     
                     self.stats['claude_calls'] += 1
                     self.stats['total_time'] += time.time() - start_time
+                    self.latency.record("claude", TaskType.REASONING, time.time() - start_time, True)
                     
                     logger.debug(f"Claude reasoning: {len(result)} chars")
                     return result
@@ -427,6 +591,7 @@ class HybridLLMClient:
                 except asyncio.TimeoutError:
                     logger.warning(f"Claude reasoning timed out after {self.config.timeout}s")
                     self.stats['errors'] += 1
+                    self.latency.record("claude", TaskType.REASONING, time.time() - start_time, False)
                     
                     if not self.config.fallback_on_error:
                         raise
@@ -435,6 +600,7 @@ class HybridLLMClient:
                     error_msg = str(e) if str(e) else type(e).__name__
                     logger.warning(f"Claude reasoning failed: {error_msg}")
                     self.stats['errors'] += 1
+                    self.latency.record("claude", TaskType.REASONING, time.time() - start_time, False)
                     
                     # Check if it's a rate limit error
                     if 'rate_limit' in error_msg.lower() or '429' in error_msg:
@@ -496,6 +662,26 @@ class HybridLLMClient:
         """
         start_time = time.time()
         
+        if self.config.enable_hedging or self.config.prefer_fastest_provider:
+            candidates = []
+            if self.claude:
+                candidates.append(("claude", lambda: self.claude.generate_text(
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )))
+            if self.local_action and self.config.use_local_fallback:
+                candidates.append(("local", lambda: self._local_generate(
+                    self.local_action, prompt, system_prompt, temperature, max_tokens
+                )))
+            async with self.semaphore:
+                await self._rate_limit()
+                return await self._hedged_call(
+                    TaskType.ACTION, candidates, 10.0, start_time,
+                    hedge=self.config.enable_hedging
+                )
+        
         async with self.semaphore:
             # Rate limiting
             await self._rate_limit()
@@ -515,12 +701,14 @@ class HybridLLMClient:
                     
                     self.stats['claude_calls'] += 1
                     self.stats['total_time'] += time.time() - start_time
+                    self.latency.record("claude", TaskType.ACTION, time.time() - start_time, True)
                     
                     return result
                     
                 except Exception as e:
                     logger.warning(f"Claude action failed: {e}")
                     self.stats['errors'] += 1
+                    self.latency.record("claude", TaskType.ACTION, time.time() - start_time, False)
                     
                     if not self.config.fallback_on_error:
                         raise
@@ -582,6 +770,23 @@ class HybridLLMClient:
         """
         start_time = time.time()
         
+        if self.config.enable_hedging or self.config.prefer_fastest_provider:
+            candidates = []
+            for name, client in (("openai", self.openai), ("claude", self.claude)):
+                if client:
+                    candidates.append((name, lambda client=client: client.generate_text(
+                        prompt=prompt,
+                        system_prompt=system_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    )))
+            async with self.semaphore:
+                await self._rate_limit()
+                return await self._hedged_call(
+                    TaskType.WORLD_MODEL, candidates, self.config.timeout, start_time,
+                    hedge=self.config.enable_hedging
+                )
+        
         async with self.semaphore:
             # Rate limiting
             await self._rate_limit()
@@ -601,6 +806,7 @@ class HybridLLMClient:
                     
                     self.stats['openai_calls'] += 1
                     self.stats['total_time'] += time.time() - start_time
+                    self.latency.record("openai", TaskType.WORLD_MODEL, time.time() - start_time, True)
                     
                     logger.debug(f"GPT-5-thinking world model: {len(result)} chars")
                     return result
@@ -608,6 +814,7 @@ class HybridLLMClient:
                 except Exception as e:
                     logger.warning(f"GPT-5-thinking world model failed: {e}")
                     self.stats['errors'] += 1
+                    self.latency.record("openai", TaskType.WORLD_MODEL, time.time() - start_time, False)
                     
                     if not self.config.fallback_on_error:
                         raise
@@ -641,6 +848,159 @@ class HybridLLMClient:
             # No world modeling available
             raise RuntimeError("No world modeling available (GPT-5-thinking and Claude both unavailable)")
     
+    async def _local_generate(
+        self,
+        client: ExpertLLMInterface,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Run a local LM Studio expert and return its text content."""
+        response = await client.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        return response.get('content', '')
+    
+    def _order_providers(
+        self,
+        task_type: TaskType,
+        candidates: List[Tuple[str, Callable[[], Awaitable[str]]]]
+    ) -> List[Tuple[str, Callable[[], Awaitable[str]]]]:
+        """Order candidates by health and (optionally) rolling p50 latency."""
+        if not self.config.prefer_fastest_provider:
+            return candidates
+        
+        def sort_key(item):
+            index, (name, _) = item
+            unhealthy = self.latency.error_rate(name, task_type) > self.config.unhealthy_error_rate
+            p50 = None
+            if self.latency.sample_count(name, task_type) >= self.config.latency_min_samples:
+                p50 = self.latency.percentile(name, task_type, 50)
+            # Providers without enough data keep their configured position
+            return (unhealthy, p50 if p50 is not None else float('inf'), index)
+        
+        return [c for _, c in sorted(enumerate(candidates), key=sort_key)]
+    
+    def _hedge_delay(self, provider: str, task_type: TaskType) -> float:
+        """How long to wait on `provider` before firing a backup request."""
+        delay = self.config.hedge_default_delay
+        if self.latency.sample_count(provider, task_type) >= self.config.latency_min_samples:
+            delay = self.latency.percentile(provider, task_type, self.config.hedge_percentile)
+        return max(self.config.hedge_min_delay, delay)
+    
+    def _hedge_budget_available(self) -> bool:
+        """Whether another hedged request stays within the extra-spend cap."""
+        return self.stats['hedged_requests'] < self.config.hedge_max_fraction * max(1, self.stats['requests'])
+    
+    async def _hedged_call(
+        self,
+        task_type: TaskType,
+        candidates: List[Tuple[str, Callable[[], Awaitable[str]]]],
+        timeout: float,
+        start_time: float,
+        hedge: bool = True
+    ) -> str:
+        """
+        Call providers in order, hedging slow ones with the next candidate.
+
+        The first provider is started immediately. If it fails, the next one is
+        started right away (plain fallback). If it is merely slow - still
+        running after its latency percentile - a backup request is fired to
+        the next provider, subject to the hedge budget, and whichever returns
+        a non-empty answer first wins. Losing requests are cancelled.
+
+        With `hedge=False` this is an ordered fallback chain sharing one
+        `timeout` (used for prefer_fastest_provider without hedging).
+        """
+        if not candidates:
+            raise RuntimeError(f"No {task_type.value} model available")
+        
+        self.stats['requests'] += 1
+        queue = list(self._order_providers(task_type, candidates))
+        running: Dict[asyncio.Task, Tuple[str, float]] = {}
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        hedged = False
+        hedge_allowed = hedge
+        last_error: Optional[BaseException] = None
+        
+        def launch():
+            name, factory = queue.pop(0)
+            task = asyncio.ensure_future(factory())
+            running[task] = (name, time.time())
+            return name
+        
+        primary = launch()
+        
+        try:
+            while running:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                
+                wait_for = remaining
+                can_hedge = hedge_allowed and bool(queue) and len(running) == 1
+                if can_hedge:
+                    name, started = next(iter(running.values()))
+                    hedge_at = started + self._hedge_delay(name, task_type)
+                    wait_for = min(remaining, max(0.0, hedge_at - time.time()))
+                
+                done, _ = await asyncio.wait(
+                    running.keys(), timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                for task in done:
+                    name, started = running.pop(task)
+                    elapsed = time.time() - started
+                    if task.exception() is None and task.result():
+                        self.latency.record(name, task_type, elapsed, True)
+                        self.stats[f'{name}_calls'] += 1
+                        self.stats['total_time'] += time.time() - start_time
+                        if name != primary:
+                            self.stats['fallback_activations'] += 1
+                            if hedged:
+                                self.stats['hedge_wins'] += 1
+                        return task.result()
+                    
+                    last_error = task.exception()
+                    self.latency.record(name, task_type, elapsed, False)
+                    self.stats['errors'] += 1
+                    error_msg = (str(last_error) or type(last_error).__name__) if last_error else 'empty response'
+                    logger.warning(f"{name} {task_type.value} failed: {error_msg}")
+                    
+                    # Check if it's a rate limit error
+                    if last_error is not None and ('rate_limit' in error_msg.lower() or '429' in error_msg):
+                        logger.error(f"⚠️ {name.capitalize()} rate limit exceeded - consider increasing delays")
+                    if last_error is not None and not self.config.fallback_on_error:
+                        raise last_error
+                
+                if not running and queue:
+                    # Primary failed outright - plain fallback, no hedge budget needed
+                    launch()
+                elif not done and can_hedge:
+                    if self._hedge_budget_available():
+                        hedged = True
+                        self.stats['hedged_requests'] += 1
+                        backup = launch()
+                        logger.debug(f"Hedging slow {task_type.value} request with {backup}")
+                    else:
+                        # Over the extra-spend cap: keep waiting on the primary
+                        hedge_allowed = False
+        finally:
+            # Losing hedges are cancelled without counting as provider errors
+            for task in running:
+                task.cancel()
+        
+        for name, started in running.values():
+            self.latency.record(name, task_type, time.time() - started, False)
+        if running:
+            raise asyncio.TimeoutError(f"No {task_type.value} model answered within {timeout}s")
+        raise RuntimeError(f"No {task_type.value} model available (all providers failed)")
+    
     async def _rate_limit(self):
         """Apply rate limiting between requests."""
         now = time.time()
@@ -684,5 +1044,6 @@ class HybridLLMClient:
                 (self.stats['gemini_calls'] + self.stats['claude_calls'] + self.stats['openai_calls']) / 
                 max(1, total_calls)
             ),
-            'fallback_rate': self.stats['fallback_activations'] / max(1, total_calls)
+            'fallback_rate': self.stats['fallback_activations'] / max(1, total_calls),
+            'provider_latency': self.latency.summary()
         }
@@ -8,6 +8,8 @@ from typing import Any, Dict, Optional, List
 import aiohttp
 from loguru import logger
 
+from .image_payload import ImageEncoding, get_image_payload_cache
+
 
 class HyperbolicClient:
     """
@@ -22,6 +24,7 @@ class HyperbolicClient:
         vlm_model: str = "Qwen/Qwen2.5-VL-72B-Instruct",  # Vision-language model
         base_url: str = "https://api.hyperbolic.xyz/v1",
         timeout: int = 300,  # Increased to 300s (5 minutes) for 235B parameter models
+        image_encoding: Optional[ImageEncoding] = None,
     ) -> None:
         """
         Initializes the HyperbolicClient.
@@ -38,12 +41,16 @@ class HyperbolicClient:
             base_url (str, optional): The base URL for the Hyperbolic API.
                                       Defaults to "https://api.hyperbolic.xyz/v1".
             timeout (int, optional): The request timeout in seconds. Defaults to 300.
+            image_encoding (Optional[ImageEncoding], optional): Format and downscaling
+                                             for uploaded images. Defaults to
+                                             full-resolution PNG.
         """
         self.api_key = api_key or os.getenv("HYPERBOLIC_API_KEY")
         self.model = model
         self.vlm_model = vlm_model
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.image_encoding = image_encoding or ImageEncoding()
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
@@ -196,16 +203,10 @@ class HyperbolicClient:
             logger.warning("analyze_image called with None image")
             return ""
 
-        import base64
-        import io
-
-        # Convert image to base64
+        # Convert image to base64 (shared across experts for the same frame)
         try:
-            buffered = io.BytesIO()
-            image.save(buffered, format="PNG")
-            image_bytes = buffered.getvalue()
-            image_b64 = base64.b64encode(image_bytes).decode("utf-8")
-            logger.debug(f"Hyperbolic image converted to base64: {len(image_bytes)} bytes")
+            encoded = get_image_payload_cache().get(image, self.image_encoding)
+            logger.debug(f"Hyperbolic image converted to base64: {encoded.size_bytes} bytes")
         except Exception as e:
             logger.error(f"Failed to convert image to base64: {e}")
             raise
@@ -226,7 +227,7 @@ class HyperbolicClient:
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/png;base64,{image_b64}"
+                            "url": encoded.data_url
                         }
                     }
                 ]
@@ -0,0 +1,243 @@
+"""
+Shared image payload encoding for vision requests.
+
+A single screenshot is often sent to several vision experts in the same
+cycle (Gemini, Hyperbolic Nemotron, local LM Studio). Instead of every
+client re-compressing the frame, encodings are cached per
+(frame, target size, format, quality) and the same bytes are handed to
+every expert.
+
+Cache entries are keyed on the identity of the image object and held
+through weak references, so they disappear automatically once the frame
+is dropped. (PIL images compare by content and are unhashable, so a
+plain WeakKeyDictionary cannot be used.)
+
+Frames should not be mutated after they are first encoded. As a cheap
+guard, each entry also stores the frame's size, mode and a small grid of
+sampled pixels; if any of those changed, the cached payloads are dropped
+and the frame is re-encoded. Edits that miss every sampled pixel are not
+detected.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from loguru import logger
+
+
+# Pixels sampled per axis for the content signature
+_SIGNATURE_GRID = 4
+
+_MIME_TYPES = {
+    "PNG": "image/png",
+    "JPEG": "image/jpeg",
+    "WEBP": "image/webp",
+}
+
+
+@dataclass(frozen=True)
+class ImageEncoding:
+    """Encoding options for one provider."""
+    format: str = "PNG"  # PNG, JPEG or WEBP
+    max_size: Optional[int] = None  # Longest side in pixels (None = full resolution)
+    quality: int = 85  # JPEG/WebP quality
+
+    def key(self) -> Tuple[str, Optional[int], int]:
+        fmt = self.format.upper()
+        # Quality does not affect PNG output
+        return (fmt, self.max_size, self.quality if fmt != "PNG" else 0)
+
+
+@dataclass
+class EncodedImage:
+    """Encoded image bytes shared between vision requests."""
+    data: bytes
+    mime_type: str
+    width: int
+    height: int
+    _b64: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def b64(self) -> str:
+        """Base64 text of the encoded bytes (computed once)."""
+        if self._b64 is None:
+            self._b64 = base64.b64encode(self.data).decode("utf-8")
+        return self._b64
+
+    @property
+    def data_url(self) -> str:
+        """``data:`` URL for OpenAI-compatible image_url payloads."""
+        return f"data:{self.mime_type};base64,{self.b64}"
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.data)
+
+
+def encode_image(image, encoding: Optional[ImageEncoding] = None) -> EncodedImage:
+    """
+    Encode a PIL image with optional downscaling, without caching.
+
+    Args:
+        image: A PIL Image.
+        encoding: Target format, size and quality. Defaults to full-size PNG.
+
+    Returns:
+        EncodedImage: The encoded bytes and metadata.
+    """
+    encoding = encoding or ImageEncoding()
+    fmt = encoding.format.upper()
+    if fmt not in _MIME_TYPES:
+        raise ValueError(f"Unsupported image format: {encoding.format}")
+
+    frame = image
+    if encoding.max_size and max(frame.size) > encoding.max_size:
+        frame = frame.copy()
+        frame.thumbnail((encoding.max_size, encoding.max_size))
+
+    if fmt == "JPEG" and frame.mode not in ("RGB", "L"):
+        frame = frame.convert("RGB")
+
+    buffered = io.BytesIO()
+    if fmt == "PNG":
+        frame.save(buffered, format=fmt)
+    else:
+        frame.save(buffered, format=fmt, quality=encoding.quality)
+
+    return EncodedImage(
+        data=buffered.getvalue(),
+        mime_type=_MIME_TYPES[fmt],
+        width=frame.size[0],
+        height=frame.size[1],
+    )
+
+
+def image_signature(image) -> Hashable:
+    """Cheap content check: size, mode and a grid of sampled pixels."""
+    width, height = image.size
+    if not (width and height):
+        return (image.size, image.mode, ())
+    step = _SIGNATURE_GRID - 1
+    xs = [i * (width - 1) // step for i in range(_SIGNATURE_GRID)]
+    ys = [i * (height - 1) // step for i in range(_SIGNATURE_GRID)]
+    samples = tuple(image.getpixel((x, y)) for y in ys for x in xs)
+    return (image.size, image.mode, samples)
+
+
+class ImagePayloadCache:
+    """
+    Per-frame cache of encoded image payloads.
+
+    The first expert that asks for a (frame, size, format) pays for the
+    compression; every other expert gets the same `EncodedImage`.
+    Frames must not be mutated after encoding (see module docstring).
+    """
+
+    def __init__(self):
+        # id(frame) -> (weak ref to frame, content signature, {encoding key: payload})
+        self._entries: Dict[int, Tuple[weakref.ref, Hashable, Dict[Tuple, EncodedImage]]] = {}
+        self._lock = threading.RLock()  # Re-entrant: weakref callbacks may fire under the lock
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'invalidations': 0,
+            'bytes_encoded': 0,
+        }
+
+    def get(self, image, encoding: Optional[ImageEncoding] = None) -> EncodedImage:
+        """
+        Return the encoded payload for `image`, encoding it on first use.
+
+        Args:
+            image: A PIL Image (the frame identity used for caching).
+            encoding: Target format, size and quality. Defaults to full-size PNG.
+
+        Returns:
+            EncodedImage: The shared encoded payload.
+        """
+        encoding = encoding or ImageEncoding()
+        key = encoding.key()
+        signature = image_signature(image)
+
+        with self._lock:
+            per_frame = self._lookup(image, signature)
+            if per_frame is not None and key in per_frame:
+                self.stats['hits'] += 1
+                return per_frame[key]
+
+        encoded = encode_image(image, encoding)
+
+        with self._lock:
+            self.stats['misses'] += 1
+            self.stats['bytes_encoded'] += encoded.size_bytes
+            per_frame = self._lookup(image, signature)
+            if per_frame is None:
+                per_frame = self._track(image, signature)
+            if per_frame is not None:
+                # Another thread may have raced us; keep the first result
+                encoded = per_frame.setdefault(key, encoded)
+
+        logger.debug(
+            f"Encoded frame {encoded.width}x{encoded.height} as {key[0]}: {encoded.size_bytes} bytes"
+        )
+        return encoded
+
+    def _lookup(self, image, signature: Hashable) -> Optional[Dict[Tuple, EncodedImage]]:
+        """Cached payloads for this exact frame object and content, if any."""
+        entry = self._entries.get(id(image))
+        if entry is None or entry[0]() is not image:
+            return None
+        if entry[1] != signature:
+            # Frame was modified in place since it was encoded
+            self.stats['invalidations'] += 1
+            del self._entries[id(image)]
+            return None
+        return entry[2]
+
+    def _track(self, image, signature: Hashable) -> Optional[Dict[Tuple, EncodedImage]]:
+        """Start caching payloads for a frame; None if it cannot be weakly referenced."""
+        frame_id = id(image)
+
+        def _release(ref, frame_id=frame_id):
+            with self._lock:
+                entry = self._entries.get(frame_id)
+                if entry is not None and entry[0] is ref:
+                    del self._entries[frame_id]
+
+        try:
+            ref = weakref.ref(image, _release)
+        except TypeError:
+            return None
+        per_frame: Dict[Tuple, EncodedImage] = {}
+        self._entries[frame_id] = (ref, signature, per_frame)
+        return per_frame
+
+    def clear(self):
+        """Drop all cached payloads."""
+        with self._lock:
+            self._entries = {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'frames_cached': len(self._entries),
+            'hit_rate': self.stats['hits'] / max(1, total),
+        }
+
+
+_shared_cache: Optional[ImagePayloadCache] = None
+
+
+def get_image_payload_cache() -> ImagePayloadCache:
+    """Return the process-wide payload cache shared by all vision clients."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ImagePayloadCache()
+    return _shared_cache
@@ -9,7 +9,9 @@ import aiohttp
 import asyncio
 from typing import Optional, Dict, List, Any
 from loguru import logger
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from .image_payload import ImageEncoding, get_image_payload_cache
 
 
 @dataclass
@@ -21,6 +23,7 @@ class LMStudioConfig:
     max_tokens: int = 4096  # Increased for Phi-4 models
     timeout: int = 600  # 10 minutes for vision models (Qwen3-VL 30B needs time to load)
     request_timeout: int = 100  # Per-request timeout for text-only (slightly lower than session timeout)
+    image_encoding: ImageEncoding = field(default_factory=ImageEncoding)  # For in-memory images
     
 
 class LMStudioClient:
@@ -117,6 +120,7 @@ class LMStudioClient:
         max_tokens: Optional[int] = None,
         stop: Optional[List[str]] = None,
         image_path: Optional[str] = None,
+        image=None,
     ) -> Dict[str, Any]:
         """
         Generates a completion from the LM Studio model.
@@ -136,6 +140,9 @@ class LMStudioClient:
                                                  Defaults to None.
             image_path (Optional[str], optional): The path to an image for vision
                                                   models. Defaults to None.
+            image (optional): An in-memory PIL image for vision models, encoded
+                              through the shared payload cache (no temp file).
+                              Takes precedence over `image_path`. Defaults to None.
 
         Returns:
             Dict[str, Any]: A dictionary containing the generated content and other
@@ -156,19 +163,24 @@ class LMStudioClient:
             combined_prompt = prompt
         
         # For vision models, add image as base64
-        if image_path:
-            import base64
-            with open(image_path, 'rb') as img_file:
-                img_data = base64.b64encode(img_file.read()).decode('utf-8')
+        has_image = image is not None or image_path is not None
+        if has_image:
+            if image is not None:
+                image_url = get_image_payload_cache().get(image, self.config.image_encoding).data_url
+            else:
+                import base64
+                with open(image_path, 'rb') as img_file:
+                    img_data = base64.b64encode(img_file.read()).decode('utf-8')
+                image_url = f"data:image/png;base64,{img_data}"
             
-            logger.debug(f"Vision request: model={self.config.model_name}, image_size={len(img_data)} bytes (base64)")
+            logger.debug(f"Vision request: model={self.config.model_name}, image_size={len(image_url)} bytes (base64)")
             
             # Vision model format (OpenAI-compatible)
             messages.append({
                 "role": "user",
                 "content": [
                     {"type": "text", "text": combined_prompt},
-                    {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{img_data}"}}
+                    {"type": "image_url", "image_url": {"url": image_url}}
                 ]
             })
         else:
@@ -188,7 +200,7 @@ class LMStudioClient:
         try:
             # Adaptive timeout based on request type
             # Vision requests (Qwen3-VL) need much more time: 300s vs 100s for text-only
-            adaptive_timeout = self.config.timeout if image_path else self.config.request_timeout
+            adaptive_timeout = self.config.timeout if has_image else self.config.request_timeout
             
             # Staggered delay to prevent overwhelming LM Studio with simultaneous requests
             # Each request waits 0.5s to create 0.5s intervals between activations
@@ -202,7 +214,7 @@ class LMStudioClient:
                     "prompt_length": len(prompt),
                     "temperature": payload["temperature"],
                     "timeout": adaptive_timeout,
-                    "has_image": image_path is not None
+                    "has_image": has_image
                 }
             )
             
@@ -265,7 +277,7 @@ class LMStudioClient:
                     "status": e.status if hasattr(e, 'status') else None,
                     "url": f"{self.config.base_url}/chat/completions",
                     "model": self.config.model_name,
-                    "has_image": image_path is not None,
+                    "has_image": has_image,
                     "message": "Check if LM Studio is running and model is loaded"
                 }
             )
@@ -399,6 +411,7 @@ class ExpertLLMInterface:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         image_path: Optional[str] = None,
+        image=None,
     ) -> Dict[str, Any]:
         """
         A convenience wrapper for the `LMStudioClient.generate` method.
@@ -413,6 +426,8 @@ class ExpertLLMInterface:
                                                   Defaults to None.
             image_path (Optional[str], optional): The path to an image for vision
                                                   models. Defaults to None.
+            image (optional): An in-memory PIL image for vision models.
+                              Defaults to None.
 
         Returns:
             Dict[str, Any]: The response from the language model.
@@ -422,7 +437,8 @@ class ExpertLLMInterface:
             system_prompt=system_prompt,
             temperature=temperature,
             max_tokens=max_tokens,
-            image_path=image_path
+            image_path=image_path,
+            image=image
         )
     
     async def expert_query(
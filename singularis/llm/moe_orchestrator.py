@@ -34,6 +34,7 @@ from .gemini_client import GeminiClient
 from .claude_client import ClaudeClient
 from .openai_client import OpenAIClient
 from .hyperbolic_client import HyperbolicClient
+from .image_payload import ImageEncoding, get_image_payload_cache
 
 
 class ExpertRole(Enum):
@@ -145,6 +146,15 @@ class MoEOrchestrator:
         claude_tpm_limit: int = 40_000,  # Claude Sonnet 4 Tier 1 limit
         openai_tpm_limit: int = 30_000,  # GPT-4o TPM limit
         hyperbolic_tpm_limit: int = 50_000,  # Hyperbolic TPM limit
+        # Quorum / early-exit consensus (all None = wait for every expert)
+        quorum_size: Optional[int] = None,  # Return once this many experts answered
+        quorum_confidence: Optional[float] = None,  # Return once mean confidence reaches this
+        quorum_agreement: Optional[float] = None,  # ...and coherence reaches this
+        quorum_deadline: Optional[float] = None,  # Hard deadline (seconds) per fan-out
+        cancel_stragglers: bool = False,  # Cancel late experts instead of backgrounding them
+        # Image upload encoding per provider (None = full-resolution PNG)
+        gemini_image_encoding: Optional[ImageEncoding] = None,
+        hyperbolic_image_encoding: Optional[ImageEncoding] = None,
     ):
         """
         Initializes the MoEOrchestrator.
@@ -178,6 +188,27 @@ class MoEOrchestrator:
             claude_tpm_limit (int, optional): The TPM limit for Claude. Defaults to 40_000.
             openai_tpm_limit (int, optional): The TPM limit for OpenAI. Defaults to 30_000.
             hyperbolic_tpm_limit (int, optional): The TPM limit for Hyperbolic. Defaults to 50_000.
+            quorum_size (Optional[int], optional): Return as soon as this many experts
+                                                   have answered. Defaults to None (all).
+            quorum_confidence (Optional[float], optional): Return early once the mean
+                                                           confidence of at least two
+                                                           answers reaches this value.
+                                                           Defaults to None.
+            quorum_agreement (Optional[float], optional): Minimum coherence required
+                                                          alongside `quorum_confidence`.
+                                                          Defaults to None.
+            quorum_deadline (Optional[float], optional): Hard deadline in seconds for a
+                                                         fan-out; experts still running
+                                                         are left behind. Defaults to None.
+            cancel_stragglers (bool, optional): Cancel experts that miss the quorum
+                                                instead of letting them finish in the
+                                                background. Defaults to False.
+            gemini_image_encoding (Optional[ImageEncoding], optional): Format and
+                                                downscaling of frames sent to Gemini
+                                                experts. Defaults to None (PNG).
+            hyperbolic_image_encoding (Optional[ImageEncoding], optional): Format and
+                                                downscaling of frames sent to Nemotron
+                                                experts. Defaults to None (PNG).
         """
         self.num_gemini_experts = num_gemini_experts
         self.num_claude_experts = num_claude_experts
@@ -202,6 +233,16 @@ class MoEOrchestrator:
         self.openai_tpm_limit = openai_tpm_limit
         self.hyperbolic_tpm_limit = hyperbolic_tpm_limit
         
+        # Quorum settings
+        self.quorum_size = quorum_size
+        self.quorum_confidence = quorum_confidence
+        self.quorum_agreement = quorum_agreement
+        self.quorum_deadline = quorum_deadline
+        self.cancel_stragglers = cancel_stragglers
+        self.gemini_image_encoding = gemini_image_encoding
+        self.hyperbolic_image_encoding = hyperbolic_image_encoding
+        self._straggler_tasks: set = set()  # Strong refs to backgrounded experts
+        
         # Per-expert rate limits (divide total by number of experts)
         self.gemini_per_expert_rpm = max(1, gemini_rpm_limit // num_gemini_experts) if num_gemini_experts > 0 else gemini_rpm_limit
         self.claude_per_expert_rpm = max(1, claude_rpm_limit // num_claude_experts) if num_claude_experts > 0 else claude_rpm_limit
@@ -254,6 +295,10 @@ class MoEOrchestrator:
             'claude_tokens_total': 0,
             'openai_tokens_total': 0,
             'hyperbolic_tokens_total': 0,
+            'quorum_early_exits': 0,
+            'quorum_deadline_hits': 0,
+            'stragglers_cancelled': 0,
+            'late_responses': 0,
         }
         
         # Fix 19: Dynamic rate limit scaling
@@ -304,7 +349,7 @@ class MoEOrchestrator:
         ]
         
         for i in range(self.num_gemini_experts):
-            client = GeminiClient(model=self.gemini_model)
+            client = GeminiClient(model=self.gemini_model, image_encoding=self.gemini_image_encoding)
             if client.is_available():
                 self.gemini_experts.append(client)
                 
@@ -410,7 +455,10 @@ class MoEOrchestrator:
         ]
         
         for i in range(self.num_hyperbolic_vision_experts):
-            client = HyperbolicClient(model=self.hyperbolic_vision_model)
+            client = HyperbolicClient(
+                model=self.hyperbolic_vision_model,
+                image_encoding=self.hyperbolic_image_encoding
+            )
             if client.is_available():
                 self.hyperbolic_vision_experts.append(client)
                 
@@ -759,11 +807,8 @@ class MoEOrchestrator:
             task = self._query_hyperbolic_expert(expert, role, prompt, image, context, is_vision=True)
             tasks.append(task)
         
-        # Execute ALL experts in parallel
-        expert_responses = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter out exceptions
-        valid_responses = [r for r in expert_responses if isinstance(r, ExpertResponse)]
+        # Execute ALL experts in parallel (returns early when a quorum is configured)
+        valid_responses = await self._gather_experts(tasks)
         
         if not valid_responses:
             raise RuntimeError("All vision experts failed")
@@ -840,11 +885,8 @@ class MoEOrchestrator:
             task = self._query_hyperbolic_expert(expert, role, prompt, None, context, is_vision=False)
             tasks.append(task)
         
-        # Execute ALL experts in parallel
-        expert_responses = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter out exceptions
-        valid_responses = [r for r in expert_responses if isinstance(r, ExpertResponse)]
+        # Execute ALL experts in parallel (returns early when a quorum is configured)
+        valid_responses = await self._gather_experts(tasks)
         
         if not valid_responses:
             raise RuntimeError("All reasoning experts failed")
@@ -908,6 +950,102 @@ class MoEOrchestrator:
         
         return vision_response, reasoning_response
     
+    def _quorum_enabled(self) -> bool:
+        """Whether any quorum / deadline setting is active."""
+        return (
+            self.quorum_size is not None
+            or self.quorum_confidence is not None
+            or self.quorum_deadline is not None
+        )
+    
+    def _quorum_reached(self, responses: List[ExpertResponse], total: int) -> bool:
+        """Check whether collected responses satisfy the early-exit quorum."""
+        if len(responses) >= total:
+            return True
+        if self.quorum_size is not None and len(responses) >= self.quorum_size:
+            return True
+        if self.quorum_confidence is not None and len(responses) >= min(2, total):
+            avg_confidence = statistics.mean(r.confidence for r in responses)
+            if avg_confidence < self.quorum_confidence:
+                return False
+            if self.quorum_agreement is not None:
+                return self._compute_coherence(responses) >= self.quorum_agreement
+            return True
+        return False
+    
+    async def _gather_experts(self, coros: List) -> List[ExpertResponse]:
+        """
+        Run expert queries concurrently and collect successful responses.
+
+        Without quorum settings this waits for every expert, like
+        ``asyncio.gather``. With a quorum it returns as soon as enough
+        answers (or enough confident agreement) are in, or when the hard
+        deadline passes. Stragglers are cancelled or left running in the
+        background; their late results still update the call statistics.
+        """
+        if not coros:
+            return []
+        
+        if not self._quorum_enabled():
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            return [r for r in results if isinstance(r, ExpertResponse)]
+        
+        pending = {asyncio.ensure_future(c) for c in coros}
+        total = len(pending)
+        valid_responses: List[ExpertResponse] = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.quorum_deadline if self.quorum_deadline is not None else None
+        
+        try:
+            while pending:
+                timeout = None
+                if deadline is not None:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        self.stats['quorum_deadline_hits'] += 1
+                        break
+                
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        valid_responses.append(task.result())
+                
+                if pending and valid_responses and self._quorum_reached(valid_responses, total):
+                    self.stats['quorum_early_exits'] += 1
+                    break
+        finally:
+            if pending:
+                self._handle_stragglers(pending)
+        
+        return valid_responses
+    
+    def _handle_stragglers(self, pending: set):
+        """Cancel or background experts that missed the quorum."""
+        if self.cancel_stragglers:
+            for task in pending:
+                task.cancel()
+            self.stats['stragglers_cancelled'] += len(pending)
+            logger.debug(f"MoE quorum: cancelled {len(pending)} straggling experts")
+            return
+        
+        for task in pending:
+            self._straggler_tasks.add(task)
+            task.add_done_callback(self._on_straggler_done)
+        logger.debug(f"MoE quorum: {len(pending)} experts continuing in background")
+    
+    def _on_straggler_done(self, task: asyncio.Future):
+        """Fold a late expert result into the statistics."""
+        self._straggler_tasks.discard(task)
+        if task.cancelled() or task.exception() is not None:
+            return
+        
+        response = task.result()
+        self.stats['late_responses'] += 1
+        calls_key = f"{response.model_type}_calls"
+        self.stats[calls_key] = self.stats.get(calls_key, 0) + 1
+    
     async def _query_gemini_expert(
         self,
         expert: GeminiClient,
@@ -1195,6 +1333,10 @@ class MoEOrchestrator:
     
     async def close(self):
         """Closes the client connections for all experts."""
+        for task in list(self._straggler_tasks):
+            task.cancel()
+        self._straggler_tasks.clear()
+        
         for expert in self.gemini_experts:
             await expert.close()
         for expert in self.claude_experts:
@@ -1225,6 +1367,7 @@ class MoEOrchestrator:
             'num_openai_mini_experts': len(self.openai_mini_experts),
             'num_hyperbolic_vision_experts': len(self.hyperbolic_vision_experts),
             'num_hyperbolic_reasoning_experts': len(self.hyperbolic_reasoning_experts),
+            'image_payload_cache': get_image_payload_cache().get_stats(),
             'total_experts': (len(self.gemini_experts) + len(self.claude_experts) + len(self.openai_experts) + 
                             len(self.openai_mini_experts) + len(self.hyperbolic_vision_experts) + len(self.hyperbolic_reasoning_experts))
         }
@@ -11,6 +11,7 @@ from .streaming_video_interpreter import (
     VideoFrame,
     StreamingInterpretation
 )
+from .frame_scheduler import FrameScheduler, frame_fingerprint
 
 from .iwm_perception_integration import IWMPerceptionModule
 
@@ -19,5 +20,7 @@ __all__ = [
     'InterpretationMode',
     'VideoFrame',
     'StreamingInterpretation',
+    'FrameScheduler',
+    'frame_fingerprint',
     'IWMPerceptionModule',
 ]
@@ -0,0 +1,307 @@
+"""
+Backpressured Frame Scheduler
+
+Sits between a frame source and an expensive per-frame interpreter (a
+vision-model API call) so interpretation cost follows the interpreter's own
+throughput rather than the source frame rate:
+
+- At most `max_in_flight` frames are interpreted concurrently.
+- Frames waiting for a slot sit in a small pending queue; when it is full
+  the oldest waiting frame is dropped (latest frame wins).
+- Frames nearly identical to the last accepted frame are skipped, compared
+  as downscaled grayscale thumbnails. The reference is forgotten when an
+  interpretation fails or pending frames are cleared, so a retry of the
+  same scene is not skipped.
+- `min_interval` spaces dispatches out to a fixed analysis rate.
+- Results are delivered in dispatch order even when concurrent
+  interpretations finish out of order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+
+FINGERPRINT_SIZE = 32
+
+
+def frame_fingerprint(image: Any, size: int = FINGERPRINT_SIZE) -> Optional[np.ndarray]:
+    """
+    Downscaled grayscale thumbnail used for near-duplicate detection.
+
+    Args:
+        image: PIL Image or (H, W[, C]) uint8 array
+        size: Thumbnail edge length
+
+    Returns:
+        (size, size) float32 array, or None if the image can't be read
+    """
+    if hasattr(image, "resize") and hasattr(image, "convert"):
+        thumbnail = image.resize((size, size), reducing_gap=2.0).convert("L")
+        return np.asarray(thumbnail, dtype=np.float32)
+
+    array = np.asarray(image)
+    if array.ndim not in (2, 3) or array.size == 0:
+        return None
+
+    # Sample a 4x grid and box-average it instead of touching every pixel
+    height, width = array.shape[:2]
+    rows = np.linspace(0, height - 1, size * 4).astype(np.intp)
+    cols = np.linspace(0, width - 1, size * 4).astype(np.intp)
+    sample = array[rows][:, cols].astype(np.float32)
+    if sample.ndim == 3:
+        sample = sample[..., :3].mean(axis=2)
+    return sample.reshape(size, 4, size, 4).mean(axis=(1, 3))
+
+
+class FrameScheduler:
+    """
+    Bounded, latest-frame-wins scheduler for per-frame interpretation.
+
+    `submit()` is called from the event loop for every frame; interpretation
+    tasks are created on that loop.
+    """
+
+    def __init__(
+        self,
+        interpret: Callable[[Any], Awaitable[Any]],
+        deliver: Optional[Callable[[Any, Any], Awaitable[None]]] = None,
+        max_in_flight: int = 1,
+        max_pending: int = 1,
+        min_interval: float = 0.0,
+        similarity_threshold: float = 2.0
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            interpret: Coroutine function frame -> result (None = no result)
+            deliver: Coroutine function (frame, result) called in dispatch order
+            max_in_flight: Concurrent interpretations
+            max_pending: Frames waiting for a slot before the oldest is dropped
+            min_interval: Minimum seconds between dispatches (0 = no limit)
+            similarity_threshold: Mean absolute thumbnail difference (0-255) below
+                which a frame counts as a duplicate (0 = never skip)
+        """
+        if max_in_flight < 1 or max_pending < 1:
+            raise ValueError("max_in_flight and max_pending must be at least 1")
+
+        self.interpret = interpret
+        self.deliver = deliver
+        self.max_in_flight = max_in_flight
+        self.max_pending = max_pending
+        self.min_interval = min_interval
+        self.similarity_threshold = similarity_threshold
+
+        self._pending: Deque[Tuple[Any, float]] = deque()
+        self._in_flight: Dict[int, asyncio.Task] = {}
+        self._completed: Dict[int, Tuple[Any, Any]] = {}
+        self._next_sequence = 0
+        self._next_delivery = 0
+        self._delivering = False
+        self._closed = False
+
+        self._last_fingerprint: Optional[np.ndarray] = None
+        self._last_dispatch = float("-inf")
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._idle_waiters: List[asyncio.Future] = []
+
+        self.stats = {
+            'submitted': 0,
+            'dispatched': 0,
+            'skipped_similar': 0,
+            'dropped': 0,
+            'completed': 0,
+            'delivered': 0,
+            'failed': 0,
+            'delivery_errors': 0,
+            'avg_queue_age': 0.0,
+            'max_queue_age': 0.0,
+            'avg_latency': 0.0,
+            'max_in_flight_seen': 0,
+        }
+
+    def _is_duplicate(self, frame: Any) -> bool:
+        if self.similarity_threshold <= 0:
+            return False
+
+        try:
+            fingerprint = frame_fingerprint(getattr(frame, "image", frame))
+        except Exception as e:
+            logger.debug(f"[FRAME-SCHEDULER] Fingerprint failed: {e}")
+            fingerprint = None
+
+        previous = self._last_fingerprint
+        if fingerprint is not None and previous is not None and fingerprint.shape == previous.shape:
+            if float(np.abs(fingerprint - previous).mean()) < self.similarity_threshold:
+                return True
+
+        self._last_fingerprint = fingerprint
+        return False
+
+    def submit(self, frame: Any) -> bool:
+        """
+        Offer a frame for interpretation.
+
+        Returns:
+            False if the frame was skipped as a near-duplicate
+        """
+        if self._closed:
+            return False
+
+        self.stats['submitted'] += 1
+        if self._is_duplicate(frame):
+            self.stats['skipped_similar'] += 1
+            return False
+
+        if len(self._pending) >= self.max_pending:
+            self._pending.popleft()
+            self.stats['dropped'] += 1
+        self._pending.append((frame, time.monotonic()))
+        self._dispatch()
+        return True
+
+    def _dispatch(self):
+        if self._closed:
+            return
+
+        loop = asyncio.get_running_loop()
+        while self._pending and len(self._in_flight) < self.max_in_flight:
+            now = time.monotonic()
+            wait = self._last_dispatch + self.min_interval - now
+            if wait > 0:
+                if self._timer is None:
+                    self._timer = loop.call_later(wait, self._on_timer)
+                return
+
+            frame, submitted_at = self._pending.popleft()
+            self._last_dispatch = now
+            self._record_queue_age(now - submitted_at)
+
+            sequence = self._next_sequence
+            self._next_sequence += 1
+            self._in_flight[sequence] = loop.create_task(self._run(sequence, frame, now))
+            self.stats['dispatched'] += 1
+            self.stats['max_in_flight_seen'] = max(self.stats['max_in_flight_seen'], len(self._in_flight))
+
+    def _on_timer(self):
+        self._timer = None
+        self._dispatch()
+
+    def _record_queue_age(self, age: float):
+        if self.stats['dispatched'] == 0:
+            self.stats['avg_queue_age'] = age
+        else:
+            self.stats['avg_queue_age'] = 0.95 * self.stats['avg_queue_age'] + 0.05 * age
+        self.stats['max_queue_age'] = max(self.stats['max_queue_age'], age)
+
+    async def _run(self, sequence: int, frame: Any, started_at: float):
+        result = None
+        try:
+            result = await self.interpret(frame)
+        except Exception as e:
+            self.stats['failed'] += 1
+            self._last_fingerprint = None  # Let the next identical frame through
+            logger.warning(f"[FRAME-SCHEDULER] Interpretation failed: {type(e).__name__}: {e}")
+
+        latency = time.monotonic() - started_at
+        if self.stats['completed'] == 0:
+            self.stats['avg_latency'] = latency
+        else:
+            self.stats['avg_latency'] = 0.95 * self.stats['avg_latency'] + 0.05 * latency
+        self.stats['completed'] += 1
+
+        # Free the slot before delivering so the next frame starts right away
+        self._in_flight.pop(sequence, None)
+        self._completed[sequence] = (frame, result)
+        self._dispatch()
+        await self._flush()
+
+    async def _flush(self):
+        """Deliver completed results in order; one flusher runs at a time."""
+        if self._delivering:
+            return
+
+        self._delivering = True
+        try:
+            while self._next_delivery in self._completed:
+                frame, result = self._completed.pop(self._next_delivery)
+                self._next_delivery += 1
+                if result is None or self.deliver is None:
+                    continue
+                try:
+                    await self.deliver(frame, result)
+                    self.stats['delivered'] += 1
+                except Exception as e:
+                    self.stats['delivery_errors'] += 1
+                    logger.error(f"[FRAME-SCHEDULER] Delivery failed: {type(e).__name__}: {e}")
+        finally:
+            self._delivering = False
+        self._notify_idle()
+
+    def _is_idle(self) -> bool:
+        return not (self._pending or self._in_flight or self._completed or self._delivering)
+
+    def _notify_idle(self):
+        if not self._is_idle():
+            return
+        waiters, self._idle_waiters = self._idle_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def drain(self):
+        """Wait until every accepted frame has been interpreted and delivered."""
+        if self._is_idle():
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._idle_waiters.append(waiter)
+        await waiter
+
+    def clear_pending(self):
+        """Drop frames still waiting for a slot (in-flight frames finish)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self.stats['dropped'] += len(self._pending)
+        self._pending.clear()
+        self._last_fingerprint = None
+        self._notify_idle()
+
+    async def close(self):
+        """Cancel pending and in-flight interpretations."""
+        self._closed = True
+        self.clear_pending()
+
+        tasks = list(self._in_flight.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._in_flight.clear()
+        self._completed.clear()
+        self._notify_idle()
+
+    @property
+    def queue_age(self) -> float:
+        """Seconds the oldest pending frame has been waiting."""
+        if not self._pending:
+            return 0.0
+        return time.monotonic() - self._pending[0][1]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        submitted = self.stats['submitted']
+        return {
+            **self.stats,
+            'in_flight': len(self._in_flight),
+            'pending': len(self._pending),
+            'queue_age': self.queue_age,
+            'drop_rate': (self.stats['dropped'] + self.stats['skipped_similar']) / submitted if submitted else 0.0,
+        }
@@ -3,6 +3,10 @@ Streaming Video Interpreter using Gemini 2.5 Flash Native Audio
 
 Real-time video analysis with audio commentary, parallel to OpenAI GPT streaming.
 Provides continuous interpretation of the game screen with spoken insights.
+
+Frames are interpreted through a FrameScheduler: a bounded number of API
+calls in flight, latest-frame-wins dropping, near-duplicate skipping and
+in-order delivery, so cost and latency stay flat as the input frame rate rises.
 """
 
 from __future__ import annotations
@@ -12,13 +16,16 @@ import base64
 import io
 import os
 import time
-from typing import Optional, List, Callable, Any
+from collections import deque
+from typing import Optional, List, Callable, Any, Deque
 from dataclasses import dataclass
 from enum import Enum
 
 import aiohttp
 from loguru import logger
 
+from .frame_scheduler import FrameScheduler
+
 try:
     import pygame_ce as pygame
     PYGAME_AVAILABLE = True
@@ -78,6 +85,9 @@ class StreamingVideoInterpreter:
         frame_rate: float = 1.0,  # Frames per second to analyze
         audio_enabled: bool = True,
         voice: str = "Kore",  # Gemini native audio voice
+        max_in_flight: int = 1,
+        max_pending: int = 1,
+        similarity_threshold: float = 2.0,
     ):
         """
         Initialize streaming video interpreter.
@@ -88,6 +98,10 @@ class StreamingVideoInterpreter:
             frame_rate: How many frames per second to analyze
             audio_enabled: Whether to generate audio commentary
             voice: Voice name for audio generation
+            max_in_flight: Concurrent interpretation requests
+            max_pending: Frames waiting for a request slot before the oldest is dropped
+            similarity_threshold: Mean thumbnail difference (0-255) below which a
+                frame repeats the last one and is skipped (0 = interpret all)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.mode = mode
@@ -99,12 +113,22 @@ class StreamingVideoInterpreter:
         self._session: Optional[aiohttp.ClientSession] = None
         
         # Frame buffer
-        self.frame_buffer: List[VideoFrame] = []
         self.max_buffer_size = 10
+        self.frame_buffer: Deque[VideoFrame] = deque(maxlen=self.max_buffer_size)
         
         # Interpretation history
-        self.interpretations: List[StreamingInterpretation] = []
         self.max_history = 100
+        self.interpretations: Deque[StreamingInterpretation] = deque(maxlen=self.max_history)
+        
+        # Backpressured interpretation; frame_rate caps the dispatch rate
+        self.scheduler = FrameScheduler(
+            self._interpret_frame,
+            self._deliver_interpretation,
+            max_in_flight=max_in_flight,
+            max_pending=max_pending,
+            min_interval=1.0 / frame_rate if frame_rate > 0 else 0.0,
+            similarity_threshold=similarity_threshold,
+        )
         
         # Streaming state
         self.is_streaming = False
@@ -145,6 +169,7 @@ class StreamingVideoInterpreter:
     async def close(self):
         """Close the interpreter and cleanup connections."""
         self.is_streaming = False
+        await self.scheduler.close()
         
         if self._session and not self._session.closed:
             try:
@@ -363,34 +388,31 @@ class StreamingVideoInterpreter:
         self.frame_buffer.append(frame)
         self.current_frame_number += 1
         
-        # Limit buffer size
-        if len(self.frame_buffer) > self.max_buffer_size:
-            self.frame_buffer.pop(0)
-        
-        # Trigger interpretation if streaming
+        # Schedule interpretation if streaming (may be skipped or superseded)
         if self.is_streaming:
-            asyncio.create_task(self._process_frame(frame))
+            self.scheduler.submit(frame)
     
     async def _process_frame(self, frame: VideoFrame):
-        """Process a frame asynchronously."""
+        """Interpret a frame immediately, bypassing the scheduler."""
         interpretation = await self._interpret_frame(frame)
         
         if interpretation:
-            # Add to history
-            self.interpretations.append(interpretation)
-            if len(self.interpretations) > self.max_history:
-                self.interpretations.pop(0)
-            
-            # Play audio if available
-            if interpretation.audio_data:
-                asyncio.create_task(self._play_audio(interpretation.audio_data))
-            
-            # Trigger callbacks
-            if self.on_interpretation:
-                await self.on_interpretation(interpretation)
-            
-            if self.on_audio and interpretation.audio_data:
-                await self.on_audio(interpretation.audio_data)
+            await self._deliver_interpretation(frame, interpretation)
+    
+    async def _deliver_interpretation(self, frame: VideoFrame, interpretation: StreamingInterpretation):
+        """Record an interpretation and notify listeners (called in frame order)."""
+        self.interpretations.append(interpretation)
+        
+        # Play audio if available
+        if interpretation.audio_data:
+            asyncio.create_task(self._play_audio(interpretation.audio_data))
+        
+        # Trigger callbacks
+        if self.on_interpretation:
+            await self.on_interpretation(interpretation)
+        
+        if self.on_audio and interpretation.audio_data:
+            await self.on_audio(interpretation.audio_data)
     
     async def start_streaming(self):
         """Start streaming interpretation."""
@@ -400,6 +422,7 @@ class StreamingVideoInterpreter:
     async def stop_streaming(self):
         """Stop streaming interpretation."""
         self.is_streaming = False
+        self.scheduler.clear_pending()
         logger.info("[VIDEO-INTERPRETER] Streaming stopped")
     
     def get_latest_interpretation(self) -> Optional[StreamingInterpretation]:
@@ -408,7 +431,7 @@ class StreamingVideoInterpreter:
     
     def get_recent_interpretations(self, count: int = 5) -> List[StreamingInterpretation]:
         """Get recent interpretations."""
-        return self.interpretations[-count:]
+        return list(self.interpretations)[-count:]
     
     def get_stats(self) -> dict:
         """Get interpreter statistics."""
@@ -420,4 +443,5 @@ class StreamingVideoInterpreter:
             "buffer_size": len(self.frame_buffer),
             "audio_enabled": self.audio_enabled,
             "voice": self.voice,
+            "scheduler": self.scheduler.get_stats(),
         }
@@ -395,8 +395,10 @@ async def perform_wolfram_analysis_if_needed(agi: 'SkyrimAGI', cycle_number: int
                         )
         
         # Also analyze global coherence trends if we have BeingState history
-        if hasattr(agi.coherence_engine, 'coherence_history') and len(agi.coherence_engine.coherence_history) > 10:
-            coherence_samples = [c for _, c in agi.coherence_engine.coherence_history[-20:]]
+        # Read the coherence column directly; coherence_history copies every sample
+        history = getattr(agi.coherence_engine, 'history', None)
+        if history is not None and len(history) > 10:
+            coherence_samples = history.column('coherence', 20).tolist()
             
             result = await agi.wolfram_analyzer.calculate_coherence_statistics(
                 coherence_samples=coherence_samples,
@@ -18,17 +18,32 @@ The curriculum knowledge enhances:
 5. Creative problem-solving (literature, arts)
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Set
 from dataclasses import dataclass
 import numpy as np
 from pathlib import Path
+import hashlib
 import json
+import math
+import re
 import time
-from collections import defaultdict
+from collections import defaultdict, Counter
 
 from loguru import logger
 
 
+STOP_WORDS = {'the', 'is', 'at', 'which', 'on', 'a', 'an', 'and', 'or', 'but', 'in', 'with', 'to', 'for'}
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits text into lowercase index terms (longer than 3 chars, no stop words)."""
+    return [
+        token for token in _TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 3 and token not in STOP_WORDS
+    ]
+
+
 @dataclass
 class CurriculumDocument:
     """Represents a single document from the university curriculum knowledge base.
@@ -63,6 +78,133 @@ class KnowledgeRetrieval:
     excerpt: str
 
 
+class BM25Index:
+    """An inverted index over curriculum chunks with Okapi BM25 scoring.
+
+    Postings map each term to ``(chunk_id, term_frequency)`` pairs, so a query
+    only touches the chunks that contain at least one of its terms instead of
+    scanning the whole curriculum. The index can be saved to and loaded from a
+    JSON file so startup does not need to re-tokenize unchanged texts.
+
+    Attributes:
+        k1: BM25 term-frequency saturation parameter.
+        b: BM25 document-length normalization parameter.
+        postings: A mapping from term to a list of (chunk_id, tf) pairs.
+        chunk_lengths: The number of index terms in each chunk.
+        chunk_categories: The category of each chunk, used for filtering.
+    """
+
+    VERSION = 1
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self.chunk_lengths: List[int] = []
+        self.chunk_categories: List[str] = []
+        self.total_length = 0
+
+    @property
+    def num_chunks(self) -> int:
+        return len(self.chunk_lengths)
+
+    @property
+    def avg_length(self) -> float:
+        return self.total_length / max(1, self.num_chunks)
+
+    def add_chunk(self, text: str, category: str) -> int:
+        """Tokenizes a chunk and adds it to the postings.
+
+        Returns:
+            The chunk id assigned to the text.
+        """
+        chunk_id = self.num_chunks
+        counts = Counter(tokenize(text))
+        for term, tf in counts.items():
+            self.postings[term].append((chunk_id, tf))
+        length = sum(counts.values())
+        self.chunk_lengths.append(length)
+        self.chunk_categories.append(category)
+        self.total_length += length
+        return chunk_id
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (always non-negative)."""
+        df = len(self.postings.get(term, ()))
+        return math.log(1.0 + (self.num_chunks - df + 0.5) / (df + 0.5))
+
+    def score(
+        self,
+        terms: Iterable[str],
+        categories: Optional[Set[str]] = None
+    ) -> Dict[int, float]:
+        """Scores every chunk that contains at least one query term.
+
+        Args:
+            terms: Query terms (already tokenized).
+            categories: If given, only chunks in these categories are scored.
+
+        Returns:
+            A mapping from chunk id to BM25 score.
+        """
+        scores: Dict[int, float] = defaultdict(float)
+        avg_length = self.avg_length or 1.0
+        for term in set(terms):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for chunk_id, tf in postings:
+                if categories is not None and self.chunk_categories[chunk_id] not in categories:
+                    continue
+                norm = self.k1 * (1.0 - self.b + self.b * self.chunk_lengths[chunk_id] / avg_length)
+                scores[chunk_id] += idf * tf * (self.k1 + 1.0) / (tf + norm)
+        return scores
+
+    def reference_score(self, terms: Iterable[str]) -> float:
+        """Score of an average-length chunk containing each query term once.
+
+        Used to map raw BM25 scores onto the 0-1 relevance scale.
+        """
+        return sum(self.idf(term) for term in set(terms))
+
+    def save(self, path: Path, signature: str):
+        """Writes the index to a JSON file tagged with the corpus signature."""
+        data = {
+            'version': self.VERSION,
+            'signature': signature,
+            'k1': self.k1,
+            'b': self.b,
+            'chunk_lengths': self.chunk_lengths,
+            'chunk_categories': self.chunk_categories,
+            'postings': {term: [c for pair in plist for c in pair] for term, plist in self.postings.items()},
+        }
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, signature: str) -> Optional['BM25Index']:
+        """Loads an index saved for the same corpus signature, or returns None."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get('version') != cls.VERSION or data.get('signature') != signature:
+            return None
+
+        index = cls(k1=data['k1'], b=data['b'])
+        index.chunk_lengths = data['chunk_lengths']
+        index.chunk_categories = data['chunk_categories']
+        index.total_length = sum(index.chunk_lengths)
+        for term, flat in data['postings'].items():
+            index.postings[term] = list(zip(flat[0::2], flat[1::2]))
+        return index
+
+
 class CurriculumRAG:
     """A Retrieval-Augmented Generation system for university curriculum knowledge.
 
@@ -76,7 +218,8 @@ class CurriculumRAG:
         curriculum_path: str = "university_curriculum",
         max_documents: int = 200,
         chunk_size: int = 2000,
-        use_embeddings: bool = False
+        use_embeddings: bool = False,
+        index_path: Optional[str] = None
     ):
         """Initializes the CurriculumRAG system.
 
@@ -86,6 +229,8 @@ class CurriculumRAG:
             chunk_size: The size of text chunks to split documents into for retrieval.
             use_embeddings: Whether to use sentence-transformer embeddings for similarity.
                             (Note: Requires the 'sentence-transformers' library).
+            index_path: Where to persist the BM25 index. Defaults to
+                        ``<curriculum_path>/.bm25_index.json``.
         """
         self.curriculum_path = Path(curriculum_path)
         self.max_documents = max_documents
@@ -102,6 +247,11 @@ class CurriculumRAG:
         # Keyword index for fast lookup
         self.keyword_index: Dict[str, List[int]] = defaultdict(list)
         
+        # BM25 inverted index over document_chunks (chunk id == list position)
+        self.index = BM25Index()
+        self.index_path = Path(index_path) if index_path else self.curriculum_path / ".bm25_index.json"
+        self.index_loaded_from_disk = False
+        
         # Embedding model (optional)
         self.embedder = None
         
@@ -174,6 +324,8 @@ class CurriculumRAG:
             except Exception as e:
                 logger.warning(f"[CURRICULUM-RAG] Failed to load {text_id}: {e}")
         
+        self._build_or_load_index()
+        
         logger.info(f"[CURRICULUM-RAG] ✓ Indexed {documents_loaded} documents, {len(self.document_chunks)} chunks")
         logger.info(f"[CURRICULUM-RAG] Categories: {list(self.category_index.keys())}")
     
@@ -200,17 +352,18 @@ class CurriculumRAG:
         # Extract query keywords
         query_keywords = self._extract_keywords(query.lower())
         
-        # Score all chunks
+        # Score only chunks that share a term with the query (inverted index)
+        bm25_scores = self.index.score(
+            query_keywords,
+            categories=set(categories) if categories else None
+        )
+        reference = self.index.reference_score(query_keywords)
+        
         chunk_scores = []
-        for i, (doc, chunk, chunk_idx) in enumerate(self.document_chunks):
-            # Filter by category if specified
-            if categories and doc.category not in categories:
-                continue
-            
-            # Calculate relevance score
-            score = self._calculate_relevance(query_keywords, chunk.lower(), doc)
-            
-            if score >= min_relevance:
+        for i, bm25 in bm25_scores.items():
+            doc = self.document_chunks[i][0]
+            score = self._calculate_relevance(query_keywords, bm25, reference, doc)
+            if min(1.0, score) >= min_relevance:
                 chunk_scores.append((i, score))
         
         # Sort by score
@@ -233,7 +386,7 @@ class CurriculumRAG:
             
             results.append(KnowledgeRetrieval(
                 document=doc,
-                relevance_score=score,
+                relevance_score=min(1.0, score),
                 excerpt=excerpt
             ))
             
@@ -345,6 +498,50 @@ class CurriculumRAG:
             chunk = content[i:i + self.chunk_size]
             self.document_chunks.append((doc, chunk, i // self.chunk_size))
     
+    def _corpus_signature(self) -> str:
+        """Fingerprint of the loaded texts and chunking settings.
+
+        A persisted index is only reused when this matches, so edited or added
+        texts trigger a rebuild.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(f"v{BM25Index.VERSION}|chunk={self.chunk_size}|".encode('utf-8'))
+        for doc in self.documents:
+            file_path = Path(doc.metadata['file_path'])
+            try:
+                stat = file_path.stat()
+                file_state = f"{stat.st_size}:{stat.st_mtime_ns}"
+            except OSError:
+                file_state = "missing"
+            hasher.update(f"{doc.text_id}|{doc.category}|{file_path}|{file_state}|{len(doc.content)}\n".encode('utf-8'))
+        return hasher.hexdigest()
+    
+    def _build_or_load_index(self):
+        """Loads the persisted BM25 index if it matches the corpus, else rebuilds it."""
+        signature = self._corpus_signature()
+        
+        index = BM25Index.load(self.index_path, signature)
+        if index is not None and index.num_chunks == len(self.document_chunks):
+            self.index = index
+            self.index_loaded_from_disk = True
+            logger.info(f"[CURRICULUM-RAG] Loaded BM25 index from {self.index_path}")
+            return
+        
+        start = time.time()
+        self.index = BM25Index()
+        for doc, chunk, _ in self.document_chunks:
+            self.index.add_chunk(chunk, doc.category)
+        self.index_loaded_from_disk = False
+        logger.info(
+            f"[CURRICULUM-RAG] Built BM25 index: {len(self.index.postings)} terms "
+            f"in {time.time() - start:.2f}s"
+        )
+        
+        try:
+            self.index.save(self.index_path, signature)
+        except OSError as e:
+            logger.warning(f"[CURRICULUM-RAG] Could not persist BM25 index: {e}")
+    
     def _index_keywords(self, doc: CurriculumDocument, doc_idx: int):
         """Extracts and indexes keywords from a document's title and category.
 
@@ -368,40 +565,35 @@ class CurriculumRAG:
         Returns:
             A list of keyword strings.
         """
-        # Simple keyword extraction
-        words = text.lower().split()
-        
-        # Filter stop words and short words
-        stop_words = {'the', 'is', 'at', 'which', 'on', 'a', 'an', 'and', 'or', 'but', 'in', 'with', 'to', 'for'}
-        keywords = [w for w in words if len(w) > 3 and w not in stop_words]
+        # Same tokenization as the index, so query terms hit postings directly
+        keywords = list(dict.fromkeys(tokenize(text)))
         
         return keywords[:20]  # Limit keywords
     
     def _calculate_relevance(
         self,
         query_keywords: List[str],
-        chunk_text: str,
+        bm25_score: float,
+        reference_score: float,
         doc: CurriculumDocument
     ) -> float:
         """Calculates a relevance score between a query and a text chunk.
 
-        The score is based on keyword matching, with bonuses for matches in the
-        document's title and category.
+        The BM25 score is expressed relative to an average-length chunk that
+        contains every query term once, with bonuses for matches in the
+        document's title and category. The result is left uncapped so that it
+        still orders chunks whose relevance saturates; callers clamp to 1.0.
 
         Args:
             query_keywords: A list of keywords from the user query.
-            chunk_text: The text of the document chunk to score.
+            bm25_score: The chunk's BM25 score for the query.
+            reference_score: `BM25Index.reference_score` for the query.
             doc: The document the chunk belongs to.
 
         Returns:
-            A relevance score between 0.0 and 1.0.
+            A relevance score (1.0 and above means a full match).
         """
-        score = 0.0
-        
-        # Keyword matching
-        chunk_lower = chunk_text.lower()
-        matches = sum(1 for kw in query_keywords if kw in chunk_lower)
-        keyword_score = matches / max(1, len(query_keywords))
+        keyword_score = bm25_score / reference_score if reference_score > 0 else 0.0
         
         # Title/category bonus
         title_lower = doc.title.lower()
@@ -412,9 +604,7 @@ class CurriculumRAG:
         title_bonus = title_matches * 0.2
         category_bonus = category_matches * 0.1
         
-        score = keyword_score + title_bonus + category_bonus
-        
-        return min(1.0, score)
+        return keyword_score + title_bonus + category_bonus
     
     def _create_excerpt(self, chunk: str, keywords: List[str], context_chars: int = 400) -> str:
         """Creates a relevant excerpt from a chunk centered around query keywords.
@@ -518,7 +708,9 @@ class CurriculumRAG:
             'categories': list(self.category_index.keys()),
             'category_counts': {k: len(v) for k, v in self.category_index.items()},
             'retrievals_performed': self.retrieval_count,
-            'keywords_indexed': len(self.keyword_index)
+            'keywords_indexed': len(self.keyword_index),
+            'index_terms': len(self.index.postings),
+            'index_loaded_from_disk': self.index_loaded_from_disk
         }
 
 
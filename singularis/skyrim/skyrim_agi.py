@@ -180,9 +180,13 @@ class SkyrimAGI:
         print("  [4/20] THE UNIFIED BEING - BeingState + CoherenceEngine...")
         from singularis.core.being_state import BeingState
         from singularis.core.coherence_engine import CoherenceEngine
+        from singularis.core.being_state_recorder import BeingStateRecorder
         
         self.being_state = BeingState()
-        self.coherence_engine = CoherenceEngine(verbose=True)
+        self.being_recorder = None
+        if self.config.record_being_state:
+            self.being_recorder = BeingStateRecorder(spill_dir=self.config.being_state_record_dir)
+        self.coherence_engine = CoherenceEngine(verbose=True, recorder=self.being_recorder)
         
         print("[BEING] Unified BeingState initialized")
         print("[BEING] CoherenceEngine ready - optimizing C_global")
@@ -1540,6 +1544,11 @@ class SkyrimAGI:
                     claude_model=self.config.claude_model,
                     gemini_rpm_limit=self.config.gemini_rpm_limit,
                     claude_rpm_limit=self.config.claude_rpm_limit,
+                    quorum_size=self.config.moe_quorum_size,
+                    quorum_confidence=self.config.moe_quorum_confidence,
+                    quorum_agreement=self.config.moe_quorum_agreement,
+                    quorum_deadline=self.config.moe_quorum_deadline,
+                    cancel_stragglers=self.config.moe_cancel_stragglers,
                 )
                 await self.moe.initialize()
                 print("[PARALLEL] [OK] MoE component ready")
@@ -1706,6 +1715,11 @@ class SkyrimAGI:
                     claude_model=self.config.claude_model,
                     gemini_rpm_limit=self.config.gemini_rpm_limit,
                     claude_rpm_limit=self.config.claude_rpm_limit,
+                    quorum_size=self.config.moe_quorum_size,
+                    quorum_confidence=self.config.moe_quorum_confidence,
+                    quorum_agreement=self.config.moe_quorum_agreement,
+                    quorum_deadline=self.config.moe_quorum_deadline,
+                    cancel_stragglers=self.config.moe_cancel_stragglers,
                 )
                 
                 await self.moe.initialize()
@@ -3911,6 +3925,8 @@ Stuck Loops Detected: {temp_stats.get('stuck_loops', 0)}""",
                         pass
                 
                 # UNIFIED BEING STATE (Final Snapshot)
+                if getattr(self, 'being_recorder', None):
+                    self.being_recorder.close()
                 if hasattr(self, 'being_state'):
                     final_snapshot = self.being_state.export_snapshot()
                     self.main_brain.record_output(
@@ -16,7 +16,7 @@ Design principles:
 - Symbolic logic allows formal reasoning about game rules
 """
 
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Dict, List, Optional, Tuple, Any, Set, FrozenSet
 from dataclasses import dataclass
 import numpy as np
 from enum import Enum
@@ -199,9 +199,16 @@ class LogicEngine:
     information through forward and backward chaining, and answer queries about
     what is known to be true.
 
+    Derived facts are tracked with justification-based truth maintenance: every
+    conclusion added by `forward_chain` remembers the premise sets that support
+    it, so retracting a base fact incrementally retracts the conclusions that
+    no longer have well-founded support (delete-and-rederive).
+
     Attributes:
         facts: A set of `LogicPredicate` objects representing known truths.
         rules: A list of `LogicRule` objects for deriving new facts.
+        base_facts: Facts asserted directly via `add_fact`.
+        justifications: For each derived fact, the premise sets that support it.
     """
 
     def __init__(self):
@@ -209,21 +216,98 @@ class LogicEngine:
         self.facts: Set[LogicPredicate] = set()  # Known facts
         self.rules: List[LogicRule] = []  # Inference rules
 
+        # Truth maintenance
+        self.base_facts: Set[LogicPredicate] = set()  # Asserted (not derived) facts
+        self.justifications: Dict[LogicPredicate, List[FrozenSet[LogicPredicate]]] = {}
+        self._dependents: Dict[LogicPredicate, Set[LogicPredicate]] = {}  # premise -> derived facts
+        self.retraction_count = 0
+
     def add_fact(self, fact: LogicPredicate):
         """Adds a fact to the knowledge base.
 
         Args:
             fact: The `LogicPredicate` to add as a known fact.
         """
+        self.base_facts.add(fact)
         self.facts.add(fact)
 
     def remove_fact(self, fact: LogicPredicate):
         """Removes a fact from the knowledge base.
 
+        Conclusions that were derived from the fact are retracted as well,
+        unless they still follow from the remaining facts.
+
         Args:
             fact: The `LogicPredicate` to remove.
         """
-        self.facts.discard(fact)
+        self.base_facts.discard(fact)
+        if fact in self.facts:
+            self._retract(fact)
+
+    def _is_supported(self, fact: LogicPredicate) -> bool:
+        """Checks whether a derived fact has a justification whose premises all hold."""
+        return any(
+            all(p in self.facts for p in support)
+            for support in self.justifications.get(fact, ())
+        )
+
+    def _add_justification(self, fact: LogicPredicate, premises: List[LogicPredicate]):
+        """Records that `premises` jointly support `fact`."""
+        support = frozenset(premises)
+        if fact in support:
+            return
+        supports = self.justifications.setdefault(fact, [])
+        if support in supports:
+            return
+        supports.append(support)
+        for premise in support:
+            self._dependents.setdefault(premise, set()).add(fact)
+
+    def _drop_justifications(self, fact: LogicPredicate):
+        """Forgets all justifications recorded for `fact`."""
+        for support in self.justifications.pop(fact, ()):
+            for premise in support:
+                dependents = self._dependents.get(premise)
+                if dependents is not None:
+                    dependents.discard(fact)
+                    if not dependents:
+                        del self._dependents[premise]
+
+    def _retract(self, fact: LogicPredicate):
+        """Retracts a fact and every conclusion resting on it (delete-and-rederive).
+
+        First over-deletes `fact` and the transitive closure of derived facts
+        that depend on it, then restores those that still have a justification
+        grounded in the surviving facts. Cyclic support between derived facts
+        therefore does not keep stale conclusions alive.
+        """
+        # Phase 1: over-delete everything downstream of the fact
+        removed: Set[LogicPredicate] = set()
+        stack = [fact]
+        while stack:
+            current = stack.pop()
+            if current in removed:
+                continue
+            removed.add(current)
+            self.facts.discard(current)
+            for dependent in self._dependents.get(current, ()):
+                if dependent not in removed and dependent not in self.base_facts:
+                    stack.append(dependent)
+
+        # Phase 2: rederive conclusions that still have grounded support
+        candidates = set(removed)
+        changed = True
+        while changed and candidates:
+            changed = False
+            for candidate in list(candidates):
+                if self._is_supported(candidate):
+                    self.facts.add(candidate)
+                    candidates.discard(candidate)
+                    changed = True
+
+        for retracted in candidates:
+            self._drop_justifications(retracted)
+        self.retraction_count += len(candidates)
 
     def add_rule(self, rule: LogicRule):
         """Adds an inference rule to the engine.
@@ -318,8 +402,13 @@ class LogicEngine:
             for rule in self.rules:
                 # Check if all premises are in facts
                 all_premises_satisfied = all(p in self.facts for p in rule.premises)
+                if not all_premises_satisfied:
+                    continue
 
-                if all_premises_satisfied and rule.conclusion not in self.facts:
+                # Record support so the conclusion can be retracted later
+                self._add_justification(rule.conclusion, rule.premises)
+
+                if rule.conclusion not in self.facts:
                     # Derive new fact
                     self.facts.add(rule.conclusion)
                     new_facts.add(rule.conclusion)
@@ -336,6 +425,9 @@ class LogicEngine:
         """
         return {
             'facts': len(self.facts),
+            'base_facts': len(self.base_facts),
+            'derived_facts': len(self.facts - self.base_facts),
+            'retractions': self.retraction_count,
             'rules': len(self.rules),
             'predicates_by_type': self._count_predicates_by_type()
         }
@@ -1421,10 +1513,18 @@ class SkyrimWorldModel:
         explanations = []
 
         # Check if directly in facts
-        if predicate in self.logic_engine.facts:
+        if predicate in self.logic_engine.base_facts:
             explanations.append(f"{predicate} is directly known")
             return explanations
 
+        # Derived facts carry their recorded justifications
+        for support in self.logic_engine.justifications.get(predicate, ()):
+            if all(p in self.logic_engine.facts for p in support):
+                prem_str = " AND ".join(sorted(str(p) for p in support))
+                explanations.append(f"{predicate} follows from: {prem_str}")
+        if explanations:
+            return explanations
+
         # Check which rules could derive this
         for rule in self.logic_engine.rules:
             if self._unify_predicates(rule.conclusion, predicate):
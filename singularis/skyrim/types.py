@@ -151,6 +151,15 @@ class SkyrimConfig(BaseModel):
     num_claude_experts: int = 1
     gemini_rpm_limit: int = 30
     claude_rpm_limit: int = 100
+    moe_quorum_size: Optional[int] = None  # Return after K experts answer (None = all)
+    moe_quorum_confidence: Optional[float] = None  # Early exit once mean confidence reaches this
+    moe_quorum_agreement: Optional[float] = None  # ...and expert coherence reaches this
+    moe_quorum_deadline: Optional[float] = None  # Hard deadline (s) per expert fan-out
+    moe_cancel_stragglers: bool = False  # Cancel experts that miss the quorum (default: background)
+    
+    # BeingState recording
+    record_being_state: bool = False  # Columnar per-cycle recording of BeingState scalars
+    being_state_record_dir: Optional[str] = None  # Spill compressed chunks here (None = memory only)
     
     # Parallel Mode
     use_parallel_mode: bool = False
@@ -14,7 +14,7 @@ Philosophical grounding:
 - Conatus (ℭ): Striving requires understanding intervention outcomes
 """
 
-from .causal_graph import CausalGraph, CausalNode, CausalEdge, Intervention
+from .causal_graph import CausalGraph, CausalNode, CausalEdge, Intervention, CompiledCausalModel
 from .vision_module import VisionModule
 from .physics_engine import PhysicsEngine
 from .world_model_orchestrator import WorldModelOrchestrator, WorldState
@@ -40,6 +40,7 @@ __all__ = [
     'CausalNode',
     'CausalEdge',
     'Intervention',
+    'CompiledCausalModel',
     'VisionModule',
     'PhysicsEngine',
     'WorldModelOrchestrator',
@@ -6,13 +6,20 @@ Implements do-calculus for interventional reasoning.
 
 Key insight: "If I do X, what happens?" ≠ "What happens when X occurs?"
 
+Interventions run against a compiled form of the graph (`CompiledCausalModel`):
+integer node ids, a coefficient matrix and a topological order grouped into
+generations, rebuilt only when nodes or edges change. A do-operation is then a
+mask override on that form rather than a copy of the networkx graph, and
+`CausalGraph.intervene_batch` evaluates many candidate interventions in one
+vectorized pass.
+
 Philosophical grounding:
 - ETHICA Part III, Prop VI: Understanding causation enables freedom
 - MATHEMATICA A3: Necessity = Causal necessity
 """
 
 import numpy as np
-from typing import Dict, List, Set, Optional, Tuple, Any
+from typing import Dict, List, Mapping, Set, Optional, Sequence, Tuple, Any, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import networkx as nx
@@ -103,6 +110,82 @@ class Intervention:
     timestamp: float = 0.0
 
 
+# One counterfactual for intervene_batch: a single do(), several joint do()s,
+# or a {variable: value} mapping
+InterventionSpec = Union[Intervention, Sequence[Intervention], Mapping[str, float]]
+
+
+class CompiledCausalModel:
+    """Array form of a causal graph's linear structural equations.
+
+    Node i's value is `sum_j weights[j, i] * x[j]` over its parents, or its
+    prior value if it has none. Generations group nodes whose parents all lie
+    in earlier generations, so each one is a single matrix product over a batch
+    of value rows.
+
+    Attributes:
+        names: Node names in id order.
+        index: Node name -> integer id.
+        weights: (n, n) coefficient matrix, `weights[cause, effect]`.
+        has_parents: Boolean mask of nodes with at least one incoming edge.
+        generations: Node ids per topological generation (roots first).
+    """
+
+    def __init__(self, graph: nx.DiGraph):
+        self.names: List[str] = list(graph.nodes())
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        n = len(self.names)
+
+        self.weights = np.zeros((n, n), dtype=np.float64)
+        for u, v, data in graph.edges(data=True):
+            self.weights[self.index[u], self.index[v]] = data.get('weight', 1.0)
+        self.has_parents = np.array([graph.in_degree(name) > 0 for name in self.names], dtype=bool)
+
+        try:
+            generations = [
+                np.array([self.index[name] for name in generation], dtype=np.intp)
+                for generation in nx.topological_generations(graph)
+            ]
+        except nx.NetworkXUnfeasible:
+            # Graph has cycle, use arbitrary order one node at a time
+            generations = [np.array([i], dtype=np.intp) for i in range(n)]
+        self.generations = generations
+
+        # Columns of the coefficient matrix each non-root generation reads
+        self._generation_weights = [
+            (ids, self.weights[:, ids]) for ids in generations
+            if self.has_parents[ids].any()
+        ]
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.names)
+
+    def evaluate(
+        self,
+        priors: np.ndarray,
+        mask: np.ndarray,
+        overrides: np.ndarray
+    ) -> np.ndarray:
+        """Propagates a batch of interventions through the structural equations.
+
+        Args:
+            priors: (n,) values used for nodes without parents.
+            mask: (batch, n) True where a node is intervened on.
+            overrides: (batch, n) intervened values (read where `mask` is True).
+
+        Returns:
+            A (batch, n) array of node values, one row per intervention.
+        """
+        # Roots take their prior; do() replaces a node's equation with a constant
+        values = np.where(mask, overrides, np.where(self.has_parents, 0.0, priors))
+        for ids, columns in self._generation_weights:
+            computed = values @ columns
+            computed = np.where(self.has_parents[ids], computed, priors[ids])
+            values[:, ids] = np.where(mask[:, ids], values[:, ids], computed)
+        return values
+
+
 class CausalGraph:
     """Implements a causal graph based on Judea Pearl's framework for causal inference.
 
@@ -130,6 +213,10 @@ class CausalGraph:
         # Intervention history for learning from surprise
         self.intervention_history: List[Tuple[Intervention, Dict[str, float]]] = []
 
+        # Compiled structural equations, rebuilt when nodes or edges change
+        self._compiled: Optional[CompiledCausalModel] = None
+        self._compiled_shape: Tuple[int, int] = (-1, -1)
+
     def add_node(self, name: str, value: Optional[float] = None) -> CausalNode:
         """Adds a node to the causal graph if it doesn't already exist.
 
@@ -144,6 +231,7 @@ class CausalGraph:
             node = CausalNode(name=name, value=value)
             self.nodes[name] = node
             self.graph.add_node(name)
+            self._compiled = None
         return self.nodes[name]
 
     def add_edge(self, cause_or_edge, effect: Optional[str] = None, strength: float = 1.0):
@@ -177,16 +265,65 @@ class CausalGraph:
             self.graph.add_edge(cause, effect, weight=strength)
             self.nodes[effect].add_parent(cause, strength)
             self.nodes[cause].add_child(effect)
+            self._compiled = None
         else:
             print(f"Warning: Adding {cause}→{effect} would create cycle. Skipped.")
 
+    def invalidate(self):
+        """Discards the compiled model after editing `self.graph` directly."""
+        self._compiled = None
+
+    def compile(self) -> CompiledCausalModel:
+        """Returns the compiled structural equations, rebuilding them if stale.
+
+        Structural edits through `add_node`/`add_edge` invalidate the cache; a
+        node or edge count that no longer matches also triggers a rebuild, so
+        direct edits to `self.graph` are picked up as well.
+        """
+        shape = (self.graph.number_of_nodes(), self.graph.number_of_edges())
+        if self._compiled is None or shape != self._compiled_shape:
+            self._compiled = CompiledCausalModel(self.graph)
+            self._compiled_shape = shape
+        return self._compiled
+
+    def _priors(self, model: CompiledCausalModel) -> np.ndarray:
+        """Current node values (None -> 0.0) in compiled id order."""
+        return np.fromiter(
+            (self.nodes[name].value or 0.0 for name in model.names),
+            dtype=np.float64,
+            count=model.num_nodes,
+        )
+
+    def _intervention_arrays(
+        self,
+        model: CompiledCausalModel,
+        interventions: Sequence[InterventionSpec]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Builds the (mask, overrides) arrays for a batch of interventions."""
+        mask = np.zeros((len(interventions), model.num_nodes), dtype=bool)
+        overrides = np.zeros((len(interventions), model.num_nodes), dtype=np.float64)
+        for row, spec in enumerate(interventions):
+            if isinstance(spec, Intervention):
+                pairs = [(spec.variable, spec.value)]
+            elif isinstance(spec, Mapping):
+                pairs = list(spec.items())
+            else:
+                pairs = [(item.variable, item.value) for item in spec]
+            for var, val in pairs:
+                if var not in model.index:
+                    raise nx.NetworkXError(f"The node {var} is not in the digraph.")
+                mask[row, model.index[var]] = True
+                overrides[row, model.index[var]] = val
+        return mask, overrides
+
     def intervene(self, intervention: Intervention) -> Dict[str, float]:
         """Performs a causal intervention using the do-operator.
 
         This is the core operation for causal reasoning. It simulates the effect
-        of forcing a variable to a specific value by creating a "mutilated" version
-        of the graph where all causal links into the intervened variable are severed.
-        It then propagates the effect of this intervention forward through the graph.
+        of forcing a variable to a specific value in the "mutilated" graph where
+        all causal links into the intervened variable are severed, then propagates
+        the effect of this intervention forward through the graph. The severing is
+        a mask over the compiled model, so the graph itself is never copied.
 
         Args:
             intervention: The `Intervention` object specifying the variable and value.
@@ -195,59 +332,33 @@ class CausalGraph:
             A dictionary of predicted values for all variables in the graph following
             the intervention.
         """
-        var = intervention.variable
-        val = intervention.value
+        return self.intervene_batch([intervention])[0]
 
-        # Create modified graph with intervention
-        intervened_graph = self.graph.copy()
-
-        # Remove incoming edges (this is the "do" operation)
-        incoming = list(intervened_graph.predecessors(var))
-        for parent in incoming:
-            intervened_graph.remove_edge(parent, var)
-
-        # Set intervened value
-        values = {var: val}
-
-        # Forward propagate through causal chain
-        values = self._forward_propagate(intervened_graph, values)
-
-        return values
-
-    def _forward_propagate(
+    def intervene_batch(
         self,
-        graph: nx.DiGraph,
-        initial_values: Dict[str, float]
-    ) -> Dict[str, float]:
-        """Propagates values forward through the causal graph respecting causal order."""
-        values = initial_values.copy()
+        interventions: Sequence[InterventionSpec],
+        as_array: bool = False
+    ) -> Union[List[Dict[str, float]], np.ndarray]:
+        """Evaluates many interventions in one vectorized pass.
 
-        # Get topological order (respects causation)
-        try:
-            topo_order = list(nx.topological_sort(graph))
-        except nx.NetworkXError:
-            # Graph has cycle, use arbitrary order
-            topo_order = list(graph.nodes())
-
-        for node_name in topo_order:
-            if node_name in values:
-                continue  # Already set (intervention or computed)
-
-            # Compute value from parents using causal function
-            parents = list(graph.predecessors(node_name))
-            if not parents:
-                # Root node with no value: use default or prior
-                values[node_name] = self.nodes[node_name].value or 0.0
-            else:
-                # Linear causal model: child = Σ(strength_i × parent_i)
-                node_val = 0.0
-                for parent in parents:
-                    if parent in values:
-                        weight = graph.edges[parent, node_name].get('weight', 1.0)
-                        node_val += weight * values[parent]
-                values[node_name] = node_val
+        Each entry is an independent counterfactual: an `Intervention`, a list of
+        interventions applied jointly, or a `{variable: value}` mapping. All of
+        them share the current node values as priors for root variables.
 
-        return values
+        Args:
+            interventions: The interventions to evaluate.
+            as_array: Return a (batch, n) array with columns in
+                `compile().names` order instead of one dict per intervention.
+
+        Returns:
+            The predicted values of every variable for each intervention.
+        """
+        model = self.compile()
+        mask, overrides = self._intervention_arrays(model, interventions)
+        values = model.evaluate(self._priors(model), mask, overrides)
+        if as_array:
+            return values
+        return [dict(zip(model.names, row)) for row in values.tolist()]
 
     def predict_intervention_outcome(
         self,
@@ -278,6 +389,31 @@ class CausalGraph:
 
         return outcome
 
+    def predict_intervention_outcomes(
+        self,
+        actions: Sequence[str],
+        state: Dict[str, float]
+    ) -> Dict[str, Dict[str, float]]:
+        """Batched `predict_intervention_outcome` for a set of candidate actions.
+
+        All candidates are evaluated against the same state in one pass over
+        the compiled model, which is what planning loops comparing many
+        actions should call.
+
+        Args:
+            actions: Names of the variables to intervene on, one per candidate.
+            state: A dictionary representing the current state of the world.
+
+        Returns:
+            A dictionary mapping each action to its predicted next state.
+        """
+        for var, val in state.items():
+            if var in self.nodes:
+                self.nodes[var].value = val
+
+        outcomes = self.intervene_batch([Intervention(variable=action, value=1.0) for action in actions])
+        return dict(zip(actions, outcomes))
+
     def counterfactual(
         self,
         actual_past: Dict[str, float],
@@ -14,10 +14,16 @@ Uses PyBullet:
 Philosophical grounding:
 - ETHICA Part II: Extension (physical) and Thought (mental) are parallel
 - Embodied cognition: Physical interaction grounds understanding
+
+The simplified simulator stores positions, velocities, masses and
+accumulated forces as (N, 3) / (N,) arrays and integrates every dynamic
+object in one array step. Collision detection uses a sweep-and-prune broad
+phase, and `simulate_interventions` runs K candidate interventions as one
+(K, N, 3) batch.
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 import json
@@ -99,9 +105,21 @@ class PhysicsEngine:
         self.time_step = time_step
         self.use_pybullet = use_pybullet
 
-        # Objects in simulation
+        # Objects in simulation. Each object's position and velocity are
+        # row views into the arrays below, which are the simulation state.
         self.objects: Dict[str, PhysicalObject] = {}
 
+        # Array state (rows in insertion order of `objects`)
+        self._names: List[str] = []
+        self._positions = np.zeros((0, 3))
+        self._velocities = np.zeros((0, 3))
+        self._forces = np.zeros((0, 3))
+        self._masses = np.zeros(0)
+        self._radii = np.zeros(0)
+        self._dynamic = np.zeros(0, dtype=bool)
+        self._position_views: List[np.ndarray] = []
+        self._velocity_views: List[np.ndarray] = []
+
         # PyBullet client (lazy loading)
         self._pybullet_client = None
 
@@ -151,15 +169,103 @@ class PhysicsEngine:
         """
         obj = PhysicalObject(
             name=name,
-            position=np.array(position),
-            velocity=np.array(velocity),
+            position=np.array(position, dtype=np.float64),
+            velocity=np.array(velocity, dtype=np.float64),
             mass=mass,
             shape=shape,
             size=size
         )
+
+        if name in self.objects:
+            index = self._names.index(name)
+        else:
+            index = len(self._names)
+            self._grow(index + 1)
+            self._names.append(name)
         self.objects[name] = obj
+        self._load_row(index, obj)
         return obj
 
+    def _grow(self, needed: int):
+        """Grows the state arrays to hold at least `needed` objects."""
+        capacity = len(self._masses)
+        if needed <= capacity:
+            return
+        capacity = max(16, 2 * capacity, needed)
+        for attr in ('_positions', '_velocities', '_forces', '_masses', '_radii', '_dynamic'):
+            old = getattr(self, attr)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, attr, new)
+
+        # Reallocation invalidated the objects' row views
+        self._position_views = [self._positions[i] for i in range(capacity)]
+        self._velocity_views = [self._velocities[i] for i in range(capacity)]
+        for index, name in enumerate(self._names):
+            obj = self.objects.get(name)
+            if obj is not None:
+                obj.position = self._position_views[index]
+                obj.velocity = self._velocity_views[index]
+
+    def _load_row(self, index: int, obj: PhysicalObject):
+        """Copies an object's state into row `index` and binds its views."""
+        position_view = self._position_views[index]
+        if obj.position is not position_view:
+            position_view[:] = obj.position
+            obj.position = position_view
+        velocity_view = self._velocity_views[index]
+        if obj.velocity is not velocity_view:
+            velocity_view[:] = obj.velocity
+            obj.velocity = velocity_view
+        if obj.forces:
+            self._forces[index] += np.sum(obj.forces, axis=0)
+            obj.forces = []
+        self._masses[index] = obj.mass
+        self._radii[index] = max(obj.size) / 2.0
+        self._dynamic[index] = obj.object_type != ObjectType.STATIC
+
+    def _sync_arrays(self) -> int:
+        """
+        Brings the array state up to date with `objects`.
+
+        Picks up objects added or removed through the dict, positions or
+        velocities that were reassigned rather than updated in place, forces
+        appended to `obj.forces`, and mass/size/type changes.
+
+        Returns:
+            The number of objects
+        """
+        names = list(self.objects)
+        if names != self._names:
+            kept = {name: i for i, name in enumerate(self._names)}
+            order = [kept.get(name) for name in names]
+            self._names = []
+            positions, velocities, forces = self._positions, self._velocities, self._forces
+            self._positions = np.zeros((0, 3))
+            self._velocities = np.zeros((0, 3))
+            self._forces = np.zeros((0, 3))
+            self._masses = np.zeros(0)
+            self._radii = np.zeros(0)
+            self._dynamic = np.zeros(0, dtype=bool)
+            self._grow(len(names))
+            for index, (name, old_index) in enumerate(zip(names, order)):
+                obj = self.objects[name]
+                if old_index is not None:
+                    self._forces[index] = forces[old_index]
+                obj.position = np.array(obj.position, dtype=np.float64)
+                obj.velocity = np.array(obj.velocity, dtype=np.float64)
+            self._names = names
+
+        for index, obj in enumerate(self.objects.values()):
+            self._load_row(index, obj)
+        return len(names)
+
+    def apply_force(self, obj_name: str, force: Sequence[float]):
+        """Applies a force to an object for the next simulation step."""
+        if obj_name in self.objects:
+            self._sync_arrays()
+            self._forces[self._names.index(obj_name)] += np.asarray(force, dtype=np.float64)
+
     def forward_simulate(
         self,
         steps: int = 100,
@@ -182,61 +288,96 @@ class PhysicsEngine:
         else:
             return self._forward_simulate_simple(steps, return_trajectory)
 
-    def _forward_simulate_simple(
+    def _integrate(
         self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        forces: np.ndarray,
         steps: int,
-        return_trajectory: bool
-    ) -> Dict[str, Any]:
-        """Performs a simplified physics simulation using basic Newtonian mechanics."""
-        trajectories = {name: [] for name in self.objects}
-
-        for step in range(steps):
-            for name, obj in self.objects.items():
-                # Skip static objects
-                if obj.object_type == ObjectType.STATIC:
-                    continue
+        record: bool = False
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Advances array state in place using basic Newtonian mechanics.
 
-                # Apply gravity
-                obj.acceleration = np.array([0, 0, self.gravity])
+        Arrays have shape (..., N, 3), so a leading batch axis simulates
+        several copies of the world at once. Static objects do not move.
+        Accumulated forces act for one step and are then cleared.
 
-                # Apply accumulated forces
-                for force in obj.forces:
-                    obj.acceleration += force / obj.mass
+        Returns:
+            (positions, velocities) per step, each (steps, ..., N, 3), if `record`
+        """
+        n = positions.shape[-2]
+        dynamic = self._dynamic[:n]
+        dynamic_col = dynamic[:, None].astype(np.float64)
+        masses = self._masses[:n]
+        inv_mass = np.divide(1.0, masses, out=np.zeros(n), where=masses != 0)[:, None]
 
-                # Update velocity: v = v + a*dt
-                obj.velocity += obj.acceleration * self.time_step
+        gravity_acc = np.zeros((n, 3))
+        gravity_acc[:, 2] = self.gravity
+        gravity_acc *= dynamic_col
+        displacement_scale = self.time_step * dynamic_col
 
-                # Update position: x = x + v*dt
-                obj.position += obj.velocity * self.time_step
+        if record:
+            position_history = np.empty((steps,) + positions.shape)
+            velocity_history = np.empty((steps,) + velocities.shape)
 
-                # Ground collision (simple)
-                if obj.position[2] < 0:
-                    obj.position[2] = 0
-                    obj.velocity[2] = -obj.velocity[2] * 0.5  # Bounce with damping
+        for step in range(steps):
+            if step == 0:
+                # Apply accumulated forces, then clear them
+                acceleration = gravity_acc + forces * inv_mass * dynamic_col
+                forces[..., dynamic, :] = 0.0
+            else:
+                acceleration = gravity_acc
+
+            # v = v + a*dt; x = x + v*dt
+            velocities += acceleration * self.time_step
+            positions += velocities * displacement_scale
+
+            # Ground collision (simple): bounce with damping
+            heights = positions[..., 2]
+            below = (heights < 0) & dynamic
+            if below.any():
+                heights[below] = 0.0
+                velocities[..., 2][below] *= -0.5
+
+            if record:
+                position_history[step] = positions
+                velocity_history[step] = velocities
+
+        if record:
+            return position_history, velocity_history
+        return None
+
+    def _final_states(self, positions: np.ndarray, velocities: np.ndarray) -> Dict[str, Dict[str, List[float]]]:
+        """Final-state dict for one copy of the world."""
+        return {
+            name: {'position': position, 'velocity': velocity}
+            for name, position, velocity in zip(self._names, positions.tolist(), velocities.tolist())
+        }
 
-                # Clear forces
-                obj.forces = []
+    def _forward_simulate_simple(
+        self,
+        steps: int,
+        return_trajectory: bool
+    ) -> Dict[str, Any]:
+        """Performs a simplified physics simulation using basic Newtonian mechanics."""
+        n = self._sync_arrays()
+        positions, velocities = self._positions[:n], self._velocities[:n]
 
-                # Record trajectory
-                if return_trajectory:
-                    trajectories[name].append({
-                        'step': step,
-                        'position': obj.position.copy(),
-                        'velocity': obj.velocity.copy()
-                    })
+        history = self._integrate(positions, velocities, self._forces[:n], steps, record=return_trajectory)
 
         if return_trajectory:
+            position_history, velocity_history = history
+            trajectories = {name: [] for name in self.objects}
+            for index in np.flatnonzero(self._dynamic[:n]):
+                trajectories[self._names[index]] = [
+                    {'step': step, 'position': position, 'velocity': velocity}
+                    for step, (position, velocity) in enumerate(zip(
+                        position_history[:, index], velocity_history[:, index]
+                    ))
+                ]
             return {'trajectories': trajectories}
         else:
-            return {
-                'final_states': {
-                    name: {
-                        'position': obj.position.tolist(),
-                        'velocity': obj.velocity.tolist()
-                    }
-                    for name, obj in self.objects.items()
-                }
-            }
+            return {'final_states': self._final_states(positions, velocities)}
 
     def _forward_simulate_pybullet(
         self,
@@ -334,26 +475,88 @@ class PhysicsEngine:
             A dictionary representing the predicted final state of the system.
         """
         # Apply intervention
-        if intervention == "apply_force":
-            obj_name = intervention_params['object']
-            force = np.array(intervention_params['force'])
-            if obj_name in self.objects:
-                self.objects[obj_name].forces.append(force)
+        if self.use_pybullet:
+            self._apply_intervention_to_objects(intervention, intervention_params)
+        else:
+            n = self._sync_arrays()
+            self._apply_intervention(
+                intervention, intervention_params,
+                self._positions[:n], self._velocities[:n], self._forces[:n]
+            )
+
+        # Simulate forward
+        return self.forward_simulate(steps, return_trajectory=False)
 
+    def _apply_intervention_to_objects(self, intervention: str, intervention_params: Dict[str, Any]):
+        """Applies an intervention through the PhysicalObject attributes."""
+        obj = self.objects.get(intervention_params.get('object'))
+        if obj is None:
+            return
+        if intervention == "apply_force":
+            obj.forces.append(np.array(intervention_params['force'], dtype=np.float64))
         elif intervention == "set_velocity":
-            obj_name = intervention_params['object']
-            velocity = np.array(intervention_params['velocity'])
-            if obj_name in self.objects:
-                self.objects[obj_name].velocity = velocity
+            obj.velocity = np.array(intervention_params['velocity'], dtype=np.float64)
+        elif intervention == "teleport":
+            obj.position = np.array(intervention_params['position'], dtype=np.float64)
+
+    def _apply_intervention(
+        self,
+        intervention: str,
+        intervention_params: Dict[str, Any],
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        forces: np.ndarray
+    ):
+        """Applies an intervention to one copy of the array state."""
+        obj_name = intervention_params.get('object')
+        if obj_name not in self.objects:
+            return
+        index = self._names.index(obj_name)
 
+        if intervention == "apply_force":
+            forces[index] += np.asarray(intervention_params['force'], dtype=np.float64)
+        elif intervention == "set_velocity":
+            velocities[index] = intervention_params['velocity']
         elif intervention == "teleport":
-            obj_name = intervention_params['object']
-            position = np.array(intervention_params['position'])
-            if obj_name in self.objects:
-                self.objects[obj_name].position = position
+            positions[index] = intervention_params['position']
 
-        # Simulate forward
-        return self.forward_simulate(steps, return_trajectory=False)
+    def simulate_interventions(
+        self,
+        interventions: Sequence[Tuple[str, Dict[str, Any]]],
+        steps: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Predicts the outcomes of K candidate interventions in one batched simulation.
+
+        Each candidate is applied to its own copy of the current state and all
+        K copies are integrated together as (K, N, 3) arrays. Unlike
+        `predict_intervention_outcome`, the engine's own state is not changed.
+
+        Args:
+            interventions: (intervention, intervention_params) pairs, as accepted
+                           by `predict_intervention_outcome`.
+            steps: The number of simulation steps to run after each intervention.
+
+        Returns:
+            One `{'final_states': ...}` dict per candidate, in input order.
+        """
+        n = self._sync_arrays()
+        k = len(interventions)
+        if k == 0:
+            return []
+
+        positions = np.repeat(self._positions[None, :n], k, axis=0)
+        velocities = np.repeat(self._velocities[None, :n], k, axis=0)
+        forces = np.repeat(self._forces[None, :n], k, axis=0)
+
+        for candidate, (intervention, params) in enumerate(interventions):
+            self._apply_intervention(intervention, params, positions[candidate], velocities[candidate], forces[candidate])
+
+        self._integrate(positions, velocities, forces, steps)
+
+        return [
+            {'final_states': self._final_states(positions[candidate], velocities[candidate])}
+            for candidate in range(k)
+        ]
 
     def check_stability(self) -> Dict[str, bool]:
         """Checks if the current configuration of objects is physically stable.
@@ -386,15 +589,49 @@ class PhysicsEngine:
             A list of tuples, where each tuple contains the names of two
             colliding objects.
         """
-        collisions = []
+        n = self._sync_arrays()
+        if n < 2:
+            return []
+
+        first, second = self._broad_phase(n)
+
+        # Narrow phase: bounding spheres
+        positions, radii = self._positions[:n], self._radii[:n]
+        delta = positions[first] - positions[second]
+        distances = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+        hits = distances < radii[first] + radii[second]
 
-        objects_list = list(self.objects.values())
-        for i, obj1 in enumerate(objects_list):
-            for obj2 in objects_list[i+1:]:
-                if self._check_collision(obj1, obj2):
-                    collisions.append((obj1.name, obj2.name))
+        first, second = first[hits], second[hits]
+        order = np.lexsort((second, first))
+        return [(self._names[i], self._names[j]) for i, j in zip(first[order].tolist(), second[order].tolist())]
 
-        return collisions
+    def _broad_phase(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Sweep-and-prune candidate pairs (i < j) whose bounding intervals overlap.
+
+        Objects are sorted by the lower end of their bounding interval along
+        the axis with the widest spread of centers; each object is paired only
+        with the objects whose interval starts before its own ends.
+        """
+        positions, radii = self._positions[:n], self._radii[:n]
+        axis = int(np.argmax(positions.var(axis=0)))
+        lower = positions[:, axis] - radii
+        upper = positions[:, axis] + radii
+
+        order = np.argsort(lower, kind='stable')
+        lower_sorted = lower[order]
+        ends = np.searchsorted(lower_sorted, upper[order], side='left')
+        counts = np.maximum(ends - np.arange(n) - 1, 0)
+
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        sweep = np.repeat(np.arange(n), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        a = order[sweep]
+        b = order[sweep + 1 + offsets]
+        return np.minimum(a, b), np.maximum(a, b)
 
     def _check_collision(
         self,
@@ -463,11 +700,12 @@ class PhysicsEngine:
         Returns:
             The total energy in Joules.
         """
-        total = 0.0
-        for name in self.objects:
-            total += self.compute_kinetic_energy(name)
-            total += self.compute_potential_energy(name)
-        return total
+        n = self._sync_arrays()
+        masses = self._masses[:n]
+        velocities = self._velocities[:n]
+        kinetic = 0.5 * masses * np.einsum('ij,ij->i', velocities, velocities)
+        potential = masses * abs(self.gravity) * self._positions[:n, 2]
+        return float(kinetic.sum() + potential.sum())
 
     def predict_trajectory(
         self,
@@ -493,27 +731,23 @@ class PhysicsEngine:
 
         # Number of steps
         steps = int(time_horizon / self.time_step)
+        if steps <= 0:
+            return []
 
-        # Simple ballistic trajectory (assuming no forces except gravity)
-        positions = []
-        pos = obj.position.copy()
-        vel = obj.velocity.copy()
-
-        for _ in range(steps):
-            # Update velocity (gravity)
-            vel[2] += self.gravity * self.time_step
-
-            # Update position
-            pos += vel * self.time_step
-
-            # Stop at ground
-            if pos[2] < 0:
-                pos[2] = 0
-                break
+        # Simple ballistic trajectory (assuming no forces except gravity),
+        # closed form of the semi-implicit Euler steps:
+        #   x_k = x_0 + dt * (k * v_0 + g * dt * k(k+1)/2 * e_z)
+        dt = self.time_step
+        k = np.arange(1, steps + 1, dtype=np.float64)[:, None]
+        positions = np.asarray(obj.position, dtype=np.float64) + dt * k * np.asarray(obj.velocity, dtype=np.float64)
+        positions[:, 2] += self.gravity * dt * dt * k[:, 0] * (k[:, 0] + 1) / 2.0
 
-            positions.append(pos.copy())
+        # Stop at ground
+        below = np.flatnonzero(positions[:, 2] < 0)
+        if len(below):
+            positions = positions[:below[0]]
 
-        return positions
+        return list(positions)
 
     def inverse_physics(
         self,
@@ -562,6 +796,8 @@ class PhysicsEngine:
         """Resets the simulation by removing all objects."""
         self.objects.clear()
         self.collision_pairs.clear()
+        self._names = []
+        self._forces[:] = 0.0
 
     def to_dict(self) -> Dict[str, Any]:
         """Serializes the current state of the physics engine to a dictionary.
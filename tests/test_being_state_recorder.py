@@ -0,0 +1,86 @@
+"""Tests for the columnar BeingState recorder and CoherenceEngine history."""
+
+import numpy as np
+import pytest
+
+from singularis.core.being_state import BeingState
+from singularis.core.being_state_recorder import (
+    BeingStateRecorder,
+    ColumnarRingBuffer,
+    rolling_mean,
+    scalar_fields,
+)
+from singularis.core.coherence_engine import CoherenceEngine
+
+
+def _state(cycle: int) -> BeingState:
+    state = BeingState(cycle_number=cycle, timestamp=1000.0 + cycle)
+    state.global_coherence = cycle / 100.0
+    state.lumina.ontic = 0.5
+    return state
+
+
+def test_scalar_fields_cover_metrics_and_skip_containers():
+    columns = scalar_fields()
+    assert 'global_coherence' in columns
+    assert 'lumina_ontic' in columns
+    assert 'gwm_loot_available' in columns
+    assert 'game_state' not in columns
+    assert 'current_goal' not in columns
+
+
+def test_ring_buffer_keeps_latest_rows_in_order():
+    buffer = ColumnarRingBuffer(('a', 'b'), capacity=4)
+    for i in range(10):
+        buffer.append((i, -i))
+
+    assert len(buffer) == 4
+    assert buffer.column('a').tolist() == [6, 7, 8, 9]
+    assert buffer.column('b', last_n=2).tolist() == [-8, -9]
+
+
+def test_windowed_queries():
+    recorder = BeingStateRecorder(capacity=64, chunk_size=16)
+    for cycle in range(50):
+        recorder.record(_state(cycle))
+
+    assert recorder.trend('global_coherence', last_n=10) == pytest.approx(0.01)
+    assert recorder.rolling_mean('global_coherence', 5, last_n=6).tolist() == pytest.approx([0.46, 0.47])
+    assert recorder.percentiles('cycle_number', q=(50,))[50] == pytest.approx(24.5)
+    assert recorder.summary(['lumina_ontic'])['lumina_ontic']['mean'] == pytest.approx(0.5)
+
+
+def test_spill_and_replay(tmp_path):
+    recorder = BeingStateRecorder(capacity=8, chunk_size=4, spill_dir=tmp_path)
+    for cycle in range(10):
+        recorder.record(_state(cycle))
+    recorder.close()
+
+    assert recorder.chunks_written == 3  # 4 + 4 + final 2
+    session = BeingStateRecorder.load_session(tmp_path, columns=['cycle_number'])
+    assert session['cycle_number'].tolist() == list(range(10))
+
+    rows = list(BeingStateRecorder.replay(tmp_path, columns=['cycle_number', 'global_coherence']))
+    assert len(rows) == 10
+    assert rows[3] == {'cycle_number': 3.0, 'global_coherence': 0.03}
+
+
+def test_rolling_mean_short_input():
+    assert len(rolling_mean(np.arange(3.0), 5)) == 0
+
+
+def test_coherence_engine_history_and_recorder():
+    recorder = BeingStateRecorder(capacity=32, chunk_size=8)
+    engine = CoherenceEngine(verbose=False, recorder=recorder)
+    states = [_state(cycle) for cycle in range(12)]
+    for state in states:
+        engine.compute(state)
+
+    assert len(engine.coherence_history) == 12
+    assert engine.coherence_history[0][0] == 1000.0
+    assert engine.get_trend() == "stable"
+    assert engine.get_stats()['samples'] == 12
+    assert len(recorder) == 12
+    assert recorder.window('global_coherence')[-1] == pytest.approx(engine.coherence_history[-1][1])
+    # compute() records the value without writing it back into the caller's state
+    assert states[-1].global_coherence == pytest.approx(0.11)
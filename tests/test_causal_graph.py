@@ -0,0 +1,117 @@
+"""Tests for compiled CausalGraph interventions and batched counterfactuals."""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from singularis.world_model.causal_graph import CausalGraph, Intervention
+
+
+def _reference_intervene(graph: CausalGraph, interventions):
+    """Graph-copy do() with per-node propagation the compiled path must match."""
+    mutilated = graph.graph.copy()
+    values = {}
+    for intervention in interventions:
+        for parent in list(mutilated.predecessors(intervention.variable)):
+            mutilated.remove_edge(parent, intervention.variable)
+        values[intervention.variable] = intervention.value
+
+    for name in nx.topological_sort(mutilated):
+        if name in values:
+            continue
+        parents = list(mutilated.predecessors(name))
+        if not parents:
+            values[name] = graph.nodes[name].value or 0.0
+        else:
+            values[name] = sum(mutilated.edges[p, name]['weight'] * values[p] for p in parents)
+    return values
+
+
+def _random_graph(n=30, edges=80, seed=0):
+    rng = np.random.default_rng(seed)
+    graph = CausalGraph()
+    for i in range(n):
+        graph.add_node(f"v{i}", float(rng.normal()) if i % 3 else None)
+    for _ in range(edges):
+        a, b = sorted(rng.choice(n, size=2, replace=False))
+        graph.add_edge(f"v{a}", f"v{b}", strength=float(rng.uniform(-1, 1)))
+    return graph
+
+
+def test_intervene_matches_graph_copy():
+    graph = _random_graph()
+    for i in range(0, 30, 4):
+        intervention = Intervention(variable=f"v{i}", value=2.5)
+        expected = _reference_intervene(graph, [intervention])
+        actual = graph.intervene(intervention)
+        assert actual.keys() == expected.keys()
+        for name in expected:
+            assert actual[name] == pytest.approx(expected[name])
+
+
+def test_intervene_batch_matches_single_interventions():
+    graph = _random_graph(seed=1)
+    specs = [
+        Intervention(variable="v3", value=1.0),
+        [Intervention(variable="v0", value=-1.0), Intervention(variable="v10", value=4.0)],
+        {"v5": 0.5, "v20": -2.0},
+    ]
+    batch = graph.intervene_batch(specs)
+
+    expected = [
+        _reference_intervene(graph, [specs[0]]),
+        _reference_intervene(graph, specs[1]),
+        _reference_intervene(graph, [Intervention(k, v) for k, v in specs[2].items()]),
+    ]
+    for actual, reference in zip(batch, expected):
+        for name in reference:
+            assert actual[name] == pytest.approx(reference[name])
+
+    array = graph.intervene_batch(specs, as_array=True)
+    names = graph.compile().names
+    assert array.shape == (3, len(names))
+    assert array[0, names.index("v3")] == 1.0
+
+
+def test_compiled_model_is_cached_until_structure_changes():
+    graph = _random_graph(n=5, edges=4)
+    compiled = graph.compile()
+    graph.intervene(Intervention(variable="v0", value=1.0))
+    graph.nodes["v0"].value = 3.0
+    assert graph.compile() is compiled
+
+    graph.add_edge("v0", "v4", strength=0.5)
+    assert graph.compile() is not compiled
+
+    # Direct edits to the networkx graph are detected by size
+    compiled = graph.compile()
+    graph.graph.remove_edge(*next(iter(graph.graph.edges())))
+    assert graph.compile() is not compiled
+
+
+def test_priors_read_at_evaluation_time():
+    graph = CausalGraph()
+    graph.add_edge("a", "c", strength=2.0)
+    graph.add_edge("b", "c", strength=1.0)
+    graph.nodes["b"].value = 1.0
+    assert graph.intervene(Intervention("a", 1.0))["c"] == pytest.approx(3.0)
+    graph.nodes["b"].value = 5.0
+    assert graph.intervene(Intervention("a", 1.0))["c"] == pytest.approx(7.0)
+
+
+def test_intervention_on_unknown_variable_raises():
+    graph = _random_graph(n=4, edges=2)
+    with pytest.raises(nx.NetworkXError):
+        graph.intervene(Intervention(variable="missing", value=1.0))
+
+
+def test_predict_intervention_outcomes_batches_candidates():
+    graph = CausalGraph()
+    graph.add_edge("study", "knowledge", strength=0.8)
+    graph.add_edge("sleep", "knowledge", strength=0.5)
+    graph.add_edge("knowledge", "coherence", strength=0.9)
+
+    outcomes = graph.predict_intervention_outcomes(["study", "sleep"], {"study": 0.0, "sleep": 0.0})
+    assert outcomes["study"]["coherence"] == pytest.approx(0.72)
+    assert outcomes["sleep"]["coherence"] == pytest.approx(0.45)
+    assert outcomes["study"] == graph.predict_intervention_outcome("study", {})
@@ -0,0 +1,90 @@
+"""Tests for the shared text-analysis frame used by ConsciousnessMeasurement."""
+
+from singularis.consciousness.measurement import (
+    TRACE_DTYPE,
+    TRACE_FIELDS,
+    ConsciousnessMeasurement,
+    MarkerAutomaton,
+    TextAnalysis,
+    analyze_text,
+    batch_to_traces,
+)
+
+
+TEXT = (
+    "I realize this is a fundamental concept. However, the example shows that "
+    "awareness is key. Therefore awareness emerges from the concept."
+)
+
+
+def _naive_connectivity(sentences):
+    sets = [set(s.lower().split()) for s in sentences]
+    total, pairs = 0.0, 0
+    for i in range(len(sets)):
+        for j in range(i + 1, len(sets)):
+            union = len(sets[i] | sets[j])
+            if union:
+                total += len(sets[i] & sets[j]) / union
+                pairs += 1
+    return total / pairs if pairs else 0.0
+
+
+def _naive_topic_consistency(sentences):
+    topic_words = [w for w in set(' '.join(sentences).lower().split()) if len(w) > 4]
+    if not topic_words:
+        return 0.5
+    repeated = sum(
+        1 for w in topic_words if sum(1 for s in sentences if w in s.lower()) > 1
+    )
+    return repeated / len(topic_words)
+
+
+def test_frame_matches_naive_computation():
+    frame = TextAnalysis.from_content(TEXT)
+
+    assert frame.sentences == [s.strip() for s in TEXT.split('.') if s.strip()]
+    assert abs(frame.connectivity - _naive_connectivity(frame.sentences)) < 1e-12
+    assert abs(frame.topic_consistency - _naive_topic_consistency(frame.sentences)) < 1e-12
+    assert frame.marker_counts['hot'] == 2  # "i realize", "awareness"
+    assert frame.marker_counts['perspectives'] == 1  # "however"
+
+
+def test_analyze_text_is_memoized():
+    assert analyze_text(TEXT) is analyze_text(TEXT)
+
+
+def test_repeated_measure_reuses_trace():
+    first = ConsciousnessMeasurement().measure(TEXT, confidence=0.7)
+    second = ConsciousnessMeasurement().measure(TEXT, confidence=0.7)
+
+    assert second.overall_consciousness == first.overall_consciousness
+    assert second.iit_phi == first.iit_phi
+    assert second.timestamp >= first.timestamp
+
+
+def test_marker_automaton_handles_prefix_markers():
+    automaton = MarkerAutomaton({'a': ['real', 'realization'], 'b': ['aware of', 'awareness']})
+    counts = automaton.count(["a realization", "awareness of", "nothing"])
+
+    assert counts['a'].tolist() == [2, 0, 0]
+    assert counts['b'].tolist() == [0, 1, 0]
+
+
+def test_measure_batch_matches_measure():
+    contents = [
+        TEXT,
+        "",
+        "Single sentence about physical touch",
+        "First we act. Second we observe the unexpected paradox. Finally it becomes clear.",
+    ]
+    confidences = [0.9, 0.5, 0.2, 0.6]
+    measurement = ConsciousnessMeasurement()
+
+    scores = measurement.measure_batch(contents, confidences=confidences)
+
+    assert scores.dtype == TRACE_DTYPE
+    assert len(scores) == len(contents)
+    for content, confidence, trace in zip(contents, confidences, batch_to_traces(scores)):
+        expected = measurement.measure(content, confidence=confidence)
+        for name in TRACE_FIELDS:
+            assert abs(getattr(trace, name) - getattr(expected, name)) < 1e-9, name
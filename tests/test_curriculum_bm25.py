@@ -0,0 +1,99 @@
+"""
+Curriculum RAG BM25 Index Tests
+
+Tests inverted-index retrieval, category filters and index persistence.
+"""
+
+import json
+
+import pytest
+
+from singularis.skyrim.curriculum_rag import BM25Index, CurriculumRAG, tokenize
+
+
+TEXTS = {
+    ("philosophy", "stoic_ethics"): "Virtue is the only good. The stoic accepts fate and acts with courage. " * 20,
+    ("natural_sciences", "thermodynamics"): "Entropy always increases in an isolated system. Energy is conserved. " * 20,
+    ("natural_sciences", "evolution_theory"): "Natural selection favours traits that improve survival and reproduction. " * 20,
+    ("psychology", "courage_and_fear"): "Fear narrows attention while courage broadens options for action. " * 20,
+}
+
+
+@pytest.fixture
+def curriculum(tmp_path):
+    for (category, text_id), content in TEXTS.items():
+        category_dir = tmp_path / category
+        category_dir.mkdir(exist_ok=True)
+        (category_dir / f"{text_id}.txt").write_text(content, encoding="utf-8")
+    manifest = {"completed": [text_id for _, text_id in TEXTS]}
+    (tmp_path / "curriculum_manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    return tmp_path
+
+
+class TestBM25Index:
+
+    def test_tokenize_filters_short_and_stop_words(self):
+        assert tokenize("The Entropy of an isolated system, with heat!") == ["entropy", "isolated", "system", "heat"]
+
+    def test_scores_only_matching_chunks(self):
+        index = BM25Index()
+        index.add_chunk("entropy entropy heat", "Science")
+        index.add_chunk("virtue courage", "Philosophy")
+        index.add_chunk("entropy virtue", "Philosophy")
+
+        scores = index.score(["entropy"])
+        assert set(scores) == {0, 2}
+        assert scores[0] > scores[2]
+
+        filtered = index.score(["entropy"], categories={"Philosophy"})
+        assert set(filtered) == {2}
+
+
+class TestCurriculumRetrieval:
+
+    def test_retrieves_relevant_document(self, curriculum):
+        rag = CurriculumRAG(curriculum_path=str(curriculum), chunk_size=500)
+        rag.initialize()
+
+        results = rag.retrieve_knowledge("What does entropy mean for energy?", top_k=2)
+        assert results
+        assert results[0].document.text_id == "thermodynamics"
+        assert 0.0 < results[0].relevance_score <= 1.0
+
+    def test_category_filter(self, curriculum):
+        rag = CurriculumRAG(curriculum_path=str(curriculum), chunk_size=500)
+        rag.initialize()
+
+        results = rag.retrieve_knowledge("courage in action", top_k=3, categories=["Psychology"])
+        assert [r.document.text_id for r in results] == ["courage_and_fear"]
+
+    def test_index_persisted_and_reused(self, curriculum):
+        first = CurriculumRAG(curriculum_path=str(curriculum), chunk_size=500)
+        first.initialize()
+        assert not first.index_loaded_from_disk
+        assert (curriculum / ".bm25_index.json").exists()
+
+        second = CurriculumRAG(curriculum_path=str(curriculum), chunk_size=500)
+        second.initialize()
+        assert second.index_loaded_from_disk
+        assert second.index.postings == first.index.postings
+
+        query = "natural selection and survival"
+        assert [r.document.text_id for r in second.retrieve_knowledge(query)] == \
+            [r.document.text_id for r in first.retrieve_knowledge(query)]
+
+    def test_index_rebuilt_when_settings_change(self, curriculum):
+        CurriculumRAG(curriculum_path=str(curriculum), chunk_size=500).initialize()
+
+        rag = CurriculumRAG(curriculum_path=str(curriculum), chunk_size=300)
+        rag.initialize()
+        assert not rag.index_loaded_from_disk
+        assert rag.index.num_chunks == len(rag.document_chunks)
+
+    def test_augment_prompt(self, curriculum):
+        rag = CurriculumRAG(curriculum_path=str(curriculum), chunk_size=500)
+        rag.initialize()
+
+        prompt = rag.augment_prompt_with_knowledge("Should I fight?", knowledge_query="stoic virtue and courage")
+        assert "[RELEVANT ACADEMIC KNOWLEDGE]" in prompt
+        assert "Stoic Ethics" in prompt
@@ -0,0 +1,112 @@
+"""Tests for concurrent, budgeted offspring mutation in DarwinianModalLogic."""
+
+import asyncio
+import time
+
+import pytest
+
+from singularis.evolution.darwinian_modal_logic import DarwinianModalLogic, PossibleWorld
+
+
+class StubMutator:
+    """Gemini stand-in with a fixed latency per call."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, prompt: str, temperature: float = 0.0, max_tokens: int = 0) -> str:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        return f"strategy {self.calls}"
+
+
+def _populate(logic: DarwinianModalLogic, size: int):
+    logic.population_size = size
+    logic.mutation_rate = 1.0  # Every offspring goes through the mutator
+    for i in range(size):
+        world = PossibleWorld(
+            world_id=f"world_{i}",
+            state={"strategy": "explore"},
+            coherence=i / size,
+            survival_score=0.1 + i / size,
+        )
+        logic.worlds[world.world_id] = world
+    logic.total_worlds_created = size
+
+
+@pytest.mark.asyncio
+async def test_generation_takes_about_one_mutation_latency():
+    latency = 0.2
+    stub = StubMutator(latency)
+    logic = DarwinianModalLogic(stub, mutation_concurrency=64, generation_time_budget=5.0)
+    _populate(logic, 50)
+    logic.selection_pressure = 0.02  # One survivor parents 49 offspring
+
+    start = time.perf_counter()
+    await logic.natural_selection()
+    elapsed = time.perf_counter() - start
+
+    assert stub.calls == 49
+    assert stub.max_in_flight == 49
+    assert elapsed < 3 * latency  # Sequential would be 50 * latency
+    assert len(logic.worlds) == 50
+    assert logic.mutation_fallbacks == 0
+    assert sum(w.state["strategy"].startswith("strategy") for w in logic.worlds.values()) == 49
+    # Default accessibility: every world sees every other, and no stale ids
+    for world in logic.worlds.values():
+        assert world.accessible_worlds == set(logic.worlds) - {world.world_id}
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_respected():
+    stub = StubMutator(0.05)
+    logic = DarwinianModalLogic(stub, mutation_concurrency=4, generation_time_budget=None)
+    _populate(logic, 20)
+    logic.selection_pressure = 0.5
+
+    await logic.natural_selection()
+
+    assert stub.calls == 10
+    assert stub.max_in_flight == 4
+    assert len(logic.worlds) == 20
+
+
+@pytest.mark.asyncio
+async def test_offspring_missing_the_budget_fall_back_to_local_mutation():
+    stub = StubMutator(5.0)
+    logic = DarwinianModalLogic(stub, mutation_concurrency=8, generation_time_budget=0.1)
+    _populate(logic, 10)
+    logic.selection_pressure = 0.5
+
+    start = time.perf_counter()
+    await logic.natural_selection()
+
+    assert time.perf_counter() - start < 1.0
+    assert len(logic.worlds) == 10
+    assert logic.mutation_fallbacks == 5
+    offspring = [w for w in logic.worlds.values() if w.parent_world_id]
+    assert len(offspring) == 5
+    assert all(w.state["strategy"] == "explore" for w in offspring)
+    assert all("Local mutation" in w.mutations[-1] for w in offspring)
+    await asyncio.sleep(0)
+    assert stub.in_flight == 0  # Late mutations were cancelled
+
+
+def test_accessibility_radius_uses_feature_distance():
+    logic = DarwinianModalLogic(None, accessibility_radius=0.15)
+    for world_id, coherence in (("a", 0.0), ("b", 0.1), ("c", 1.0)):
+        logic.worlds[world_id] = PossibleWorld(world_id=world_id, state={}, coherence=coherence)
+
+    logic.update_accessibility()
+
+    assert logic.worlds["a"].accessible_worlds == {"b"}
+    assert logic.worlds["b"].accessible_worlds == {"a"}
+    assert logic.worlds["c"].accessible_worlds == set()
@@ -0,0 +1,115 @@
+"""Tests for sparse propagation and Hebbian learning in the DATA-Brain swarm."""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from singularis.data_brain.sparse_graph import SparseSwarmGraph
+from singularis.data_brain.swarm_intelligence import MicroAgent, AgentRole, SwarmIntelligence
+
+
+def _reference_step(agents):
+    """Dict-based propagation step (the original per-agent loop)."""
+    new = {}
+    for agent_id, agent in agents.items():
+        total = sum(w * agents[n].activation for n, w in agent.connections.items())
+        new[agent_id] = 1.0 / (1.0 + math.exp(-total))
+    for agent_id, value in new.items():
+        agents[agent_id].activation = value
+
+
+def _random_agents(n, seed=0):
+    rng = random.Random(seed)
+    agents = {i: MicroAgent(agent_id=i, role=AgentRole.SYNTHESIS, activation=rng.random()) for i in range(n)}
+    for i in range(n):
+        for j in rng.sample(range(n), 3):
+            if j != i:
+                w = rng.uniform(-0.5, 0.5)
+                agents[i].connections[j] = w
+                agents[j].connections[i] = w
+    return agents
+
+
+def test_propagation_matches_dict_reference():
+    agents = _random_agents(40)
+    graph = SparseSwarmGraph.from_connections(40, ((i, a.connections) for i, a in agents.items()))
+    activations = np.array([agents[i].activation for i in range(40)])
+
+    for _ in range(3):
+        _reference_step(agents)
+    result = graph.propagate(activations, iterations=3)
+
+    assert np.allclose(result, [agents[i].activation for i in range(40)], atol=1e-12)
+
+
+def test_hebbian_matches_pairwise_updates():
+    agents = _random_agents(30, seed=1)
+    graph = SparseSwarmGraph.from_connections(30, ((i, a.connections) for i, a in agents.items()))
+    activations = np.array([agents[i].activation for i in range(30)])
+
+    active = [i for i in range(30) if activations[i] > 0.5]
+    for x, i in enumerate(active):
+        for j in active[x + 1:]:
+            corr = activations[i] * activations[j]
+            agents[i].hebbian_update(j, corr, 0.05)
+            agents[j].hebbian_update(i, corr, 0.05)
+
+    pairs, changed = graph.hebbian_update(activations, learning_rate=0.05)
+    assert pairs == len(active) * (len(active) - 1) // 2
+    for i in range(30):
+        row = graph.row(i)
+        assert set(row) == set(agents[i].connections)
+        assert all(row[k] == pytest.approx(agents[i].connections[k]) for k in row)
+
+
+def test_masked_hebbian_keeps_topology():
+    agents = _random_agents(30, seed=2)
+    graph = SparseSwarmGraph.from_connections(30, ((i, a.connections) for i, a in agents.items()))
+    nnz = graph.weights.nnz
+    before = graph.weights.copy()
+
+    pairs, _ = graph.hebbian_update(np.full(30, 0.9), learning_rate=0.05, grow_limit=4)
+    assert graph.weights.nnz == nnz  # No new connections above the growth limit
+    assert pairs == nnz // 2
+    assert np.all(graph.weights.data >= before.data)
+
+
+@pytest.mark.asyncio
+async def test_batch_evaluation_is_read_only_and_matches_single():
+    random.seed(3)
+    swarm = SwarmIntelligence(num_agents=64, topology="random")
+    snapshot = swarm.activations.copy()
+    edges = swarm.graph.weights.copy()
+
+    queries = ["why should we plan", "remember my past", "hello"]
+    batch = swarm.evaluate_batch(queries)
+    assert np.array_equal(swarm.activations, snapshot)
+    assert (swarm.graph.weights != edges).nnz == 0
+
+    for query, decision in zip(queries, batch):
+        single = swarm.evaluate_batch([query])[0]
+        assert decision['recommended_experts'] == single['recommended_experts']
+        assert decision['confidence'] == pytest.approx(single['confidence'])
+
+    result = await swarm.process_query(queries[0], {})
+    assert result['recommended_experts'] == batch[0]['recommended_experts']
+    # Agents mirror the array state after a query
+    assert swarm.agents[0].activation == swarm.activations[0]
+    for agent_id in (0, 17, 63):
+        assert dict(swarm.agents[agent_id].connections) == swarm.graph.row(agent_id)
+
+
+def test_hand_edited_connections_reach_graph():
+    random.seed(5)
+    swarm = SwarmIntelligence(num_agents=32, topology="random")
+    target = next(j for j in range(1, 32) if j not in swarm.agents[0].connections)
+
+    swarm.agents[0].connections[target] = 0.5
+    swarm.agents[target].connections[0] = 0.5
+    assert target not in swarm.graph.row(0)  # Edits wait for rebuild_graph()
+
+    swarm.rebuild_graph()
+    assert swarm.graph.row(0)[target] == pytest.approx(0.5)
+    assert swarm.agents[0].connections[target] == pytest.approx(0.5)
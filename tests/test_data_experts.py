@@ -0,0 +1,155 @@
+"""Tests for the DATA expert system: shared-base adapter host and generation executor."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from singularis.data import experts
+from singularis.data.experts import ExpertConfig, SharedBaseModelHost
+from singularis.data.generation import GenerationExecutor, GenerationRequest
+
+
+class FakeAdapterModel:
+    """Stands in for a PeftModel: records adapter switches."""
+
+    def __init__(self):
+        self.active = None
+        self.switches = []
+
+    def set_adapter(self, name):
+        self.active = name
+        self.switches.append(name)
+
+    def add_adapter(self, name, config):
+        pass  # PEFT adds adapters without activating them
+
+
+def _host(model):
+    host = SharedBaseModelHost("base", device="cpu")
+    host.model = model
+    host.is_loaded = True
+    return host
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_grouped_by_adapter():
+    model = FakeAdapterModel()
+    host = _host(model)
+    calls = []
+
+    def call(tag):
+        calls.append((model.active, tag))
+        return tag
+
+    requests = [("a", 1), ("b", 2), ("a", 3), ("b", 4), ("a", 5)]
+    results = await asyncio.gather(*(host.run(name, lambda t=tag: call(t)) for name, tag in requests))
+
+    assert results == [1, 2, 3, 4, 5]
+    # Each call ran with its own adapter active
+    assert all(active == {1: "a", 3: "a", 5: "a", 2: "b", 4: "b"}[tag] for active, tag in calls)
+    # Two groups, two switches (None -> a -> b) instead of one per request
+    assert host.get_stats()["adapter_switches"] == 2
+    assert host.get_stats()["groups_served"] == 2
+    host.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_later_registered_adapter_is_activated_on_request(monkeypatch):
+    model = FakeAdapterModel()
+
+    def get_peft_model(base, config, adapter_name):
+        model.active = adapter_name  # The wrapping adapter starts active
+        return model
+
+    monkeypatch.setattr(experts, "LoraConfig", lambda **kwargs: kwargs, raising=False)
+    monkeypatch.setattr(experts, "TaskType", SimpleNamespace(CAUSAL_LM="CAUSAL_LM"), raising=False)
+    monkeypatch.setattr(experts, "get_peft_model", get_peft_model, raising=False)
+
+    host = _host(object())
+    for name in ("first", "second"):
+        config = ExpertConfig(name=name, specialization=[], node_assignment="node", capacity=1.0)
+        assert await host.register_adapter(name, config)
+
+    assert await host.run("second", lambda: model.active) == "second"
+    assert model.switches == ["second"]
+    host.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_the_caller():
+    host = _host(FakeAdapterModel())
+
+    def boom():
+        raise RuntimeError("generation failed")
+
+    with pytest.raises(RuntimeError):
+        await host.run("a", boom)
+    assert await host.run("a", lambda: "ok") == "ok"
+    host.shutdown()
+
+
+def test_active_key_cannot_starve_others():
+    executor = GenerationExecutor(lambda key, requests: [], max_consecutive_groups=1)
+    executor.active_key = "a"
+    executor._consecutive_groups = 1
+    executor._pending["b"] = []
+    executor._pending["a"] = []
+
+    assert executor._next_key() == "b"
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_prompts_for_one_key_are_batched_off_loop():
+    batches = []
+    loop_thread = threading.get_ident()
+
+    def generate_batch(key, requests):
+        assert threading.get_ident() != loop_thread
+        time.sleep(0.05)
+        batches.append([r.prompt for r in requests])
+        return [f"{key}:{r.prompt}:{r.max_new_tokens}" for r in requests]
+
+    executor = GenerationExecutor(generate_batch, batch_window=0.01)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    results = await asyncio.gather(*(
+        executor.submit("expert", GenerationRequest(prompt=f"p{i}", max_new_tokens=i + 1))
+        for i in range(4)
+    ))
+    ticker_task.cancel()
+
+    assert results == ["expert:p0:1", "expert:p1:2", "expert:p2:3", "expert:p3:4"]
+    assert batches == [["p0", "p1", "p2", "p3"]]  # One padded call
+    assert ticks >= 5  # Event loop kept running during generation
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requests_are_dropped():
+    seen = []
+
+    def generate_batch(key, requests):
+        seen.extend(r.prompt for r in requests)
+        return [r.prompt for r in requests]
+
+    executor = GenerationExecutor(generate_batch, batch_window=0.02)
+    doomed = asyncio.create_task(executor.submit("e", GenerationRequest(prompt="drop")))
+    kept = asyncio.create_task(executor.submit("e", GenerationRequest(prompt="keep")))
+    await asyncio.sleep(0)
+    doomed.cancel()
+
+    assert await kept == "keep"
+    assert seen == ["keep"]
+    assert executor.get_stats()["cancelled"] == 1
+    executor.shutdown()
@@ -0,0 +1,116 @@
+"""Tests for in-flight-aware load balancing in the DATA router and node manager."""
+
+import asyncio
+
+import pytest
+
+from singularis.data.core import DATAConfig
+from singularis.data.experts import ExpertRouter
+from singularis.data.load_balancing import LoadTracker
+from singularis.data.node_manager import NodeConfig, NodeManager, NodeRole
+
+
+def test_tracker_counts_in_flight_and_ewma():
+    tracker = LoadTracker(alpha=0.5)
+    tracker.begin("a")
+    tracker.begin("a")
+    assert tracker.in_flight["a"] == 2
+
+    tracker.end("a", 100.0)
+    tracker.end("a", 200.0, success=False)
+    assert tracker.in_flight["a"] == 0
+    assert tracker.ewma_latency_ms["a"] == pytest.approx(150.0)
+    assert tracker.errors["a"] == 1
+    # Unobserved targets get the mean of observed ones
+    assert tracker.latency("b") == pytest.approx(150.0)
+
+
+def test_selectors_prefer_the_idle_target():
+    tracker = LoadTracker(seed=0)
+    for key in ("a", "b", "c"):
+        tracker.end(key, 10.0)
+    for _ in range(5):
+        tracker.begin("a")
+        tracker.begin("b")
+
+    assert tracker.least_outstanding(["a", "b", "c"]) == "c"
+    picks = [tracker.power_of_two_choices(["a", "b", "c"]) for _ in range(50)]
+    assert "c" in picks
+    # "c" wins whenever it is sampled, so it is picked most often
+    assert picks.count("c") > picks.count("a")
+
+
+def _router():
+    router = ExpertRouter(DATAConfig(share_base_model=False), node_manager=None, communicator=None)
+    router.experts = {"x": None, "y": None}
+    return router
+
+
+def test_idle_experts_keep_specialization_ranking():
+    router = _router()
+    # Cumulative history no longer matters
+    router.expert_load = {"x": 1000, "y": 0}
+    scores = router._apply_load_balancing({"x": 0.9, "y": 0.5})
+    assert scores == {"x": 0.9, "y": 0.5}
+
+
+def test_busy_expert_is_penalized():
+    router = _router()
+    for _ in range(4):
+        router.load_tracker.begin("x")
+    scores = router._apply_load_balancing({"x": 0.6, "y": 0.55})
+    assert scores["x"] < scores["y"]
+
+
+@pytest.mark.asyncio
+async def test_execute_expert_tracks_expert_and_node_load():
+    manager = NodeManager(DATAConfig())
+    await manager.register_node(NodeConfig(
+        node_id="node_a", role=NodeRole.COMMAND_CENTER, hostname="localhost", port=0,
+        gpu_count=0, vram_gb=0.0, ram_gb=1.0, cpu_cores=1, capabilities=["x"], max_capacity=1.0
+    ))
+    router = ExpertRouter(DATAConfig(share_base_model=False), node_manager=manager, communicator=None)
+    await router.initialize_experts()
+
+    started = asyncio.Event()
+    release = asyncio.Event()
+    expert = router.experts["reasoning_expert"]  # Assigned to node_a
+
+    async def slow_generate(prompt, **kwargs):
+        started.set()
+        await release.wait()
+        return {"success": True, "response": "ok", "expert_name": expert.config.name}
+
+    expert.generate = slow_generate
+    task = asyncio.create_task(router.execute_expert("reasoning_expert", "q"))
+    await started.wait()
+    assert router.load_tracker.in_flight["reasoning_expert"] == 1
+    assert manager.node_status["node_a"].active_tasks == 1
+
+    release.set()
+    await task
+    assert router.load_tracker.in_flight["reasoning_expert"] == 0
+    assert router.load_tracker.ewma_latency_ms["reasoning_expert"] > 0
+    status = manager.node_status["node_a"]
+    assert status.active_tasks == 0
+    assert status.total_tasks_completed == 1
+    router.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_capability_selection_spreads_across_nodes():
+    manager = NodeManager(DATAConfig())
+    for i in range(3):
+        await manager.register_node(NodeConfig(
+            node_id=f"n{i}", role=NodeRole.REAL_TIME_INFERENCE, hostname="localhost", port=0,
+            gpu_count=0, vram_gb=0.0, ram_gb=1.0, cpu_cores=1, capabilities=["infer"], max_capacity=1.0
+        ))
+
+    chosen = []
+    for _ in range(9):
+        node = manager.get_node_for_capability("infer")
+        manager.begin_task(node)  # Outstanding work steers the next choice
+        chosen.append(node)
+
+    assert set(chosen) == {"n0", "n1", "n2"}
+    assert manager.get_node_for_capability("missing") is None
@@ -0,0 +1,115 @@
+"""Tests for the DATA socket transport and DistributedCommunicator wiring."""
+
+import asyncio
+
+import pytest
+
+from singularis.data.communication import DistributedCommunicator
+from singularis.data.core import DATAConfig
+from singularis.data.node_manager import NodeConfig, NodeManager, NodeRole
+from singularis.data.transport import encode_frame, read_frame
+
+
+def _node(node_id: str, port: int) -> NodeConfig:
+    return NodeConfig(
+        node_id=node_id,
+        role=NodeRole.REAL_TIME_INFERENCE,
+        hostname="127.0.0.1",
+        port=port,
+        gpu_count=0,
+        vram_gb=0.0,
+        ram_gb=8.0,
+        cpu_cores=4,
+        capabilities=["fast_inference"],
+        max_capacity=0.8,
+    )
+
+
+async def _communicator(
+    config: DATAConfig, node_ids=("node_a", "node_b")
+) -> DistributedCommunicator:
+    manager = NodeManager(config)
+    for node_id in node_ids:
+        await manager.register_node(_node(node_id, 0))
+    communicator = DistributedCommunicator(config, manager)
+    assert await communicator.initialize()
+    return communicator
+
+
+@pytest.mark.asyncio
+async def test_frame_round_trip():
+    reader = asyncio.StreamReader()
+    reader.feed_data(encode_frame({"a": 1, "nested": {"b": [1, 2]}}))
+    reader.feed_eof()
+
+    assert await read_frame(reader) == {"a": 1, "nested": {"b": [1, 2]}}
+    assert await read_frame(reader) is None
+
+
+def test_frame_size_limit():
+    with pytest.raises(ValueError):
+        encode_frame({"blob": "x" * 100}, max_size=10)
+
+
+@pytest.mark.asyncio
+async def test_inprocess_is_default():
+    communicator = await _communicator(DATAConfig())
+    assert communicator.transport is None
+    assert await communicator.send_message("node_b", "query", {"q": 1}, sender_id="node_a")
+
+    message = await communicator.receive_message("node_b", timeout=1.0)
+    assert message.content == {"q": 1}
+    await communicator.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_uds_transport_between_communicators(tmp_path):
+    common = dict(transport="uds", transport_socket_dir=str(tmp_path), heartbeat_interval=0.05)
+    side_a = await _communicator(DATAConfig(local_nodes=["node_a"], **common))
+    side_b = await _communicator(DATAConfig(local_nodes=["node_b"], **common))
+
+    try:
+        assert "node_b" not in side_a.message_queues
+        for i in range(3):
+            assert await side_a.send_message("node_b", "query", {"i": i}, sender_id="node_a")
+
+        received = [await side_b.receive_message("node_b", timeout=2.0) for _ in range(3)]
+        assert [m.content["i"] for m in received] == [0, 1, 2]
+        assert received[0].sender_id == "node_a"
+
+        # One reused connection for all sends
+        assert side_a.transport.get_stats()["connections_opened"] == 1
+
+        # Heartbeats from A refresh B's view of node_a without reaching the inbox
+        side_b.connections["node_a"]["last_heartbeat"] = 0.0
+        await asyncio.sleep(0.2)
+        assert side_b.connections["node_a"]["last_heartbeat"] > 0.0
+        assert "node_a" in side_b.node_manager.remote_nodes
+        assert side_b.message_queues["node_b"].empty()
+        assert side_b.connections["node_a"]["status"] == "connected"
+    finally:
+        await side_a.shutdown()
+        await side_b.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_covers_every_local_node(tmp_path):
+    common = dict(transport="uds", transport_socket_dir=str(tmp_path), heartbeat_interval=0.05)
+    node_ids = ("node_a", "node_b", "node_c", "node_d")
+    # node_d is registered but never served, so heartbeats to it fail
+    side_a = await _communicator(DATAConfig(local_nodes=["node_a", "node_c"], **common), node_ids)
+    side_b = await _communicator(DATAConfig(local_nodes=["node_b"], **common), node_ids)
+
+    try:
+        for node_id in ("node_a", "node_c"):
+            side_b.connections[node_id]["last_heartbeat"] = 0.0
+        await asyncio.sleep(0.3)
+
+        for node_id in ("node_a", "node_c"):
+            assert side_b.connections[node_id]["last_heartbeat"] > 0.0
+            assert side_b.connections[node_id]["status"] == "connected"
+        assert side_a.connections["node_d"]["status"] == "unreachable"
+        assert side_a.connections["node_b"]["status"] == "connected"
+    finally:
+        await side_a.shutdown()
+        await side_b.shutdown()
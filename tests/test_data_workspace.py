@@ -0,0 +1,132 @@
+"""Tests for event-driven GlobalWorkspace broadcasts and subscriber queues."""
+
+import threading
+import time
+
+import pytest
+
+from singularis.data.workspace import GlobalWorkspace, WorkspaceSubscription
+
+
+@pytest.fixture
+def workspace():
+    ws = GlobalWorkspace(capacity=7, attention_window=1.0, broadcast_interval=None, salience_threshold=0.5)
+    yield ws
+    if ws.is_active:
+        ws.stop_workspace()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.001)
+    return predicate()
+
+
+def test_broadcast_wakes_without_polling(workspace):
+    received = []
+    arrived = threading.Event()
+
+    def subscriber(message):
+        received.append((time.perf_counter(), message))
+        arrived.set()
+
+    workspace.subscribe_to_broadcasts(subscriber, name="fast")
+    workspace.start_workspace()
+
+    submitted = time.perf_counter()
+    workspace.submit_to_workspace("hello", source="vision", priority=0.9)
+    # attention_window is 1s: only an event-driven wakeup delivers in time
+    assert arrived.wait(timeout=0.5)
+    assert received[0][0] - submitted < 0.1
+    assert received[0][1]['content'] == "hello"
+    assert received[0][1]['sequence'] == 1
+    assert workspace.get_metrics()['max_broadcast_latency'] < 0.1
+
+
+def test_rejected_items_are_not_broadcast(workspace):
+    received = []
+    workspace.subscribe_to_broadcasts(received.append)
+    workspace.start_workspace()
+
+    workspace.submit_to_workspace("quiet", source="audio", priority=0.1)
+    workspace.submit_to_workspace("loud", source="audio", priority=0.9)
+    assert _wait_for(lambda: len(received) == 1)
+    assert _wait_for(lambda: workspace.get_metrics()['rejected_items'] == 1)
+    assert [m['content'] for m in received] == ["loud"]
+
+
+def test_stalled_subscriber_does_not_delay_others(workspace):
+    release = threading.Event()
+    fast = []
+
+    def stalled(message):
+        release.wait(timeout=5.0)
+
+    stalled_sub = workspace.subscribe_to_broadcasts(stalled, name="stalled", max_queue=2, policy="drop_oldest")
+    workspace.subscribe_to_broadcasts(fast.append, name="fast", max_queue=64)
+    workspace.start_workspace()
+
+    for i in range(10):
+        workspace.submit_to_workspace(i, source="planner", priority=0.9)
+
+    assert _wait_for(lambda: len(fast) == 10)
+    assert sorted(m['content'] for m in fast) == list(range(10))
+
+    stats = workspace.get_subscriber_stats()
+    assert stats["stalled"]["queue_depth"] <= 2
+    assert stats["stalled"]["dropped"] >= 7
+    assert stats["stalled"]["backlog_lag"] > 0.0
+    assert stats["fast"]["dropped"] == 0
+    assert workspace.get_metrics()["dropped_broadcasts"] == stats["stalled"]["dropped"]
+
+    release.set()
+    assert _wait_for(lambda: stalled_sub.queue_depth == 0)
+
+
+def test_processor_callbacks_are_queued_and_counted(workspace):
+    seen = []
+    workspace.register_processor("reasoner", processor=seen.append)
+    workspace.start_workspace()
+    workspace.submit_to_workspace("fact", source="reasoner", priority=0.8)
+
+    assert _wait_for(lambda: workspace.get_processor_stats()["reasoner"]["access_count"] == 1)
+    assert seen[0]["content"] == "fact"
+    assert "reasoner" in workspace.get_subscriber_stats()
+
+
+def test_subscription_policies():
+    coalescing = WorkspaceSubscription("c", callback=lambda m: None, max_queue=2, policy="coalesce")
+    coalescing.offer(1, {"v": "a"})
+    coalescing.offer(1, {"v": "b"})
+    coalescing.offer(2, {"v": "c"})
+    coalescing.offer(3, {"v": "d"})
+    assert coalescing.queue_depth == 2
+    assert coalescing.metrics["coalesced"] == 1
+    assert coalescing.metrics["dropped"] == 1
+    assert [entry[2]["v"] for entry in coalescing._queue] == ["c", "d"]
+
+    newest = WorkspaceSubscription("n", callback=lambda m: None, max_queue=1, policy="drop_newest")
+    newest.offer(1, {"v": "a"})
+    newest.offer(2, {"v": "b"})
+    assert [entry[2]["v"] for entry in newest._queue] == ["a"]
+
+    with pytest.raises(ValueError):
+        WorkspaceSubscription("x", callback=print, policy="block")
+
+
+def test_idle_refresh_coalesces_for_slow_subscribers():
+    ws = GlobalWorkspace(broadcast_interval=0.005, salience_threshold=0.5)
+    release = threading.Event()
+    sub = ws.subscribe_to_broadcasts(lambda m: release.wait(timeout=5.0), name="slow", max_queue=4)
+    ws.start_workspace()
+    try:
+        ws.submit_to_workspace("state", source="memory", priority=0.9)
+        assert _wait_for(lambda: sub.metrics["coalesced"] > 3)
+        # One in flight, at most one pending refresh of the same item
+        assert sub.queue_depth <= 1
+    finally:
+        release.set()
+        ws.stop_workspace()
@@ -0,0 +1,204 @@
+"""Tests for the backpressured frame scheduler and StreamingVideoInterpreter integration."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from singularis.perception import (
+    FrameScheduler,
+    InterpretationMode,
+    StreamingInterpretation,
+    StreamingVideoInterpreter,
+    frame_fingerprint,
+)
+
+
+def _image(value: int, size=(64, 48)) -> np.ndarray:
+    return np.full((size[1], size[0], 3), value, dtype=np.uint8)
+
+
+def _frame(frame_id: int, image: np.ndarray) -> SimpleNamespace:
+    return SimpleNamespace(id=frame_id, image=image)
+
+
+class _SlowInterpreter:
+    """Fake interpreter recording concurrency; later frames may finish first."""
+
+    def __init__(self, delays=(0.02,)):
+        self.delays = delays
+        self.calls = []
+        self.started = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, frame):
+        self.calls.append(frame)
+        self.started.append(time.monotonic())
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays[(len(self.calls) - 1) % len(self.delays)])
+        finally:
+            self.active -= 1
+        return f"result-{frame.id}"
+
+
+def test_fingerprint_matches_pil_and_arrays():
+    array = np.random.default_rng(0).integers(0, 256, size=(120, 160, 3), dtype=np.uint8)
+    assert frame_fingerprint(array).shape == (32, 32)
+    assert frame_fingerprint(Image.fromarray(array)).shape == (32, 32)
+    assert frame_fingerprint(np.zeros(0)) is None
+
+
+async def test_in_flight_limit_and_latest_frame_wins():
+    interpret = _SlowInterpreter(delays=(0.05,))
+    delivered = []
+
+    async def deliver(frame, result):
+        delivered.append(result)
+
+    scheduler = FrameScheduler(interpret, deliver, max_in_flight=2, max_pending=1, similarity_threshold=0)
+    for i in range(20):
+        scheduler.submit(_frame(i, _image(i * 10)))
+    await scheduler.drain()
+
+    assert interpret.max_active == 2
+    # Two frames start immediately, only the newest waiting frame survives
+    assert [frame.id for frame in interpret.calls] == [0, 1, 19]
+    assert delivered == ["result-0", "result-1", "result-19"]
+    stats = scheduler.get_stats()
+    assert stats['dropped'] == 17
+    assert stats['drop_rate'] == pytest.approx(17 / 20)
+    assert stats['max_queue_age'] >= 0.04
+    assert stats['in_flight'] == 0 and stats['pending'] == 0
+
+
+async def test_results_delivered_in_order():
+    # First request is the slowest, so completions arrive reversed
+    interpret = _SlowInterpreter(delays=(0.06, 0.04, 0.02, 0.0))
+    delivered = []
+
+    async def deliver(frame, result):
+        delivered.append(frame.id)
+
+    scheduler = FrameScheduler(interpret, deliver, max_in_flight=4, max_pending=4, similarity_threshold=0)
+    for i in range(4):
+        scheduler.submit(_frame(i, _image(i * 40)))
+    await scheduler.drain()
+
+    assert interpret.max_active == 4
+    assert delivered == [0, 1, 2, 3]
+
+
+async def test_near_duplicates_skipped():
+    interpret = _SlowInterpreter(delays=(0.0,))
+    scheduler = FrameScheduler(interpret, max_pending=8, similarity_threshold=2.0)
+
+    base = _image(100)
+    noisy = base.copy()
+    noisy[0, 0] = 255  # One changed pixel
+    assert scheduler.submit(_frame(0, base))
+    assert not scheduler.submit(_frame(1, noisy))
+    assert scheduler.submit(_frame(2, _image(160)))
+    await scheduler.drain()
+
+    assert [frame.id for frame in interpret.calls] == [0, 2]
+    assert scheduler.get_stats()['skipped_similar'] == 1
+
+
+async def test_min_interval_caps_dispatch_rate():
+    interpret = _SlowInterpreter(delays=(0.0,))
+    scheduler = FrameScheduler(interpret, min_interval=0.05, similarity_threshold=0)
+
+    for i in range(10):
+        scheduler.submit(_frame(i, _image(i * 20)))
+        await asyncio.sleep(0.01)
+    await scheduler.drain()
+
+    assert len(interpret.calls) < 10
+    assert interpret.calls[-1].id == 9
+    gaps = np.diff(interpret.started)
+    assert (gaps >= 0.045).all()
+
+
+async def test_failures_do_not_block_delivery():
+    async def interpret(frame):
+        await asyncio.sleep(0.01 if frame.id else 0.03)
+        if frame.id == 0:
+            raise RuntimeError("API down")
+        return frame.id
+
+    delivered = []
+
+    async def deliver(frame, result):
+        delivered.append(result)
+
+    scheduler = FrameScheduler(interpret, deliver, max_in_flight=2, max_pending=2, similarity_threshold=0)
+    for i in range(3):
+        scheduler.submit(_frame(i, _image(i * 80)))
+    await scheduler.drain()
+
+    assert delivered == [1, 2]
+    assert scheduler.get_stats()['failed'] == 1
+
+
+async def test_identical_frame_retried_after_failure():
+    calls = []
+
+    async def interpret(frame):
+        calls.append(frame.id)
+        if frame.id == 0:
+            raise RuntimeError("API down")
+        return frame.id
+
+    scheduler = FrameScheduler(interpret)
+    scheduler.submit(_frame(0, _image(100)))
+    await scheduler.drain()
+
+    # Same scene again: the failed attempt must not make it look like a duplicate
+    assert scheduler.submit(_frame(1, _image(100)))
+    await scheduler.drain()
+    assert calls == [0, 1]
+
+    # After a success the duplicate check applies again
+    assert not scheduler.submit(_frame(2, _image(100)))
+
+
+async def test_interpreter_streams_through_scheduler():
+    interpreter = StreamingVideoInterpreter(api_key="test", frame_rate=0, audio_enabled=False, max_in_flight=2)
+
+    async def fake_interpret(frame):
+        await asyncio.sleep(0.02)
+        return StreamingInterpretation(
+            text=f"frame {frame.frame_number}",
+            audio_data=None,
+            timestamp=frame.timestamp,
+            mode=InterpretationMode.COMPREHENSIVE,
+            confidence=0.85,
+            frame_number=frame.frame_number,
+        )
+
+    interpreter.scheduler.interpret = fake_interpret
+    received = []
+
+    async def on_interpretation(interpretation):
+        received.append(interpretation.frame_number)
+
+    interpreter.on_interpretation = on_interpretation
+    await interpreter.start_streaming()
+    for i in range(30):
+        await interpreter.add_frame(Image.fromarray(_image(i * 8)))
+    await interpreter.scheduler.drain()
+
+    assert received == sorted(received)
+    assert received[-1] == 29
+    assert len(received) < 30
+    assert len(interpreter.frame_buffer) == interpreter.max_buffer_size
+    stats = interpreter.get_stats()
+    assert stats['total_interpretations'] == len(received)
+    assert stats['scheduler']['max_in_flight_seen'] <= 2
+    await interpreter.close()
@@ -0,0 +1,138 @@
+"""Tests for the HaackLang module compiler and cache (no haackc needed)."""
+
+import importlib.util
+import os
+import pickle
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+# The package __init__ pulls in the haackc-based runtime; compiler.py itself doesn't
+_spec = importlib.util.spec_from_file_location(
+    "haacklang_compiler",
+    Path(__file__).parent.parent / "singularis" / "haacklang_bridge" / "compiler.py",
+)
+compiler = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = compiler  # Cached modules are pickled by reference
+_spec.loader.exec_module(compiler)
+
+OP_DECLARE, OP_GUARD, OP_EXEC = compiler.OP_DECLARE, compiler.OP_GUARD, compiler.OP_EXEC
+ModuleCache, lower, source_hash = compiler.ModuleCache, compiler.lower, compiler.source_hash
+
+
+@dataclass
+class Program:
+    statements: List = field(default_factory=list)
+
+
+@dataclass
+class TruthValueDeclaration:
+    name: str
+
+
+@dataclass
+class GuardStatement:
+    track: str
+    body: str
+
+
+@dataclass
+class Assignment:
+    name: str
+
+
+def parse(source: str) -> Program:
+    """Stub parser: one statement per line, `decl X`, `guard TRACK X` or `let X`."""
+    statements = []
+    for line in source.splitlines():
+        kind, *args = line.split()
+        if kind == "decl":
+            statements.append(TruthValueDeclaration(args[0]))
+        elif kind == "guard":
+            statements.append(GuardStatement(args[0], args[1]))
+        else:
+            statements.append(Assignment(args[0]))
+    return Program(statements)
+
+
+SOURCE = "decl danger\nguard reflex flee\nguard strategic plan\nlet combined\n"
+
+
+def test_memory_then_disk_hits(tmp_path):
+    cache = ModuleCache(parse, cache_dir=tmp_path)
+
+    first, origin = cache.compile_source("mod", SOURCE)
+    assert origin == "compiled"
+    assert cache.compile_source("mod", SOURCE) == (first, "memory")
+
+    cache.clear_memory()
+    from_disk, origin = cache.compile_source("mod", SOURCE)
+    assert origin == "disk"
+    assert from_disk.code == first.code
+    assert cache.get_stats()["compiles"] == 1
+
+
+def test_format_version_mismatch_recompiles(tmp_path, monkeypatch):
+    cache = ModuleCache(parse, cache_dir=tmp_path)
+    cache.compile_source("mod", SOURCE)
+    cache.clear_memory()
+
+    monkeypatch.setattr(compiler, "CODE_FORMAT_VERSION", compiler.CODE_FORMAT_VERSION + 1)
+    assert cache.compile_source("mod", SOURCE)[1] == "compiled"
+
+
+def test_hash_mismatch_recompiles(tmp_path):
+    cache = ModuleCache(parse, cache_dir=tmp_path)
+    compiled, _ = cache.compile_source("mod", SOURCE)
+    cache.clear_memory()
+
+    # A cache file whose payload was compiled from different source
+    stale = lower("mod", source_hash("let other\n"), parse("let other\n"))
+    (path,) = tmp_path.glob("mod.*.hlc")
+    path.write_bytes(pickle.dumps((compiler.CODE_FORMAT_VERSION, stale)))
+
+    recompiled, origin = cache.compile_source("mod", SOURCE)
+    assert origin == "compiled"
+    assert recompiled.source_hash == compiled.source_hash
+
+
+def test_new_source_version_evicts_old_entry():
+    cache = ModuleCache(parse)
+    old, _ = cache.compile_source("mod", SOURCE)
+    new, _ = cache.compile_source("mod", SOURCE + "let extra\n")
+    cache.compile_source("other", SOURCE)
+
+    assert set(cache._memory) == {("mod", new.source_hash), ("other", old.source_hash)}
+
+
+def test_changed_ignores_touch_and_reports_edits(tmp_path):
+    path = tmp_path / "mod.haack"
+    path.write_text(SOURCE)
+    cache = ModuleCache(parse)
+    cache.load(path)
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.changed() == []
+
+    path.write_text(SOURCE.replace("flee", "hide"))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    assert cache.changed() == [path]
+
+
+def test_program_for_keeps_exec_and_active_guards():
+    compiled = lower("mod", source_hash(SOURCE), parse(SOURCE))
+    assert [op for op, _, _ in compiled.code] == [OP_DECLARE, OP_GUARD, OP_GUARD, OP_EXEC]
+
+    program = compiled.program_for({"reflex", "perception"})
+    assert [type(node).__name__ for node in program.statements] == ["GuardStatement", "Assignment"]
+    assert program.statements[0].track == "reflex"
+    assert compiled.program_for(set()).statements == [Assignment("combined")]
+    # Same active guard set -> same cached program
+    assert compiled.program_for({"reflex"}) is program
+
+    declarations = compiled.declarations()
+    assert declarations.statements == [TruthValueDeclaration("danger")]
+    # The parsed AST itself is untouched
+    assert len(compiled.ast.statements) == 4
@@ -0,0 +1,86 @@
+"""
+Tests for the vectorized HaackLang operators and the ring-buffer TemporalWindow.
+"""
+
+import numpy as np
+import pytest
+
+from singularis.infinity.haacklang_operators import (
+    ParaconsistentArray,
+    ParaconsistentValue,
+    TemporalWindow,
+    paraconsistent_and,
+    paraconsistent_or,
+    paraconsistent_to_fuzzy,
+    temporal_derivative,
+    temporal_last,
+)
+
+
+def _naive_slope(values):
+    n = len(values)
+    x_mean = (n - 1) / 2
+    y_mean = sum(values) / n
+    numerator = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(values))
+    denominator = sum((i - x_mean) ** 2 for i in range(n))
+    return numerator / denominator
+
+
+def test_array_operators_match_scalar_path():
+    rng = np.random.default_rng(0)
+    a_values = [ParaconsistentValue(*pair) for pair in rng.random((200, 2)).tolist()]
+    b_values = [ParaconsistentValue(*pair) for pair in rng.random((200, 2)).tolist()]
+    a = ParaconsistentArray.from_values(a_values)
+    b = ParaconsistentArray.from_values(b_values)
+
+    for op in (paraconsistent_and, paraconsistent_or):
+        combined = op(a, b)
+        assert isinstance(combined, ParaconsistentArray)
+        assert combined.to_values() == [op(x, y) for x, y in zip(a_values, b_values)]
+
+    merged = paraconsistent_and(a, b)
+    scalar = [paraconsistent_and(x, y) for x, y in zip(a_values, b_values)]
+    np.testing.assert_allclose(paraconsistent_to_fuzzy(merged), [paraconsistent_to_fuzzy(v) for v in scalar])
+    assert merged.is_contradictory().tolist() == [v.is_contradictory() for v in scalar]
+    assert merged.is_uncertain(0.3).tolist() == [v.is_uncertain(0.3) for v in scalar]
+    np.testing.assert_allclose(merged.certainty(), [v.certainty() for v in scalar])
+    np.testing.assert_allclose(merged.contradiction(), [v.contradiction() for v in scalar])
+    assert merged[3] == scalar[3]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 50])
+def test_temporal_window_incremental_stats(size):
+    rng = np.random.default_rng(size)
+    window = TemporalWindow(size=size)
+    history = []
+
+    for step, value in enumerate(rng.normal(size=5 * size + 3).tolist()):
+        window.add(value, float(step))
+        history.append(value)
+        expected = history[-size:]
+
+        assert window.get_values() == expected
+        assert window.timestamps[-1] == float(step)
+        assert window.mean() == pytest.approx(np.mean(expected))
+        assert window.variance() == pytest.approx(np.var(expected), abs=1e-9)
+        if len(expected) >= 2:
+            assert temporal_derivative(window) == pytest.approx(_naive_slope(expected), abs=1e-9)
+        else:
+            assert temporal_derivative(window) == 0.0
+
+    assert temporal_last(window, 3) == history[-size:][-3:]
+    # Same edge cases as slicing the old list-based window
+    for n in (0, -1, size + 5):
+        assert temporal_last(window, n) == history[-size:][-n:]
+
+
+def test_temporal_window_trend_direction():
+    window = TemporalWindow(size=5)
+    for i, value in enumerate([0.2, 0.3, 0.5, 0.6, 0.7]):
+        window.add(value, float(i))
+    assert window.trend() == pytest.approx(0.13)
+
+    for i, value in enumerate([0.6, 0.4, 0.2, 0.1, 0.0]):
+        window.add(value, float(5 + i))
+    assert window.trend() < 0
+    assert len(window) == 5
@@ -0,0 +1,200 @@
+"""Tests for HaackLangRuntime execution over cached modules (haackc stubbed out)."""
+
+import importlib.util
+import sys
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+import pytest
+
+BRIDGE_DIR = Path(__file__).parent.parent / "singularis" / "haacklang_bridge"
+
+SOURCE = "decl danger\nguard reflex flee\nguard strategic plan\nlet danger\n"
+
+
+@dataclass
+class Program:
+    statements: List = field(default_factory=list)
+
+
+@dataclass
+class TruthValueDeclaration:
+    name: str
+
+
+@dataclass
+class GuardStatement:
+    track: str
+    body: str
+
+
+@dataclass
+class Assignment:
+    name: str
+
+
+class Track:
+    def __init__(self, name, period=1, logic=None):
+        self.name = name
+        self.period = period
+        self.logic = logic
+
+    def is_active(self, beat):
+        return beat % self.period == 0
+
+    def advance(self):
+        pass
+
+
+class TruthValue:
+    def __init__(self, tracks=None, initial_value=0.0):
+        self.value = initial_value
+
+    def set(self, track, value):
+        self.value = value
+
+    def get(self, track):
+        return self.value
+
+    def to_dict(self):
+        return {"value": self.value}
+
+
+class Context:
+    def __init__(self, name, logic=None, track=None):
+        self.name = name
+
+
+class Lexer:
+    def __init__(self, source):
+        self.source = source
+
+    def tokenize(self):
+        return self.source.splitlines()
+
+
+class Parser:
+    """One statement per line: `decl X`, `guard TRACK X` or `let X`."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    def parse(self):
+        statements = []
+        for line in self.tokens:
+            kind, *args = line.split()
+            if kind == "decl":
+                statements.append(TruthValueDeclaration(args[0]))
+            elif kind == "guard":
+                statements.append(GuardStatement(args[0], args[1]))
+            else:
+                statements.append(Assignment(args[0]))
+        return Program(statements)
+
+
+class Interpreter:
+    """Logs every statement; declarations reset, assignments increment."""
+
+    def __init__(self):
+        self.tracks = {}
+        self.truthvalues = {}
+        self.python_callbacks = {}
+        self.log = []
+
+    def set_variable(self, name, value):
+        pass
+
+    def interpret(self, program):
+        for node in program.statements:
+            if isinstance(node, TruthValueDeclaration):
+                self.truthvalues[node.name] = TruthValue()
+                self.log.append(("decl", node.name))
+            elif isinstance(node, GuardStatement):
+                self.log.append(("guard", node.body))
+            else:
+                self.truthvalues.setdefault(node.name, TruthValue()).value += 1
+                self.log.append(("let", node.name))
+
+
+@pytest.fixture
+def runtime_module(monkeypatch):
+    """runtime.py imported against stub haackc modules, without the package __init__."""
+    logic = types.SimpleNamespace(CLASSICAL="classical", FUZZY="fuzzy", PARACONSISTENT="para")
+    stubs = {
+        "haackc": {},
+        "haackc.runtime": {
+            "Track": Track, "TruthValue": TruthValue, "Context": Context, "LogicType": logic,
+        },
+        "haackc.parser": {"Parser": Parser},
+        "haackc.lexer": {"Lexer": Lexer},
+        "haackc.interpreter": {"Interpreter": Interpreter},
+    }
+    for name, attrs in stubs.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attrs)
+        monkeypatch.setitem(sys.modules, name, module)
+
+    package = types.ModuleType("haacklang_bridge_under_test")
+    package.__path__ = [str(BRIDGE_DIR)]
+    monkeypatch.setitem(sys.modules, package.__name__, package)
+
+    spec = importlib.util.spec_from_file_location(
+        f"{package.__name__}.runtime", BRIDGE_DIR / "runtime.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def module_path(tmp_path):
+    path = tmp_path / "mod.haack"
+    path.write_text(SOURCE)
+    return path
+
+
+def _run_beats(runtime, beats):
+    results = []
+    for _ in range(beats):
+        runtime.advance_beat()
+        result = runtime.execute("mod")
+        assert result.success, result.errors
+        results.append(result.truthvalues)
+    return results
+
+
+def test_default_execute_matches_uncached_interpretation(runtime_module, module_path):
+    runtime = runtime_module.HaackLangRuntime()
+    assert runtime.load_module(module_path)
+    assert runtime.interpreter.log == []  # Nothing runs at load time by default
+
+    results = _run_beats(runtime, 6)
+    assert runtime.load_module(module_path)  # Memory-cache hit
+    results += _run_beats(runtime, 6)
+
+    reference = Interpreter()
+    expected = []
+    for _ in range(12):
+        reference.interpret(Parser(Lexer(SOURCE).tokenize()).parse())
+        expected.append({name: tv.to_dict() for name, tv in reference.truthvalues.items()})
+
+    assert results == expected
+    assert runtime.interpreter.log == reference.log
+    assert runtime.get_stats()["module_cache"]["compiles"] == 1
+
+
+def test_compile_programs_declares_once_and_prunes_idle_guards(runtime_module, module_path):
+    runtime = runtime_module.HaackLangRuntime(compile_programs=True)
+    assert runtime.load_module(module_path)
+    assert runtime.interpreter.log == [("decl", "danger")]
+
+    results = _run_beats(runtime, 6)
+    # The declaration no longer resets danger each beat
+    assert [r["danger"]["value"] for r in results] == [1, 2, 3, 4, 5, 6]
+
+    guards = [body for kind, body in runtime.interpreter.log if kind == "guard"]
+    assert guards.count("flee") == 6
+    assert guards.count("plan") == 2  # strategic fires every third beat
@@ -0,0 +1,210 @@
+"""
+Hybrid LLM Hedging Tests
+
+Tests hedged requests and latency-aware provider ordering in HybridLLMClient.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from singularis.llm.hybrid_client import (
+    HybridConfig,
+    HybridLLMClient,
+    ProviderLatencyTracker,
+    TaskType,
+)
+
+
+class StubProvider:
+    """Minimal stand-in for a cloud text client."""
+
+    def __init__(self, delay: float, text: str = "ok", fail: bool = False):
+        self.delay = delay
+        self.text = text
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate_text(self, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError("provider error")
+        return self.text
+
+    async def close(self):
+        pass
+
+
+def make_client(**overrides) -> HybridLLMClient:
+    settings = dict(
+        enable_hedging=True,
+        hedge_min_delay=0.05,
+        hedge_default_delay=0.05,
+        hedge_max_fraction=1.0,
+        min_request_interval=0.0,
+        timeout=5,
+    )
+    settings.update(overrides)
+    return HybridLLMClient(HybridConfig(**settings))
+
+
+class TestProviderLatencyTracker:
+
+    def test_percentiles_and_error_rate(self):
+        tracker = ProviderLatencyTracker(window=10)
+        for latency in [0.1, 0.2, 0.3, 0.4, 1.0]:
+            tracker.record("claude", TaskType.REASONING, latency, True)
+        tracker.record("claude", TaskType.REASONING, 5.0, False)
+
+        assert tracker.percentile("claude", TaskType.REASONING, 50) == 0.3
+        assert tracker.percentile("claude", TaskType.REASONING, 95) == 1.0
+        assert tracker.error_rate("claude", TaskType.REASONING) == pytest.approx(1 / 6)
+        assert tracker.percentile("openai", TaskType.REASONING, 50) is None
+
+
+class TestHedging:
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self):
+        client = make_client()
+        client.openai = StubProvider(delay=2.0, text="slow")
+        client.claude = StubProvider(delay=0.01, text="fast")
+
+        start = time.perf_counter()
+        result = await client.generate_world_model("integrate")
+        elapsed = time.perf_counter() - start
+
+        assert result == "fast"
+        assert elapsed < 1.0
+        assert client.stats['hedged_requests'] == 1
+        assert client.stats['hedge_wins'] == 1
+
+        await asyncio.sleep(0)  # let the losing request observe its cancellation
+        assert client.openai.cancelled == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self):
+        client = make_client()
+        client.openai = StubProvider(delay=0.0, text="primary")
+        client.claude = StubProvider(delay=0.0, text="backup")
+
+        assert await client.generate_world_model("integrate") == "primary"
+        assert client.claude.calls == 0
+        assert client.stats['hedged_requests'] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_primary_falls_back(self):
+        client = make_client()
+        client.openai = StubProvider(delay=0.0, fail=True)
+        client.claude = StubProvider(delay=0.0, text="backup")
+
+        assert await client.generate_world_model("integrate") == "backup"
+        assert client.stats['errors'] == 1
+        assert client.stats['hedged_requests'] == 0
+
+    @pytest.mark.asyncio
+    async def test_hedge_budget_caps_extra_requests(self):
+        client = make_client(hedge_max_fraction=0.0)
+        client.openai = StubProvider(delay=0.2, text="slow")
+        client.claude = StubProvider(delay=0.0, text="backup")
+
+        assert await client.generate_world_model("integrate") == "slow"
+        assert client.claude.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_prefers_fastest_provider(self):
+        client = make_client(prefer_fastest_provider=True, latency_min_samples=2)
+        client.openai = StubProvider(delay=0.0, text="openai")
+        client.claude = StubProvider(delay=0.0, text="claude")
+        for _ in range(3):
+            client.latency.record("openai", TaskType.WORLD_MODEL, 3.0, True)
+            client.latency.record("claude", TaskType.WORLD_MODEL, 0.5, True)
+
+        assert await client.generate_world_model("integrate") == "claude"
+        assert 'claude/world_model' in client.get_stats()['provider_latency']
+
+    @pytest.mark.asyncio
+    async def test_prefers_fastest_provider_without_hedging(self):
+        client = make_client(enable_hedging=False, prefer_fastest_provider=True, latency_min_samples=2)
+        client.openai = StubProvider(delay=0.0, text="openai")
+        client.claude = StubProvider(delay=0.2, fail=True)
+        for _ in range(3):
+            client.latency.record("openai", TaskType.WORLD_MODEL, 3.0, True)
+            client.latency.record("claude", TaskType.WORLD_MODEL, 0.5, True)
+
+        # Claude goes first, fails, and openai serves as a plain fallback (no hedge)
+        assert await client.generate_world_model("integrate") == "openai"
+        assert client.claude.calls == 1
+        assert client.stats['hedged_requests'] == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_errors_are_flagged(self):
+        from loguru import logger
+
+        client = make_client()
+        client.openai = None
+        client.claude = StubProvider(delay=0.0)
+        client.claude.generate_text = self._raise(RuntimeError("Error 429: rate_limit_error"))
+        messages = []
+        sink = logger.add(lambda message: messages.append(message.record["message"]), level="ERROR")
+        try:
+            with pytest.raises(RuntimeError):
+                await client.generate_reasoning("think")
+        finally:
+            logger.remove(sink)
+
+        assert any("rate limit exceeded" in message for message in messages)
+
+    @pytest.mark.asyncio
+    async def test_vision_falls_back_to_gemini_pro_after_hedged_candidates(self, monkeypatch):
+        import singularis.llm.hybrid_client as hybrid_client
+
+        class StubVision:
+            def __init__(self, text="", fail=False, **kwargs):
+                self.text, self.fail, self.model = text, fail, kwargs.get("model")
+                self.calls = 0
+
+            async def analyze_image(self, **kwargs):
+                self.calls += 1
+                if self.fail:
+                    raise RuntimeError("vision error")
+                return self.text
+
+            async def close(self):
+                pass
+
+        pro_clients = []
+
+        def gemini_client(**kwargs):
+            pro_clients.append(StubVision(text="pro", **kwargs))
+            return pro_clients[-1]
+
+        monkeypatch.setattr(hybrid_client, "GeminiClient", gemini_client)
+        client = make_client()
+        client.gemini = StubVision(fail=True)
+        client.local_vision = None
+
+        assert await client.analyze_image("describe", image=object()) == "pro"
+        assert client.gemini.calls == 1
+        assert [c.model for c in pro_clients] == ["gemini-2.5-pro"]
+
+        # Without fallback_on_error the hedged path's error surfaces untouched
+        client = make_client(fallback_on_error=False)
+        client.gemini = StubVision(fail=True)
+        client.local_vision = None
+        with pytest.raises(RuntimeError):
+            await client.analyze_image("describe", image=object())
+        assert len(pro_clients) == 1
+
+    @staticmethod
+    def _raise(error):
+        async def generate_text(**kwargs):
+            raise error
+        return generate_text
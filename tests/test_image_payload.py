@@ -0,0 +1,106 @@
+"""
+Image Payload Cache Tests
+
+Tests shared per-frame encoding for multi-expert vision requests.
+"""
+
+import asyncio
+
+import pytest
+from PIL import Image
+
+from singularis.llm.image_payload import ImageEncoding, ImagePayloadCache, encode_image
+from singularis.llm.gemini_client import GeminiClient
+
+
+def make_frame(width: int = 1280, height: int = 720) -> Image.Image:
+    frame = Image.new("RGB", (width, height))
+    for x in range(0, width, 16):
+        for y in range(0, height, 16):
+            frame.putpixel((x, y), (x % 256, y % 256, (x + y) % 256))
+    return frame
+
+
+class TestImagePayloadCache:
+
+    def test_encodes_once_per_frame_and_encoding(self):
+        cache = ImagePayloadCache()
+        frame = make_frame()
+
+        first = cache.get(frame)
+        second = cache.get(frame)
+        assert first is second
+        assert cache.stats == {'hits': 1, 'misses': 1, 'invalidations': 0, 'bytes_encoded': first.size_bytes}
+
+        jpeg = cache.get(frame, ImageEncoding(format="JPEG", max_size=640))
+        assert jpeg is not first
+        assert jpeg.mime_type == "image/jpeg"
+        assert (jpeg.width, jpeg.height) == (640, 360)
+        assert cache.stats['misses'] == 2
+
+    def test_new_frame_misses(self):
+        cache = ImagePayloadCache()
+        cache.get(make_frame())
+        cache.get(make_frame())
+        assert cache.stats['misses'] == 2
+
+    def test_frame_mutated_in_place_is_reencoded(self):
+        cache = ImagePayloadCache()
+        frame = make_frame(64, 64)
+        first = cache.get(frame)
+
+        frame.paste((255, 0, 0), (0, 0, 64, 64))
+        second = cache.get(frame)
+        assert second is not first
+        assert second.data != first.data
+        assert cache.stats['invalidations'] == 1
+        assert cache.get(frame) is second
+
+    def test_entries_released_with_frame(self):
+        cache = ImagePayloadCache()
+        frame = make_frame(64, 64)
+        cache.get(frame)
+        assert cache.get_stats()['frames_cached'] == 1
+        del frame
+        assert cache.get_stats()['frames_cached'] == 0
+
+    def test_downscale_and_data_url(self):
+        encoded = encode_image(make_frame(), ImageEncoding(format="WEBP", max_size=320, quality=70))
+        assert max(encoded.width, encoded.height) == 320
+        assert encoded.data_url.startswith("data:image/webp;base64,")
+
+    def test_rgba_frames_encode_as_jpeg(self):
+        frame = Image.new("RGBA", (32, 32), (255, 0, 0, 128))
+        encoded = encode_image(frame, ImageEncoding(format="JPEG"))
+        assert encoded.mime_type == "image/jpeg"
+
+    def test_invalid_format(self):
+        with pytest.raises(ValueError):
+            encode_image(make_frame(8, 8), ImageEncoding(format="BMP"))
+
+
+class TestClientsShareEncoding:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_experts_reuse_payload(self, monkeypatch):
+        cache = ImagePayloadCache()
+        monkeypatch.setattr("singularis.llm.gemini_client.get_image_payload_cache", lambda: cache)
+
+        gemini = GeminiClient(api_key="test")
+        sent = []
+
+        async def fake_generate_content(contents, **kwargs):
+            sent.append(contents[0]["parts"][1]["inline_data"]["data"])
+            return {"candidates": [{"content": {"parts": [{"text": "scene"}]}}]}
+
+        gemini._generate_content = fake_generate_content
+
+        frame = make_frame()
+        await asyncio.gather(
+            gemini.analyze_image("a", frame),
+            gemini.analyze_image("b", frame),
+        )
+
+        assert sent[0] == sent[1]
+        assert cache.stats['misses'] == 1
+        assert cache.stats['hits'] == 1
@@ -0,0 +1,217 @@
+"""Tests for LifeTimeline bulk ingestion, write-behind and connection handling."""
+
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "integrations"))
+
+from life_timeline import EventSource, EventType, LifeEvent, LifeTimeline  # noqa: E402
+
+
+START = datetime(2025, 1, 1)
+
+
+def _hr(i, user="u"):
+    return LifeEvent(
+        id=f"{user}_hr{i}",
+        user_id=user,
+        timestamp=START + timedelta(minutes=i),
+        source=EventSource.FITBIT,
+        type=EventType.HEART_RATE,
+        features={"bpm": 60 + i % 40},
+    )
+
+
+@pytest.fixture
+def timeline(tmp_path):
+    tl = LifeTimeline(str(tmp_path / "timeline.db"), write_flush_interval=0.05)
+    yield tl
+    tl.close()
+
+
+def test_wal_mode_enabled(timeline):
+    assert timeline.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_bulk_add_uses_one_commit_per_chunk(timeline):
+    inserted = timeline.add_events((_hr(i) for i in range(2500)), chunk_size=1000)
+    assert inserted == 2500
+    assert timeline.stats["commits"] == 3
+    assert len(timeline.query_day("u", START)) == 1441  # Range end is inclusive
+
+
+def test_bulk_add_skips_duplicates(timeline):
+    timeline.add_event(_hr(1))
+    assert timeline.add_events([_hr(0), _hr(1), _hr(2)]) == 2
+    assert timeline.stats["duplicates_skipped"] == 1
+    assert not timeline.add_event(_hr(1))
+
+
+def test_failed_batch_is_rolled_back(timeline, monkeypatch):
+    def broken_rollups(rows):
+        raise RuntimeError("rollup failed")
+
+    monkeypatch.setattr(timeline, "_update_rollups", broken_rollups)
+    assert timeline.add_events([_hr(0), _hr(1)]) == 0
+    assert timeline.stats["write_errors"] == 1
+    monkeypatch.undo()
+
+    # The failed batch must not ride along with the next commit
+    assert timeline.add_events([_hr(2)]) == 1
+    assert [e.id for e in timeline.query_day("u", START)] == ["u_hr2"]
+
+
+def test_write_behind_groups_commits_and_reads_see_them(timeline):
+    for i in range(300):
+        assert timeline.add_event(_hr(i), wait=False)
+    # Queries flush queued events first
+    assert len(timeline.query_by_time("u", START, START + timedelta(days=1))) == 300
+    assert timeline.stats["commits"] < 300
+
+
+def test_close_commits_queued_events(tmp_path):
+    path = str(tmp_path / "timeline.db")
+    tl = LifeTimeline(path, write_flush_interval=10.0)
+    tl.add_events((_hr(i) for i in range(50)), wait=False)
+    tl.close()
+
+    reopened = LifeTimeline(path)
+    assert len(reopened.query_last_of_type("u", EventType.HEART_RATE, limit=100)) == 50
+    reopened.close()
+
+
+def test_concurrent_writers_and_readers(timeline):
+    errors = []
+
+    def write(user):
+        try:
+            timeline.add_events(_hr(i, user) for i in range(200))
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    def read():
+        try:
+            for _ in range(20):
+                timeline.query_by_time("w0", START, START + timedelta(days=1))
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(f"w{i}",)) for i in range(4)]
+    threads += [threading.Thread(target=read) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    for i in range(4):
+        assert len(timeline.query_by_time(f"w{i}", START, START + timedelta(days=1))) == 200
+    assert timeline.get_stats()["readers_open"] <= timeline.reader_pool_size
+
+
+def test_in_memory_database_shares_the_writer():
+    tl = LifeTimeline(":memory:")
+    tl.add_event(_hr(0), wait=False)
+    assert len(tl.query_day("u", START)) == 1
+    tl.close()
+
+
+def _mixed_events(now, count=3000):
+    kinds = [
+        (EventType.HEART_RATE, EventSource.FITBIT, lambda i: {"heart_rate": 55 + i % 60}),
+        (EventType.SLEEP, EventSource.FITBIT, lambda i: {"quality": (i % 10) / 10, "duration_hours": 7}),
+        (EventType.STEPS, EventSource.FITBIT, lambda i: {"steps": i % 300}),
+        (EventType.MESSAGE, EventSource.MESSENGER, lambda i: {"message": "hi"}),
+    ]
+    for i in range(count):
+        event_type, source, features = kinds[i % len(kinds)]
+        yield LifeEvent(
+            id=f"m{i}",
+            user_id="u",
+            timestamp=now - timedelta(minutes=37 * i),
+            source=source,
+            type=event_type,
+            features=features(i),
+        )
+
+
+@pytest.mark.parametrize("span", [timedelta(minutes=20), timedelta(hours=5), timedelta(days=3), timedelta(days=60)])
+def test_aggregate_matches_raw_events(timeline, span):
+    now = datetime.now()
+    timeline.add_events(_mixed_events(now))
+    start, end = now - span - timedelta(minutes=13), now - timedelta(minutes=7)
+
+    aggregates = timeline.aggregate("u", start, end)
+    raw = timeline.query_by_time("u", start, end)
+
+    counts = {}
+    for event in raw:
+        key = (event.type.value, event.source.value)
+        counts[key] = counts.get(key, 0) + 1
+    assert {key: entry["count"] for key, entry in aggregates.items()} == counts
+
+    heart_rates = [e.features["heart_rate"] for e in raw if e.type == EventType.HEART_RATE]
+    if heart_rates:
+        stats = aggregates[("heart_rate", "fitbit")]["heart_rate"]
+        assert stats["count"] == len(heart_rates)
+        assert stats["sum"] == pytest.approx(sum(heart_rates))
+        assert (stats["min"], stats["max"]) == (min(heart_rates), max(heart_rates))
+
+
+def test_summary_reads_rollups(timeline):
+    now = datetime.now()
+    timeline.add_events(_mixed_events(now))
+    summary = timeline.get_timeline_summary("u", days=30)
+
+    raw = timeline.query_by_time("u", now - timedelta(days=30), datetime.now())
+    assert summary["total_events"] == len(raw)
+    assert summary["by_source"]["messenger"] == sum(1 for e in raw if e.source == EventSource.MESSENGER)
+    assert summary["first_event"] == raw[0].timestamp.isoformat()
+
+    sleep_days = timeline.get_daily_rollups("u", now - timedelta(days=30), now, event_types=[EventType.SLEEP])
+    assert 0 < len(sleep_days) <= 31
+    assert all("sleep_quality" in day for day in sleep_days)
+
+
+def test_multi_type_filters_are_pushed_down(timeline):
+    now = datetime.now()
+    timeline.add_events(_mixed_events(now, count=400))
+    start = now - timedelta(days=30)
+
+    events = timeline.query_events(
+        "u", start, now,
+        any_of=[([EventType.SLEEP], [EventSource.FITBIT]), ([EventType.MESSAGE], None)],
+    )
+    assert events and {e.type for e in events} == {EventType.SLEEP, EventType.MESSAGE}
+    assert [e.timestamp for e in events] == sorted(e.timestamp for e in events)
+
+    recent = timeline.query_events("u", start, now, event_types=[EventType.STEPS], limit=5)
+    steps = timeline.query_events("u", start, now, event_types=[EventType.STEPS])
+    assert [e.id for e in recent] == [e.id for e in steps[-5:]]
+
+
+def test_search_features_filters_in_sql(timeline):
+    now = datetime.now()
+    timeline.add_events(_mixed_events(now, count=400))
+    matches = timeline.search_features("u", "heart_rate", 59, days_back=30)
+    assert matches and all(e.features["heart_rate"] == 59 for e in matches)
+    assert timeline.search_features("u", "message", "hi", days_back=30)
+
+
+def test_rollups_rebuilt_for_existing_database(tmp_path):
+    path = str(tmp_path / "timeline.db")
+    now = datetime.now()
+    tl = LifeTimeline(path)
+    tl.add_events(_mixed_events(now, count=200))
+    expected = tl.get_timeline_summary("u", days=30)["total_events"]
+    tl.conn.execute("DROP TABLE life_rollups")
+    tl.conn.commit()
+    tl.close()
+
+    reopened = LifeTimeline(path)
+    assert reopened.get_timeline_summary("u", days=30)["total_events"] == expected
+    reopened.close()
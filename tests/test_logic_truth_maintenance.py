@@ -0,0 +1,102 @@
+"""
+Logic Engine Truth Maintenance Tests
+
+Tests that derived facts are retracted when their supporting premises go away.
+"""
+
+from singularis.skyrim.skyrim_world_model import (
+    LogicEngine,
+    LogicPredicate,
+    LogicRule,
+    SkyrimWorldModel,
+)
+
+
+def pred(name: str) -> LogicPredicate:
+    return LogicPredicate(name, ("Player",), True)
+
+
+class TestLogicTruthMaintenance:
+    """Test justification-based retraction in LogicEngine."""
+
+    def test_derived_fact_retracted_with_premise(self):
+        """Removing a base fact retracts conclusions that depended on it."""
+        engine = LogicEngine()
+        engine.add_rule(LogicRule([pred("InCombat"), pred("Outnumbered")], pred("ShouldRetreat")))
+        engine.add_fact(pred("InCombat"))
+        engine.add_fact(pred("Outnumbered"))
+
+        assert engine.forward_chain() == {pred("ShouldRetreat")}
+
+        engine.remove_fact(pred("Outnumbered"))
+        assert pred("ShouldRetreat") not in engine.facts
+        assert pred("ShouldRetreat") not in engine.justifications
+
+    def test_chained_retraction(self):
+        """Retraction propagates through multi-step derivations."""
+        engine = LogicEngine()
+        engine.add_rule(LogicRule([pred("A")], pred("B")))
+        engine.add_rule(LogicRule([pred("B")], pred("C")))
+        engine.add_fact(pred("A"))
+        engine.forward_chain()
+        assert pred("C") in engine.facts
+
+        engine.remove_fact(pred("A"))
+        assert engine.facts == set()
+
+    def test_alternative_support_keeps_fact(self):
+        """A conclusion with another valid justification survives retraction."""
+        engine = LogicEngine()
+        engine.add_rule(LogicRule([pred("A")], pred("C")))
+        engine.add_rule(LogicRule([pred("B")], pred("C")))
+        engine.add_fact(pred("A"))
+        engine.add_fact(pred("B"))
+        engine.forward_chain()
+
+        engine.remove_fact(pred("A"))
+        assert pred("C") in engine.facts
+
+        engine.remove_fact(pred("B"))
+        assert pred("C") not in engine.facts
+
+    def test_cyclic_support_is_not_self_sustaining(self):
+        """Derived facts supporting each other do not outlive their grounding."""
+        engine = LogicEngine()
+        engine.add_rule(LogicRule([pred("A")], pred("B")))
+        engine.add_rule(LogicRule([pred("B")], pred("A")))
+        engine.add_fact(pred("A"))
+        engine.forward_chain()
+
+        engine.remove_fact(pred("A"))
+        assert engine.facts == set()
+
+    def test_asserted_fact_survives_premise_removal(self):
+        """A fact asserted directly is not retracted when its derivation fails."""
+        engine = LogicEngine()
+        engine.add_rule(LogicRule([pred("A")], pred("B")))
+        engine.add_fact(pred("A"))
+        engine.add_fact(pred("B"))
+        engine.forward_chain()
+
+        engine.remove_fact(pred("A"))
+        assert pred("B") in engine.facts
+
+    def test_world_model_fact_set_is_bounded(self):
+        """Alternating game states do not grow the fact set."""
+        model = SkyrimWorldModel()
+        danger = {'health': 20, 'in_combat': True, 'enemies_nearby': 4}
+        calm = {'health': 100, 'in_combat': False, 'enemies_nearby': 0}
+
+        model.query_logic_recommendation(danger)
+        danger_facts = set(model.logic_engine.facts)
+        model.query_logic_recommendation(calm)
+        calm_facts = set(model.logic_engine.facts)
+
+        for _ in range(5):
+            model.query_logic_recommendation(danger)
+            assert model.logic_engine.facts == danger_facts
+            result = model.query_logic_recommendation(calm)
+            assert model.logic_engine.facts == calm_facts
+
+        assert not result['should_heal']
+        assert not result['should_retreat']
@@ -0,0 +1,95 @@
+"""Tests for CSR-backed ModularNetwork statistics and incremental updates."""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from singularis.core.modular_network import ModularNetwork, NetworkTopology
+
+
+def _to_networkx(net: ModularNetwork) -> nx.Graph:
+    graph = nx.Graph()
+    graph.add_nodes_from(net.nodes)
+    for node_id, node in net.nodes.items():
+        graph.add_edges_from((node_id, target) for target in node.connections)
+    return graph
+
+
+def _reference_modularity(net: ModularNetwork) -> float:
+    """Q = (1/2m) Σ[A_ij - k_i*k_j/2m] δ(c_i, c_j), evaluated pairwise."""
+    degrees = {i: len(node.connections) for i, node in net.nodes.items()}
+    m = sum(degrees.values()) / 2
+    q = 0.0
+    for i, node_i in net.nodes.items():
+        for j, node_j in net.nodes.items():
+            if node_i.module_id != node_j.module_id:
+                continue
+            q += (1.0 if j in node_i.connections else 0.0) - degrees[i] * degrees[j] / (2 * m)
+    return q / (2 * m)
+
+
+def _assert_stats_match_reference(net: ModularNetwork):
+    graph = _to_networkx(net)
+    stats = net.get_stats()
+    degrees = [d for _, d in graph.degree()]
+    assert stats['avg_degree'] == pytest.approx(np.mean(degrees))
+    assert stats['avg_clustering'] == pytest.approx(nx.average_clustering(graph))
+    assert stats['modularity'] == pytest.approx(_reference_modularity(net))
+
+    lengths = [d for _, row in nx.all_pairs_shortest_path_length(graph) for d in row.values() if d > 0]
+    assert stats['avg_path_length'] == pytest.approx(np.mean(lengths))
+
+    for node_id, coeff in nx.clustering(graph).items():
+        assert net.nodes[node_id].clustering_coeff == pytest.approx(coeff)
+
+
+@pytest.mark.parametrize("topology", list(NetworkTopology))
+def test_statistics_match_reference(topology):
+    net = ModularNetwork(num_nodes=90, num_modules=5, topology=topology, seed=3)
+    assert net.adjacency.nnz == sum(len(node.connections) for node in net.nodes.values())
+    _assert_stats_match_reference(net)
+
+
+def test_incremental_updates_match_full_recompute():
+    net = ModularNetwork(num_nodes=80, num_modules=4, seed=7)
+    rng = np.random.default_rng(0)
+    for _ in range(60):
+        a, b = rng.choice(80, size=2, replace=False).tolist()
+        if b in net.nodes[a].connections:
+            assert net.remove_connection(a, b)
+        else:
+            assert net.add_connection(a, b, 0.4)
+
+    # Reconnecting an existing pair only changes its weight
+    target = next(iter(net.nodes[0].connections))
+    assert not net.add_connection(0, target, 0.9)
+    assert net.nodes[target].connections[0] == 0.9
+
+    _assert_stats_match_reference(net)
+    incremental = net.get_stats()
+    net._compute_statistics()
+    assert net.get_stats() == pytest.approx(incremental)
+
+
+def test_sampled_statistics_are_reproducible():
+    kwargs = dict(num_nodes=400, num_modules=8, seed=11, path_sample_size=40, clustering_sample_size=100)
+    first = ModularNetwork(**kwargs)
+    second = ModularNetwork(**kwargs)
+    assert first.get_stats() == second.get_stats()
+    assert len(first._path_sources) == 40
+    assert first._tracked.sum() == 100
+
+    # Sampled estimates stay close to the exact values
+    graph = _to_networkx(first)
+    assert first.stats['avg_path_length'] == pytest.approx(nx.average_shortest_path_length(graph), rel=0.05)
+    assert first._estimate_avg_path_length(sample_size=40, seed=1) == first._estimate_avg_path_length(sample_size=40, seed=1)
+
+
+def test_bfs_distances_match_networkx():
+    net = ModularNetwork(num_nodes=150, num_modules=3, topology=NetworkTopology.SMALL_WORLD, seed=5)
+    graph = _to_networkx(net)
+    for source in (0, 42, 149):
+        expected = nx.single_source_shortest_path_length(graph, source)
+        distances = net._bfs_distances(source)
+        for node_id in range(150):
+            assert distances[node_id] == expected.get(node_id, -1)
@@ -0,0 +1,129 @@
+"""
+MoE Quorum Tests
+
+Tests early-exit consensus in MoEOrchestrator expert fan-out.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from singularis.llm.moe_orchestrator import (
+    ExpertConfig,
+    ExpertResponse,
+    ExpertRole,
+    MoEOrchestrator,
+)
+
+
+def make_orchestrator(**kwargs) -> MoEOrchestrator:
+    """Create an orchestrator with reasoning-expert configs but no clients."""
+    moe = MoEOrchestrator(**kwargs)
+    for role in (ExpertRole.STRATEGIC_PLANNER, ExpertRole.TACTICAL_EXECUTOR, ExpertRole.WORLD_MODELER):
+        moe.expert_configs[role] = ExpertConfig(role=role, model_type="claude", model_name="stub")
+    return moe
+
+
+async def stub_expert(
+    delay: float,
+    confidence: float = 0.8,
+    role=ExpertRole.STRATEGIC_PLANNER,
+    model_type: str = "claude",
+):
+    await asyncio.sleep(delay)
+    return ExpertResponse(
+        role=role,
+        content=f"answer after {delay}s",
+        confidence=confidence,
+        reasoning="stub",
+        execution_time=delay,
+        model_type=model_type,
+    )
+
+
+async def failing_expert():
+    await asyncio.sleep(0.01)
+    raise RuntimeError("provider down")
+
+
+class TestMoEQuorum:
+    """Test quorum / early-exit gathering of expert responses."""
+
+    @pytest.mark.asyncio
+    async def test_default_waits_for_all(self):
+        moe = make_orchestrator()
+        responses = await moe._gather_experts([stub_expert(0.01), stub_expert(0.05), failing_expert()])
+        assert len(responses) == 2
+        assert moe.stats['quorum_early_exits'] == 0
+
+    @pytest.mark.asyncio
+    async def test_quorum_size_returns_early(self):
+        moe = make_orchestrator(quorum_size=2)
+        start = time.perf_counter()
+        responses = await moe._gather_experts([stub_expert(0.01), stub_expert(0.02), stub_expert(1.0)])
+        elapsed = time.perf_counter() - start
+
+        assert len(responses) == 2
+        assert elapsed < 0.5
+        assert moe.stats['quorum_early_exits'] == 1
+
+        # Straggler finishes in the background and still updates stats
+        calls_before = moe.stats['claude_calls']
+        await asyncio.sleep(1.1)
+        assert moe.stats['late_responses'] == 1
+        assert moe.stats['claude_calls'] == calls_before + 1
+
+    @pytest.mark.asyncio
+    async def test_late_hyperbolic_response_counted(self):
+        moe = make_orchestrator(quorum_size=1)
+        await moe._gather_experts([stub_expert(0.01), stub_expert(0.05, model_type="hyperbolic")])
+        calls_before = moe.stats['hyperbolic_calls']
+
+        await asyncio.sleep(0.1)
+        assert moe.stats['late_responses'] == 1
+        assert moe.stats['hyperbolic_calls'] == calls_before + 1
+
+    @pytest.mark.asyncio
+    async def test_confidence_threshold(self):
+        moe = make_orchestrator(quorum_confidence=0.75)
+        responses = await moe._gather_experts([
+            stub_expert(0.01, confidence=0.9),
+            stub_expert(0.02, confidence=0.8, role=ExpertRole.TACTICAL_EXECUTOR),
+            stub_expert(1.0, confidence=0.4),
+        ])
+        assert len(responses) == 2
+        await moe.close()
+
+    @pytest.mark.asyncio
+    async def test_deadline_and_cancel(self):
+        moe = make_orchestrator(quorum_deadline=0.1, cancel_stragglers=True)
+        start = time.perf_counter()
+        responses = await moe._gather_experts([stub_expert(0.01), stub_expert(2.0)])
+        elapsed = time.perf_counter() - start
+
+        assert len(responses) == 1
+        assert elapsed < 0.5
+        assert moe.stats['quorum_deadline_hits'] == 1
+        assert moe.stats['stragglers_cancelled'] == 1
+
+    @pytest.mark.asyncio
+    async def test_query_reasoning_experts_uses_quorum(self):
+        moe = make_orchestrator(quorum_size=1)
+
+        async def fast(*args, **kwargs):
+            return await stub_expert(0.01)
+
+        async def slow(*args, **kwargs):
+            return await stub_expert(1.0)
+
+        moe.claude_experts = [object(), object()]
+        calls = iter([fast, slow])
+        moe._query_claude_expert = lambda *a, **k: next(calls)()
+
+        result = await moe.query_reasoning_experts("What next?")
+        assert len(result.expert_responses) == 1
+        assert result.total_time < 0.5
+
+        moe.claude_experts = []
+        await moe.close()
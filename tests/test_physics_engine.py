@@ -0,0 +1,141 @@
+"""Tests for the array-backed PhysicsEngine simulation and broad-phase collisions."""
+
+import numpy as np
+import pytest
+
+from singularis.world_model.physics_engine import ObjectType, PhysicsEngine
+
+
+def _reference_step(engine, steps):
+    """Per-object integration the vectorized path must reproduce."""
+    states = {
+        name: (obj.position.copy(), obj.velocity.copy(), [f.copy() for f in obj.forces], obj.mass, obj.object_type)
+        for name, obj in engine.objects.items()
+    }
+    for _ in range(steps):
+        for name, (position, velocity, forces, mass, object_type) in states.items():
+            if object_type == ObjectType.STATIC:
+                continue
+            acceleration = np.array([0, 0, engine.gravity], dtype=float)
+            for force in forces:
+                acceleration += force / mass
+            velocity += acceleration * engine.time_step
+            position += velocity * engine.time_step
+            if position[2] < 0:
+                position[2] = 0
+                velocity[2] = -velocity[2] * 0.5
+            forces.clear()
+    return {name: (p, v) for name, (p, v, *_) in states.items()}
+
+
+def _random_engine(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    engine = PhysicsEngine(time_step=0.01)
+    for i in range(n):
+        engine.add_object(
+            f"obj{i}",
+            position=tuple(rng.uniform(0, 20, size=3)),
+            velocity=tuple(rng.normal(size=3)),
+            mass=float(rng.uniform(0.5, 5.0)),
+            size=tuple(rng.uniform(0.2, 2.0, size=3)),
+        )
+    engine.objects["obj3"].object_type = ObjectType.STATIC
+    engine.objects["obj5"].forces.append(np.array([0.0, 0.0, 400.0]))
+    return engine
+
+
+def test_forward_simulate_matches_per_object_integration():
+    engine = _random_engine()
+    expected = _reference_step(engine, 300)
+
+    final = engine.forward_simulate(steps=300)["final_states"]
+
+    for name, (position, velocity) in expected.items():
+        np.testing.assert_allclose(final[name]["position"], position, atol=1e-9)
+        np.testing.assert_allclose(final[name]["velocity"], velocity, atol=1e-9)
+        # Objects see the simulated state through their attributes
+        np.testing.assert_allclose(engine.objects[name].position, position, atol=1e-9)
+    assert engine.objects["obj5"].forces == []
+
+
+def test_trajectory_skips_static_objects():
+    engine = _random_engine(n=6)
+    result = engine.forward_simulate(steps=10, return_trajectory=True)["trajectories"]
+    assert result["obj3"] == []
+    assert [frame["step"] for frame in result["obj0"]] == list(range(10))
+    np.testing.assert_allclose(result["obj0"][-1]["position"], engine.objects["obj0"].position)
+
+
+def test_reassigned_attributes_and_removed_objects_are_picked_up():
+    engine = _random_engine(n=10)
+    engine.objects["obj1"].position = np.array([1.0, 2.0, 50.0])
+    engine.objects["obj1"].velocity = np.zeros(3)
+    del engine.objects["obj2"]
+
+    final = engine.forward_simulate(steps=1)["final_states"]
+
+    assert "obj2" not in final
+    assert final["obj1"]["position"][:2] == [1.0, 2.0]
+    assert final["obj1"]["position"][2] == pytest.approx(50.0 + engine.gravity * 0.01 * 0.01)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_broad_phase_collisions_match_all_pairs(seed):
+    engine = _random_engine(n=150, seed=seed)
+    engine.add_object("floor", position=(10, 10, -0.5), size=(100, 100, 1))
+    objects = list(engine.objects.values())
+
+    expected = [
+        (a.name, b.name)
+        for i, a in enumerate(objects)
+        for b in objects[i + 1:]
+        if engine._check_collision(a, b)
+    ]
+    assert expected
+    assert engine.detect_collisions() == expected
+
+
+def test_simulate_interventions_matches_sequential_predictions():
+    engine = _random_engine(n=20)
+    engine.objects["obj5"].forces.clear()  # Pending forces are not serialized
+    snapshot = engine.to_dict()
+    candidates = [
+        ("apply_force", {"object": "obj0", "force": [0, 0, 500]}),
+        ("set_velocity", {"object": "obj1", "velocity": [3, 0, 2]}),
+        ("teleport", {"object": "obj2", "position": [0, 0, 30]}),
+        ("apply_force", {"object": "missing", "force": [1, 1, 1]}),
+    ]
+    before = {name: obj.position.copy() for name, obj in engine.objects.items()}
+
+    batched = engine.simulate_interventions(candidates, steps=50)
+
+    # The engine's own state is untouched
+    for name, obj in engine.objects.items():
+        np.testing.assert_array_equal(obj.position, before[name])
+
+    for (intervention, params), outcome in zip(candidates, batched):
+        fresh = PhysicsEngine.from_dict(snapshot)
+        for name, obj in engine.objects.items():
+            fresh.objects[name].object_type = obj.object_type
+        expected = fresh.predict_intervention_outcome(intervention, params, steps=50)["final_states"]
+        for name in expected:
+            np.testing.assert_allclose(outcome["final_states"][name]["position"], expected[name]["position"], atol=1e-9)
+            np.testing.assert_allclose(outcome["final_states"][name]["velocity"], expected[name]["velocity"], atol=1e-9)
+
+
+def test_predict_trajectory_matches_stepwise_ballistics():
+    engine = PhysicsEngine(time_step=0.01)
+    engine.add_object("ball", position=(0, 0, 10), velocity=(5, 0, 3))
+
+    predicted = engine.predict_trajectory("ball", time_horizon=5.0)
+
+    pos, vel, expected = np.array([0.0, 0, 10]), np.array([5.0, 0, 3]), []
+    for _ in range(500):
+        vel[2] += engine.gravity * engine.time_step
+        pos += vel * engine.time_step
+        if pos[2] < 0:
+            break
+        expected.append(pos.copy())
+
+    assert len(predicted) == len(expected)
+    np.testing.assert_allclose(predicted, expected, atol=1e-9)
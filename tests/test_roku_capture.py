@@ -0,0 +1,178 @@
+"""Tests for the persistent raw-frame stream and parallel Roku region analysis."""
+
+import asyncio
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "integrations"))
+
+from adb_frame_stream import (  # noqa: E402
+    LEGACY_RAW_HEADER_SIZE,
+    RawFrameStream,
+    decode_raw_pixels,
+    encode_raw_frame,
+)
+
+
+def _producer(frames=None, width=64, height=48, header_size=16, corrupt_after=None):
+    """Command for a local fake screencap stream: frame i is filled with i % 256."""
+    script = textwrap.dedent(f"""
+        import struct, sys, time
+        out = sys.stdout.buffer
+        i = 0
+        while {frames!r} is None or i < {frames!r}:
+            if {corrupt_after!r} is not None and i == {corrupt_after!r}:
+                out.write(struct.pack('<III', 1 << 20, 1 << 20, 99) + b'\\0' * ({header_size} - 12))
+                out.flush()
+                time.sleep(5)
+            header = struct.pack('<III', {width}, {height}, 1) + b'\\0' * ({header_size} - 12)
+            out.write(header + bytes([i % 256]) * ({width} * {height} * 4))
+            out.flush()
+            i += 1
+            time.sleep(0.002)
+    """)
+    return [sys.executable, "-c", script]
+
+
+@pytest.mark.parametrize("pixel_format", [1, 2, 3])
+def test_raw_frame_roundtrip(pixel_format):
+    frame = np.random.default_rng(0).integers(0, 256, size=(5, 7, 3), dtype=np.uint8)
+    data = encode_raw_frame(frame, pixel_format=pixel_format)
+    decoded = decode_raw_pixels(memoryview(data)[16:], 7, 5, pixel_format)
+    np.testing.assert_array_equal(decoded, frame)
+
+
+def test_rgb565_roundtrip_is_quantized():
+    frame = np.random.default_rng(1).integers(0, 256, size=(4, 4, 3), dtype=np.uint8)
+    data = encode_raw_frame(frame, pixel_format=4, header_size=LEGACY_RAW_HEADER_SIZE)
+    decoded = decode_raw_pixels(data[LEGACY_RAW_HEADER_SIZE:], 4, 4, 4)
+    assert np.abs(decoded.astype(int) - frame.astype(int)).max() < 8
+
+
+def test_stream_delivers_latest_frames():
+    stream = RawFrameStream(_producer(width=32, height=24))
+    stream.start()
+    try:
+        first = stream.latest(timeout=5.0)
+        assert first is not None
+        sequence, frame = first
+        assert frame.shape == (24, 32, 3)
+        assert (frame == frame[0, 0]).all()
+
+        second = stream.latest(after=sequence, timeout=5.0)
+        assert second is not None and second[0] > sequence
+
+        time.sleep(0.1)
+        stats = stream.get_stats()
+        assert stats["frames_decoded"] >= 2
+        assert stats["decode_fps"] > 0
+        assert stats["frames_skipped"] > 0  # Unread frames are overwritten, not queued
+    finally:
+        stream.stop()
+    assert stream._process.poll() is not None
+    assert stream.latest(after=stream._sequence, timeout=0.1) is None
+
+
+def test_stream_restarts_after_producer_exits():
+    stream = RawFrameStream(_producer(frames=2), restart_delay=0.01)
+    stream.start()
+    try:
+        deadline = time.monotonic() + 5.0
+        while stream.restarts < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stream.restarts >= 2
+        assert stream.frames_decoded >= 4
+    finally:
+        stream.stop()
+
+
+def test_corrupt_header_resyncs_stream():
+    stream = RawFrameStream(_producer(corrupt_after=1), restart_delay=0.01, max_frame_pixels=1 << 16)
+    stream.start()
+    try:
+        deadline = time.monotonic() + 5.0
+        while (stream.decode_errors < 1 or stream.restarts < 1) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stream.decode_errors >= 1
+        assert stream.restarts >= 1
+    finally:
+        stream.stop()
+
+
+class _FakeTimeline:
+    def __init__(self):
+        self.events = []
+
+    def add_event(self, event):
+        self.events.append(event)
+
+
+class _FakeInterpreter:
+    """Stands in for StreamingVideoInterpreter; must run on the loop it was bound to."""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.calls = 0
+
+    async def _interpret_frame(self, frame):
+        assert asyncio.get_running_loop() is self.loop
+        self.calls += 1
+        await asyncio.sleep(0.01)
+
+        class Interpretation:
+            text = "A person is walking through the room"
+
+        return Interpretation()
+
+
+def _gateway(**kwargs):
+    pytest.importorskip("cv2")
+    from roku_screencap_gateway import RokuScreenCaptureGateway
+
+    return RokuScreenCaptureGateway(
+        timeline=_FakeTimeline(), user_id="u", device_ip="127.0.0.1", **kwargs
+    )
+
+
+def test_gateway_stream_mode_processes_regions_in_parallel():
+    gateway = _gateway(capture_mode="stream", stream_command=_producer(width=64, height=48), region_workers=4)
+    try:
+        frames = [gateway.capture_frame(timeout=5.0) for _ in range(3)]
+        assert all(frame is not None and frame.shape == (48, 64, 3) for frame in frames)
+        assert gateway.frames_captured == 3
+
+        for frame in frames:
+            gateway.process_frame(frame)
+        assert len(gateway.camera_regions) == 4
+        assert gateway.basic_cv_analyses == 12
+        stats = gateway.get_stats()
+        assert stats["capture_mode"] == "stream"
+        assert stats["stream"]["frames_decoded"] >= 3
+    finally:
+        gateway.stop()
+
+
+async def test_agi_results_are_collected_inside_running_loop():
+    pytest.importorskip("PIL")
+    loop = asyncio.get_running_loop()
+    interpreter = _FakeInterpreter(loop)
+    gateway = _gateway(video_interpreter=interpreter, agi_loop=loop, region_workers=4)
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    try:
+        # Workers wait on the caller's loop, so run the frame off-loop
+        events = await asyncio.to_thread(gateway.process_frame, frame)
+        assert interpreter.calls == 4
+        assert {e["camera_id"] for e in events if e["type"] == "person_detected"} == {"cam1", "cam2", "cam3", "cam4"}
+
+        # Called on the loop itself: scheduled, then collected on the next frame
+        assert gateway.process_camera_region(frame, (0, 0, 32, 24), "cam1") == []
+        await asyncio.sleep(0.05)
+        late = gateway.drain_late_events()
+        assert any(e["type"] == "person_detected" for e in late)
+    finally:
+        gateway.stop()
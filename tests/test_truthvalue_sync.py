@@ -0,0 +1,183 @@
+"""Tests for TruthValueSync's array-backed state, history and batched sync."""
+
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# The package __init__ pulls in the haackc-based runtime; truthvalue_sync.py doesn't need it
+_spec = importlib.util.spec_from_file_location(
+    "haacklang_truthvalue_sync",
+    Path(__file__).parent.parent / "singularis" / "haacklang_bridge" / "truthvalue_sync.py",
+)
+truthvalue_sync = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = truthvalue_sync
+_spec.loader.exec_module(truthvalue_sync)
+TruthValueSync = truthvalue_sync.TruthValueSync
+
+
+class StubRuntime:
+    """Dict-backed stand-in for HaackLangRuntime's truthvalue API."""
+
+    def __init__(self):
+        self.values = {}
+        self.writes = []
+
+    def get_truthvalue(self, name, track):
+        return self.values.get((name, track))
+
+    def set_truthvalue(self, name, track, value):
+        self.values[(name, track)] = value
+        self.writes.append((name, track, value))
+
+
+def _sync(**kwargs):
+    return TruthValueSync(StubRuntime(), **kwargs)
+
+
+def _reference_latency(history):
+    """avg_latency_ms as the pre-array implementation computed it."""
+    recent = history[-100:]
+    latencies = [
+        (recent[i].timestamp - recent[i - 1].timestamp) * 1000
+        for i in range(1, len(recent))
+        if recent[i].source != recent[i - 1].source
+    ]
+    return sum(latencies) / len(latencies) if latencies else None
+
+
+def test_history_ring_buffer_wraps_oldest_first():
+    sync = _sync(max_history=5)
+    for i in range(8):
+        sync.update_from_python("danger", "reflex", i / 10)
+
+    assert [u.new_value for u in sync.update_history] == [0.3, 0.4, 0.5, 0.6, 0.7]
+    assert [u.old_value for u in sync.update_history] == [0.2, 0.3, 0.4, 0.5, 0.6]
+
+    # A batch larger than the buffer keeps only its newest entries
+    keys = [(f"v{i}", "t") for i in range(7)]
+    sync.sync_batch(keys, np.arange(7) / 10)
+    assert [u.name for u in sync.update_history] == ["v2", "v3", "v4", "v5", "v6"]
+
+
+def test_history_limit_semantics():
+    sync = _sync()
+    for i in range(5):
+        sync.update_from_python("a" if i % 2 else "b", "t", i / 10)
+
+    assert len(sync.get_update_history(limit=0)) == 5  # Same as history[-0:]
+    assert [u.new_value for u in sync.get_update_history(limit=2)] == [0.3, 0.4]
+    assert [u.new_value for u in sync.get_update_history(name="a")] == [0.1, 0.3]
+
+
+def test_value_stats_mean():
+    sync = _sync()
+    for value in (0.2, 0.4, 0.9):
+        sync.update_from_haacklang("danger", "reflex", value)
+
+    stats = sync.get_value_stats("danger", "reflex")
+    assert stats["updates"] == 3
+    assert stats["mean"] == pytest.approx(0.5)
+    assert stats["current"] == 0.9
+    assert sync.get_value_stats("missing", "t")["updates"] == 0
+
+
+def test_sync_batch_push_and_pull():
+    sync = _sync()
+    keys = [("a", "t"), ("b", "t"), ("c", "t")]
+
+    pushed = sync.sync_batch(keys, [0.1, 0.5, 0.9])
+    assert pushed.tolist() == [0.1, 0.5, 0.9]
+    assert sync.runtime.values == {("a", "t"): 0.1, ("b", "t"): 0.5, ("c", "t"): 0.9}
+
+    sync.runtime.values[("b", "t")] = 0.7
+    del sync.runtime.values[("c", "t")]  # Missing in the runtime: keep the synced value
+    ids = sync.variable_ids(keys)
+    pulled = sync.sync_batch(ids, direction="pull")
+    assert pulled.tolist() == [0.1, 0.7, 0.9]
+    assert sync.get_current_value("b", "t") == 0.7
+
+    stats = sync.get_stats()
+    assert (stats["python_to_haack"], stats["haack_to_python"]) == (3, 3)
+
+    with pytest.raises(ValueError):
+        sync.sync_batch(keys)
+
+
+def test_sync_batch_duplicate_ids_apply_in_order():
+    sync = _sync()
+    seen = []
+    sync.register_callback("a", lambda name, track, old, new: seen.append((old, new)))
+    sync.update_from_python("a", "t", 0.1)
+    seen.clear()
+
+    sync.sync_batch([("a", "t"), ("a", "t")], [0.2, 0.3])
+
+    assert seen == [(0.1, 0.2), (0.2, 0.3)]
+    assert [(u.old_value, u.new_value) for u in sync.get_update_history(limit=2)] == [(0.1, 0.2), (0.2, 0.3)]
+    assert sync.get_current_value("a", "t") == 0.3
+    assert sync.get_value_stats("a", "t")["updates"] == 3
+
+
+@pytest.mark.parametrize("strategy", ["trust_newer", "trust_python", "trust_haacklang", "average"])
+def test_conflicts_counted_and_pushed_value_kept(strategy):
+    sync = _sync()
+    sync.conflict_strategy = strategy
+
+    sync.runtime.values[("a", "t")] = 0.9
+    sync.update_from_python("a", "t", 0.1)  # Conflict with the runtime
+    sync.update_from_python("b", "t", 0.5)  # Nothing in the runtime yet
+    assert sync.stats.conflicts == 1
+    assert sync.get_current_value("a", "t") == 0.1
+    assert sync.runtime.values[("a", "t")] == 0.1
+
+    # Batch: a moves far (conflict), b barely (no conflict), c is new (no conflict);
+    # the repeated a conflicts with the first a of the same batch
+    result = sync.sync_batch([("a", "t"), ("b", "t"), ("c", "t"), ("a", "t")], [0.8, 0.55, 0.3, 0.2])
+    assert sync.stats.conflicts == 3
+    assert result.tolist() == [0.8, 0.55, 0.3, 0.2]
+    assert sync.runtime.values[("a", "t")] == 0.2
+
+
+def test_callbacks_only_for_registered_names():
+    sync = _sync()
+    sync.variable_ids([("early", "t"), ("other", "t")])
+    calls = []
+    sync.register_callback("early", lambda *args: calls.append(args))  # Existing variable
+    sync.register_callback("late", lambda *args: calls.append(args))  # Registered before first use
+
+    assert sync._has_callbacks[sync.variable_id("early", "t")]
+    assert not sync._has_callbacks[sync.variable_id("other", "t")]
+
+    sync.sync_batch([("early", "t"), ("other", "t"), ("late", "x")], [0.4, 0.5, 0.6])
+    assert calls == [("early", "t", 0.0, 0.4), ("late", "x", 0.0, 0.6)]
+
+    calls.clear()
+    sync.sync_batch([("early", "t")], [0.7], notify_callbacks=False)
+    assert calls == []
+
+
+def test_avg_latency_matches_previous_rescan(monkeypatch):
+    rng = random.Random(0)
+    clock = [1000.0]
+    monkeypatch.setattr(truthvalue_sync.time, "time", lambda: clock[0])
+
+    sync = _sync()
+    names = [f"v{i}" for i in range(5)]
+    for _ in range(400):
+        clock[0] += rng.uniform(0.001, 0.05)
+        choice = rng.random()
+        if choice < 0.4:
+            sync.update_from_python(rng.choice(names), "t", rng.random())
+        elif choice < 0.8:
+            sync.update_from_haacklang(rng.choice(names), "t", rng.random())
+        else:
+            keys = [(rng.choice(names), "t") for _ in range(rng.randint(1, 30))]
+            sync.sync_batch(keys, [rng.random() for _ in keys], direction=rng.choice(["push", "pull"]))
+
+        expected = _reference_latency(sync.update_history)
+        if expected is not None:
+            assert sync.stats.avg_latency_ms == pytest.approx(expected)